@@ -39,8 +39,8 @@ from src.accounts.services.vacation import (
 )
 from src.authentication.enums import AuthTokenType
 from src.executor import RawSqlExecutor
-from src.permissions.enums import PermissionSource
-from src.permissions.models import UserObjectPermission
+from src.permissions.enums import PermissionSource, WorkflowAclPerm
+from src.permissions.models import UserObjectPermission, WorkflowAcl
 from src.processes.enums import (
     OwnerType,
     PerformerType,
@@ -59,6 +59,9 @@ from src.processes.models.workflows.workflow import Workflow
 from src.processes.services.workflow_permissions import (
     WorkflowPermissionService,
 )
+from src.processes.services.workflows.instantiation import (
+    InstantiationPlanService,
+)
 from src.processes.tasks.tasks import complete_tasks
 from src.processes.tasks.update_workflow import update_workflow_owners
 from src.storage.tasks import (
@@ -465,6 +468,15 @@ class ReassignService:
             object_pk__in=account_wf_pks,
         )
 
+    def _workflow_viewer_acl_qs(self):
+        return WorkflowAcl.objects.filter(
+            perm=WorkflowAclPerm.VIEW,
+            source_type=PermissionSource.WORKFLOW_VIEWER,
+            workflow_id__in=Workflow.objects.filter(
+                account=self.account,
+            ).values('id'),
+        )
+
     def _transfer_workflow_viewer_rows(self):
         """Reassign legacy WORKFLOW_VIEWER rows old_user -> new_user.
 
@@ -490,6 +502,15 @@ class ReassignService:
             ).delete()
         base_qs.filter(user=self.old_user).update(user=self.new_user)
 
+        acl_qs = self._workflow_viewer_acl_qs()
+        acl_qs.filter(
+            user=self.old_user,
+            workflow_id__in=acl_qs.filter(
+                user=self.new_user,
+            ).values('workflow_id'),
+        ).delete()
+        acl_qs.filter(user=self.old_user).update(user=self.new_user)
+
     def _revoke_workflow_viewer_rows(self):
         """Drop legacy WORKFLOW_VIEWER rows for old_user.
 
@@ -501,6 +522,9 @@ class ReassignService:
         self._workflow_viewer_base_qs().filter(
             user=self.old_user,
         ).delete()
+        self._workflow_viewer_acl_qs().filter(
+            user=self.old_user,
+        ).delete()
 
     def _affected_template_ids(self):
         affected_template_ids = []
@@ -532,7 +556,10 @@ class ReassignService:
         """
         if not affected_template_ids:
             return
-        update_workflow_owners(template_ids=affected_template_ids)
+        update_workflow_owners(
+            template_ids=affected_template_ids,
+            sync=True,
+        )
 
     def _reassign_in_template_conditions(self):
         if self.old_group:
@@ -665,6 +692,12 @@ class ReassignService:
             self._reassign_in_template_conditions()
             self._reassign_in_conditions()
             self._cleanup_personal_groups()
+            account_id = self.account.id
+            transaction.on_commit(
+                lambda: InstantiationPlanService.delete_account_plans(
+                    account_id,
+                ),
+            )
             if self.new_user:
                 user_id = self.new_user.id
             elif self.new_group and self.new_group.users.exists():
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pytz import timezone as pytz_tz
 from pytz.exceptions import UnknownTimeZoneError
 from celery import shared_task
@@ -41,21 +43,36 @@ def send_system_notification():
             )
 
 
-@shared_task
-def process_vacations():
-    """Auto-start and auto-stop vacation delegations.
+def _start_vacation(user, user_now: datetime):
+    vacation = user.vacation
+    if not vacation or user_now.date() < vacation.start_date:
+        return
+    sub_ids = list(
+        vacation.substitute_group.users
+        .values_list('id', flat=True),
+    )
+    if sub_ids:
+        VacationDelegationService(user).activate(
+            sub_ids,
+            absence_status=AbsenceStatus.VACATION,
+            vacation_start_date=(
+                vacation.start_date
+            ),
+            vacation_end_date=(
+                vacation.end_date
+            ),
+        )
 
-    Runs every 15 minutes via Celery beat.
-    Checks user timezones to determine if vacation should
-    start or end based on local date.
-    Per-user error isolation ensures one failure does not
-    block processing of other users.
-    """
-    user_model = get_user_model()
-    now = timezone.now()
 
-    auto_start_users = (
-        user_model.objects
+def _stop_vacation(user, user_now: datetime):
+    vacation = user.vacation
+    if vacation and user_now.date() > vacation.end_date:
+        VacationDelegationService(user).deactivate()
+
+
+def _get_auto_start_users():
+    return (
+        get_user_model().objects
         .filter(
             vacations__isnull=False,
             vacations__is_deleted=False,
@@ -65,37 +82,11 @@ def process_vacations():
         )
         .order_by('id')
     )
-    for user in auto_start_users:
-        try:
-            user_now = now.astimezone(pytz_tz(user.timezone))
-        except UnknownTimeZoneError:
-            continue
-        vacation = user.vacation
-        if not vacation:
-            continue
-        if user_now.date() >= vacation.start_date:
-            sub_ids = list(
-                vacation.substitute_group.users
-                .values_list('id', flat=True),
-            )
-            if sub_ids:
-                try:
-                    VacationDelegationService(user).activate(
-                        sub_ids,
-                        absence_status=AbsenceStatus.VACATION,
-                        vacation_start_date=(
-                            vacation.start_date
-                        ),
-                        vacation_end_date=(
-                            vacation.end_date
-                        ),
-                    )
-                except Exception:  # noqa: BLE001
-                    continue
 
-    # Auto-stop: users past their end date
-    auto_stop_users = (
-        user_model.objects
+
+def _get_auto_stop_users():
+    return (
+        get_user_model().objects
         .filter(
             vacations__isnull=False,
             vacations__is_deleted=False,
@@ -107,14 +98,56 @@ def process_vacations():
         )
         .order_by('id')
     )
-    for user in auto_stop_users:
+
+
+def process_user_vacation(user_id: int):
+
+    """ Auto-start or auto-stop the vacation of one user,
+        fired by the vacation timer """
+
+    now = timezone.now()
+    for users, process in (
+        (_get_auto_start_users(), _start_vacation),
+        (_get_auto_stop_users(), _stop_vacation),
+    ):
+        user = users.filter(id=user_id).first()
+        if user is None:
+            continue
+        try:
+            process(user, now.astimezone(pytz_tz(user.timezone)))
+        except UnknownTimeZoneError:
+            return
+
+
+@shared_task
+def process_vacations():
+    """Auto-start and auto-stop vacation delegations.
+
+    Runs every 15 minutes via Celery beat.
+    Checks user timezones to determine if vacation should
+    start or end based on local date.
+    Per-user error isolation ensures one failure does not
+    block processing of other users.
+    """
+    now = timezone.now()
+
+    for user in _get_auto_start_users():
         try:
             user_now = now.astimezone(pytz_tz(user.timezone))
         except UnknownTimeZoneError:
             continue
-        vacation = user.vacation
-        if vacation and user_now.date() > vacation.end_date:
-            try:
-                VacationDelegationService(user).deactivate()
-            except Exception:  # noqa: BLE001
-                continue
+        try:
+            _start_vacation(user, user_now)
+        except Exception:  # noqa: BLE001
+            continue
+
+    # Auto-stop: users past their end date
+    for user in _get_auto_stop_users():
+        try:
+            user_now = now.astimezone(pytz_tz(user.timezone))
+        except UnknownTimeZoneError:
+            continue
+        try:
+            _stop_vacation(user, user_now)
+        except Exception:  # noqa: BLE001
+            continue
@@ -244,3 +244,34 @@ def test_counters__task_performer_changed__ok(mocker, api_client):
     assert response_delete.status_code == 204
     assert response.status_code == 200
     assert response.data['tasks_count'] == 1
+
+
+def test_counters__task_inbox__ok(api_client, settings):
+
+    # arrange
+    settings.TASK_INBOX_QUERIES = True
+    account = create_test_account()
+    owner = create_test_owner(account=account)
+    user = create_test_admin(account=account)
+    group = create_test_group(account, users=[user])
+    workflow = create_test_workflow(owner, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    TaskPerformer.objects.create(
+        task_id=task.id,
+        type=PerformerType.GROUP,
+        group_id=group.id,
+    )
+    create_test_workflow(user, tasks_count=1)
+    completed_workflow = create_test_workflow(user, tasks_count=1)
+    TaskPerformer.objects.filter(
+        task__workflow=completed_workflow,
+        user_id=user.id,
+    ).update(is_completed=True)
+    api_client.token_authenticate(user)
+
+    # act
+    response = api_client.get('/accounts/user/counters')
+
+    # assert
+    assert response.status_code == 200
+    assert response.data['tasks_count'] == 2
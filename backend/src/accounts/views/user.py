@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import action
@@ -47,7 +48,7 @@ from src.openapi import (
     UserCountersSerializer,
     VALIDATION_ERROR,
 )
-from src.processes.models.workflows.task import Task
+from src.processes.models.workflows.task import Task, TaskInbox
 from src.storage.utils import sync_account_file_fields
 from src.utils.validation import raise_validation_error
 
@@ -127,14 +128,21 @@ class UserViewSet(
     )
     @action(methods=('GET',), detail=False)
     def counters(self, request, *args, **kwargs):
-        return self.response_ok({
-            'tasks_count': (
+        if settings.TASK_INBOX_QUERIES:
+            tasks_count = (
+                TaskInbox.objects
+                .by_user(request.user.id)
+                .active()
+                .count()
+            )
+        else:
+            tasks_count = (
                 Task.objects
                 .active_for_user(request.user.id)
                 .distinct()
                 .count()
-            ),
-        })
+            )
+        return self.response_ok({'tasks_count': tasks_count})
 
     @extend_schema(
         tags=['Accounts'],
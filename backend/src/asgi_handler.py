@@ -6,47 +6,202 @@
 # culprit is not CORS, but async mind games.
 
 
+import asyncio
+import json
 import logging
+import os
+import socket
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from channels.exceptions import RequestAborted, RequestTimeout
 from channels.http import AsgiHandler as ChannelsAsgiHandler
 from django import http
 from django.conf import settings
 from django.core import signals
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
 from django.core.exceptions import RequestDataTooBig
 from django.http import FileResponse, HttpResponse
 from django.urls import set_script_prefix
+from django_redis.cache import RedisCache
+from redis.exceptions import RedisError
 
 logger = logging.getLogger("django.request")
 
+ASGI_METRICS_KEY = 'asgi:metrics'
+
+
+def publish_asgi_metrics(values: Dict[str, float]):
+
+    """ Writes the metrics of the current process to the Redis hash,
+        one field per process. Skipped without the Redis cache """
+
+    cache = caches[DEFAULT_CACHE_ALIAS]
+    if not isinstance(cache, RedisCache):
+        return
+    process = f'{socket.gethostname()}:{os.getpid()}'
+    client = cache.client.get_client(write=True)
+    client.hset(
+        cache.make_key(ASGI_METRICS_KEY),
+        process,
+        json.dumps({**values, 'updated': time.time()}),
+    )
+
+
+def get_asgi_metrics(reset: bool = False) -> Dict[str, Dict[str, float]]:
+
+    """ Returns the last published metrics per process
+        Metrics are collected only with the Redis cache """
+
+    cache = caches[DEFAULT_CACHE_ALIAS]
+    if not isinstance(cache, RedisCache):
+        return {}
+    client = cache.client.get_client(write=True)
+    key = cache.make_key(ASGI_METRICS_KEY)
+    pipe = client.pipeline()
+    pipe.hgetall(key)
+    if reset:
+        pipe.delete(key)
+    values = pipe.execute()[0]
+    return {
+        process.decode(): json.loads(value)
+        for process, value in values.items()
+    }
+
+
+class LoopLagMonitor:
+
+    """ Measures how late the event loop wakes up a sleeping coroutine.
+        A sync view executed directly on the loop shows up here
+        as a lag equal to the view duration.
+        Every publish interval the lag of the window and the handler
+        stats are published, see publish_asgi_metrics. """
+
+    def __init__(
+        self,
+        interval: float,
+        threshold: float,
+        publish_interval: float = 0,
+        get_stats: Optional[Callable[[], Dict[str, int]]] = None,
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self.publish_interval = publish_interval
+        self.get_stats = get_stats
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.slow_count = 0
+        self._published = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None and self.interval > 0:
+            loop = asyncio.get_event_loop()
+            self._task = loop.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            await self.measure()
+            if (
+                self.publish_interval > 0
+                and time.monotonic() - self._published
+                >= self.publish_interval
+            ):
+                await self.publish()
+
+    async def measure(self):
+        started = time.monotonic()
+        await asyncio.sleep(self.interval)
+        lag = time.monotonic() - started - self.interval
+        self.last_lag = max(lag, 0.0)
+        self.max_lag = max(self.max_lag, self.last_lag)
+        if self.last_lag > self.threshold:
+            self.slow_count += 1
+            logger.warning(
+                "Event loop lag %.3fs (max %.3fs)",
+                self.last_lag,
+                self.max_lag,
+                extra={'loop_lag': self.last_lag},
+            )
+
+    async def publish(self):
+
+        """ Publishes the window in the default executor,
+            the Redis call must not block the loop it measures """
+
+        values = {
+            'last_lag': self.last_lag,
+            'max_lag': self.max_lag,
+            'slow_count': self.slow_count,
+        }
+        if self.get_stats is not None:
+            values.update(self.get_stats())
+        self.max_lag = 0.0
+        self.slow_count = 0
+        self._published = time.monotonic()
+        loop = asyncio.get_event_loop()
+        try:
+            await loop.run_in_executor(None, publish_asgi_metrics, values)
+        except RedisError:
+            logger.exception("Failed to publish the ASGI metrics")
+
 
 class AsgiHandler(ChannelsAsgiHandler):
     # All methods have been copied and slightly modified from the parent-class
     # If you wanna know what happens here - look in the parent class
+
+    def __init__(self):
+        super().__init__()
+        self.threaded = settings.ASGI_THREADED_VIEWS
+        self.request_timeout = settings.ASGI_REQUEST_TIMEOUT
+        self.max_pending = settings.ASGI_MAX_PENDING_REQUESTS
+        self.pending = 0
+        self.rejected_count = 0
+        self.timed_out_count = 0
+        self.loop_lag = LoopLagMonitor(
+            interval=settings.ASGI_LOOP_LAG_INTERVAL,
+            threshold=settings.ASGI_LOOP_LAG_THRESHOLD,
+            publish_interval=settings.ASGI_METRICS_INTERVAL,
+            get_stats=self.get_stats,
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if self.threaded:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.ASGI_THREAD_POOL_SIZE,
+                thread_name_prefix='asgi-view',
+            )
+
     async def __call__(self, scope, receive, send):
         if scope["type"] != "http":
             raise ValueError(
                 f'The AsgiHandler can only handle HTTP connections, '
                 f'not {scope["type"]}',
             )
-        self.scope = scope
-        self.send = send
-
+        self.loop_lag.start()
         try:
             body_stream = await self.read_body(receive)
         except RequestAborted:
             return
-        await self.handle(body_stream)
+        if self.threaded:
+            await self.handle_threaded(scope, send, body_stream)
+        else:
+            await self.handle(scope, send, body_stream)
+
+    def get_scope_response(self, scope, body) -> Optional[HttpResponse]:
 
-    async def handle(self, body):
-        script_prefix = self.scope.get("root_path", "") or ""
+        """ Sync part of the request handling. In threaded mode it runs
+            in the worker thread, so thread-local state (script prefix,
+            db connection) belongs to the thread that serves the view """
+
+        script_prefix = scope.get("root_path", "") or ""
         if settings.FORCE_SCRIPT_NAME:
             script_prefix = settings.FORCE_SCRIPT_NAME
         set_script_prefix(script_prefix)
-        signals.request_started.send(sender=self.__class__, scope=self.scope)
+        signals.request_started.send(sender=self.__class__, scope=scope)
         try:
-            request = self.request_class(self.scope, body)
+            request = self.request_class(scope, body)
         except UnicodeDecodeError:
             logger.warning(
                 "Bad Request (UnicodeDecodeError)",
@@ -60,13 +215,136 @@ class AsgiHandler(ChannelsAsgiHandler):
                 status=408,
             )
         except RequestAborted:
-            return
+            return None
         except RequestDataTooBig:
             response = HttpResponse("413 Payload too large", status=413)
         else:
             response = self.get_response(request)
             if isinstance(response, FileResponse):
                 response.block_size = 1024 * 512
+        return response
+
+    async def handle(self, scope, send, body):
+        response = self.get_scope_response(scope, body)
+        if response is None:
+            return
         for response_message in self.encode_response(response):
-            await self.send(response_message)
+            await send(response_message)
         response.close()
+
+    def _get_response_messages(
+        self,
+        scope,
+        body,
+    ) -> Tuple[Optional[HttpResponse], Optional[List[dict]]]:
+
+        """ Returns encoded messages of a regular response.
+            Streaming responses are returned as is and encoded lazily """
+
+        response = self.get_scope_response(scope, body)
+        if response is None or response.streaming:
+            return response, None
+        try:
+            return response, list(self.encode_response(response))
+        finally:
+            response.close()
+
+    async def handle_threaded(self, scope, send, body):
+
+        """ Runs the sync view in the bounded thread pool so the event loop
+            keeps serving websockets and other requests meanwhile.
+            Requests over the pending limit are rejected with 503,
+            requests running longer than the timeout get 504. The worker
+            thread itself can't be cancelled, so it keeps its pending
+            slot until the view really finishes. """
+
+        if self.pending >= self.max_pending:
+            self.rejected_count += 1
+            logger.warning(
+                "Service Unavailable (too many pending requests)",
+                extra={"status_code": 503, "pending": self.pending},
+            )
+            await self._send_plain(send, "503 Service Unavailable", 503)
+            return
+
+        loop = asyncio.get_event_loop()
+        self.pending += 1
+        future = loop.run_in_executor(
+            self._executor,
+            self._get_response_messages,
+            scope,
+            body,
+        )
+        future.add_done_callback(self._release_pending)
+        try:
+            response, messages = await asyncio.wait_for(
+                asyncio.shield(future),
+                timeout=self.request_timeout,
+            )
+        except asyncio.TimeoutError:
+            self.timed_out_count += 1
+            logger.warning(
+                "Gateway Timeout (view took longer than %ss)",
+                self.request_timeout,
+                extra={"status_code": 504, "path": scope.get("path")},
+            )
+            future.add_done_callback(self._close_abandoned)
+            await self._send_plain(send, "504 Gateway Timeout", 504)
+            return
+
+        if response is None:
+            return
+        if messages is None:
+            await self._send_streaming(send, response)
+        else:
+            for response_message in messages:
+                await send(response_message)
+
+    def get_stats(self) -> Dict[str, int]:
+
+        """ Counters since the last call, the pending is the current value """
+
+        stats = {
+            'pending': self.pending,
+            'rejected_count': self.rejected_count,
+            'timed_out_count': self.timed_out_count,
+        }
+        self.rejected_count = 0
+        self.timed_out_count = 0
+        return stats
+
+    def _release_pending(self, future):
+        self.pending -= 1
+
+    def _close_abandoned(self, future):
+        if future.cancelled() or future.exception():
+            return
+        response, messages = future.result()
+        if response is not None and messages is None:
+            self._executor.submit(response.close)
+
+    async def _send_streaming(self, send, response):
+
+        """ Streaming content (files) is read chunk by chunk
+            in the pool, never on the loop """
+
+        loop = asyncio.get_event_loop()
+        iterator: Iterator[dict] = iter(self.encode_response(response))
+        try:
+            while True:
+                message = await loop.run_in_executor(
+                    self._executor,
+                    next,
+                    iterator,
+                    None,
+                )
+                if message is None:
+                    break
+                await send(message)
+        finally:
+            await loop.run_in_executor(self._executor, response.close)
+
+    async def _send_plain(self, send, text: str, status: int):
+        response = HttpResponse(text, status=status)
+        for response_message in self.encode_response(response):
+            await send(response_message)
@@ -69,7 +69,7 @@ class AuthMiddleware(
                 and auth_header_parts[0].lower() == 'bearer'
             ):
                 token = auth_header_parts[1]
-                cached_data = PneumaticToken.data(token)
+                cached_data = PneumaticToken.request_data(request, token)
                 # after logout token cached_data not exist
                 if cached_data and cached_data['for_api_key']:
                     if request.method == 'GET':
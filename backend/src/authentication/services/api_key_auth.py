@@ -24,11 +24,13 @@ class APIKeyAuthentication(TokenAuthentication):
     """
 
     keyword = 'Bearer'
+    request = None
 
     def authenticate(
         self,
         request: Request,
     ) -> Optional[Tuple[User, PneumaticToken]]:
+        self.request = request
         result = super().authenticate(request)
         self._apply_auth_context(request, result)
         return result
@@ -45,7 +47,10 @@ class APIKeyAuthentication(TokenAuthentication):
             return None
 
         # Check cache first for fast authentication
-        cached_data = PneumaticToken.data(key)
+        if self.request is None:
+            cached_data = PneumaticToken.data(key)
+        else:
+            cached_data = PneumaticToken.request_data(self.request, key)
         if cached_data:
             try:
                 user = User.objects.get(pk=cached_data['user_id'])
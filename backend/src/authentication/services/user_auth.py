@@ -47,15 +47,22 @@ class AuthService:
 class PneumaticTokenAuthentication(TokenAuthentication):
 
     keyword = 'Bearer'
+    request = None
 
     def authenticate(
         self,
         request: Request,
     ) -> Optional[Tuple[User, PneumaticToken]]:
+        self.request = request
         result = super().authenticate(request)
         self._apply_auth_context(request, result)
         return result
 
+    def _get_token_data(self, token: str) -> Optional[dict]:
+        if self.request is None:
+            return PneumaticToken.data(token)
+        return PneumaticToken.request_data(self.request, token)
+
     def authenticate_credentials(
         self,
         token: Union[bytes, str],
@@ -63,7 +70,7 @@ class PneumaticTokenAuthentication(TokenAuthentication):
         if isinstance(token, bytes):
             token = token.decode('utf-8')
 
-        cached_data = PneumaticToken.data(token)
+        cached_data = self._get_token_data(token)
         if not cached_data:
             return None
 
@@ -87,7 +94,7 @@ class PneumaticTokenAuthentication(TokenAuthentication):
         request.session['is_authenticated'] = bool(result)
         if result:
             user, token = result
-            cached_data = PneumaticToken.data(token.key)
+            cached_data = self._get_token_data(token.key)
             if cached_data:
                 request.token_type = (
                     AuthTokenType.API
@@ -38,7 +38,7 @@ def test_middleware__user_token_auth__skip(api_client, mocker):
     # assert
     assert response.status_code == 200
     assert not AccountEvent.objects.all().exists()
-    token_data_mock.assert_has_calls([mocker.call(token)] * 3)
+    token_data_mock.assert_called_once_with(token)
 
 
 def test_middleware__api_token_auth__ok(api_client, mocker):
@@ -77,7 +77,7 @@ def test_middleware__api_token_auth__ok(api_client, mocker):
         direction=RequestDirection.RECEIVED,
         http_status=200,
     )
-    token_data_mock.assert_has_calls([mocker.call(token)] * 3)
+    token_data_mock.assert_called_once_with(token)
 
 
 def test_middleware__get_request_with_data__ok(api_client, mocker):
@@ -118,7 +118,7 @@ def test_middleware__get_request_with_data__ok(api_client, mocker):
         direction=RequestDirection.RECEIVED,
         request_data=params,
     )
-    token_data_mock.assert_has_calls([mocker.call(token)] * 3)
+    token_data_mock.assert_called_once_with(token)
 
 
 def test_middleware__get_request_with_query_string__ok(api_client, mocker):
@@ -158,7 +158,7 @@ def test_middleware__get_request_with_query_string__ok(api_client, mocker):
         direction=RequestDirection.RECEIVED,
         request_data={'key_1': 'Value1,Value2', 'key_2': '123'},
     )
-    token_data_mock.assert_has_calls([mocker.call(token)] * 3)
+    token_data_mock.assert_called_once_with(token)
 
 
 def test_middleware__post_request_with_data__ok(api_client, mocker):
@@ -200,7 +200,7 @@ def test_middleware__post_request_with_data__ok(api_client, mocker):
     )
     assert event.request_data == data
     assert event.response_data is None
-    token_data_mock.assert_has_calls([mocker.call(token)] * 3)
+    token_data_mock.assert_called_once_with(token)
 
 
 def test_middleware__head_request__skip(api_client, mocker):
@@ -230,7 +230,7 @@ def test_middleware__head_request__skip(api_client, mocker):
     # assert
     assert response.status_code == 405
     assert not AccountEvent.objects.all().exists()
-    token_data_mock.assert_has_calls([mocker.call(token)] * 2)
+    token_data_mock.assert_called_once_with(token)
 
 
 def test_middleware__options_request__skip(api_client, mocker):
@@ -261,7 +261,7 @@ def test_middleware__options_request__skip(api_client, mocker):
     # assert
     assert response.status_code == 200
     assert not AccountEvent.objects.all().exists()
-    token_data_mock.assert_has_calls([mocker.call(token)] * 2)
+    token_data_mock.assert_called_once_with(token)
 
 
 def test_middleware__disable_log_api_requests__skip(api_client, mocker):
@@ -286,7 +286,7 @@ def test_middleware__disable_log_api_requests__skip(api_client, mocker):
     # assert
     assert response.status_code == 200
     assert not AccountEvent.objects.all().exists()
-    token_data_mock.assert_has_calls([mocker.call(token)] * 2)
+    token_data_mock.assert_called_once_with(token)
 
 
 def test_middleware__bad_request__save_error(api_client, mocker):
@@ -333,4 +333,4 @@ def test_middleware__bad_request__save_error(api_client, mocker):
     assert event.response_data['details']['reason'] == (
         'This field is required.'
     )
-    token_data_mock.assert_has_calls([mocker.call(token)] * 3)
+    token_data_mock.assert_called_once_with(token)
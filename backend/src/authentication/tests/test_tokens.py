@@ -0,0 +1,128 @@
+"""Unit-tests for PneumaticToken data caching."""
+from types import SimpleNamespace
+
+import pytest
+
+from src.authentication.tokens import PneumaticToken
+from src.processes.tests.fixtures import create_test_owner
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def local_cache(settings):
+    settings.AUTH_TOKEN_LOCAL_CACHE_TTL = 60
+    settings.AUTH_TOKEN_LOCAL_CACHE_SIZE = 2
+    PneumaticToken.clear_local_cache()
+    yield
+    PneumaticToken.clear_local_cache()
+
+
+def test_request_data__called_twice__hash_once(mocker):
+
+    # arrange
+    user = create_test_owner()
+    token = PneumaticToken.create(user)
+    request = SimpleNamespace()
+    encrypt_spy = mocker.spy(PneumaticToken, 'encrypt')
+
+    # act
+    PneumaticToken.request_data(request, token)
+    data = PneumaticToken.request_data(request, token)
+
+    # assert
+    assert data['user_id'] == user.id
+    assert encrypt_spy.call_count == 1
+
+
+def test_request_data__not_found__not_memoized(mocker):
+
+    # arrange
+    request = SimpleNamespace()
+    data_mock = mocker.patch(
+        'src.authentication.tokens.PneumaticToken.data',
+        return_value=None,
+    )
+
+    # act
+    PneumaticToken.request_data(request, 'token')
+    PneumaticToken.request_data(request, 'token')
+
+    # assert
+    assert data_mock.call_count == 2
+
+
+def test_data__local_cache__hash_once(mocker, local_cache):
+
+    # arrange
+    user = create_test_owner()
+    token = PneumaticToken.create(user)
+    encrypt_spy = mocker.spy(PneumaticToken, 'encrypt')
+
+    # act
+    PneumaticToken.data(token)
+    data = PneumaticToken.data(token)
+
+    # assert
+    assert data['user_id'] == user.id
+    assert encrypt_spy.call_count == 1
+
+
+def test_data__local_cache_disabled__hash_each_time(mocker, settings):
+
+    # arrange
+    settings.AUTH_TOKEN_LOCAL_CACHE_TTL = 0
+    user = create_test_owner()
+    token = PneumaticToken.create(user)
+    encrypt_spy = mocker.spy(PneumaticToken, 'encrypt')
+
+    # act
+    PneumaticToken.data(token)
+    PneumaticToken.data(token)
+
+    # assert
+    assert encrypt_spy.call_count == 2
+
+
+def test_data__local_cache_size__evict_oldest(local_cache):
+
+    # arrange
+    user = create_test_owner()
+    tokens = [PneumaticToken.create(user) for _ in range(3)]
+
+    # act
+    for token in tokens:
+        PneumaticToken.data(token)
+
+    # assert
+    assert len(PneumaticToken._local_cache) == 2
+    assert PneumaticToken._get_local_data(tokens[0]) is None
+    assert PneumaticToken._get_local_data(tokens[2])['user_id'] == user.id
+
+
+def test_expire_token__local_cache__invalidated(local_cache):
+
+    # arrange
+    user = create_test_owner()
+    token = PneumaticToken.create(user)
+    PneumaticToken.data(token)
+
+    # act
+    PneumaticToken.expire_token(token)
+
+    # assert
+    assert PneumaticToken.data(token) is None
+
+
+def test_expire_all_tokens__local_cache__invalidated(local_cache):
+
+    # arrange
+    user = create_test_owner()
+    token = PneumaticToken.create(user)
+    PneumaticToken.data(token)
+
+    # act
+    PneumaticToken.expire_all_tokens(user)
+
+    # assert
+    assert PneumaticToken.data(token) is None
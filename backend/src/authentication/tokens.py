@@ -1,8 +1,11 @@
 import hashlib
 import secrets
+import time
 from abc import abstractmethod
+from collections import OrderedDict
 from datetime import timedelta
-from typing import Any, Optional
+from threading import Lock
+from typing import Any, Iterable, Optional
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -37,20 +40,103 @@ class PneumaticToken:
     """
 
     cache = caches['auth']
+    # In-process LRU, enabled by AUTH_TOKEN_LOCAL_CACHE_TTL:
+    # sha256(token): (expire_at, encrypted token, cached data)
+    _local_cache = OrderedDict()
+    _local_cache_lock = Lock()
 
     def __init__(self, key: str, user: UserModel):
         self.key = key
         self.user = user
 
+    @staticmethod
+    def _get_local_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @classmethod
+    def _get_local_data(cls, token: str) -> Optional[dict]:
+        if not settings.AUTH_TOKEN_LOCAL_CACHE_TTL:
+            return None
+        key = cls._get_local_key(token)
+        with cls._local_cache_lock:
+            value = cls._local_cache.get(key)
+            if value is None:
+                return None
+            expire_at, _, data = value
+            if expire_at < time.monotonic():
+                del cls._local_cache[key]
+                return None
+            cls._local_cache.move_to_end(key)
+        return data
+
+    @classmethod
+    def _set_local_data(cls, token: str, encrypted_token: str, data: dict):
+        if not settings.AUTH_TOKEN_LOCAL_CACHE_TTL:
+            return
+        key = cls._get_local_key(token)
+        expire_at = time.monotonic() + settings.AUTH_TOKEN_LOCAL_CACHE_TTL
+        with cls._local_cache_lock:
+            cls._local_cache[key] = (expire_at, encrypted_token, data)
+            cls._local_cache.move_to_end(key)
+            while len(cls._local_cache) > settings.AUTH_TOKEN_LOCAL_CACHE_SIZE:
+                cls._local_cache.popitem(last=False)
+
+    @classmethod
+    def clear_local_cache(
+        cls,
+        encrypted_tokens: Optional[Iterable[str]] = None,
+    ):
+
+        """ Drops the given tokens or the whole in-process cache.
+            Other processes drop expired tokens after the TTL """
+
+        with cls._local_cache_lock:
+            if encrypted_tokens is None:
+                cls._local_cache.clear()
+                return
+            encrypted_tokens = set(encrypted_tokens)
+            keys = [
+                key for key, value in cls._local_cache.items()
+                if value[1] in encrypted_tokens
+            ]
+            for key in keys:
+                del cls._local_cache[key]
+
     @classmethod
     def _get_cached_data(cls, token) -> Optional[dict]:
+        data = cls._get_local_data(token)
+        if data is not None:
+            return data
         encrypted_token = cls.encrypt(token)
-        return cls.cache.get(encrypted_token)
+        data = cls.cache.get(encrypted_token)
+        if data:
+            cls._set_local_data(token, encrypted_token, data)
+        return data
 
     @classmethod
     def data(cls, token):
         return cls._get_cached_data(token)
 
+    @classmethod
+    def request_data(cls, request, token: str) -> Optional[dict]:
+
+        """ Token data memoized on the request: authentication,
+            auth context and logging middleware hash the token once.
+            Missing data is not memoized, the API key authentication
+            populates the cache within the same request """
+
+        request = getattr(request, '_request', request)
+        tokens_data = getattr(request, 'auth_tokens_data', None)
+        if tokens_data is None:
+            tokens_data = {}
+            request.auth_tokens_data = tokens_data
+        data = tokens_data.get(token)
+        if data is None:
+            data = cls.data(token)
+            if data:
+                tokens_data[token] = data
+        return data
+
     @classmethod
     def encrypt(cls, token):
         encrypted_token = hashlib.pbkdf2_hmac(
@@ -93,6 +179,7 @@ class PneumaticToken:
 
         cls.set_key_value(encrypted_token, cache_values)
         cls.set_key_value(user.pk, tokens)
+        cls.clear_local_cache([encrypted_token])
         return token
 
     @classmethod
@@ -126,6 +213,7 @@ class PneumaticToken:
     @classmethod
     def expire_token(cls, token: str):
         encrypted_token = cls.encrypt(token)
+        cls.clear_local_cache([encrypted_token])
         user_info = cls.cache.get(encrypted_token)
         if not user_info:
             return
@@ -146,6 +234,7 @@ class PneumaticToken:
             cls.cache.delete(token)
 
         cls.cache.delete(user.pk)
+        cls.clear_local_cache(tokens)
 
     @classmethod
     def set_key_value(cls, key: str, value: Any):
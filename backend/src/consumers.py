@@ -1,5 +1,6 @@
 import contextlib
 import json
+from typing import List
 
 from channels.exceptions import DenyConnection
 from channels.generic.websocket import AsyncWebsocketConsumer
@@ -18,27 +19,34 @@ class PneumaticBaseConsumer(AsyncWebsocketConsumer):
         if self.scope['user'].is_anonymous:
             raise DenyConnection
 
+    def get_group_names(self) -> List[str]:
+
+        """ The user group and the account group for broadcasts """
+
+        user = self.scope['user']
+        return [
+            f'{self.classname}_{user.id}',
+            f'{self.classname}_account_{user.account_id}',
+        ]
+
     async def connect(self):
         await self.validate_connection()
 
-        room_name = self.scope['user'].id
-        room_group_name = f'{self.classname}_{room_name}'
-
-        await self.channel_layer.group_add(
-            room_group_name,
-            self.channel_name,
-        )
+        for group_name in self.get_group_names():
+            await self.channel_layer.group_add(
+                group_name,
+                self.channel_name,
+            )
 
         await self.accept()
 
     async def disconnect(self, code):
         if not self.scope['user'].is_anonymous:
-            room_name = self.scope['user'].id
-            room_group_name = f'{self.classname}_{room_name}'
-            await self.channel_layer.group_discard(
-                room_group_name,
-                self.channel_name,
-            )
+            for group_name in self.get_group_names():
+                await self.channel_layer.group_discard(
+                    group_name,
+                    self.channel_name,
+                )
 
     async def notification(self, event):
         await self.send(
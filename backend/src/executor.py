@@ -1,6 +1,16 @@
+from collections import namedtuple
+from typing import Any, Callable
+
 from django.db import connections
 
 
+class RowFormat:
+
+    DICT = 'dict'
+    TUPLE = 'tuple'
+    NAMEDTUPLE = 'namedtuple'
+
+
 class RawSqlExecutor:
 
     @staticmethod
@@ -25,16 +35,61 @@ class RawSqlExecutor:
             cursor.execute(query, params)
 
     @staticmethod
-    def fetch(query, params, stream=False, fetch_size=300, db='default'):
-        with connections[db].cursor() as cursor:
+    def _get_row_factory(cursor, row_format: str) -> Callable[[tuple], Any]:
+        if row_format == RowFormat.TUPLE:
+            return tuple
+        columns = [col[0] for col in cursor.description]
+        if row_format == RowFormat.NAMEDTUPLE:
+            # Columns are known at runtime only, rename the invalid names
+            row_cls = namedtuple('Row', columns, rename=True)  # noqa: PYI024
+            return row_cls._make
+        return lambda row: dict(zip(columns, row))
+
+    @staticmethod
+    def _get_cursor(db: str, stream: bool, fetch_size: int):
+
+        """ The server-side (named) cursor returns the rows by chunks,
+            the client-side cursor loads the whole result on execute.
+            Out of a transaction the named cursor is declared WITH HOLD,
+            the result is kept by the database server, not the worker """
+
+        connection = connections[db]
+        if (
+            not stream
+            or connection.settings_dict.get('DISABLE_SERVER_SIDE_CURSORS')
+        ):
+            return connection.cursor()
+        cursor = connection.chunked_cursor()
+        cursor.cursor.itersize = fetch_size
+        return cursor
+
+    @staticmethod
+    def fetch(
+        query,
+        params,
+        stream=False,
+        fetch_size=300,
+        db='default',
+        row_format=RowFormat.DICT,
+    ):
+        with RawSqlExecutor._get_cursor(db, stream, fetch_size) as cursor:
             cursor.execute(query, params)
-            columns = [col[0] for col in cursor.description]
             if stream:
+                make_row = None
                 while True:
                     results = cursor.fetchmany(fetch_size)
                     if not results:
                         break
+                    # Server-side cursor gets the description on first fetch
+                    if make_row is None:
+                        make_row = RawSqlExecutor._get_row_factory(
+                            cursor,
+                            row_format,
+                        )
                     for row in results:
-                        yield dict(zip(columns, row))
-            for row in cursor.fetchall():
-                yield dict(zip(columns, row))
+                        yield make_row(row)
+            else:
+                results = cursor.fetchall()
+                make_row = RawSqlExecutor._get_row_factory(cursor, row_format)
+                for row in results:
+                    yield make_row(row)
@@ -0,0 +1,8 @@
+class ThrottleMode:
+
+    # One request per period: the rate "3/min" allows a request
+    # each 20 seconds
+    SPACING = 'spacing'
+    # Bursts up to the rate number of requests,
+    # then one request per period
+    GCRA = 'gcra'
@@ -16,7 +16,9 @@ from src.generics.messages import (
     MSG_GE_0002,
     MSG_GE_0007,
     MSG_GE_0020,
+    MSG_GE_0021,
 )
+from src.generics.paginations import KeysetPaginationMixin
 
 
 class AccountQstMixin:
@@ -188,3 +190,20 @@ class DateFormatField(serializers.ChoiceField):
     def to_representation(self, value):
         value = str(value)
         return UserDateFormat.MAP_TO_API[value]
+
+
+class KeysetCursorField(serializers.CharField):
+
+    """ Opaque keyset pagination cursor, an empty value
+        requests the first page """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('allow_blank', True)
+        super().__init__(**kwargs)
+
+    def run_validation(self, data=empty):
+        value = super().run_validation(data)
+        try:
+            return KeysetPaginationMixin.decode_cursor(value)
+        except ValueError as ex:
+            raise ValidationError(detail=MSG_GE_0021) from ex
@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from src.asgi_handler import get_asgi_metrics
+
+
+class Command(BaseCommand):
+    help = (
+        'Show the event loop lag and the thread pool stats '
+        'of the ASGI processes'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Reset the metrics after reading',
+        )
+
+    def handle(self, *args, **options):
+        metrics = get_asgi_metrics(reset=options['reset'])
+        if not metrics:
+            self.stdout.write('No ASGI metrics collected.')
+            return
+        now = time.time()
+        for process, values in sorted(metrics.items()):
+            self.stdout.write(
+                f'{process}: loop lag {values["last_lag"]:.3f}s '
+                f'(max {values["max_lag"]:.3f}s, '
+                f'slow {values["slow_count"]}), '
+                f'pending {values.get("pending", 0)}, '
+                f'rejected {values.get("rejected_count", 0)}, '
+                f'timed out {values.get("timed_out_count", 0)}, '
+                f'updated {now - values["updated"]:.0f}s ago',
+            )
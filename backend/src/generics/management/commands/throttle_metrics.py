@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from src.generics.throttling import get_throttle_metrics
+
+
+class Command(BaseCommand):
+    help = 'Show the number of checked and throttled requests per scope'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Reset the counters after reading',
+        )
+
+    def handle(self, *args, **options):
+        metrics = get_throttle_metrics(reset=options['reset'])
+        if not metrics:
+            self.stdout.write('No throttle metrics collected.')
+            return
+        for scope, values in sorted(metrics.items()):
+            requests = values['requests']
+            throttled = values['throttled']
+            percent = throttled * 100 / requests if requests else 0
+            self.stdout.write(
+                f'{scope}: requests {requests}, '
+                f'throttled {throttled} ({percent:.1f}%)',
+            )
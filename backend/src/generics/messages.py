@@ -35,3 +35,4 @@ MSG_GE_0019 = _('Dec')
 MSG_GE_0020 = _(
     'An incorrect value has been passed in; a timestamp format is expected.',
 )
+MSG_GE_0021 = _('Invalid cursor.')
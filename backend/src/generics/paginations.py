@@ -1,6 +1,105 @@
+import base64
+import binascii
+import json
+from datetime import date
+from typing import Any, Dict, Optional
+
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class DefaultPagination(LimitOffsetPagination):
     default_limit = 15
     max_limit = 1000
+
+
+class KeysetPaginationMixin:
+
+    """ Cursor pagination for raw list queries built
+        with src.queries.KeysetPaginationMixin
+
+        Enabled by the "cursor" query param (empty for the first
+        page), otherwise the limit/offset pagination is used.
+        The raw queryset should have the "keyset_query" attribute and
+        select "limit + 1" rows to detect the next page without
+        a count. The count is calculated only on "with_count=true"
+        and is set to the queryset "count" attribute. """
+
+    cursor_query_param = 'cursor'
+    keyset_default_limit = DefaultPagination.default_limit
+
+    @staticmethod
+    def encode_cursor(cursor: Dict[str, Any]) -> str:
+
+        def default(value):
+            if isinstance(value, date):
+                return value.isoformat()
+            raise TypeError(type(value))
+
+        data = json.dumps(cursor, default=default, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(value: str) -> Dict[str, Any]:
+
+        """ Raises ValueError for a malformed cursor """
+
+        if not value:
+            return {}
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(value.encode()))
+        except (binascii.Error, UnicodeError) as ex:
+            raise ValueError(value) from ex
+        if not isinstance(cursor, dict):
+            raise ValueError(value)
+        return cursor
+
+    def is_keyset(self, queryset, request) -> bool:
+        return (
+            self.cursor_query_param in request.query_params
+            and hasattr(queryset, 'keyset_query')
+        )
+
+    def get_keyset_limit(self, request) -> int:
+        return self.get_limit(request) or self.keyset_default_limit
+
+    def paginate_keyset(self, queryset, request) -> list:
+        self.keyset = True
+        self.request = request
+        self.limit = self.get_keyset_limit(request)
+        self.count = getattr(queryset, 'count', None)
+        self.next_cursor: Optional[str] = None
+        rows = list(queryset)
+        if len(rows) > self.limit:
+            rows = rows[:self.limit]
+            self.next_cursor = self.encode_cursor(
+                queryset.keyset_query.get_keyset_cursor(rows[-1]),
+            )
+        return rows
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.is_keyset(queryset, request):
+            return self.paginate_keyset(queryset, request)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_next_link(self):
+        if not getattr(self, 'keyset', False):
+            return super().get_next_link()
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.offset_query_param)
+        return replace_query_param(
+            url,
+            self.cursor_query_param,
+            self.next_cursor,
+        )
+
+    def get_previous_link(self):
+        if getattr(self, 'keyset', False):
+            return None
+        return super().get_previous_link()
+
+
+class KeysetPagination(KeysetPaginationMixin, LimitOffsetPagination):
+    pass
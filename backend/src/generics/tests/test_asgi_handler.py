@@ -0,0 +1,256 @@
+import asyncio
+import json
+import time
+
+import pytest
+from django.http import HttpResponse, StreamingHttpResponse
+from django_redis.cache import RedisCache
+
+from src.asgi_handler import (
+    ASGI_METRICS_KEY,
+    AsgiHandler,
+    LoopLagMonitor,
+    get_asgi_metrics,
+    publish_asgi_metrics,
+)
+
+SCOPE = {'type': 'http', 'path': '/workflows'}
+
+
+@pytest.fixture
+def handler(settings):
+    settings.ASGI_THREADED_VIEWS = True
+    settings.ASGI_THREAD_POOL_SIZE = 2
+    settings.ASGI_MAX_PENDING_REQUESTS = 2
+    settings.ASGI_REQUEST_TIMEOUT = 1
+    handler = AsgiHandler()
+    yield handler
+    handler._executor.shutdown(wait=True)
+
+
+class SendMock:
+
+    def __init__(self):
+        self.messages = []
+
+    async def __call__(self, message):
+        self.messages.append(message)
+
+
+@pytest.mark.asyncio
+async def test_handle_threaded__ok(mocker, handler):
+
+    # arrange
+    get_response_mock = mocker.patch.object(
+        handler,
+        'get_scope_response',
+        return_value=HttpResponse('ok'),
+    )
+    send = SendMock()
+
+    # act
+    await handler.handle_threaded(SCOPE, send, b'')
+    await asyncio.sleep(0)
+
+    # assert
+    get_response_mock.assert_called_once_with(SCOPE, b'')
+    assert send.messages[0]['status'] == 200
+    assert send.messages[1]['body'] == b'ok'
+    assert handler.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_handle_threaded__too_many_pending__service_unavailable(
+    mocker,
+    handler,
+):
+
+    # arrange
+    get_response_mock = mocker.patch.object(handler, 'get_scope_response')
+    handler.pending = handler.max_pending
+    send = SendMock()
+
+    # act
+    await handler.handle_threaded(SCOPE, send, b'')
+
+    # assert
+    get_response_mock.assert_not_called()
+    assert send.messages[0]['status'] == 503
+    assert send.messages[1]['body'] == b'503 Service Unavailable'
+    assert handler.pending == handler.max_pending
+    assert handler.get_stats()['rejected_count'] == 1
+
+
+@pytest.mark.asyncio
+async def test_handle_threaded__view_timeout__gateway_timeout(
+    mocker,
+    handler,
+):
+
+    # arrange
+    response = StreamingHttpResponse(iter([b'data']))
+    close_spy = mocker.spy(response, 'close')
+
+    def get_scope_response(scope, body):
+        time.sleep(0.2)
+        return response
+
+    mocker.patch.object(
+        handler,
+        'get_scope_response',
+        side_effect=get_scope_response,
+    )
+    handler.request_timeout = 0.05
+    send = SendMock()
+
+    # act
+    await handler.handle_threaded(SCOPE, send, b'')
+
+    # assert
+    assert send.messages[0]['status'] == 504
+    assert send.messages[1]['body'] == b'504 Gateway Timeout'
+    assert handler.pending == 1
+    assert handler.get_stats()['timed_out_count'] == 1
+    await asyncio.sleep(0.3)
+    handler._executor.shutdown(wait=True)
+    assert handler.pending == 0
+    close_spy.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_handle_threaded__streaming__send_chunks(mocker, handler):
+
+    # arrange
+    response = StreamingHttpResponse(iter([b'first', b'second']))
+    close_spy = mocker.spy(response, 'close')
+    mocker.patch.object(
+        handler,
+        'get_scope_response',
+        return_value=response,
+    )
+    send = SendMock()
+
+    # act
+    await handler.handle_threaded(SCOPE, send, b'')
+
+    # assert
+    assert send.messages[0]['status'] == 200
+    bodies = [message['body'] for message in send.messages[1:]]
+    assert b''.join(bodies) == b'firstsecond'
+    assert send.messages[-1]['more_body'] is False
+    close_spy.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_handle_threaded__aborted__not_send(mocker, handler):
+
+    # arrange
+    mocker.patch.object(handler, 'get_scope_response', return_value=None)
+    send = SendMock()
+
+    # act
+    await handler.handle_threaded(SCOPE, send, b'')
+
+    # assert
+    assert send.messages == []
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor__blocked_loop__slow():
+
+    # arrange
+    monitor = LoopLagMonitor(interval=0.01, threshold=0.05)
+
+    # act
+    task = asyncio.ensure_future(monitor.measure())
+    await asyncio.sleep(0)
+    # a sync view running on the loop
+    time.sleep(0.1)  # noqa: ASYNC251
+    await task
+
+    # assert
+    assert monitor.last_lag >= 0.05
+    assert monitor.max_lag == monitor.last_lag
+    assert monitor.slow_count == 1
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_publish__reset_window(mocker):
+
+    # arrange
+    publish_mock = mocker.patch('src.asgi_handler.publish_asgi_metrics')
+    monitor = LoopLagMonitor(
+        interval=1,
+        threshold=0.5,
+        publish_interval=60,
+        get_stats=lambda: {'pending': 3},
+    )
+    monitor.last_lag = 0.1
+    monitor.max_lag = 0.7
+    monitor.slow_count = 2
+
+    # act
+    await monitor.publish()
+
+    # assert
+    publish_mock.assert_called_once_with(
+        {
+            'last_lag': 0.1,
+            'max_lag': 0.7,
+            'slow_count': 2,
+            'pending': 3,
+        },
+    )
+    assert monitor.max_lag == 0
+    assert monitor.slow_count == 0
+
+
+def test_publish_asgi_metrics__redis_cache__set_process_field(mocker):
+
+    # arrange
+    cache_mock = mocker.Mock(spec=RedisCache)
+    cache_mock.make_key = lambda key: f':1:{key}'
+    client_mock = cache_mock.client.get_client.return_value
+    mocker.patch('src.asgi_handler.caches', {'default': cache_mock})
+    mocker.patch('src.asgi_handler.socket.gethostname', return_value='web')
+    mocker.patch('src.asgi_handler.os.getpid', return_value=7)
+
+    # act
+    publish_asgi_metrics({'max_lag': 0.7})
+
+    # assert
+    key, field, value = client_mock.hset.call_args[0]
+    assert key == f':1:{ASGI_METRICS_KEY}'
+    assert field == 'web:7'
+    assert json.loads(value)['max_lag'] == 0.7
+
+
+def test_get_asgi_metrics__redis_cache__ok(mocker):
+
+    # arrange
+    cache_mock = mocker.Mock(spec=RedisCache)
+    cache_mock.make_key = lambda key: f':1:{key}'
+    pipe_mock = mocker.Mock()
+    pipe_mock.execute.return_value = [
+        {b'web:7': b'{"max_lag": 0.7}'},
+        1,
+    ]
+    client_mock = cache_mock.client.get_client.return_value
+    client_mock.pipeline.return_value = pipe_mock
+    mocker.patch('src.asgi_handler.caches', {'default': cache_mock})
+
+    # act
+    result = get_asgi_metrics(reset=True)
+
+    # assert
+    assert result == {'web:7': {'max_lag': 0.7}}
+    pipe_mock.delete.assert_called_once_with(f':1:{ASGI_METRICS_KEY}')
+
+
+def test_get_asgi_metrics__locmem_cache__empty():
+
+    # act
+    result = get_asgi_metrics()
+
+    # assert
+    assert result == {}
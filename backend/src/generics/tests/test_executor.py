@@ -0,0 +1,122 @@
+import pytest
+
+from src.executor import RawSqlExecutor, RowFormat
+
+pytestmark = pytest.mark.django_db
+
+QUERY = (
+    'SELECT n AS number, n * 2 AS doubled '
+    'FROM generate_series(1, %(count)s) AS n'
+)
+
+
+@pytest.mark.parametrize('stream', (True, False))
+def test_fetch__dict__ok(stream):
+
+    # act
+    rows = list(
+        RawSqlExecutor.fetch(
+            QUERY,
+            {'count': 5},
+            stream=stream,
+            fetch_size=2,
+        ),
+    )
+
+    # assert
+    assert len(rows) == 5
+    assert rows[0] == {'number': 1, 'doubled': 2}
+    assert rows[4] == {'number': 5, 'doubled': 10}
+
+
+def test_fetch__stream__server_side_cursor(mocker):
+
+    # arrange
+    get_cursor_spy = mocker.spy(
+        RawSqlExecutor,
+        '_get_cursor',
+    )
+
+    # act
+    rows = list(
+        RawSqlExecutor.fetch(
+            QUERY,
+            {'count': 3},
+            stream=True,
+            fetch_size=2,
+        ),
+    )
+
+    # assert
+    assert len(rows) == 3
+    cursor = get_cursor_spy.spy_return
+    assert cursor.cursor.name
+    assert cursor.cursor.itersize == 2
+
+
+def test_fetch__not_stream__client_side_cursor(mocker):
+
+    # arrange
+    get_cursor_spy = mocker.spy(
+        RawSqlExecutor,
+        '_get_cursor',
+    )
+
+    # act
+    list(RawSqlExecutor.fetch(QUERY, {'count': 3}))
+
+    # assert
+    cursor = get_cursor_spy.spy_return
+    assert cursor.cursor.name is None
+
+
+def test_fetch__stream_tuple__ok():
+
+    # act
+    rows = list(
+        RawSqlExecutor.fetch(
+            QUERY,
+            {'count': 3},
+            stream=True,
+            fetch_size=2,
+            row_format=RowFormat.TUPLE,
+        ),
+    )
+
+    # assert
+    assert rows == [(1, 2), (2, 4), (3, 6)]
+
+
+def test_fetch__stream_namedtuple__ok():
+
+    # act
+    rows = list(
+        RawSqlExecutor.fetch(
+            QUERY,
+            {'count': 3},
+            stream=True,
+            fetch_size=2,
+            row_format=RowFormat.NAMEDTUPLE,
+        ),
+    )
+
+    # assert
+    assert len(rows) == 3
+    assert rows[2].number == 3
+    assert rows[2].doubled == 6
+
+
+def test_fetch__stream_empty_result__ok():
+
+    # act
+    rows = list(
+        RawSqlExecutor.fetch(
+            QUERY,
+            {'count': 0},
+            stream=True,
+            row_format=RowFormat.NAMEDTUPLE,
+        ),
+    )
+
+    # assert
+    assert rows == []
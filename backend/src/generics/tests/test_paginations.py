@@ -0,0 +1,47 @@
+from datetime import datetime
+
+import pytest
+import pytz
+
+from src.generics.paginations import KeysetPaginationMixin
+
+
+def test_encode_cursor__decode__ok():
+
+    # arrange
+    cursor = {
+        'date_created': datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=pytz.UTC),
+        'nearest_due_date': None,
+        'is_urgent': True,
+        'id': 5,
+    }
+
+    # act
+    result = KeysetPaginationMixin.decode_cursor(
+        KeysetPaginationMixin.encode_cursor(cursor),
+    )
+
+    # assert
+    assert result == {
+        'date_created': '2024-01-02T03:04:05.123456+00:00',
+        'nearest_due_date': None,
+        'is_urgent': True,
+        'id': 5,
+    }
+
+
+def test_decode_cursor__empty__first_page():
+
+    # act
+    result = KeysetPaginationMixin.decode_cursor('')
+
+    # assert
+    assert result == {}
+
+
+@pytest.mark.parametrize('value', ['invalid', 'WzFd', 'bm90IGpzb24='])
+def test_decode_cursor__malformed__raise_exception(value):
+
+    # act
+    with pytest.raises(ValueError):
+        KeysetPaginationMixin.decode_cursor(value)
@@ -0,0 +1,114 @@
+from typing import List, Tuple
+
+import pytest
+from rest_framework.exceptions import ValidationError
+
+from src.queries import KeysetPaginationMixin
+
+
+class KeysetQuery(KeysetPaginationMixin):
+
+    keyset_alias = 'rows'
+    keyset_nullable = frozenset({'due_date'})
+
+    def __init__(self, cursor, columns: List[Tuple[str, bool]]):
+        self.params = {}
+        self.columns = columns
+        self._set_keyset_cursor(cursor)
+
+    def get_keyset_columns(self) -> List[Tuple[str, bool]]:
+        return self.columns
+
+
+def test_get_keyset_where__search_rank__cast_to_real():
+
+    # arrange
+    query = KeysetQuery(
+        cursor={'search_rank': 0.0607927, 'id': 5},
+        columns=[('search_rank', True), ('id', True)],
+    )
+
+    # act
+    result = query.get_keyset_where()
+
+    # assert
+    assert result == (
+        'WHERE (rows.search_rank < CAST(%(keyset_0)s AS real)) '
+        'OR (rows.search_rank = CAST(%(keyset_0)s AS real) '
+        'AND rows.id < %(keyset_1)s)'
+    )
+    assert query.params == {'keyset_0': '0.0607927', 'keyset_1': 5}
+
+
+def test_get_keyset_where__nullable_none__infinity():
+
+    # arrange
+    query = KeysetQuery(
+        cursor={'due_date': None, 'id': 5},
+        columns=[('due_date', False), ('id', False)],
+    )
+
+    # act
+    query.get_keyset_where()
+
+    # assert
+    assert query.params == {'keyset_0': 'infinity', 'keyset_1': 5}
+
+
+def test_set_keyset_cursor__other_ordering__first_page():
+
+    # act
+    query = KeysetQuery(
+        cursor={'date_created': '2024-01-02T03:04:05+00:00', 'id': 5},
+        columns=[('due_date', False), ('id', False)],
+    )
+
+    # assert
+    assert query.is_keyset is True
+    assert query.keyset_values is None
+
+
+@pytest.mark.parametrize(
+    ('field', 'value'),
+    [
+        ('id', 'abc'),
+        ('id', True),
+        ('id', 2 ** 63),
+        ('id', None),
+        ('search_rank', '0.5'),
+        ('search_rank', {'value': 1}),
+        ('is_urgent', 1),
+        ('date_created', 'abc'),
+        ('date_created', '2024-13-02T03:04:05'),
+        ('date_created', ['2024-01-02T03:04:05']),
+        ('name', 5),
+        ('name', 'a\x00b'),
+        ('unknown', 'abc'),
+    ],
+)
+def test_set_keyset_cursor__invalid_value__raise_exception(field, value):
+
+    # act
+    with pytest.raises(ValidationError):
+        KeysetQuery(cursor={field: value}, columns=[(field, True)])
+
+
+@pytest.mark.parametrize(
+    ('field', 'value'),
+    [
+        ('id', 5),
+        ('search_rank', 0),
+        ('search_rank', 0.5),
+        ('is_urgent', False),
+        ('date_created', '2024-01-02T03:04:05.123456+00:00'),
+        ('due_date', None),
+        ('name', 'Template'),
+    ],
+)
+def test_set_keyset_cursor__valid_value__ok(field, value):
+
+    # act
+    query = KeysetQuery(cursor={field: value}, columns=[(field, True)])
+
+    # assert
+    assert query.keyset_values == [value]
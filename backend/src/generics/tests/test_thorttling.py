@@ -1,11 +1,16 @@
 import pytest
+from django.core.cache.backends.locmem import LocMemCache
+from django_redis.cache import RedisCache
 
 from src.authentication.enums import AuthTokenType
+from src.generics.enums import ThrottleMode
 from src.generics.throttling import (
+    THROTTLE_METRICS_KEY,
     AnonThrottle,
     ApiKeyThrottle,
     CustomSimpleRateThrottle,
     TokenThrottle,
+    get_throttle_metrics,
 )
 
 pytestmark = pytest.mark.django_db
@@ -433,6 +438,299 @@ class TestCustomSimpleRateThrottle:
         # assert
         assert result is None
 
+    def test_get_burst__spacing_mode__one(self, mocker):
+
+        # arrange
+        mocker.patch.object(
+            CustomSimpleRateThrottle,
+            attribute='__init__',
+            return_value=None,
+        )
+        service = CustomSimpleRateThrottle()
+        service.rate = '3/min'
+
+        # act
+        result = service._get_burst()
+
+        # assert
+        assert result == 1
+
+    def test_get_burst__gcra_mode__num_requests(self, mocker):
+
+        # arrange
+        mocker.patch.object(
+            CustomSimpleRateThrottle,
+            attribute='__init__',
+            return_value=None,
+        )
+        service = CustomSimpleRateThrottle()
+        service.mode = ThrottleMode.GCRA
+        service.rate = '3/min'
+
+        # act
+        result = service._get_burst()
+
+        # assert
+        assert result == 3
+
+    def test_private_allow_request__gcra_mode__burst_allowed(self, mocker):
+
+        # arrange
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.get_cache_key',
+            return_value='key',
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.get_rate',
+            return_value='3/min',
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.timer',
+            return_value=1639048599.0,
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.cache',
+            LocMemCache('throttling', {}),
+        )
+        request = mocker.Mock()
+        service = CustomSimpleRateThrottle()
+        service.mode = ThrottleMode.GCRA
+
+        # act
+        results = [service._allow_request(request) for _ in range(4)]
+
+        # assert
+        assert results == [True, True, True, False]
+        assert service.need_wait is True
+        assert service.wait_time == 20
+
+    def test_allow_request__redis_cache__atomic(self, mocker):
+
+        # arrange
+        mocker.patch.object(
+            CustomSimpleRateThrottle,
+            attribute='__init__',
+            return_value=None,
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.skip_condition',
+            return_value=False,
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '._is_atomic',
+            return_value=True,
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.get_rate',
+            return_value='3/min',
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.get_cache_key',
+            return_value='key',
+        )
+        check_view_throttles_mock = mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '._check_view_throttles',
+            return_value={'key': 0},
+        )
+        allow_request_mock = mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '._allow_request',
+        )
+        request = mocker.Mock(spec=['user'])
+        view = mocker.Mock()
+
+        # act
+        result_1 = CustomSimpleRateThrottle().allow_request(request, view)
+        result_2 = CustomSimpleRateThrottle().allow_request(request, view)
+
+        # assert
+        assert result_1 is True
+        assert result_2 is True
+        check_view_throttles_mock.assert_called_once_with(request, view)
+        allow_request_mock.assert_not_called()
+
+    def test_allow_request__redis_cache_need_wait__disallow(self, mocker):
+
+        # arrange
+        mocker.patch.object(
+            CustomSimpleRateThrottle,
+            attribute='__init__',
+            return_value=None,
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.skip_condition',
+            return_value=False,
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '._is_atomic',
+            return_value=True,
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.get_rate',
+            return_value='3/min',
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.get_cache_key',
+            return_value='key',
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '._check_view_throttles',
+            return_value={'key': 2.5},
+        )
+        throttle_failure_mock = mocker.patch(
+            'rest_framework.throttling.SimpleRateThrottle'
+            '.throttle_failure',
+            return_value=False,
+        )
+        request = mocker.Mock(spec=['user'])
+        view = mocker.Mock()
+        service = CustomSimpleRateThrottle()
+
+        # act
+        result = service.allow_request(request, view)
+
+        # assert
+        assert result is False
+        throttle_failure_mock.assert_called_once()
+        assert service.wait() == 2.5
+
+    def test_check_view_throttles__one_script_call(self, mocker):
+
+        # arrange
+        client_mock = mocker.Mock()
+        script_mock = mocker.Mock(return_value=[0, 1500])
+        client_mock.register_script = mocker.Mock(return_value=script_mock)
+        cache_mock = mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.cache',
+        )
+        cache_mock.client.get_client.return_value = client_mock
+        cache_mock.make_key = lambda key: f':1:{key}'
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '._gcra_script',
+            None,
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.THROTTLE_RATES',
+            {'scope_1': '3/min', 'scope_2': '1/s'},
+        )
+        throttle_1 = CustomSimpleRateThrottle()
+        throttle_1.scope = 'scope_1'
+        throttle_1.mode = ThrottleMode.GCRA
+        throttle_2 = CustomSimpleRateThrottle()
+        throttle_2.scope = 'scope_2'
+        skipped_throttle = CustomSimpleRateThrottle()
+        skipped_throttle.scope = 'skipped'
+        view = mocker.Mock()
+        view.get_throttles.return_value = [
+            throttle_1,
+            throttle_2,
+            skipped_throttle,
+        ]
+        request = mocker.Mock()
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.get_ident',
+            return_value='1',
+        )
+        throttle_1.rate = throttle_1.get_rate()
+        throttle_1.period = throttle_1._get_period()
+        throttle_1.key = throttle_1.get_cache_key(request)
+
+        # act
+        result = throttle_1._check_view_throttles(request, view)
+
+        # assert
+        assert result == {
+            'throttle_scope_1_1': 0,
+            'throttle_scope_2_1': 1.5,
+        }
+        client_mock.register_script.assert_called_once()
+        script_mock.assert_called_once_with(
+            keys=[
+                ':1:gcra:throttle_scope_1_1',
+                ':1:gcra:throttle_scope_2_1',
+                f':1:{THROTTLE_METRICS_KEY}',
+            ],
+            args=[20000, 3, 'scope_1', 1000, 1, 'scope_2'],
+            client=client_mock,
+        )
+
+    def test_is_atomic__default_locmem_cache__false(self):
+
+        # arrange
+        service = CustomSimpleRateThrottle()
+
+        # act
+        result = service._is_atomic()
+
+        # assert
+        assert result is False
+
+    def test_is_atomic__default_redis_cache__true(self, mocker):
+
+        # arrange
+        mocker.patch(
+            'src.generics.throttling.caches',
+            {'default': RedisCache('redis://localhost:6379/0', {})},
+        )
+        service = CustomSimpleRateThrottle()
+
+        # act
+        result = service._is_atomic()
+
+        # assert
+        assert result is True
+
+    def test_allow_request__default_redis_cache__atomic(self, mocker):
+
+        # arrange
+        mocker.patch(
+            'src.generics.throttling.caches',
+            {'default': RedisCache('redis://localhost:6379/0', {})},
+        )
+        mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.skip_condition',
+            return_value=False,
+        )
+        allow_request_atomic_mock = mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '._allow_request_atomic',
+            return_value=True,
+        )
+        allow_request_mock = mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '._allow_request',
+        )
+        request = mocker.Mock()
+        view = mocker.Mock()
+        service = CustomSimpleRateThrottle()
+
+        # act
+        result = service.allow_request(request, view)
+
+        # assert
+        assert result is True
+        allow_request_atomic_mock.assert_called_once_with(request, view)
+        allow_request_mock.assert_not_called()
+
 
 class TestAnonThrottle:
 
@@ -789,3 +1087,41 @@ class TestApiKeyThrottle:
 
         # assert
         assert result == token
+
+
+class TestGetThrottleMetrics:
+
+    def test_get_throttle_metrics__redis_cache__ok(self, mocker):
+
+        # arrange
+        cache_mock = mocker.Mock(spec=RedisCache)
+        cache_mock.make_key = lambda key: f':1:{key}'
+        pipe_mock = mocker.Mock()
+        pipe_mock.execute.return_value = [
+            {b'scope_1:requests': b'10', b'scope_1:throttled': b'2'},
+            1,
+        ]
+        client_mock = cache_mock.client.get_client.return_value
+        client_mock.pipeline.return_value = pipe_mock
+        mocker.patch(
+            'src.generics.throttling.caches',
+            {'default': cache_mock},
+        )
+
+        # act
+        result = get_throttle_metrics(reset=True)
+
+        # assert
+        assert result == {'scope_1': {'requests': 10, 'throttled': 2}}
+        pipe_mock.hgetall.assert_called_once_with(f':1:{THROTTLE_METRICS_KEY}')
+        pipe_mock.delete.assert_called_once_with(
+            f':1:{THROTTLE_METRICS_KEY}',
+        )
+
+    def test_get_throttle_metrics__locmem_cache__empty(self):
+
+        # act
+        result = get_throttle_metrics()
+
+        # assert
+        assert result == {}
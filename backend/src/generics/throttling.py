@@ -1,9 +1,52 @@
-from typing import Optional
+from typing import Dict, Optional
 
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache import cache as default_cache
 from django.core.exceptions import ImproperlyConfigured
+from django_redis.cache import RedisCache
 from rest_framework.throttling import SimpleRateThrottle
 
 from src.authentication.enums import AuthTokenType
+from src.generics.enums import ThrottleMode
+
+THROTTLE_METRICS_KEY = 'throttle:metrics'
+
+# Checks all the throttle keys of a request in one call.
+# KEYS: the throttle keys followed by the metrics hash key.
+# ARGV: "interval in ms, burst, scope" for each throttle key.
+# The theoretical arrival times are written only when every key
+# allows the request, so a throttled request consumes nothing.
+# Returns the wait in ms for each throttle key, 0 if allowed.
+GCRA_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local metrics_key = KEYS[#KEYS]
+local allowed = true
+local waits = {}
+local tats = {}
+for i = 1, #KEYS - 1 do
+    local interval = tonumber(ARGV[i * 3 - 2])
+    local burst = tonumber(ARGV[i * 3 - 1])
+    local scope = ARGV[i * 3]
+    local tat = tonumber(redis.call('GET', KEYS[i])) or now
+    if tat < now then
+        tat = now
+    end
+    tats[i] = tat + interval
+    waits[i] = math.max(tats[i] - interval * burst - now, 0)
+    redis.call('HINCRBY', metrics_key, scope .. ':requests', 1)
+    if waits[i] > 0 then
+        allowed = false
+        redis.call('HINCRBY', metrics_key, scope .. ':throttled', 1)
+    end
+end
+if allowed then
+    for i = 1, #KEYS - 1 do
+        redis.call('SET', KEYS[i], tats[i], 'PX', tats[i] - now)
+    end
+end
+return waits
+"""
 
 
 class CustomSimpleRateThrottle(SimpleRateThrottle):
@@ -15,7 +58,13 @@ class CustomSimpleRateThrottle(SimpleRateThrottle):
     as 'create' and 'retrieve'
 
     * Unlike the drf throttling implementation, it counts the speed,
-        not the number of request at a time """
+        not the number of request at a time
+
+    * With the Redis cache all the throttles of the view are checked
+        atomically in one call, see GCRA_SCRIPT """
+
+    mode = ThrottleMode.SPACING
+    _gcra_script = None
 
     def __init__(self):
         self.need_wait = False
@@ -55,10 +104,33 @@ class CustomSimpleRateThrottle(SimpleRateThrottle):
         num_requests, duration = self.parse_rate(self.rate)
         return duration / num_requests
 
+    def _get_burst(self) -> int:
+
+        """ Returns the number of requests allowed without spacing """
+
+        if self.mode == ThrottleMode.GCRA:
+            num_requests, _ = self.parse_rate(self.rate)
+            return num_requests
+        return 1
+
+    def _get_cache_backend(self):
+
+        """ The default cache is a proxy to the backend of the thread,
+            the backend itself is needed to tell its type """
+
+        if self.cache is default_cache:
+            return caches[DEFAULT_CACHE_ALIAS]
+        return self.cache
+
+    def _is_atomic(self) -> bool:
+        return isinstance(self._get_cache_backend(), RedisCache)
+
     def _allow_request(self, request) -> bool:
 
         """ Returns 'False' if request should be throttled """
 
+        if self.mode == ThrottleMode.GCRA:
+            return self._allow_request_gcra(request)
         self.rate = self.get_rate()
         self.period = self._get_period()
         self.key = self.get_cache_key(request)
@@ -75,12 +147,92 @@ class CustomSimpleRateThrottle(SimpleRateThrottle):
             return self.throttle_failure()
         return self.throttle_success()
 
+    def _allow_request_gcra(self, request) -> bool:
+
+        """ Non-atomic GCRA check for the caches other than Redis """
+
+        self.rate = self.get_rate()
+        self.period = self._get_period()
+        self.key = self.get_cache_key(request)
+        self.current_request_time = self.timer()
+        tat = max(
+            self.cache.get(self.key, self.current_request_time),
+            self.current_request_time,
+        ) + self.period
+        self.wait_time = (
+            tat - self.period * self._get_burst() - self.current_request_time
+        )
+        self.need_wait = self.wait_time > 0
+        if self.need_wait:
+            return self.throttle_failure()
+        self.cache.set(self.key, tat, tat - self.current_request_time)
+        return True
+
+    def _check_view_throttles(self, request, view) -> Dict[str, float]:
+
+        """ Checks all not skipped throttles of the view in one Redis call
+            Returns the wait in seconds for each throttle cache key """
+
+        throttles = {self.key: self}
+        for throttle in view.get_throttles():
+            if (
+                not isinstance(throttle, CustomSimpleRateThrottle)
+                or throttle.cache is not self.cache
+                or throttle.skip_condition(request)
+            ):
+                continue
+            throttle.rate = throttle.get_rate()
+            throttle.period = throttle._get_period()
+            throttles.setdefault(throttle.get_cache_key(request), throttle)
+
+        cache = self._get_cache_backend()
+        keys = [cache.make_key(f'gcra:{key}') for key in throttles]
+        keys.append(cache.make_key(THROTTLE_METRICS_KEY))
+        args = []
+        for throttle in throttles.values():
+            args.extend((
+                max(round(throttle.period * 1000), 1),
+                throttle._get_burst(),
+                throttle.scope,
+            ))
+        client = cache.client.get_client(write=True)
+        if CustomSimpleRateThrottle._gcra_script is None:
+            CustomSimpleRateThrottle._gcra_script = client.register_script(
+                GCRA_SCRIPT,
+            )
+        waits = self._gcra_script(keys=keys, args=args, client=client)
+        return {
+            key: wait / 1000
+            for key, wait in zip(throttles, waits)
+        }
+
+    def _allow_request_atomic(self, request, view) -> bool:
+
+        """ Returns 'False' if request should be throttled
+            The first throttle of the view checks all others,
+            the rest take the result saved in the request """
+
+        self.rate = self.get_rate()
+        self.period = self._get_period()
+        self.key = self.get_cache_key(request)
+        waits = getattr(request, '_throttle_waits', None)
+        if waits is None or self.key not in waits:
+            waits = self._check_view_throttles(request, view)
+            request._throttle_waits = waits
+        self.wait_time = waits[self.key]
+        self.need_wait = self.wait_time > 0
+        if self.need_wait:
+            return self.throttle_failure()
+        return True
+
     def allow_request(self, request, view) -> bool:
 
         """ Returns 'False' if request should be throttled """
 
         if self.skip_condition(request):
             return True
+        if self._is_atomic():
+            return self._allow_request_atomic(request, view)
         return self._allow_request(request)
 
     def wait(self) -> Optional[int]:
@@ -147,3 +299,29 @@ class ApiKeyThrottle(BaseAuthThrottle):
         if super().skip_condition(request):
             return True
         return request.token_type != AuthTokenType.API
+
+
+def get_throttle_metrics(reset: bool = False) -> Dict[str, Dict[str, int]]:
+
+    """ Returns the number of checked and throttled requests per scope
+        Metrics are collected only with the Redis cache """
+
+    cache = caches[DEFAULT_CACHE_ALIAS]
+    if not isinstance(cache, RedisCache):
+        return {}
+    client = cache.client.get_client(write=True)
+    key = cache.make_key(THROTTLE_METRICS_KEY)
+    pipe = client.pipeline()
+    pipe.hgetall(key)
+    if reset:
+        pipe.delete(key)
+    values = pipe.execute()[0]
+    metrics = {}
+    for field, value in values.items():
+        scope, name = field.decode().rsplit(':', 1)
+        scope_metrics = metrics.setdefault(
+            scope,
+            {'requests': 0, 'throttled': 0},
+        )
+        scope_metrics[name] = int(value)
+    return metrics
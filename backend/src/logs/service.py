@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from django.contrib.auth import get_user_model
 
@@ -158,6 +158,19 @@ class AccountLogService(BaseModelService):
             user_id=user_id,
         )
 
+    def webhooks(self, events: List[dict]):
+
+        """ Inserts the log of many webhook() calls in one query """
+
+        AccountEvent.objects.bulk_create(
+            AccountEvent(
+                event_type=AccountEventType.WEBHOOK,
+                direction=RequestDirection.SENT,
+                **event,
+            )
+            for event in events
+        )
+
     def contacts_request(
         self,
         user: UserModel,
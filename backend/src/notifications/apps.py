@@ -1,6 +1,27 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class NotificationsConfig(AppConfig):
     name = 'src.notifications'
     verbose_name = 'Notifications'
+
+    def ready(self):
+        from src.notifications.clients.cache import (  # noqa: PLC0415
+            EmailTemplateCache,
+        )
+        from src.notifications.models import (  # noqa: PLC0415
+            EmailTemplateModel,
+        )
+
+        # Compiled templates of the account are outdated
+        post_save.connect(
+            EmailTemplateCache.on_template_change,
+            sender=EmailTemplateModel,
+            dispatch_uid='email_template_cache_save',
+        )
+        post_delete.connect(
+            EmailTemplateCache.on_template_change,
+            sender=EmailTemplateModel,
+            dispatch_uid='email_template_cache_delete',
+        )
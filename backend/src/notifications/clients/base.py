@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 
 class EmailClient(ABC):
@@ -16,3 +16,10 @@ class EmailClient(ABC):
         user_id: int,
     ) -> None:
         pass
+
+    def send_many(self, messages: Iterable[Dict[str, Any]]) -> None:
+
+        """ Each message is a dict with the send_email arguments """
+
+        for message in messages:
+            self.send_email(**message)
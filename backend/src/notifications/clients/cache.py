@@ -0,0 +1,67 @@
+from threading import Lock
+from uuid import uuid4
+from typing import Dict, Optional, Tuple
+
+from django.template import Template
+
+from src.generics.mixins.services import ClsCacheMixin
+from src.notifications.enums import EmailType
+from src.notifications.models import EmailTemplateModel
+
+
+class EmailTemplateCache(ClsCacheMixin):
+
+    """ Compiled account email templates are kept in the process memory.
+        The account version in the shared cache is changed
+        on EmailTemplateModel save/delete and invalidates
+        the compiled templates in all the workers """
+
+    cache_key_prefix = 'email_templates_version'
+    _lock = Lock()
+    # (account_id, email_type): (version, (subject, content) or None)
+    _templates: Dict[
+        Tuple[int, str],
+        Tuple[Optional[str], Optional[Tuple[Template, Template]]],
+    ] = {}
+
+    @classmethod
+    def get(
+        cls,
+        account_id: int,
+        email_type: EmailType.LITERALS,
+    ) -> Optional[Tuple[Template, Template]]:
+
+        """ Returns the compiled subject and content templates
+            or None if the account has no active template for the type """
+
+        version = cls._get_cache(key=account_id)
+        key = (account_id, email_type)
+        cached = cls._templates.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        template = EmailTemplateModel.objects.filter(
+            account_id=account_id,
+            email_types__contains=[email_type],
+            is_active=True,
+        ).first()
+        compiled = (
+            (Template(template.subject), Template(template.content))
+            if template else None
+        )
+        with cls._lock:
+            cls._templates[key] = (version, compiled)
+        return compiled
+
+    @classmethod
+    def invalidate(cls, account_id: int):
+        cls._set_cache(key=account_id, value=uuid4().hex)
+
+    @classmethod
+    def on_template_change(cls, instance: EmailTemplateModel, **kwargs):
+        cls.invalidate(instance.account_id)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._templates.clear()
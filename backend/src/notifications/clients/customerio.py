@@ -1,3 +1,4 @@
+from threading import Lock
 from typing import Any, Dict
 
 from customerio import APIClient, SendEmailRequest
@@ -9,9 +10,29 @@ from src.notifications.enums import cio_template_ids
 
 class CustomerIOEmailClient(EmailClient):
 
+    # One API client per worker process keeps the HTTP session alive
+    _clients: Dict[str, APIClient] = {}
+    _clients_lock = Lock()
+
     def __init__(self, account_id: int):
         super().__init__(account_id)
-        self.client = APIClient(settings.CUSTOMERIO_TRANSACTIONAL_API_KEY)
+        self.client = self.get_api_client(
+            settings.CUSTOMERIO_TRANSACTIONAL_API_KEY,
+        )
+
+    @classmethod
+    def get_api_client(cls, api_key: str) -> APIClient:
+        with cls._clients_lock:
+            client = cls._clients.get(api_key)
+            if client is None:
+                client = APIClient(api_key)
+                cls._clients[api_key] = client
+            return client
+
+    @classmethod
+    def clear_api_clients(cls):
+        with cls._clients_lock:
+            cls._clients.clear()
 
     def send_email(
         self,
@@ -1,13 +1,17 @@
-from typing import Any, Dict, Tuple
+import smtplib
+from contextlib import suppress
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Tuple
 
 from django.conf import settings
 from django.core.mail import EmailMessage, get_connection
-from django.template import Context, Template
+from django.core.mail.backends.base import BaseEmailBackend
+from django.template import Context
 from django.template.loader import get_template
 
 from src.notifications.clients import EmailClient
+from src.notifications.clients.cache import EmailTemplateCache
 from src.notifications.enums import EmailType
-from src.notifications.models import EmailTemplateModel
 
 
 class SMTPEmailClient(EmailClient):
@@ -36,38 +40,57 @@ class SMTPEmailClient(EmailClient):
         EmailType.VACATION_DELEGATION: DEFAULT_TEMPLATE_AUTH,
     }
 
-    def __init__(self, account_id: int):
-        super().__init__(account_id)
-        self.connection = get_connection(fail_silently=False)
-
-    def __del__(self):
-        """Close connection when instance is destroyed."""
-        if hasattr(self, 'connection') and self.connection:
-            self.connection.close()
-
-    def send_email(
+    # One SMTP session per worker process instead of a session per email
+    _connection = None
+    _connection_lock = Lock()
+
+    @classmethod
+    def get_connection(cls) -> BaseEmailBackend:
+        with cls._connection_lock:
+            if cls._connection is None:
+                connection = get_connection(fail_silently=False)
+                # An opened connection is not closed after send_messages
+                connection.open()
+                cls._connection = connection
+            return cls._connection
+
+    @classmethod
+    def close_connection(cls):
+        with cls._connection_lock:
+            connection, cls._connection = cls._connection, None
+        if connection is not None:
+            with suppress(smtplib.SMTPException, OSError):
+                connection.close()
+
+    def _send_messages(self, emails: List[EmailMessage]):
+
+        """ Messages are sent one by one over the opened session,
+            so after a reconnect only the unsent ones are sent again """
+
+        connection = self.get_connection()
+        for i, email in enumerate(emails):
+            try:
+                connection.send_messages([email])
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                # The server closes an idle session, reconnect once
+                self.close_connection()
+                self.get_connection().send_messages(emails[i:])
+                return
+
+    def _get_message(
         self,
         to: str,
         template_code: EmailType.LITERALS,
         message_data: Dict[str, Any],
-        user_id: int,
-    ) -> None:
-        # Find template that includes this template_code in email_types
-        template = EmailTemplateModel.objects.filter(
+    ) -> EmailMessage:
+        templates = EmailTemplateCache.get(
             account_id=self.account_id,
-            email_types__contains=[template_code],
-            is_active=True,
-        ).first()
-
-        if template:
-            subject = self._render_template_string(
-                template.subject,
-                message_data,
-            )
-            html_content = self._render_template_string(
-                template.content,
-                message_data,
-            )
+            email_type=template_code,
+        )
+        if templates:
+            subject_template, content_template = templates
+            subject = subject_template.render(Context(message_data))
+            html_content = content_template.render(Context(message_data))
         else:
             subject, html_content = self._get_default_template(
                 template_code,
@@ -80,18 +103,39 @@ class SMTPEmailClient(EmailClient):
             body=html_content,
             from_email=settings.DEFAULT_FROM_EMAIL,
             to=[to],
-            connection=self.connection,
         )
         email.content_subtype = 'html'
-        email.send()
+        return email
 
-    def _render_template_string(
+    def send_email(
         self,
-        template_string: str,
-        context: Dict[str, Any],
-    ) -> str:
-        template = Template(template_string)
-        return template.render(Context(context))
+        to: str,
+        template_code: EmailType.LITERALS,
+        message_data: Dict[str, Any],
+        user_id: int,
+    ) -> None:
+        self._send_messages([
+            self._get_message(
+                to=to,
+                template_code=template_code,
+                message_data=message_data,
+            ),
+        ])
+
+    def send_many(self, messages: Iterable[Dict[str, Any]]) -> None:
+
+        """ Renders all the messages and sends them in one SMTP session """
+
+        emails = [
+            self._get_message(
+                to=message['to'],
+                template_code=message['template_code'],
+                message_data=message['message_data'],
+            )
+            for message in messages
+        ]
+        if emails:
+            self._send_messages(emails)
 
     def _get_default_template(
         self,
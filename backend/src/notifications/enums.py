@@ -38,6 +38,7 @@ class NotificationMethod:
     task_deleted = 'task_deleted'
     event_created = 'event_created'
     event_updated = 'event_updated'
+    event_watched = 'event_watched'
     notification_created = 'notification_created'
     dataset_created = 'dataset_created'
     dataset_updated = 'dataset_updated'
@@ -84,6 +85,7 @@ class NotificationMethod:
         task_deleted,
         event_created,
         event_updated,
+        event_watched,
         notification_created,
         dataset_created,
         dataset_updated,
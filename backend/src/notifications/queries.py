@@ -1,4 +1,5 @@
-from typing import Tuple
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
 
 from django.contrib.auth import get_user_model
 
@@ -18,7 +19,32 @@ UserModel = get_user_model()
 
 class UsersWithOverdueTaskQuery(SqlQueryObject, DereferencedPerformersMixin):
 
+    """ due_date_from limits the search to the tasks
+        that became overdue after the previous run,
+        task_ids limits it to the given tasks """
+
+    def __init__(
+        self,
+        due_date_from: Optional[datetime] = None,
+        task_ids: Optional[List[int]] = None,
+    ):
+        self.due_date_from = due_date_from
+        self.task_ids = task_ids
+
     def get_sql(self) -> Tuple[str, dict]:
+        params = {}
+        due_date_from = ''
+        if self.due_date_from is not None:
+            due_date_from = 'AND pt.due_date > %(due_date_from)s'
+            params['due_date_from'] = self.due_date_from
+        task_ids = ''
+        if self.task_ids is not None:
+            sql_list, task_ids_params = self._to_sql_list(
+                values=self.task_ids,
+                prefix='task_id',
+            )
+            task_ids = f'AND pt.id IN {sql_list}'
+            params.update(task_ids_params)
         return f"""
         SELECT DISTINCT ON (user_id, task_id)
           result.user_id,
@@ -79,6 +105,8 @@ class UsersWithOverdueTaskQuery(SqlQueryObject, DereferencedPerformersMixin):
               AND pw.status = '{WorkflowStatus.RUNNING}'
               AND pt.due_date IS NOT NULL
               AND pt.due_date <= NOW()
+              {due_date_from}
+              {task_ids}
               AND dereferenced_performers.is_completed IS FALSE
               AND au.status = '{UserStatus.ACTIVE}'
         ) result INNER JOIN accounts_user au
@@ -87,7 +115,7 @@ class UsersWithOverdueTaskQuery(SqlQueryObject, DereferencedPerformersMixin):
           ON aa.id = au.account_id
         WHERE notification is NULL
         ORDER BY user_id, task_id, account_id
-        """, {}
+        """, params
 
 
 class UsersWithRemainderTaskQuery(SqlQueryObject, DereferencedPerformersMixin):
@@ -130,3 +158,25 @@ class UsersWithRemainderTaskQuery(SqlQueryObject, DereferencedPerformersMixin):
         ORDER BY au.id
         """
         return result, {}
+
+
+class IncrementUnreadPushCounterQuery(SqlQueryObject):
+
+    """ Increments the iOS app badge counter of all the users in a single
+        UPDATE and returns new values to send with the notification """
+
+    def __init__(self, user_ids: Iterable[int]):
+        self.user_ids = list(user_ids)
+
+    def get_sql(self) -> Tuple[str, dict]:
+        user_ids, params = self._to_sql_list(
+            values=self.user_ids,
+            prefix='user_id',
+        )
+        return f"""
+        UPDATE notifications_usernotifications
+        SET count_unread_push_in_ios_app = count_unread_push_in_ios_app + 1
+        WHERE is_deleted IS FALSE
+          AND user_id IN {user_ids}
+        RETURNING user_id, count_unread_push_in_ios_app
+        """, params
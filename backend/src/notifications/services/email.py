@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -43,7 +43,12 @@ class EmailService(NotificationService):
         account_id: int,
         logging: bool = False,
         logo_lg: Optional[str] = None,
+        batch: bool = False,
     ):
+
+        """ In the batch mode emails are collected until flush()
+            and sent by the client in one session """
+
         super().__init__(account_id, logging, logo_lg)
         client_cls = (
             CustomerIOEmailClient
@@ -51,6 +56,8 @@ class EmailService(NotificationService):
             else SMTPEmailClient
         )
         self.client: EmailClient = client_cls(account_id=account_id)
+        self.batch = batch
+        self._batch_messages: List[dict] = []
 
     ALLOWED_METHODS = {
         NotificationMethod.new_task,
@@ -100,12 +107,30 @@ class EmailService(NotificationService):
         template_code: str,
         data: Dict[str, Any],
     ):
+        if self.batch:
+            self._batch_messages.append({
+                'title': title,
+                'user_id': user_id,
+                'user_email': user_email,
+                'template_code': template_code,
+                'data': data,
+            })
+            return
+
         self.client.send_email(
             to=user_email,
             template_code=template_code,
             message_data=data,
             user_id=user_id,
         )
+        self._log_email(title=title, user_email=user_email, data=data)
+
+    def _log_email(
+        self,
+        title: str,
+        user_email: str,
+        data: Dict[str, Any],
+    ):
         if self.logging:
             AccountLogService().email_message(
                 title=f'Email to: {user_email}: {title}',
@@ -115,6 +140,29 @@ class EmailService(NotificationService):
                 contractor=settings.EMAIL_PROVIDER,
             )
 
+    def flush(self):
+
+        """ Sends the emails collected in the batch mode """
+
+        messages, self._batch_messages = self._batch_messages, []
+        if not messages:
+            return
+        self.client.send_many([
+            {
+                'to': message['user_email'],
+                'template_code': message['template_code'],
+                'message_data': message['data'],
+                'user_id': message['user_id'],
+            }
+            for message in messages
+        ])
+        for message in messages:
+            self._log_email(
+                title=message['title'],
+                user_email=message['user_email'],
+                data=message['data'],
+            )
+
     def _send(
         self,
         title: str,
@@ -1,4 +1,5 @@
-from typing import Dict
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -21,6 +22,7 @@ from firebase_admin.messaging import (
 )
 
 from src.accounts.enums import UserType
+from src.executor import RawSqlExecutor
 from src.logs.enums import (
     AccountEventStatus,
 )
@@ -30,6 +32,7 @@ from src.notifications.enums import (
     NotificationMethod,
 )
 from src.notifications.models import Device, UserNotifications
+from src.notifications.queries import IncrementUnreadPushCounterQuery
 from src.notifications.services.base import (
     NotificationService,
 )
@@ -57,6 +60,18 @@ class PushNotificationService(NotificationService):
         NotificationMethod.reaction,
         NotificationMethod.complete_workflow,
     }
+    # Firebase limit of tokens per multicast message
+    MULTICAST_MAX_TOKENS = 500
+
+    def __init__(self, *args, batch: bool = False, **kwargs):
+
+        """ In the batch mode messages are collected until flush(),
+            the same message for many recipients is sent by multicast
+            requests instead of a request per device token """
+
+        super().__init__(*args, **kwargs)
+        self.batch = batch
+        self._batch_messages: Dict[tuple, dict] = {}
 
     def _send_to_browsers(
         self,
@@ -179,6 +194,15 @@ class PushNotificationService(NotificationService):
             'body': body,
             **extra_data,
         }
+        if self.batch:
+            key = tuple(sorted(data.items()))
+            message = self._batch_messages.setdefault(
+                key,
+                {'title': title, 'body': body, 'data': data, 'recipients': {}},
+            )
+            message['recipients'][user_id] = user_email
+            return
+
         self._send_to_browsers(
             title=title,
             body=body,
@@ -194,7 +218,187 @@ class PushNotificationService(NotificationService):
             data=data,
         )
 
-    def _handle_error(
+    def flush(self):
+
+        """ Sends the messages collected in the batch mode """
+
+        batch_messages = self._batch_messages.values()
+        self._batch_messages = {}
+        for message in batch_messages:
+            self._send_multicast_to_browsers(**message)
+            self._send_multicast_to_apps(**message)
+
+    def _send_multicast_to_browsers(
+        self,
+        title: str,
+        body: str,
+        data: dict,
+        recipients: Dict[int, str],
+    ):
+        tokens = list(
+            Device.objects
+            .filter(user_id__in=recipients.keys())
+            .active()
+            .browser()
+            .values_list('user_id', 'token'),
+        )
+        for i in range(0, len(tokens), self.MULTICAST_MAX_TOKENS):
+            chunk = tokens[i:i + self.MULTICAST_MAX_TOKENS]
+            message = messaging.MulticastMessage(
+                notification=PushNotification(
+                    title=title,
+                    body=body,
+                ),
+                data=data,
+                tokens=[token for _, token in chunk],
+            )
+            self._send_multicast(
+                message=message,
+                tokens=chunk,
+                recipients=recipients,
+                data=data,
+                device='browser',
+            )
+
+    def _send_multicast_to_apps(
+        self,
+        title: str,
+        body: str,
+        data: dict,
+        recipients: Dict[int, str],
+    ):
+        tokens = list(
+            Device.objects
+            .filter(user_id__in=recipients.keys())
+            .active()
+            .app()
+            .values_list('user_id', 'token'),
+        )
+        if not tokens:
+            return
+
+        query = IncrementUnreadPushCounterQuery(
+            user_ids={user_id for user_id, _ in tokens},
+        )
+        badges = {
+            row['user_id']: row['count_unread_push_in_ios_app']
+            for row in RawSqlExecutor.fetch(*query.get_sql())
+        }
+        # The badge is a part of the message, one message per value
+        tokens_by_badge: Dict[Optional[int], List[Tuple[int, str]]] = (
+            defaultdict(list)
+        )
+        for user_id, token in tokens:
+            tokens_by_badge[badges.get(user_id)].append((user_id, token))
+
+        for badge, badge_tokens in tokens_by_badge.items():
+            for i in range(0, len(badge_tokens), self.MULTICAST_MAX_TOKENS):
+                chunk = badge_tokens[i:i + self.MULTICAST_MAX_TOKENS]
+                message = messaging.MulticastMessage(
+                    notification=PushNotification(
+                        title=title,
+                        body=body,
+                    ),
+                    data=data,
+                    tokens=[token for _, token in chunk],
+                    apns=Config(
+                        payload=APNSPayload(
+                            aps=Aps(
+                                sound='default',
+                                badge=badge,
+                            ),
+                        ),
+                    ),
+                )
+                self._send_multicast(
+                    message=message,
+                    tokens=chunk,
+                    recipients=recipients,
+                    data=data,
+                    device='app',
+                )
+
+    def _send_multicast(
+        self,
+        message: messaging.MulticastMessage,
+        tokens: List[Tuple[int, str]],
+        recipients: Dict[int, str],
+        data: dict,
+        device: str,
+    ):
+
+        """ Responses are in the order of tokens,
+            invalid tokens are deleted with a single query """
+
+        try:
+            response = messaging.send_multicast(message)
+        except FirebaseError as exception:
+            capture_sentry_message(
+                message='Push notification multicast sending error',
+                data={
+                    'device': device,
+                    'tokens_count': len(tokens),
+                    'exception_type': str(type(exception)),
+                    'message': str(exception),
+                    'code': str(exception.code),
+                    'cause': str(exception.cause),
+                    'http_response': str(exception.http_response),
+                },
+                level=SentryLogLevel.ERROR,
+            )
+            return
+
+        invalid_tokens = []
+        for (user_id, token), send_response in zip(
+            tokens,
+            response.responses,
+        ):
+            user_email = recipients[user_id]
+            if send_response.success:
+                if self.logging:
+                    AccountLogService().push_notification(
+                        title=(
+                            f'Push to {device}: {user_email}: '
+                            f'{data["title"]}'
+                        ),
+                        request_data=data,
+                        account_id=self.account_id,
+                        status=AccountEventStatus.SUCCESS,
+                    )
+            elif self._is_invalid_token(send_response.exception):
+                invalid_tokens.append(token)
+                self._log_error(
+                    token=token,
+                    user_id=user_id,
+                    user_email=user_email,
+                    exception=send_response.exception,
+                    data=data,
+                    device=device,
+                )
+            else:
+                self._handle_error(
+                    token=token,
+                    user_id=user_id,
+                    user_email=user_email,
+                    exception=send_response.exception,
+                    data=data,
+                    device=device,
+                )
+        if invalid_tokens:
+            Device.objects.filter(token__in=invalid_tokens).delete()
+
+    @staticmethod
+    def _is_invalid_token(exception: FirebaseError) -> bool:
+        return isinstance(
+            exception,
+            (
+                InvalidArgumentError,
+                UnregisteredError,
+                SenderIdMismatchError,
+            ),
+        )
+
+    def _log_error(
         self,
         token: str,
         user_id: int,
@@ -220,16 +424,25 @@ class PushNotificationService(NotificationService):
                     'http_response': str(exception.http_response),
                 },
             )
-        if (
-            isinstance(
-                exception,
-                (
-                    InvalidArgumentError,
-                    UnregisteredError,
-                    SenderIdMismatchError,
-                ),
-            )
-        ):
+
+    def _handle_error(
+        self,
+        token: str,
+        user_id: int,
+        user_email: str,
+        exception: FirebaseError,
+        data: dict,
+        device: str,
+    ):
+        self._log_error(
+            token=token,
+            user_id=user_id,
+            user_email=user_email,
+            exception=exception,
+            data=data,
+            device=device,
+        )
+        if self._is_invalid_token(exception):
             Device.objects.delete_by_token(token=token)
         else:
             capture_sentry_message(
@@ -1,6 +1,6 @@
 import uuid
-from asyncio import get_event_loop
-from typing import Dict, Optional
+from asyncio import gather, get_event_loop
+from typing import Dict, Iterable, List, Optional
 
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
@@ -43,6 +43,7 @@ class WebSocketService(NotificationService):
         NotificationMethod.reaction,
         NotificationMethod.event_created,
         NotificationMethod.event_updated,
+        NotificationMethod.event_watched,
         NotificationMethod.notification_created,
         NotificationMethod.user_created,
         NotificationMethod.user_updated,
@@ -104,6 +105,69 @@ class WebSocketService(NotificationService):
         )
         task.add_done_callback(background_tasks.discard)
 
+    async def _group_send_many(
+        self,
+        group_names: List[str],
+        data: Dict[str, str],
+    ):
+
+        """ All the groups are sent concurrently in the one event loop
+            entry, the channel layer requests are not waited one by one """
+
+        layer = get_channel_layer()
+        event = {
+            'type': 'notification',
+            'notification': data,
+        }
+        await gather(*(
+            layer.group_send(group_name, event)
+            for group_name in group_names
+        ))
+
+    def _async_bulk_send(
+        self,
+        group_names: List[str],
+        data: Dict[str, str],
+    ):
+        background_tasks = set()
+        loop = get_event_loop()
+        task = loop.create_task(
+            self._group_send_many(group_names, data),
+        )
+        task.add_done_callback(background_tasks.discard)
+
+    def _get_message(
+        self,
+        method_name: NotificationMethod.LITERALS,
+        data: Dict[str, str],
+    ) -> dict:
+        return {
+            'id': str(uuid.uuid4()),
+            'date_created_tsp': timezone.now().timestamp(),
+            'type': method_name,
+            'data': data,
+        }
+
+    def _bulk_send(
+        self,
+        method_name: NotificationMethod.LITERALS,
+        group_names: List[str],
+        data: Dict[str, str],
+        sync: bool = False,
+    ):
+        self._validate_send(method_name)
+        if not group_names:
+            return
+
+        message = self._get_message(method_name=method_name, data=data)
+        if sync:
+            try:
+                async_to_sync(self._group_send_many)(group_names, message)
+            except RuntimeError:
+                self._async_bulk_send(group_names=group_names, data=message)
+        else:
+            self._async_bulk_send(group_names=group_names, data=message)
+
     def _send(
         self,
         method_name: NotificationMethod.LITERALS,
@@ -115,13 +179,7 @@ class WebSocketService(NotificationService):
         #  Use "handle_error" method
         self._validate_send(method_name)
 
-        message = {
-            'id': str(uuid.uuid4()),
-            'date_created_tsp': timezone.now().timestamp(),
-            'type': method_name,
-            'data': data,
-        }
-
+        message = self._get_message(method_name=method_name, data=data)
         if sync:
             try:
                 self._sync_send(group_name=group_name, data=message)
@@ -133,6 +191,45 @@ class WebSocketService(NotificationService):
     def _handle_error(self, *args, **kwargs):
         pass
 
+    def send_to_users(
+        self,
+        method_name: NotificationMethod.LITERALS,
+        user_ids: Iterable[int],
+        data: dict,
+        sync: bool = False,
+    ):
+
+        """ Sends the same message to many users: the message is built
+            once and all the user groups are sent in one event loop entry """
+
+        self._bulk_send(
+            method_name=method_name,
+            group_names=[
+                f'{EventsConsumer.classname}_{user_id}'
+                for user_id in user_ids
+            ],
+            data=data,
+            sync=sync,
+        )
+
+    def send_to_account(
+        self,
+        method_name: NotificationMethod.LITERALS,
+        data: dict,
+        sync: bool = False,
+    ):
+
+        """ Broadcasts the message to all connected users of the account """
+
+        self._bulk_send(
+            method_name=method_name,
+            group_names=[
+                f'{EventsConsumer.classname}_account_{self.account_id}',
+            ],
+            data=data,
+            sync=sync,
+        )
+
     def send_overdue_task(
         self,
         user_id: int,
@@ -1,11 +1,13 @@
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 import pytz
 from celery import shared_task
 from celery.task import Task as TaskCelery
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 from firebase_admin.exceptions import FirebaseError
@@ -43,6 +45,7 @@ from src.notifications.services.websockets import (
 from src.processes.models.workflows.event import (
     WorkflowEvent,
     WorkflowEventAction,
+    WorkflowEventWatched,
 )
 from src.processes.models.workflows.task import (
     Task,
@@ -53,11 +56,12 @@ from src.processes.services.workflow_permissions import (
     WorkflowPermissionService,
 )
 from src.processes.serializers.workflows.events import (
-    WorkflowEventSerializer,
+    WorkflowEventWatchedSerializer,
 )
 from src.processes.utils.common import get_duration_format
 from src.services.html_converter import convert_text_to_html
 from src.services.markdown import MarkdownService
+from src.utils.logging import capture_sentry_exception
 
 UserModel = get_user_model()
 
@@ -82,6 +86,7 @@ __all__ = [
     'send_new_task_notification',
     'send_new_task_websocket',
     'send_not_urgent_notification',
+    'send_notification_chunk',
     'send_overdue_task_notification',
     'send_reaction_notification',
     'send_reminder_task_notification',
@@ -91,6 +96,7 @@ __all__ = [
     'send_task_completed_websocket',
     'send_task_deleted_notification',
     'send_tasks_digest_notification',
+    'send_tasks_digest_notifications',
     'send_unread_notifications',
     'send_urgent_notification',
     'send_user_created_notification',
@@ -102,14 +108,36 @@ __all__ = [
     'send_verification_notification',
     'send_workflow_comment_watched',
     'send_workflows_digest_notification',
+    'send_workflows_digest_notifications',
 ]
 
 
+# Periodic notifications are sent by the channel in parallel chunks
+NOTIFICATION_CHANNELS = {
+    'email': EmailService,
+    'push': PushNotificationService,
+    'websocket': WebSocketService,
+}
+NOTIFICATIONS_CHUNK_SIZE = 500
+
+# Overdue tasks are searched from the previous run only. Once the full
+# scan key expires all the tasks are rechecked, e.g. a resumed workflow
+OVERDUE_WATERMARK_KEY = 'send_overdue_task_notification_watermark'
+OVERDUE_WATERMARK_OVERLAP = timedelta(minutes=5)
+OVERDUE_FULL_SCAN_KEY = 'send_overdue_task_notification_full_scan'
+OVERDUE_FULL_SCAN_TIMEOUT = 60 * 60
+
+
 class NotificationTask(TaskCelery):
     autoretry_for = (FirebaseError, )
     retry_backoff = True
 
 
+def _chunks(items: list, size: int = NOTIFICATIONS_CHUNK_SIZE) -> Iterator:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
 def _send_notification(
     method_name: NotificationMethod.LITERALS,
     user_id: int,
@@ -117,21 +145,28 @@ def _send_notification(
     account_id: int,
     logo_lg: Optional[str] = None,
     logging: bool = False,
+    push_service: Optional[PushNotificationService] = None,
+    email_service: Optional[EmailService] = None,
+    channels: Optional[Iterable[str]] = None,
     **kwargs,
 ):
 
-    services = {
-        PushNotificationService,
-        EmailService,
-        WebSocketService,
-    }
+    if channels is None:
+        services = set(NOTIFICATION_CHANNELS.values())
+    else:
+        services = {NOTIFICATION_CHANNELS[channel] for channel in channels}
     for service_cls in services:
         if method_name in service_cls.ALLOWED_METHODS:
-            service = service_cls(
-                logging=logging,
-                account_id=account_id,
-                logo_lg=logo_lg,
-            )
+            if push_service and service_cls is PushNotificationService:
+                service = push_service
+            elif email_service and service_cls is EmailService:
+                service = email_service
+            else:
+                service = service_cls(
+                    logging=logging,
+                    account_id=account_id,
+                    logo_lg=logo_lg,
+                )
             send_method = getattr(service, f'send_{method_name}')
             send_method(
                 user_email=user_email,
@@ -187,12 +222,25 @@ def _send_new_task_notification(
         html_description = None
         text_description = None
     link = f'{settings.FRONTEND_URL}/tasks/{task_id}'
-
+    push_service = PushNotificationService(
+        logging=logging,
+        account_id=account_id,
+        logo_lg=logo_lg,
+        batch=True,
+    )
+    email_service = EmailService(
+        logging=logging,
+        account_id=account_id,
+        logo_lg=logo_lg,
+        batch=True,
+    )
     for (user_id, user_email, is_subscribed) in recipients:
         if is_subscribed:
             _send_notification(
                 logging=logging,
                 account_id=account_id,
+                push_service=push_service,
+                email_service=email_service,
                 method_name=method_name,
                 user_id=user_id,
                 user_email=user_email,
@@ -211,6 +259,8 @@ def _send_new_task_notification(
                 link=link,
                 sync=True,
             )
+    push_service.flush()
+    email_service.flush()
 
 
 def _send_new_task_websocket(
@@ -352,56 +402,174 @@ def send_task_completed_notification(**kwargs):
     _send_task_completed_notification(**kwargs)
 
 
-def _send_overdue_task_notification():
-    query = UsersWithOverdueTaskQuery()
-    overdue_task_users = RawSqlExecutor.fetch(
-        *query.get_sql(),
-        stream=True,
-        fetch_size=50,
+def _send_notification_chunk(channel: str, data: List[dict]):
+    notification_ids = [
+        elem['notification_id'] for elem in data
+        if elem.get('notification_id')
+    ]
+    notifications = (
+        Notification.objects.in_bulk(notification_ids)
+        if notification_ids else {}
     )
-    notifications = []
-    send_data = []
-    for elem in overdue_task_users:
-        task = Task.objects.select_related('workflow').get(id=elem['task_id'])
-        task_json = NotificationTaskSerializer(
-            instance=task,
-            notification_type=NotificationType.OVERDUE_TASK,
-        ).data
-        workflow_json = NotificationWorkflowSerializer(
-            instance=task.workflow,
-        ).data
-        notification = Notification(
-            task=task,
-            task_json=task_json,
-            workflow_json=workflow_json,
-            user_id=elem['user_id'],
-            account_id=elem['account_id'],
-            type=NotificationType.OVERDUE_TASK,
+    for elem in data:
+        notification_id = elem.pop('notification_id', None)
+        if notification_id:
+            elem['notification'] = notifications.get(notification_id)
+        _send_notification(channels=[channel], **elem)
+
+
+@shared_task(base=NotificationTask)
+def send_notification_chunk(**kwargs):
+    _send_notification_chunk(**kwargs)
+
+
+def _fan_out_notifications(
+    method_name: NotificationMethod.LITERALS,
+    send_data: List[dict],
+):
+
+    """ Each channel sends the notifications in its own celery tasks,
+        so a slow provider doesn't hold up the other ones """
+
+    for channel, service_cls in NOTIFICATION_CHANNELS.items():
+        if method_name not in service_cls.ALLOWED_METHODS:
+            continue
+        for chunk in _chunks(send_data):
+            send_notification_chunk.delay(channel=channel, data=chunk)
+
+
+def _get_guest_link(elem: dict) -> Tuple[str, str]:
+    token = GuestJWTAuthService.get_str_token(
+        task_id=elem['task_id'],
+        user_id=elem['user_id'],
+        account_id=elem['account_id'],
+    )
+    link = (
+        f'{settings.FRONTEND_URL}/guest-task/{elem["task_id"]}'
+        f'?token={token}&utm_campaign=guestUser'
+        f'&utm_term={elem["user_id"]}'
+    )
+    return token, link
+
+
+def _lock_overdue_tasks(send_data: List[dict]) -> List[dict]:
+
+    """ A due date timer and the sweep can pick the same task at once.
+        The task rows are locked in the id order, so the second one waits
+        and skips the users already notified by the first one """
+
+    task_ids = sorted({elem['task_id'] for elem in send_data})
+    notified = set()
+    for chunk in _chunks(task_ids):
+        list(
+            Task.objects
+            .select_for_update()
+            .filter(id__in=chunk)
+            .order_by('id')
+            .values_list('id', flat=True),
         )
-        if elem['user_type'] == UserType.GUEST:
-            token = GuestJWTAuthService.get_str_token(
-                task_id=elem['task_id'],
-                user_id=elem['user_id'],
-                account_id=elem['account_id'],
+        notified.update(
+            Notification._base_manager.filter(
+                task_id__in=chunk,
+                type=NotificationType.OVERDUE_TASK,
+            ).values_list('task_id', 'user_id'),
+        )
+    return [
+        elem for elem in send_data
+        if (elem['task_id'], elem['user_id']) not in notified
+    ]
+
+
+def _send_overdue_task_notification(
+    task_ids: Optional[List[int]] = None,
+    full_scan: bool = False,
+):
+
+    """ Without task_ids all the tasks that became overdue
+        since the previous run are searched, or all the overdue tasks
+        if full_scan is set or the previous full scan was over an hour ago """
+
+    started_at = timezone.now()
+    is_full_scan = False
+    if task_ids is None:
+        is_full_scan = full_scan or cache.get(OVERDUE_FULL_SCAN_KEY) is None
+        query = UsersWithOverdueTaskQuery(
+            due_date_from=(
+                None if is_full_scan else cache.get(OVERDUE_WATERMARK_KEY)
+            ),
+        )
+    else:
+        query = UsersWithOverdueTaskQuery(task_ids=task_ids)
+    send_data = list(
+        RawSqlExecutor.fetch(
+            *query.get_sql(),
+            stream=True,
+            fetch_size=NOTIFICATIONS_CHUNK_SIZE,
+        ),
+    )
+
+    # Payloads are built once per task instead of once per recipient
+    payload_task_ids = {elem['task_id'] for elem in send_data}
+    payloads = {}
+    for chunk in _chunks(list(payload_task_ids)):
+        tasks = Task.objects.select_related('workflow').filter(id__in=chunk)
+        for task in tasks:
+            payloads[task.id] = (
+                NotificationTaskSerializer(
+                    instance=task,
+                    notification_type=NotificationType.OVERDUE_TASK,
+                ).data,
+                NotificationWorkflowSerializer(instance=task.workflow).data,
             )
-            elem['token'] = token
-            elem['link'] = (
-                f'{settings.FRONTEND_URL}/guest-task/{elem["task_id"]}'
-                f'?token={token}&utm_campaign=guestUser'
-                f'&utm_term={elem["user_id"]}'
+    # The task could be deleted after the query
+    send_data = [elem for elem in send_data if elem['task_id'] in payloads]
+
+    with transaction.atomic():
+        send_data = _lock_overdue_tasks(send_data)
+        notifications = []
+        for elem in send_data:
+            task_json, workflow_json = payloads[elem['task_id']]
+            notifications.append(
+                Notification(
+                    task_id=elem['task_id'],
+                    task_json=task_json,
+                    workflow_json=workflow_json,
+                    user_id=elem['user_id'],
+                    account_id=elem['account_id'],
+                    type=NotificationType.OVERDUE_TASK,
+                ),
             )
+        Notification.objects.bulk_create(
+            notifications,
+            batch_size=NOTIFICATIONS_CHUNK_SIZE,
+        )
+
+    for elem, notification in zip(send_data, notifications):
+        elem['notification_id'] = notification.id
+        if elem['user_type'] == UserType.GUEST:
+            elem['token'], elem['link'] = _get_guest_link(elem)
         else:
             elem['token'] = None
             elem['link'] = f'{settings.FRONTEND_URL}/tasks/{elem["task_id"]}'
-        notifications.append(notification)
         elem['method_name'] = NotificationMethod.overdue_task
-        elem['notification'] = notification
         elem['sync'] = True
-        send_data.append(elem)
-
-    Notification.objects.bulk_create(notifications)
-    for elem in send_data:
-        _send_notification(**elem)
+    _fan_out_notifications(
+        method_name=NotificationMethod.overdue_task,
+        send_data=send_data,
+    )
+    if task_ids is not None:
+        return
+    if is_full_scan:
+        cache.add(
+            OVERDUE_FULL_SCAN_KEY,
+            started_at,
+            timeout=OVERDUE_FULL_SCAN_TIMEOUT,
+        )
+    cache.set(
+        OVERDUE_WATERMARK_KEY,
+        started_at - OVERDUE_WATERMARK_OVERLAP,
+        timeout=None,
+    )
 
 
 @shared_task(base=NotificationTask)
@@ -409,33 +577,30 @@ def send_overdue_task_notification():
     with periodic_lock('send_overdue_task_notification') as acquired:
         if not acquired:
             return
-        _send_overdue_task_notification()
+        # With the timer service it is the sweep of the missed timers,
+        # e.g. a due date set with the queryset update
+        _send_overdue_task_notification(full_scan=settings.TIMER_SERVICE)
 
 
 def _send_reminder_task_notification():
     query = UsersWithRemainderTaskQuery()
-    users = RawSqlExecutor.fetch(
-        *query.get_sql(),
-        stream=True,
-        fetch_size=50,
+    send_data = list(
+        RawSqlExecutor.fetch(
+            *query.get_sql(),
+            stream=True,
+            fetch_size=NOTIFICATIONS_CHUNK_SIZE,
+        ),
     )
-    for elem in users:
+    for elem in send_data:
         if elem['user_type'] == UserType.GUEST:
-            token = GuestJWTAuthService.get_str_token(
-                task_id=elem['task_id'],
-                user_id=elem['user_id'],
-                account_id=elem['account_id'],
-            )
-            elem['token'] = token
-            elem['link'] = (
-                f'{settings.FRONTEND_URL}/guest-task/{elem["task_id"]}'
-                f'?token={token}&utm_campaign=guestUser'
-                f'&utm_term={elem["user_id"]}'
-            )
+            elem['token'], elem['link'] = _get_guest_link(elem)
         else:
             elem['token'] = None
             elem['link'] = f'{settings.FRONTEND_URL}/tasks'
-        _send_notification(**elem)
+    _fan_out_notifications(
+        method_name=NotificationMethod.task_reminder,
+        send_data=send_data,
+    )
 
 
 @shared_task(base=NotificationTask)
@@ -455,6 +620,7 @@ def _send_workflows_digest_notification(
     digest: dict,
     logo_lg: Optional[str] = None,
     logging: bool = False,
+    email_service: Optional[EmailService] = None,
 ):
     """Send workflows digest notification through notification system."""
 
@@ -469,6 +635,7 @@ def _send_workflows_digest_notification(
         account_id=account_id,
         logo_lg=logo_lg,
         logging=logging,
+        email_service=email_service,
         date_from=date_from,
         date_to=date_to,
         digest=digest,
@@ -482,6 +649,53 @@ def send_workflows_digest_notification(**kwargs):
     _send_workflows_digest_notification(**kwargs)
 
 
+def _send_digest_notifications(
+    send_notification: Callable,
+    notifications: List[dict],
+):
+
+    """ Emails of a chunk of digests are sent in one batch per account.
+        The users are already marked as sent, so a failed digest
+        must not stop the rest of the chunk """
+
+    email_services = {}
+    for notification in notifications:
+        account_id = notification['account_id']
+        if account_id not in email_services:
+            email_services[account_id] = EmailService(
+                logging=notification.get('logging', False),
+                account_id=account_id,
+                logo_lg=notification.get('logo_lg'),
+                batch=True,
+            )
+        try:
+            send_notification(
+                email_service=email_services[account_id],
+                **notification,
+            )
+        except Exception as ex:  # noqa: BLE001
+            capture_sentry_exception(
+                ex,
+                data={
+                    'user_id': notification['user_id'],
+                    'account_id': account_id,
+                },
+            )
+    for account_id, email_service in email_services.items():
+        try:
+            email_service.flush()
+        except Exception as ex:  # noqa: BLE001
+            capture_sentry_exception(ex, data={'account_id': account_id})
+
+
+@shared_task(base=NotificationTask)
+def send_workflows_digest_notifications(notifications: List[dict]):
+    _send_digest_notifications(
+        send_notification=_send_workflows_digest_notification,
+        notifications=notifications,
+    )
+
+
 def _send_tasks_digest_notification(
     user_id: int,
     user_email: str,
@@ -491,6 +705,7 @@ def _send_tasks_digest_notification(
     digest: dict,
     logo_lg: Optional[str] = None,
     logging: bool = False,
+    email_service: Optional[EmailService] = None,
 ):
     """Send tasks digest notification through notification system."""
 
@@ -506,6 +721,7 @@ def _send_tasks_digest_notification(
         account_id=account_id,
         logo_lg=logo_lg,
         logging=logging,
+        email_service=email_service,
         date_from=date_from,
         date_to=date_to,
         digest=digest,
@@ -519,6 +735,14 @@ def send_tasks_digest_notification(**kwargs):
     _send_tasks_digest_notification(**kwargs)
 
 
+@shared_task(base=NotificationTask)
+def send_tasks_digest_notifications(notifications: List[dict]):
+    _send_digest_notifications(
+        send_notification=_send_tasks_digest_notification,
+        notifications=notifications,
+    )
+
+
 def _send_user_deactivated_notification(
     user_id: int,
     user_email: str,
@@ -1151,39 +1375,27 @@ def _send_event_created(
             status=UserStatus.ACTIVE,
         )
         .order_by('id')
-        .values_list('id', 'email')
+        .values_list('id', flat=True)
     )
-    for (user_id, user_email) in users:
-        _send_notification(
-            logging=logging,
-            method_name=NotificationMethod.event_created,
-            data=data,
-            user_id=user_id,
-            user_email=user_email,
-            account_id=account_id,
-            logo_lg=logo_lg,
-            sync=True,
-        )
-
+    user_ids = list(users)
     if data.get('task'):
-        guests = (
+        user_ids.extend(
             TaskPerformer.objects
             .by_task(data['task']['id'])
             .guests()
             .exclude_directly_deleted()
-            .values_list('user_id', 'user__email')
+            .values_list('user_id', flat=True),
         )
-        for (guest_id, guest_email) in guests:
-            _send_notification(
-                logging=logging,
-                method_name=NotificationMethod.event_created,
-                data=data,
-                user_id=guest_id,
-                user_email=guest_email,
-                account_id=account_id,
-                logo_lg=logo_lg,
-                sync=True,
-            )
+    WebSocketService(
+        logging=logging,
+        account_id=account_id,
+        logo_lg=logo_lg,
+    ).send_to_users(
+        method_name=NotificationMethod.event_created,
+        user_ids=user_ids,
+        data=data,
+        sync=True,
+    )
 
 
 @shared_task(base=NotificationTask)
@@ -1191,19 +1403,18 @@ def send_event_created(**kwargs):
     _send_event_created(**kwargs)
 
 
-def _send_event_updated(
-    logging: bool,
+def _get_event_user_ids(
     account_id: int,
-    logo_lg: Optional[str],
-    data: dict,
-):
+    workflow_id: int,
+    task_id: Optional[int],
+) -> Optional[List[int]]:
 
-    """ Send ws when workflow event updated """
+    """ Users which see the workflow event in the feed """
 
     try:
-        workflow = Workflow.objects.get(id=data['workflow_id'])
+        workflow = Workflow.objects.get(id=workflow_id)
     except Workflow.DoesNotExist:
-        return
+        return None
     users = (
         UserModel.objects
         .on_account(account_id)
@@ -1212,39 +1423,46 @@ def _send_event_updated(
             status=UserStatus.ACTIVE,
         )
         .order_by('id')
-        .values_list('id', 'email')
+        .values_list('id', flat=True)
     )
-    for (user_id, user_email) in users:
-        _send_notification(
-            logging=logging,
-            method_name=NotificationMethod.event_updated,
-            data=data,
-            user_id=user_id,
-            user_email=user_email,
-            account_id=account_id,
-            logo_lg=logo_lg,
-            sync=True,
-        )
-
-    if data.get('task'):
-        guests = (
+    user_ids = list(users)
+    if task_id:
+        user_ids.extend(
             TaskPerformer.objects
-            .by_task(data['task']['id'])
+            .by_task(task_id)
             .guests()
             .exclude_directly_deleted()
-            .values_list('user_id', 'user__email')
+            .values_list('user_id', flat=True),
         )
-        for (guest_id, guest_email) in guests:
-            _send_notification(
-                logging=logging,
-                method_name=NotificationMethod.event_updated,
-                data=data,
-                user_id=guest_id,
-                user_email=guest_email,
-                account_id=account_id,
-                logo_lg=logo_lg,
-                sync=True,
-            )
+    return user_ids
+
+
+def _send_event_updated(
+    logging: bool,
+    account_id: int,
+    logo_lg: Optional[str],
+    data: dict,
+):
+
+    """ Send ws when workflow event updated """
+
+    user_ids = _get_event_user_ids(
+        account_id=account_id,
+        workflow_id=data['workflow_id'],
+        task_id=data['task']['id'] if data.get('task') else None,
+    )
+    if user_ids is None:
+        return
+    WebSocketService(
+        logging=logging,
+        account_id=account_id,
+        logo_lg=logo_lg,
+    ).send_to_users(
+        method_name=NotificationMethod.event_updated,
+        user_ids=user_ids,
+        data=data,
+        sync=True,
+    )
 
 
 @shared_task(base=NotificationTask)
@@ -1252,30 +1470,80 @@ def send_event_updated(**kwargs):
     _send_event_updated(**kwargs)
 
 
+def _send_event_watched(
+    logging: bool,
+    account_id: int,
+    logo_lg: Optional[str],
+    task_id: Optional[int],
+    data: dict,
+):
+
+    """ Send ws with the new watched receipts of the comment """
+
+    user_ids = _get_event_user_ids(
+        account_id=account_id,
+        workflow_id=data['workflow_id'],
+        task_id=task_id,
+    )
+    if user_ids is None:
+        return
+    WebSocketService(
+        logging=logging,
+        account_id=account_id,
+        logo_lg=logo_lg,
+    ).send_to_users(
+        method_name=NotificationMethod.event_watched,
+        user_ids=user_ids,
+        data=data,
+        sync=True,
+    )
+
+
 def _send_workflow_comment_watched():
 
-    new_actions_ids = WorkflowEventAction.objects.watched().only_ids()
-    if new_actions_ids:
-        with transaction.atomic():
-            modified_events = WorkflowEvent.objects.update_watched_from(
-                new_actions_ids,
-            )
-            WorkflowEventAction.objects.filter(id__in=new_actions_ids).delete()
-        modified_events_ids = (el.id for el in modified_events)
-        events = (
-            WorkflowEvent.objects
-            .select_related('account', 'workflow')
-            .filter(id__in=modified_events_ids)
-            .type_comment()
+    """ Only the new receipts and the total count are sent,
+        the receipts of the event are not reloaded """
+
+    new_actions_ids = list(WorkflowEventAction.objects.watched().only_ids())
+    if not new_actions_ids:
+        return
+    with transaction.atomic():
+        receipts = list(
+            WorkflowEventWatched.objects.create_from_actions(new_actions_ids),
+        )
+        WorkflowEventAction.objects.filter(id__in=new_actions_ids).delete()
+    if not receipts:
+        return
+    receipts_by_event = defaultdict(list)
+    for receipt in receipts:
+        receipts_by_event[receipt.event_id].append(receipt)
+    counts = (
+        WorkflowEventWatched.objects
+        .on_events(receipts_by_event.keys())
+        .counts_by_event()
+    )
+    events = (
+        WorkflowEvent.objects
+        .select_related('account')
+        .filter(id__in=receipts_by_event.keys())
+        .type_comment()
+    )
+    for event in events:
+        _send_event_watched(
+            logging=event.account.log_api_requests,
+            account_id=event.account_id,
+            logo_lg=event.account.logo_lg,
+            task_id=event.task_id,
+            data={
+                'id': event.id,
+                'workflow_id': event.workflow_id,
+                'watched_count': counts[event.id],
+                'watched': WorkflowEventWatchedSerializer(
+                    instance=receipts_by_event[event.id],
+                    many=True,
+                ).data,
+            },
         )
-        for event in events:
-            data = WorkflowEventSerializer(instance=event).data
-            _send_event_updated(
-                data=data,
-                account_id=event.account_id,
-                logo_lg=event.account.logo_lg,
-                logging=event.account.log_api_requests,
-            )
 
 
 @shared_task(base=NotificationTask)
@@ -1382,21 +1650,14 @@ def _send_group_created_notification(
     group_data: dict,
     **kwargs,
 ):
-    users = UserModel.objects.filter(
+    WebSocketService(
+        logging=logging,
         account_id=account_id,
-        status=UserStatus.ACTIVE,
-    ).values_list('id', 'email')
-
-    for (user_id, user_email) in users:
-        _send_notification(
-            method_name=NotificationMethod.group_created,
-            account_id=account_id,
-            user_id=user_id,
-            user_email=user_email,
-            logging=logging,
-            group_data=group_data,
-            sync=True,
-        )
+    ).send_to_account(
+        method_name=NotificationMethod.group_created,
+        data=group_data,
+        sync=True,
+    )
 
 
 @shared_task(base=NotificationTask)
@@ -1410,21 +1671,14 @@ def _send_group_updated_notification(
     group_data: dict,
     **kwargs,
 ):
-    users = UserModel.objects.filter(
+    WebSocketService(
+        logging=logging,
         account_id=account_id,
-        status=UserStatus.ACTIVE,
-    ).values_list('id', 'email')
-
-    for (user_id, user_email) in users:
-        _send_notification(
-            method_name=NotificationMethod.group_updated,
-            account_id=account_id,
-            user_id=user_id,
-            user_email=user_email,
-            logging=logging,
-            group_data=group_data,
-            sync=True,
-        )
+    ).send_to_account(
+        method_name=NotificationMethod.group_updated,
+        data=group_data,
+        sync=True,
+    )
 
 
 @shared_task(base=NotificationTask)
@@ -1438,21 +1692,14 @@ def _send_group_deleted_notification(
     group_data: dict,
     **kwargs,
 ):
-    users = UserModel.objects.filter(
+    WebSocketService(
+        logging=logging,
         account_id=account_id,
-        status=UserStatus.ACTIVE,
-    ).values_list('id', 'email')
-
-    for (user_id, user_email) in users:
-        _send_notification(
-            method_name=NotificationMethod.group_deleted,
-            account_id=account_id,
-            user_id=user_id,
-            user_email=user_email,
-            logging=logging,
-            group_data=group_data,
-            sync=True,
-        )
+    ).send_to_account(
+        method_name=NotificationMethod.group_deleted,
+        data=group_data,
+        sync=True,
+    )
 
 
 @shared_task(base=NotificationTask)
@@ -1466,21 +1713,14 @@ def _send_user_created_notification(
     user_data: dict,
     **kwargs,
 ):
-    users = UserModel.objects.filter(
+    WebSocketService(
+        logging=logging,
         account_id=account_id,
-        status=UserStatus.ACTIVE,
-    ).values_list('id', 'email')
-
-    for (user_id, user_email) in users:
-        _send_notification(
-            method_name=NotificationMethod.user_created,
-            account_id=account_id,
-            user_id=user_id,
-            user_email=user_email,
-            logging=logging,
-            user_data=user_data,
-            sync=True,
-        )
+    ).send_to_account(
+        method_name=NotificationMethod.user_created,
+        data=user_data,
+        sync=True,
+    )
 
 
 @shared_task(base=NotificationTask)
@@ -1494,21 +1734,14 @@ def _send_user_updated_notification(
     user_data: dict,
     **kwargs,
 ):
-    users = UserModel.objects.filter(
+    WebSocketService(
+        logging=logging,
         account_id=account_id,
-        status=UserStatus.ACTIVE,
-    ).values_list('id', 'email')
-
-    for (user_id, user_email) in users:
-        _send_notification(
-            method_name=NotificationMethod.user_updated,
-            account_id=account_id,
-            user_id=user_id,
-            user_email=user_email,
-            logging=logging,
-            user_data=user_data,
-            sync=True,
-        )
+    ).send_to_account(
+        method_name=NotificationMethod.user_updated,
+        data=user_data,
+        sync=True,
+    )
 
 
 @shared_task(base=NotificationTask)
@@ -1522,21 +1755,14 @@ def _send_user_deleted_notification(
     user_data: dict,
     **kwargs,
 ):
-    users = UserModel.objects.filter(
+    WebSocketService(
+        logging=logging,
         account_id=account_id,
-        status=UserStatus.ACTIVE,
-    ).values_list('id', 'email')
-
-    for (user_id, user_email) in users:
-        _send_notification(
-            method_name=NotificationMethod.user_deleted,
-            account_id=account_id,
-            user_id=user_id,
-            user_email=user_email,
-            logging=logging,
-            user_data=user_data,
-            sync=True,
-        )
+    ).send_to_account(
+        method_name=NotificationMethod.user_deleted,
+        data=user_data,
+        sync=True,
+    )
 
 
 @shared_task(base=NotificationTask)
@@ -1,8 +1,18 @@
 import guardian.management
 import pytest
+from django.core.cache import cache
 from unittest.mock import Mock
 
 from src.generics.tests.clients import PneumaticApiClient
+from src.notifications.clients import (
+    CustomerIOEmailClient,
+    SMTPEmailClient,
+)
+from src.notifications.clients.cache import EmailTemplateCache
+from src.notifications.tasks import (
+    OVERDUE_FULL_SCAN_KEY,
+    OVERDUE_WATERMARK_KEY,
+)
 
 
 def pytest_configure(config):
@@ -12,3 +22,17 @@ def pytest_configure(config):
 @pytest.fixture
 def api_client():
     return PneumaticApiClient(HTTP_USER_AGENT='Mozilla/5.0')
+
+
+@pytest.fixture(autouse=True)
+def reset_email_clients():
+    # Clients and templates are shared by the process between tests
+    CustomerIOEmailClient.clear_api_clients()
+    SMTPEmailClient.close_connection()
+    EmailTemplateCache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_overdue_watermark():
+    cache.delete(OVERDUE_WATERMARK_KEY)
+    cache.delete(OVERDUE_FULL_SCAN_KEY)
@@ -0,0 +1,184 @@
+import smtplib
+
+import pytest
+
+from src.notifications.clients.cache import EmailTemplateCache
+from src.notifications.clients.smtp import SMTPEmailClient
+from src.notifications.enums import EmailType
+from src.notifications.models import EmailTemplateModel
+from src.processes.tests.fixtures import create_test_user
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_message__account_template__compile_once(mocker):
+
+    # arrange
+    user = create_test_user()
+    EmailTemplateModel.objects.create(
+        account=user.account,
+        name='Tasks',
+        email_types=[EmailType.NEW_TASK],
+        subject='Task {{ task_name }}',
+        content='<p>{{ task_name }}</p>',
+    )
+    EmailTemplateCache.invalidate(user.account_id)
+    template_spy = mocker.spy(EmailTemplateModel.objects, 'filter')
+    client = SMTPEmailClient(account_id=user.account_id)
+
+    # act
+    client._get_message(
+        to=user.email,
+        template_code=EmailType.NEW_TASK,
+        message_data={'task_name': 'First'},
+    )
+    email = client._get_message(
+        to=user.email,
+        template_code=EmailType.NEW_TASK,
+        message_data={'task_name': 'Second'},
+    )
+
+    # assert
+    assert template_spy.call_count == 1
+    assert email.subject == 'Task Second'
+    assert email.body == '<p>Second</p>'
+    assert email.to == [user.email]
+
+
+def test_get_message__template_changed__recompile():
+
+    # arrange
+    user = create_test_user()
+    template = EmailTemplateModel.objects.create(
+        account=user.account,
+        name='Tasks',
+        email_types=[EmailType.NEW_TASK],
+        subject='Old {{ task_name }}',
+        content='<p>{{ task_name }}</p>',
+    )
+    client = SMTPEmailClient(account_id=user.account_id)
+    client._get_message(
+        to=user.email,
+        template_code=EmailType.NEW_TASK,
+        message_data={'task_name': 'First'},
+    )
+    template.subject = 'New {{ task_name }}'
+
+    # act
+    template.save()
+
+    # assert
+    email = client._get_message(
+        to=user.email,
+        template_code=EmailType.NEW_TASK,
+        message_data={'task_name': 'First'},
+    )
+    assert email.subject == 'New First'
+
+
+def test_send_many__one_session__ok(mocker):
+
+    # arrange
+    connection_mock = mocker.Mock()
+    get_connection_mock = mocker.patch(
+        'src.notifications.clients.smtp.get_connection',
+        return_value=connection_mock,
+    )
+    client = SMTPEmailClient(account_id=1)
+
+    # act
+    client.send_many([
+        {
+            'to': 'first@test.test',
+            'template_code': EmailType.NEW_TASK,
+            'message_data': {'workflow_name': 'First'},
+            'user_id': 1,
+        },
+        {
+            'to': 'second@test.test',
+            'template_code': EmailType.NEW_TASK,
+            'message_data': {'workflow_name': 'Second'},
+            'user_id': 2,
+        },
+    ])
+    client.send_email(
+        to='third@test.test',
+        template_code=EmailType.NEW_TASK,
+        message_data={'workflow_name': 'Third'},
+        user_id=3,
+    )
+
+    # assert
+    get_connection_mock.assert_called_once_with(fail_silently=False)
+    connection_mock.open.assert_called_once()
+    assert [
+        [email.to for email in call[0][0]]
+        for call in connection_mock.send_messages.call_args_list
+    ] == [
+        [['first@test.test']],
+        [['second@test.test']],
+        [['third@test.test']],
+    ]
+
+
+def test_send_email__server_disconnected__reconnect(mocker):
+
+    # arrange
+    stale_connection_mock = mocker.Mock()
+    stale_connection_mock.send_messages.side_effect = (
+        smtplib.SMTPServerDisconnected
+    )
+    connection_mock = mocker.Mock()
+    mocker.patch(
+        'src.notifications.clients.smtp.get_connection',
+        side_effect=[stale_connection_mock, connection_mock],
+    )
+    client = SMTPEmailClient(account_id=1)
+
+    # act
+    client.send_email(
+        to='first@test.test',
+        template_code=EmailType.NEW_TASK,
+        message_data={'workflow_name': 'First'},
+        user_id=1,
+    )
+
+    # assert
+    stale_connection_mock.close.assert_called_once()
+    connection_mock.send_messages.assert_called_once()
+
+
+def test_send_many__disconnected_in_batch__send_rest_only(mocker):
+
+    # arrange
+    stale_connection_mock = mocker.Mock()
+    stale_connection_mock.send_messages.side_effect = [
+        1,
+        smtplib.SMTPServerDisconnected,
+    ]
+    connection_mock = mocker.Mock()
+    mocker.patch(
+        'src.notifications.clients.smtp.get_connection',
+        side_effect=[stale_connection_mock, connection_mock],
+    )
+    client = SMTPEmailClient(account_id=1)
+
+    # act
+    client.send_many([
+        {
+            'to': f'{name}@test.test',
+            'template_code': EmailType.NEW_TASK,
+            'message_data': {'workflow_name': name},
+            'user_id': user_id,
+        }
+        for user_id, name in enumerate(('first', 'second', 'third'))
+    ])
+
+    # assert
+    stale_connection_mock.close.assert_called_once()
+    connection_mock.send_messages.assert_called_once()
+    emails = connection_mock.send_messages.call_args[0][0]
+    assert [email.to for email in emails] == [
+        ['second@test.test'],
+        ['third@test.test'],
+    ]
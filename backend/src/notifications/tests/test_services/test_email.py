@@ -2141,3 +2141,58 @@ def test_send_vacation_delegation__ok(mocker):
             'button_text': 'View Tasks',
         },
     )
+
+
+def test_send_email_via_client__batch__send_on_flush(mocker):
+
+    # arrange
+    settings_mock = mocker.patch(
+        'src.notifications.services.email.settings',
+    )
+    settings_mock.EMAIL_PROVIDER = EmailProvider.SMTP
+    send_email_mock = mocker.patch(
+        'src.notifications.clients.smtp.SMTPEmailClient.send_email',
+    )
+    send_many_mock = mocker.patch(
+        'src.notifications.clients.smtp.SMTPEmailClient.send_many',
+    )
+    create_account_log_mock = mocker.patch(
+        'src.notifications.services.email.AccountLogService'
+        '.email_message',
+    )
+    data = {'test': 'data'}
+    service = EmailService(
+        logging=True,
+        account_id=123,
+        batch=True,
+    )
+    for user_id, email in ((1, 'first@test.test'), (2, 'second@test.test')):
+        service._send_email_via_client(
+            title='Title test',
+            user_id=user_id,
+            user_email=email,
+            template_code=EmailType.NEW_TASK,
+            data=data,
+        )
+
+    # act
+    service.flush()
+
+    # assert
+    send_email_mock.assert_not_called()
+    send_many_mock.assert_called_once_with([
+        {
+            'to': 'first@test.test',
+            'template_code': EmailType.NEW_TASK,
+            'message_data': data,
+            'user_id': 1,
+        },
+        {
+            'to': 'second@test.test',
+            'template_code': EmailType.NEW_TASK,
+            'message_data': data,
+            'user_id': 2,
+        },
+    ])
+    assert create_account_log_mock.call_count == 2
+    assert service._batch_messages == []
@@ -1611,3 +1611,298 @@ class TestPushNotificationService:
             user_id=user.id,
             user_email=user.email,
         )
+
+    def test_send__batch__collect_recipients(self, mocker):
+
+        # arrange
+        account = create_test_account(log_api_requests=False)
+        user = create_test_user(account=account)
+        another_user = create_test_user(
+            account=account,
+            email='another@test.test',
+        )
+        method_name = 'test_method_name'
+        settings_mock = mocker.patch(
+            'src.notifications.services.push.settings',
+        )
+        settings_mock.PROJECT_CONF = {'PUSH': True}
+        mocker.patch(
+            'src.notifications.services.push.'
+            'PushNotificationService.ALLOWED_METHODS',
+            {method_name},
+        )
+        send_to_browsers_mock = mocker.patch(
+            'src.notifications.services.push.'
+            'PushNotificationService._send_to_browsers',
+        )
+        send_to_apps_mock = mocker.patch(
+            'src.notifications.services.push.'
+            'PushNotificationService._send_to_apps',
+        )
+        multicast_to_browsers_mock = mocker.patch(
+            'src.notifications.services.push.'
+            'PushNotificationService._send_multicast_to_browsers',
+        )
+        multicast_to_apps_mock = mocker.patch(
+            'src.notifications.services.push.'
+            'PushNotificationService._send_multicast_to_apps',
+        )
+        service = PushNotificationService(
+            account_id=account.id,
+            logging=account.log_api_requests,
+            batch=True,
+        )
+        data = {
+            'method': method_name,
+            'title': 'title',
+            'body': 'body',
+            'extra': 'extra',
+        }
+
+        # act
+        for recipient in (user, another_user):
+            service._send(
+                title='title',
+                body='body',
+                method_name=method_name,
+                extra_data={'extra': 'extra'},
+                user_id=recipient.id,
+                user_email=recipient.email,
+            )
+        service.flush()
+
+        # assert
+        send_to_browsers_mock.assert_not_called()
+        send_to_apps_mock.assert_not_called()
+        recipients = {
+            user.id: user.email,
+            another_user.id: another_user.email,
+        }
+        multicast_to_browsers_mock.assert_called_once_with(
+            title='title',
+            body='body',
+            data=data,
+            recipients=recipients,
+        )
+        multicast_to_apps_mock.assert_called_once_with(
+            title='title',
+            body='body',
+            data=data,
+            recipients=recipients,
+        )
+        assert service._batch_messages == {}
+
+    def test_send_multicast_to_browsers__ok(self, mocker):
+
+        # arrange
+        account = create_test_account(log_api_requests=False)
+        user = create_test_user(account=account)
+        another_user = create_test_user(
+            account=account,
+            email='another@test.test',
+        )
+        Device.objects.create(user=user, token='token_1', is_app=False)
+        Device.objects.create(
+            user=another_user,
+            token='token_2',
+            is_app=False,
+        )
+        Device.objects.create(user=user, token='app_token', is_app=True)
+        data = {'title': 'title', 'extra': 'extra'}
+        message_mock = mocker.Mock()
+        create_message_mock = mocker.patch(
+            'src.notifications.services.push.messaging.MulticastMessage',
+            return_value=message_mock,
+        )
+        send_multicast_mock = mocker.patch(
+            'src.notifications.services.push.messaging.send_multicast',
+            return_value=mocker.Mock(
+                responses=[
+                    mocker.Mock(success=True, exception=None),
+                    mocker.Mock(success=True, exception=None),
+                ],
+            ),
+        )
+        handle_error_mock = mocker.patch(
+            'src.notifications.services.push.'
+            'PushNotificationService._handle_error',
+        )
+        service = PushNotificationService(
+            account_id=account.id,
+            logging=account.log_api_requests,
+            batch=True,
+        )
+
+        # act
+        service._send_multicast_to_browsers(
+            title='title',
+            body='body',
+            data=data,
+            recipients={
+                user.id: user.email,
+                another_user.id: another_user.email,
+            },
+        )
+
+        # assert
+        create_message_mock.assert_called_once()
+        tokens = create_message_mock.call_args[1]['tokens']
+        assert set(tokens) == {'token_1', 'token_2'}
+        send_multicast_mock.assert_called_once_with(message_mock)
+        handle_error_mock.assert_not_called()
+
+    def test_send_multicast_to_apps__increment_counter_once(self, mocker):
+
+        # arrange
+        account = create_test_account(log_api_requests=False)
+        user = create_test_user(account=account)
+        counter = UserNotifications.objects.create(
+            user=user,
+            count_unread_push_in_ios_app=1,
+        )
+        Device.objects.create(user=user, token='token_1', is_app=True)
+        Device.objects.create(user=user, token='token_2', is_app=True)
+        aps_mock = mocker.patch(
+            'src.notifications.services.push.Aps',
+        )
+        mocker.patch(
+            'src.notifications.services.push.Config',
+        )
+        create_message_mock = mocker.patch(
+            'src.notifications.services.push.messaging.MulticastMessage',
+        )
+        mocker.patch(
+            'src.notifications.services.push.messaging.send_multicast',
+            return_value=mocker.Mock(
+                responses=[
+                    mocker.Mock(success=True, exception=None),
+                    mocker.Mock(success=True, exception=None),
+                ],
+            ),
+        )
+        service = PushNotificationService(
+            account_id=account.id,
+            logging=account.log_api_requests,
+            batch=True,
+        )
+
+        # act
+        service._send_multicast_to_apps(
+            title='title',
+            body='body',
+            data={'title': 'title'},
+            recipients={user.id: user.email},
+        )
+
+        # assert
+        counter.refresh_from_db()
+        assert counter.count_unread_push_in_ios_app == 2
+        aps_mock.assert_called_once_with(sound='default', badge=2)
+        create_message_mock.assert_called_once()
+        tokens = create_message_mock.call_args[1]['tokens']
+        assert set(tokens) == {'token_1', 'token_2'}
+
+    def test_send_multicast__invalid_tokens__bulk_delete(self, mocker):
+
+        # arrange
+        account = create_test_account(log_api_requests=False)
+        user = create_test_user(account=account)
+        Device.objects.create(user=user, token='valid', is_app=False)
+        Device.objects.create(user=user, token='invalid_1', is_app=False)
+        Device.objects.create(user=user, token='invalid_2', is_app=False)
+        error = FirebaseError(message='Error', code=13)
+        mocker.patch(
+            'src.notifications.services.push.messaging.send_multicast',
+            return_value=mocker.Mock(
+                responses=[
+                    mocker.Mock(success=True, exception=None),
+                    mocker.Mock(
+                        success=False,
+                        exception=UnregisteredError(message='error'),
+                    ),
+                    mocker.Mock(
+                        success=False,
+                        exception=InvalidArgumentError(message='error'),
+                    ),
+                    mocker.Mock(success=False, exception=error),
+                ],
+            ),
+        )
+        handle_error_mock = mocker.patch(
+            'src.notifications.services.push.'
+            'PushNotificationService._handle_error',
+        )
+        log_error_mock = mocker.patch(
+            'src.notifications.services.push.'
+            'PushNotificationService._log_error',
+        )
+        service = PushNotificationService(
+            account_id=account.id,
+            logging=account.log_api_requests,
+            batch=True,
+        )
+        data = {'title': 'title'}
+
+        # act
+        service._send_multicast(
+            message=mocker.Mock(),
+            tokens=[
+                (user.id, 'valid'),
+                (user.id, 'invalid_1'),
+                (user.id, 'invalid_2'),
+                (user.id, 'other'),
+            ],
+            recipients={user.id: user.email},
+            data=data,
+            device='browser',
+        )
+
+        # assert
+        assert log_error_mock.call_count == 2
+        handle_error_mock.assert_called_once_with(
+            token='other',
+            user_id=user.id,
+            user_email=user.email,
+            exception=error,
+            data=data,
+            device='browser',
+        )
+        tokens = set(Device.objects.values_list('token', flat=True))
+        assert tokens == {'valid'}
+
+    def test_send_multicast__request_error__capture_sentry(self, mocker):
+
+        # arrange
+        account = create_test_account(log_api_requests=False)
+        user = create_test_user(account=account)
+        Device.objects.create(user=user, token='token', is_app=False)
+        mocker.patch(
+            'src.notifications.services.push.messaging.send_multicast',
+            side_effect=FirebaseError(message='Error', code=13),
+        )
+        sentry_mock = mocker.patch(
+            'src.notifications.services.push.capture_sentry_message',
+        )
+        handle_error_mock = mocker.patch(
+            'src.notifications.services.push.'
+            'PushNotificationService._handle_error',
+        )
+        service = PushNotificationService(
+            account_id=account.id,
+            logging=account.log_api_requests,
+            batch=True,
+        )
+
+        # act
+        service._send_multicast(
+            message=mocker.Mock(),
+            tokens=[(user.id, 'token')],
+            recipients={user.id: user.email},
+            data={'title': 'title'},
+            device='browser',
+        )
+
+        # assert
+        sentry_mock.assert_called_once()
+        handle_error_mock.assert_not_called()
+        assert Device.objects.filter(token='token').exists()
@@ -1473,3 +1473,166 @@ def test_send_account_plan_changed__ok(mocker):
         data=plan_data,
         sync=True,
     )
+
+
+def test_send_to_users__ok(mocker):
+
+    # arrange
+    data = {'event': 'data'}
+    bulk_send_mock = mocker.patch(
+        'src.notifications.services.websockets.'
+        'WebSocketService._bulk_send',
+    )
+    service = WebSocketService(
+        logging=True,
+        logo_lg='https://logo.com',
+        account_id=123,
+    )
+
+    # act
+    service.send_to_users(
+        method_name=NotificationMethod.event_created,
+        user_ids=[12, 13],
+        data=data,
+        sync=True,
+    )
+
+    # assert
+    bulk_send_mock.assert_called_once_with(
+        method_name=NotificationMethod.event_created,
+        group_names=['events_12', 'events_13'],
+        data=data,
+        sync=True,
+    )
+
+
+def test_send_to_account__ok(mocker):
+
+    # arrange
+    data = {'user': 'data'}
+    bulk_send_mock = mocker.patch(
+        'src.notifications.services.websockets.'
+        'WebSocketService._bulk_send',
+    )
+    service = WebSocketService(
+        logging=True,
+        account_id=123,
+    )
+
+    # act
+    service.send_to_account(
+        method_name=NotificationMethod.user_created,
+        data=data,
+        sync=True,
+    )
+
+    # assert
+    bulk_send_mock.assert_called_once_with(
+        method_name=NotificationMethod.user_created,
+        group_names=['events_account_123'],
+        data=data,
+        sync=True,
+    )
+
+
+def test_bulk_send__one_message_for_all_groups(mocker):
+
+    # arrange
+    data = {'event': 'data'}
+    message = {'id': 'message_id', 'data': data}
+    get_message_mock = mocker.patch(
+        'src.notifications.services.websockets.'
+        'WebSocketService._get_message',
+        return_value=message,
+    )
+    group_send_mock = mocker.patch(
+        'src.notifications.services.websockets.'
+        'WebSocketService._group_send_many',
+    )
+    async_to_sync_mock = mocker.patch(
+        'src.notifications.services.websockets.async_to_sync',
+        return_value=mocker.Mock(),
+    )
+    service = WebSocketService(
+        logging=True,
+        account_id=123,
+    )
+    group_names = ['events_12', 'events_13']
+
+    # act
+    service._bulk_send(
+        method_name=NotificationMethod.event_created,
+        group_names=group_names,
+        data=data,
+        sync=True,
+    )
+
+    # assert
+    get_message_mock.assert_called_once_with(
+        method_name=NotificationMethod.event_created,
+        data=data,
+    )
+    async_to_sync_mock.assert_called_once_with(group_send_mock)
+    async_to_sync_mock.return_value.assert_called_once_with(
+        group_names,
+        message,
+    )
+
+
+def test_bulk_send__no_groups__skip(mocker):
+
+    # arrange
+    async_to_sync_mock = mocker.patch(
+        'src.notifications.services.websockets.async_to_sync',
+    )
+    service = WebSocketService(
+        logging=True,
+        account_id=123,
+    )
+
+    # act
+    service._bulk_send(
+        method_name=NotificationMethod.event_created,
+        group_names=[],
+        data={'event': 'data'},
+        sync=True,
+    )
+
+    # assert
+    async_to_sync_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_consumer_send_to_account__received(mocker):
+
+    # arrange
+    user = create_test_user()
+    user_data = {'id': 1, 'first_name': 'John'}
+    service = WebSocketService(
+        logging=False,
+        account_id=user.account_id,
+    )
+    mocker.patch(
+        'src.authentication.'
+        'middleware.PneumaticToken.get_user_from_token',
+        return_value=user,
+    )
+    communicator = WebsocketCommunicator(
+        application,
+        '/ws/events?auth_token=123456',
+    )
+    await communicator.connect()
+
+    service.send_to_account(
+        method_name=NotificationMethod.user_created,
+        data=user_data,
+        sync=False,
+    )
+
+    # act
+    response = await communicator.receive_json_from()
+
+    # assert
+    assert response['type'] == NotificationMethod.user_created
+    assert response['data'] == user_data
+    await communicator.disconnect()
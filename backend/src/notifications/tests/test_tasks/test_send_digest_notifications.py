@@ -0,0 +1,98 @@
+import pytest
+
+from src.notifications.services.email import EmailService
+from src.notifications.tasks import (
+    _send_digest_notifications,
+    _send_workflows_digest_notification,
+)
+from src.processes.tests.fixtures import create_test_account
+
+pytestmark = pytest.mark.django_db
+
+
+def test_send_digest_notifications__one_batch_per_account(mocker):
+
+    # arrange
+    account_1 = create_test_account()
+    account_2 = create_test_account()
+    send_digest_mock = mocker.patch(
+        'src.notifications.services.email.EmailService'
+        '.send_workflows_digest',
+    )
+    flush_mock = mocker.patch(
+        'src.notifications.services.email.EmailService.flush',
+    )
+    init_spy = mocker.spy(EmailService, '__init__')
+    notifications = [
+        {
+            'user_id': user_id,
+            'user_email': f'user{user_id}@pneumatic.app',
+            'account_id': account_id,
+            'date_from': '01 Jan',
+            'date_to': '07 Jan, 2024',
+            'digest': {},
+            'logo_lg': None,
+        }
+        for user_id, account_id in (
+            (1, account_1.id),
+            (2, account_1.id),
+            (3, account_2.id),
+        )
+    ]
+
+    # act
+    _send_digest_notifications(
+        send_notification=_send_workflows_digest_notification,
+        notifications=notifications,
+    )
+
+    # assert
+    assert send_digest_mock.call_count == 3
+    assert flush_mock.call_count == 2
+    assert init_spy.call_count == 2
+    for call in init_spy.call_args_list:
+        assert call.kwargs['batch'] is True
+
+
+def test_send_digest_notifications__one_failed__send_others(mocker):
+
+    # arrange
+    account = create_test_account()
+    send_digest_mock = mocker.patch(
+        'src.notifications.services.email.EmailService'
+        '.send_workflows_digest',
+        side_effect=[Exception('error'), None, None],
+    )
+    flush_mock = mocker.patch(
+        'src.notifications.services.email.EmailService.flush',
+    )
+    capture_mock = mocker.patch(
+        'src.notifications.tasks.capture_sentry_exception',
+    )
+    notifications = [
+        {
+            'user_id': user_id,
+            'user_email': f'user{user_id}@pneumatic.app',
+            'account_id': account.id,
+            'date_from': '01 Jan',
+            'date_to': '07 Jan, 2024',
+            'digest': {},
+            'logo_lg': None,
+        }
+        for user_id in (1, 2, 3)
+    ]
+
+    # act
+    _send_digest_notifications(
+        send_notification=_send_workflows_digest_notification,
+        notifications=notifications,
+    )
+
+    # assert
+    assert send_digest_mock.call_count == 3
+    flush_mock.assert_called_once()
+    capture_mock.assert_called_once()
+    assert capture_mock.call_args.kwargs['data'] == {
+        'user_id': 1,
+        'account_id': account.id,
+    }
@@ -90,6 +90,8 @@ def test_send_new_task_notification__external_workflow__ok(api_client, mocker):
     send_notification_mock.assert_called_once_with(
         logging=account.log_api_requests,
         account_id=account.id,
+        push_service=mocker.ANY,
+        email_service=mocker.ANY,
         method_name=NotificationMethod.new_task,
         user_id=user.id,
         user_email=user.email,
@@ -161,6 +163,10 @@ def test_send_new_task_notification__is_returned_true__call_services(mocker):
         attribute='__init__',
         return_value=None,
     )
+    push_flush_mock = mocker.patch(
+        'src.notifications.services.push.'
+        'PushNotificationService.flush',
+    )
     push_notification_mock = mocker.patch(
         'src.notifications.services.push.'
         'PushNotificationService.send_returned_task',
@@ -205,7 +211,9 @@ def test_send_new_task_notification__is_returned_true__call_services(mocker):
         logging=logging,
         account_id=account.id,
         logo_lg=logo_lg,
+        batch=True,
     )
+    push_flush_mock.assert_called_once()
     link = f'{settings.FRONTEND_URL}/tasks/{task.id}'
     push_notification_mock.assert_called_once_with(
         task_data=task_data,
@@ -294,6 +302,10 @@ def test_send_new_task_notification__is_returned_false__call_services(mocker):
         attribute='__init__',
         return_value=None,
     )
+    push_flush_mock = mocker.patch(
+        'src.notifications.services.push.'
+        'PushNotificationService.flush',
+    )
     push_notification_mock = mocker.patch(
         'src.notifications.services.push.'
         'PushNotificationService.send_new_task',
@@ -339,7 +351,9 @@ def test_send_new_task_notification__is_returned_false__call_services(mocker):
         logging=logging,
         account_id=account.id,
         logo_lg=logo_lg,
+        batch=True,
     )
+    push_flush_mock.assert_called_once()
     link = f'{settings.FRONTEND_URL}/tasks/{task.id}'
     push_notification_mock.assert_called_once_with(
         task_data=task_data,
@@ -448,6 +462,8 @@ def test_send_new_task_notification__ok(mocker, value):
             mocker.call(
                 logging=logging,
                 account_id=account.id,
+                push_service=mocker.ANY,
+                email_service=mocker.ANY,
                 method_name=method_name,
                 user_id=owner.id,
                 user_email=owner.email,
@@ -469,6 +485,8 @@ def test_send_new_task_notification__ok(mocker, value):
             mocker.call(
                 logging=logging,
                 account_id=account.id,
+                push_service=mocker.ANY,
+                email_service=mocker.ANY,
                 method_name=method_name,
                 user_id=user.id,
                 user_email=user.email,
@@ -622,6 +640,8 @@ def test_send_new_task_notification__task_data__ok(mocker):
     send_notification_mock.assert_called_once_with(
         logging=logging,
         account_id=account.id,
+        push_service=mocker.ANY,
+        email_service=mocker.ANY,
         method_name=NotificationMethod.new_task,
         user_id=user.id,
         user_email=user.email,
@@ -2,6 +2,7 @@ from datetime import timedelta
 
 import pytest
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 
 from src.accounts.enums import (
@@ -13,19 +14,25 @@ from src.accounts.serializers.notifications import (
     NotificationTaskSerializer,
     NotificationWorkflowSerializer,
 )
+from src.executor import RawSqlExecutor
 from src.notifications.enums import NotificationMethod
 from src.notifications.services.push import (
     PushNotificationService,
 )
 from src.notifications.tasks import (
+    NOTIFICATION_CHANNELS,
+    OVERDUE_FULL_SCAN_KEY,
+    OVERDUE_WATERMARK_KEY,
+    OVERDUE_WATERMARK_OVERLAP,
     _send_overdue_task_notification,
+    send_overdue_task_notification,
 )
 from src.processes.enums import (
     DirectlyStatus,
     WorkflowStatus,
     PerformerType,
 )
-from src.processes.models.workflows.task import TaskPerformer
+from src.processes.models.workflows.task import Task, TaskPerformer
 from src.processes.tests.fixtures import (
     create_test_account,
     create_test_admin,
@@ -39,6 +46,13 @@ from src.processes.tests.fixtures import (
 pytestmark = pytest.mark.django_db
 
 
+@pytest.fixture(autouse=True)
+def clear_overdue_watermark():
+    cache.delete_many([OVERDUE_WATERMARK_KEY, OVERDUE_FULL_SCAN_KEY])
+    yield
+    cache.delete_many([OVERDUE_WATERMARK_KEY, OVERDUE_FULL_SCAN_KEY])
+
+
 def test_send_overdue_task_notification__call_all_services__ok(mocker):
 
     # arrange
@@ -216,27 +230,30 @@ def test_send_overdue_task_notification__guest__ok(mocker):
         f'{settings.FRONTEND_URL}/guest-task/{task.id}'
         f'?token={token}&utm_campaign=guestUser&utm_term={guest.id}'
     )
-    send_notification_mock.assert_called_once_with(
-        logging=account.log_api_requests,
-        method_name=NotificationMethod.overdue_task,
-        account_id=guest.account_id,
-        user_id=guest.id,
-        user_type=guest.type,
-        user_email=guest.email,
-        logo_lg=account.logo_lg,
-        task_id=task.id,
-        task_name=task.name,
-        workflow_id=workflow.id,
-        workflow_name=workflow.name,
-        template_name=workflow.template.name,
-        workflow_starter_id=workflow.workflow_starter_id,
-        workflow_starter_first_name=user.first_name,
-        workflow_starter_last_name=user.last_name,
-        notification=notification,
-        sync=True,
-        token=token,
-        link=link,
-    )
+    assert send_notification_mock.call_count == len(NOTIFICATION_CHANNELS)
+    for channel in NOTIFICATION_CHANNELS:
+        send_notification_mock.assert_any_call(
+            channels=[channel],
+            logging=account.log_api_requests,
+            method_name=NotificationMethod.overdue_task,
+            account_id=guest.account_id,
+            user_id=guest.id,
+            user_type=guest.type,
+            user_email=guest.email,
+            logo_lg=account.logo_lg,
+            task_id=task.id,
+            task_name=task.name,
+            workflow_id=workflow.id,
+            workflow_name=workflow.name,
+            template_name=workflow.template.name,
+            workflow_starter_id=workflow.workflow_starter_id,
+            workflow_starter_first_name=user.first_name,
+            workflow_starter_last_name=user.last_name,
+            notification=notification,
+            sync=True,
+            token=token,
+            link=link,
+        )
     get_token_mock.assert_called_once_with(
         task_id=task.id,
         user_id=guest.id,
@@ -348,54 +365,59 @@ def test_send_overdue_task_notification__two_performers__ok(mocker):
         type=NotificationType.OVERDUE_TASK,
         status=NotificationStatus.NEW,
     )
-    assert send_notification_mock.call_count == 2
-    link = f'{settings.FRONTEND_URL}/tasks/{task.id}'
-    send_notification_mock.assert_has_calls(
-        [
-            mocker.call(
-                logging=user.account.log_api_requests,
-                method_name=NotificationMethod.overdue_task,
-                account_id=user.account_id,
-                user_id=user.id,
-                user_type=user.type,
-                user_email=user.email,
-                logo_lg=None,
-                task_id=task.id,
-                task_name=task.name,
-                workflow_id=workflow.id,
-                workflow_name=workflow.name,
-                template_name=workflow.template.name,
-                workflow_starter_id=workflow.workflow_starter_id,
-                workflow_starter_first_name=user.first_name,
-                workflow_starter_last_name=user.last_name,
-                notification=notification_1,
-                sync=True,
-                token=None,
-                link=link,
-            ),
-            mocker.call(
-                logging=user_2.account.log_api_requests,
-                method_name=NotificationMethod.overdue_task,
-                account_id=user.account_id,
-                user_id=user_2.id,
-                user_type=user.type,
-                user_email=user_2.email,
-                logo_lg=None,
-                task_id=task.id,
-                task_name=task.name,
-                workflow_id=workflow.id,
-                workflow_name=workflow.name,
-                template_name=workflow.template.name,
-                workflow_starter_id=workflow.workflow_starter_id,
-                workflow_starter_first_name=user.first_name,
-                workflow_starter_last_name=user.last_name,
-                notification=notification_2,
-                sync=True,
-                token=None,
-                link=link,
-            ),
-        ],
+    assert send_notification_mock.call_count == (
+        2 * len(NOTIFICATION_CHANNELS)
     )
+    link = f'{settings.FRONTEND_URL}/tasks/{task.id}'
+    for channel in NOTIFICATION_CHANNELS:
+        send_notification_mock.assert_has_calls(
+            [
+                mocker.call(
+                    channels=[channel],
+                    logging=user.account.log_api_requests,
+                    method_name=NotificationMethod.overdue_task,
+                    account_id=user.account_id,
+                    user_id=user.id,
+                    user_type=user.type,
+                    user_email=user.email,
+                    logo_lg=None,
+                    task_id=task.id,
+                    task_name=task.name,
+                    workflow_id=workflow.id,
+                    workflow_name=workflow.name,
+                    template_name=workflow.template.name,
+                    workflow_starter_id=workflow.workflow_starter_id,
+                    workflow_starter_first_name=user.first_name,
+                    workflow_starter_last_name=user.last_name,
+                    notification=notification_1,
+                    sync=True,
+                    token=None,
+                    link=link,
+                ),
+                mocker.call(
+                    channels=[channel],
+                    logging=user_2.account.log_api_requests,
+                    method_name=NotificationMethod.overdue_task,
+                    account_id=user.account_id,
+                    user_id=user_2.id,
+                    user_type=user.type,
+                    user_email=user_2.email,
+                    logo_lg=None,
+                    task_id=task.id,
+                    task_name=task.name,
+                    workflow_id=workflow.id,
+                    workflow_name=workflow.name,
+                    template_name=workflow.template.name,
+                    workflow_starter_id=workflow.workflow_starter_id,
+                    workflow_starter_first_name=user.first_name,
+                    workflow_starter_last_name=user.last_name,
+                    notification=notification_2,
+                    sync=True,
+                    token=None,
+                    link=link,
+                ),
+            ],
+        )
 
 
 def test_send_overdue_task_notification__completed_task__skip(
@@ -586,27 +608,30 @@ def test_send_overdue_task_notification__deleted_performer__skip(mocker):
         status=NotificationStatus.NEW,
     )
     link = f'{settings.FRONTEND_URL}/tasks/{task.id}'
-    send_notification_mock.assert_called_once_with(
-        logging=user.account.log_api_requests,
-        method_name=NotificationMethod.overdue_task,
-        account_id=user.account_id,
-        user_id=user.id,
-        user_type=user.type,
-        user_email=user.email,
-        logo_lg=None,
-        task_id=task.id,
-        task_name=task.name,
-        workflow_id=workflow.id,
-        workflow_name=workflow.name,
-        template_name=workflow.template.name,
-        workflow_starter_id=workflow.workflow_starter_id,
-        workflow_starter_first_name=user.first_name,
-        workflow_starter_last_name=user.last_name,
-        notification=notification,
-        sync=True,
-        token=None,
-        link=link,
-    )
+    assert send_notification_mock.call_count == len(NOTIFICATION_CHANNELS)
+    for channel in NOTIFICATION_CHANNELS:
+        send_notification_mock.assert_any_call(
+            channels=[channel],
+            logging=user.account.log_api_requests,
+            method_name=NotificationMethod.overdue_task,
+            account_id=user.account_id,
+            user_id=user.id,
+            user_type=user.type,
+            user_email=user.email,
+            logo_lg=None,
+            task_id=task.id,
+            task_name=task.name,
+            workflow_id=workflow.id,
+            workflow_name=workflow.name,
+            template_name=workflow.template.name,
+            workflow_starter_id=workflow.workflow_starter_id,
+            workflow_starter_first_name=user.first_name,
+            workflow_starter_last_name=user.last_name,
+            notification=notification,
+            sync=True,
+            token=None,
+            link=link,
+        )
 
 
 def test_send_overdue_task_notification__completed_performer__skip(mocker):
@@ -649,27 +674,30 @@ def test_send_overdue_task_notification__completed_performer__skip(mocker):
         status=NotificationStatus.NEW,
     )
     link = f'{settings.FRONTEND_URL}/tasks/{task.id}'
-    send_notification_mock.assert_called_once_with(
-        logging=user.account.log_api_requests,
-        method_name=NotificationMethod.overdue_task,
-        account_id=user.account_id,
-        user_id=user.id,
-        user_type=user.type,
-        user_email=user.email,
-        logo_lg=None,
-        task_id=task.id,
-        task_name=task.name,
-        workflow_id=workflow.id,
-        workflow_name=workflow.name,
-        template_name=workflow.template.name,
-        workflow_starter_id=workflow.workflow_starter_id,
-        workflow_starter_first_name=user.first_name,
-        workflow_starter_last_name=user.last_name,
-        notification=notification,
-        sync=True,
-        token=None,
-        link=link,
-    )
+    assert send_notification_mock.call_count == len(NOTIFICATION_CHANNELS)
+    for channel in NOTIFICATION_CHANNELS:
+        send_notification_mock.assert_any_call(
+            channels=[channel],
+            logging=user.account.log_api_requests,
+            method_name=NotificationMethod.overdue_task,
+            account_id=user.account_id,
+            user_id=user.id,
+            user_type=user.type,
+            user_email=user.email,
+            logo_lg=None,
+            task_id=task.id,
+            task_name=task.name,
+            workflow_id=workflow.id,
+            workflow_name=workflow.name,
+            template_name=workflow.template.name,
+            workflow_starter_id=workflow.workflow_starter_id,
+            workflow_starter_first_name=user.first_name,
+            workflow_starter_last_name=user.last_name,
+            notification=notification,
+            sync=True,
+            token=None,
+            link=link,
+        )
 
 
 def test_send_overdue_task_notification__group_performer__ok(mocker):
@@ -704,24 +732,228 @@ def test_send_overdue_task_notification__group_performer__ok(mocker):
         status=NotificationStatus.NEW,
     )
     link = f'{settings.FRONTEND_URL}/tasks/{task.id}'
-    send_notification_mock.assert_called_once_with(
-        logging=user.account.log_api_requests,
-        method_name=NotificationMethod.overdue_task,
-        account_id=group_user.account_id,
-        user_id=group_user.id,
-        user_type=group_user.type,
-        user_email=group_user.email,
-        logo_lg=None,
+    assert send_notification_mock.call_count == len(NOTIFICATION_CHANNELS)
+    for channel in NOTIFICATION_CHANNELS:
+        send_notification_mock.assert_any_call(
+            channels=[channel],
+            logging=user.account.log_api_requests,
+            method_name=NotificationMethod.overdue_task,
+            account_id=group_user.account_id,
+            user_id=group_user.id,
+            user_type=group_user.type,
+            user_email=group_user.email,
+            logo_lg=None,
+            task_id=task.id,
+            task_name=task.name,
+            workflow_id=workflow.id,
+            workflow_name=workflow.name,
+            template_name=workflow.template.name,
+            workflow_starter_id=workflow.workflow_starter_id,
+            workflow_starter_first_name=user.first_name,
+            workflow_starter_last_name=user.last_name,
+            notification=notification,
+            sync=True,
+            token=None,
+            link=link,
+        )
+
+
+def test_send_overdue_task_notification__two_performers__serialize_once(
+    mocker,
+):
+
+    # arrange
+    user = create_test_user()
+    user_2 = create_test_user(
+        is_account_owner=False,
+        account=user.account,
+        email='t@t.t',
+    )
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    task.due_date = timezone.now() - timedelta(minutes=5)
+    task.save(update_fields=['due_date'])
+    task.add_raw_performer(user_2)
+    task.update_performers()
+    mocker.patch('src.notifications.tasks._send_notification')
+    task_serializer_spy = mocker.spy(
+        NotificationTaskSerializer,
+        '__init__',
+    )
+
+    # act
+    _send_overdue_task_notification()
+
+    # assert
+    assert task_serializer_spy.call_count == 1
+    assert Notification.objects.filter(
         task_id=task.id,
-        task_name=task.name,
-        workflow_id=workflow.id,
-        workflow_name=workflow.name,
-        template_name=workflow.template.name,
-        workflow_starter_id=workflow.workflow_starter_id,
-        workflow_starter_first_name=user.first_name,
-        workflow_starter_last_name=user.last_name,
-        notification=notification,
-        sync=True,
-        token=None,
-        link=link,
+        type=NotificationType.OVERDUE_TASK,
+    ).count() == 2
+
+
+def test_send_overdue_task_notification__before_watermark__skip(mocker):
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    task.due_date = timezone.now() - timedelta(minutes=5)
+    task.save(update_fields=['due_date'])
+    cache.set(OVERDUE_WATERMARK_KEY, timezone.now() - timedelta(minutes=1))
+    cache.set(OVERDUE_FULL_SCAN_KEY, timezone.now())
+    send_notification_mock = mocker.patch(
+        'src.notifications.tasks._send_notification',
     )
+
+    # act
+    _send_overdue_task_notification()
+
+    # assert
+    assert not Notification.objects.filter(
+        task_id=task.id,
+        type=NotificationType.OVERDUE_TASK,
+    ).exists()
+    send_notification_mock.assert_not_called()
+    assert cache.get(OVERDUE_WATERMARK_KEY) > task.due_date
+
+
+def test_send_overdue_task_notification__full_scan_expired__ok(mocker):
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    task.due_date = timezone.now() - timedelta(hours=2)
+    task.save(update_fields=['due_date'])
+    cache.set(OVERDUE_WATERMARK_KEY, timezone.now() - timedelta(minutes=1))
+    send_notification_mock = mocker.patch(
+        'src.notifications.tasks._send_notification',
+    )
+    started_at = timezone.now()
+
+    # act
+    _send_overdue_task_notification()
+
+    # assert
+    assert Notification.objects.filter(
+        task_id=task.id,
+        user_id=user.id,
+        type=NotificationType.OVERDUE_TASK,
+    ).exists()
+    assert send_notification_mock.call_count > 0
+    assert cache.get(OVERDUE_FULL_SCAN_KEY) >= started_at
+    assert cache.get(OVERDUE_WATERMARK_KEY) >= (
+        started_at - OVERDUE_WATERMARK_OVERLAP
+    )
+
+
+def test_send_overdue_task_notification__full_run__set_watermark(mocker):
+
+    # arrange
+    mocker.patch('src.notifications.tasks._send_notification')
+    started_at = timezone.now()
+
+    # act
+    _send_overdue_task_notification()
+
+    # assert
+    watermark = cache.get(OVERDUE_WATERMARK_KEY)
+    assert watermark is not None
+    assert watermark >= started_at - OVERDUE_WATERMARK_OVERLAP
+
+
+def test_send_overdue_task_notification__task_ids__not_set_watermark(
+    mocker,
+):
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    task.due_date = timezone.now() - timedelta(minutes=5)
+    task.save(update_fields=['due_date'])
+    mocker.patch('src.notifications.tasks._send_notification')
+
+    # act
+    _send_overdue_task_notification(task_ids=[task.id])
+
+    # assert
+    assert Notification.objects.filter(
+        task_id=task.id,
+        type=NotificationType.OVERDUE_TASK,
+    ).exists()
+    assert cache.get(OVERDUE_WATERMARK_KEY) is None
+
+
+def test_send_overdue_task_notification__notified_meanwhile__skip(mocker):
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    task.due_date = timezone.now() - timedelta(minutes=5)
+    task.save(update_fields=['due_date'])
+    send_notification_mock = mocker.patch(
+        'src.notifications.tasks._send_notification',
+    )
+    fetch = RawSqlExecutor.fetch
+
+    def fetch_and_notify(*args, **kwargs):
+        rows = list(fetch(*args, **kwargs))
+        # The due date timer notified the user after the query
+        Notification.objects.create(
+            task_id=task.id,
+            user_id=user.id,
+            type=NotificationType.OVERDUE_TASK,
+            account_id=user.account.id,
+        )
+        return rows
+
+    mocker.patch(
+        'src.notifications.tasks.RawSqlExecutor.fetch',
+        side_effect=fetch_and_notify,
+    )
+
+    # act
+    _send_overdue_task_notification()
+
+    # assert
+    assert Notification.objects.filter(
+        task_id=task.id,
+        user_id=user.id,
+        type=NotificationType.OVERDUE_TASK,
+    ).count() == 1
+    send_notification_mock.assert_not_called()
+
+
+def test_send_overdue_task_notification__timer_service__full_scan(
+    mocker,
+    settings,
+):
+
+    # arrange
+    settings.TIMER_SERVICE = True
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    # The due date timer is missed, e.g. the queryset update
+    Task.objects.filter(id=task.id).update(
+        due_date=timezone.now() - timedelta(hours=2),
+    )
+    cache.set(OVERDUE_WATERMARK_KEY, timezone.now() - timedelta(minutes=1))
+    cache.set(OVERDUE_FULL_SCAN_KEY, timezone.now())
+    send_notification_mock = mocker.patch(
+        'src.notifications.tasks._send_notification',
+    )
+
+    # act
+    send_overdue_task_notification()
+
+    # assert
+    assert Notification.objects.filter(
+        task_id=task.id,
+        user_id=user.id,
+        type=NotificationType.OVERDUE_TASK,
+    ).exists()
+    assert send_notification_mock.call_count > 0
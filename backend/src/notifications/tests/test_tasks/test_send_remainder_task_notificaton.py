@@ -101,21 +101,24 @@ def test_send_reminder_task__ok(mocker):
     _send_reminder_task_notification()
 
     # assert
-    send_notification_mock.assert_called_once_with(
-        account_id=account.id,
-        logging=account.log_api_requests,
-        logo_lg=account.logo_lg,
-        method_name=NotificationMethod.task_reminder,
-        user_id=account_owner.id,
-        user_first_name=account_owner.first_name,
-        user_email=account_owner.email,
-        user_type=account_owner.type,
-        count=1,
-        task_id=task.id,
-        token=None,
-        link=f'{settings.FRONTEND_URL}/tasks',
-        sync=True,
-    )
+    assert send_notification_mock.call_count == 2
+    for channel in ('email', 'push'):
+        send_notification_mock.assert_any_call(
+            channels=[channel],
+            account_id=account.id,
+            logging=account.log_api_requests,
+            logo_lg=account.logo_lg,
+            method_name=NotificationMethod.task_reminder,
+            user_id=account_owner.id,
+            user_first_name=account_owner.first_name,
+            user_email=account_owner.email,
+            user_type=account_owner.type,
+            count=1,
+            task_id=task.id,
+            token=None,
+            link=f'{settings.FRONTEND_URL}/tasks',
+            sync=True,
+        )
 
 
 def test_send_reminder_task__two_tasks_from_diff_templates__ok(mocker):
@@ -145,21 +148,24 @@ def test_send_reminder_task__two_tasks_from_diff_templates__ok(mocker):
     _send_reminder_task_notification()
 
     # assert
-    send_notification_mock.assert_called_once_with(
-        account_id=account.id,
-        logging=account.log_api_requests,
-        logo_lg=account.logo_lg,
-        method_name=NotificationMethod.task_reminder,
-        user_id=account_owner.id,
-        user_first_name=account_owner.first_name,
-        user_email=account_owner.email,
-        user_type=account_owner.type,
-        count=2,
-        task_id=task_1.id,
-        token=None,
-        link=f'{settings.FRONTEND_URL}/tasks',
-        sync=True,
-    )
+    assert send_notification_mock.call_count == 2
+    for channel in ('email', 'push'):
+        send_notification_mock.assert_any_call(
+            channels=[channel],
+            account_id=account.id,
+            logging=account.log_api_requests,
+            logo_lg=account.logo_lg,
+            method_name=NotificationMethod.task_reminder,
+            user_id=account_owner.id,
+            user_first_name=account_owner.first_name,
+            user_email=account_owner.email,
+            user_type=account_owner.type,
+            count=2,
+            task_id=task_1.id,
+            token=None,
+            link=f'{settings.FRONTEND_URL}/tasks',
+            sync=True,
+        )
 
 
 def test_send_reminder_task__two_tasks_from_one_template__ok(mocker):
@@ -184,18 +190,21 @@ def test_send_reminder_task__two_tasks_from_one_template__ok(mocker):
     _send_reminder_task_notification()
 
     # assert
-    send_notification_mock.assert_called_once_with(
-        account_id=account.id,
-        logging=account.log_api_requests,
-        logo_lg=account.logo_lg,
-        method_name=NotificationMethod.task_reminder,
-        user_id=account_owner.id,
-        user_first_name=account_owner.first_name,
-        user_email=account_owner.email,
-        user_type=account_owner.type,
-        count=2,
-        task_id=task_1.id,
-        token=None,
-        link=f'{settings.FRONTEND_URL}/tasks',
-        sync=True,
-    )
+    assert send_notification_mock.call_count == 2
+    for channel in ('email', 'push'):
+        send_notification_mock.assert_any_call(
+            channels=[channel],
+            account_id=account.id,
+            logging=account.log_api_requests,
+            logo_lg=account.logo_lg,
+            method_name=NotificationMethod.task_reminder,
+            user_id=account_owner.id,
+            user_first_name=account_owner.first_name,
+            user_email=account_owner.email,
+            user_type=account_owner.type,
+            count=2,
+            task_id=task_1.id,
+            token=None,
+            link=f'{settings.FRONTEND_URL}/tasks',
+            sync=True,
+        )
@@ -1,6 +1,7 @@
 import pytest
 from django.utils import timezone
 
+from src.notifications.enums import NotificationMethod
 from src.notifications.tasks import (
     _send_workflow_comment_watched,
 )
@@ -9,9 +10,7 @@ from src.processes.enums import (
 )
 from src.processes.models.workflows.event import (
     WorkflowEventAction,
-)
-from src.processes.serializers.workflows.events import (
-    WorkflowEventSerializer,
+    WorkflowEventWatched,
 )
 from src.processes.services.events import (
     WorkflowEventService,
@@ -37,19 +36,18 @@ def test_send_workflow_comment_watched__not_watched__skip(mocker):
         text='text',
         after_create_actions=False,
     )
-    send_workflow_event_mock = mocker.patch(
-        'src.notifications.tasks._send_event_updated',
+    send_event_watched_mock = mocker.patch(
+        'src.notifications.tasks._send_event_watched',
     )
 
     # act
     _send_workflow_comment_watched()
 
     # assert
-    comment_event.refresh_from_db()
-    data = WorkflowEventSerializer(instance=comment_event).data
-    assert comment_event.watched == []
-    assert data['watched'] == []
-    send_workflow_event_mock.assert_not_called()
+    assert not WorkflowEventWatched.objects.filter(
+        event=comment_event,
+    ).exists()
+    send_event_watched_mock.assert_not_called()
 
 
 def test_send_workflow_comment_watched__first_watched__ok(mocker):
@@ -63,45 +61,47 @@ def test_send_workflow_comment_watched__first_watched__ok(mocker):
         is_account_owner=False,
     )
     workflow = create_test_workflow(account_owner, tasks_count=1)
+    task = workflow.tasks.get(number=1)
     comment_event = WorkflowEventService.comment_created_event(
         user=account_owner,
-        task=workflow.tasks.get(number=1),
+        task=task,
         text='text',
         after_create_actions=False,
     )
-
     event_action = WorkflowEventAction.objects.create(
         user=user,
         event=comment_event,
         type=WorkflowEventActionType.WATCHED,
     )
-    send_workflow_event_mock = mocker.patch(
-        'src.notifications.tasks._send_event_updated',
+    send_event_watched_mock = mocker.patch(
+        'src.notifications.tasks._send_event_watched',
     )
 
     # act
     _send_workflow_comment_watched()
 
     # assert
-    comment_event.refresh_from_db()
-    data = WorkflowEventSerializer(instance=comment_event).data
     assert not WorkflowEventAction.objects.filter(id=event_action.id).exists()
-    assert len(comment_event.watched) == 1
-    assert comment_event.watched[0]['date'] is not None
-    assert comment_event.watched[0]['user_id'] == user.id
+    receipt = WorkflowEventWatched.objects.get(event=comment_event)
+    assert receipt.user_id == user.id
+    assert receipt.date == event_action.created
+    send_event_watched_mock.assert_called_once()
+    kwargs = send_event_watched_mock.call_args.kwargs
+    assert kwargs['account_id'] == account.id
+    assert kwargs['logo_lg'] == account.logo_lg
+    assert kwargs['logging'] == account.log_api_requests
+    assert kwargs['task_id'] == task.id
+    data = kwargs['data']
+    assert data['id'] == comment_event.id
+    assert data['workflow_id'] == workflow.id
+    assert data['watched_count'] == 1
     assert len(data['watched']) == 1
-    assert type(data['watched'][0]['date_tsp']) is float
-    assert data['watched'][0]['date'] is not None
     assert data['watched'][0]['user_id'] == user.id
-    send_workflow_event_mock.assert_called_once_with(
-        data=data,
-        account_id=account.id,
-        logging=account.log_api_requests,
-        logo_lg=account.logo_lg,
-    )
+    assert data['watched'][0]['date'] is not None
+    assert type(data['watched'][0]['date_tsp']) is float
 
 
-def test_send_workflow_comment_watched__second_watched__ok(mocker):
+def test_send_workflow_comment_watched__second_watched__send_delta(mocker):
 
     # arrange
     account = create_test_account()
@@ -123,42 +123,107 @@ def test_send_workflow_comment_watched__second_watched__ok(mocker):
         text='text',
         after_create_actions=False,
     )
-    comment_event.watched = [
-        {
-            'date':  timezone.now().strftime('%Y-%m-%dT%H:%M'),
-            'date_tsp':  timezone.now().timestamp(),
-            'user_id': user_2.id,
-        },
-    ]
-    comment_event.save()
+    WorkflowEventWatched.objects.create(
+        event=comment_event,
+        user=user_2,
+        date=timezone.now(),
+    )
+    WorkflowEventAction.objects.create(
+        user=user,
+        event=comment_event,
+        type=WorkflowEventActionType.WATCHED,
+    )
+    send_event_watched_mock = mocker.patch(
+        'src.notifications.tasks._send_event_watched',
+    )
+
+    # act
+    _send_workflow_comment_watched()
 
+    # assert
+    assert WorkflowEventWatched.objects.filter(
+        event=comment_event,
+    ).count() == 2
+    data = send_event_watched_mock.call_args.kwargs['data']
+    assert data['watched_count'] == 2
+    assert len(data['watched']) == 1
+    assert data['watched'][0]['user_id'] == user.id
+
+
+def test_send_workflow_comment_watched__already_watched__skip(mocker):
+
+    # arrange
+    account = create_test_account()
+    account_owner = create_test_user(account=account)
+    user = create_test_user(
+        email='test@test.test',
+        account=account,
+        is_account_owner=False,
+    )
+    workflow = create_test_workflow(account_owner, tasks_count=1)
+    comment_event = WorkflowEventService.comment_created_event(
+        user=account_owner,
+        task=workflow.tasks.get(number=1),
+        text='text',
+        after_create_actions=False,
+    )
+    receipt = WorkflowEventWatched.objects.create(
+        event=comment_event,
+        user=user,
+        date=timezone.now(),
+    )
     event_action = WorkflowEventAction.objects.create(
         user=user,
         event=comment_event,
         type=WorkflowEventActionType.WATCHED,
     )
-    send_workflow_event_mock = mocker.patch(
-        'src.notifications.tasks._send_event_updated',
+    send_event_watched_mock = mocker.patch(
+        'src.notifications.tasks._send_event_watched',
     )
 
     # act
     _send_workflow_comment_watched()
 
     # assert
-    comment_event.refresh_from_db()
-    data = WorkflowEventSerializer(instance=comment_event).data
     assert not WorkflowEventAction.objects.filter(id=event_action.id).exists()
-    assert len(comment_event.watched) == 2
-    assert comment_event.watched[0]['date'] is not None
-    assert type(comment_event.watched[0]['date_tsp']) is float
-    assert comment_event.watched[0]['user_id'] == user.id
-    assert comment_event.watched[1]['date'] is not None
-    assert type(comment_event.watched[1]['date_tsp']) is float
-    assert comment_event.watched[1]['user_id'] == user_2.id
-    assert len(data['watched']) == 2
-    send_workflow_event_mock.assert_called_once_with(
-        data=data,
-        account_id=account.id,
-        logo_lg=account.logo_lg,
-        logging=account.log_api_requests,
+    assert list(
+        WorkflowEventWatched.objects.filter(event=comment_event),
+    ) == [receipt]
+    send_event_watched_mock.assert_not_called()
+
+
+def test_send_event_watched__ok(mocker):
+
+    # arrange
+    account = create_test_account()
+    account_owner = create_test_user(account=account)
+    user = create_test_user(
+        email='test@test.test',
+        account=account,
+        is_account_owner=False,
     )
+    workflow = create_test_workflow(account_owner, tasks_count=1)
+    comment_event = WorkflowEventService.comment_created_event(
+        user=account_owner,
+        task=workflow.tasks.get(number=1),
+        text='text',
+        after_create_actions=False,
+    )
+    WorkflowEventAction.objects.create(
+        user=user,
+        event=comment_event,
+        type=WorkflowEventActionType.WATCHED,
+    )
+    send_to_users_mock = mocker.patch(
+        'src.notifications.tasks.WebSocketService.send_to_users',
+    )
+
+    # act
+    _send_workflow_comment_watched()
+
+    # assert
+    send_to_users_mock.assert_called_once()
+    kwargs = send_to_users_mock.call_args.kwargs
+    assert kwargs['method_name'] == NotificationMethod.event_watched
+    assert account_owner.id in kwargs['user_ids']
+    assert kwargs['data']['watched_count'] == 1
@@ -1,5 +1,6 @@
 import pytest
 
+from src.notifications.enums import NotificationMethod
 from src.notifications.services.websockets import (
     WebSocketService,
 )
@@ -75,7 +76,7 @@ def test_send_event_created__system_task_event__ok(mocker):
     )
     websocket_notification_mock = mocker.patch(
         'src.notifications.services.websockets.'
-        'WebSocketService.send_event_created',
+        'WebSocketService.send_to_users',
     )
 
     # act
@@ -87,45 +88,21 @@ def test_send_event_created__system_task_event__ok(mocker):
     )
 
     # assert
-    assert websocket_notification_mock.call_count == 3
-    assert websocket_service_init_mock.call_count == 3
-    websocket_service_init_mock.assert_has_calls([
-        mocker.call(
-            logo_lg=account.logo_lg,
-            account_id=account.id,
-            logging=account.log_api_requests,
-        ),
-        mocker.call(
-            logo_lg=account.logo_lg,
-            account_id=account.id,
-            logging=account.log_api_requests,
-        ),
-        mocker.call(
-            logo_lg=account.logo_lg,
-            account_id=account.id,
-            logging=account.log_api_requests,
-        ),
-    ])
-    websocket_notification_mock.assert_has_calls([
-        mocker.call(
-            user_id=account_owner.id,
-            user_email=account_owner.email,
-            sync=True,
-            data=data,
-        ),
-        mocker.call(
-            user_id=member.id,
-            user_email=member.email,
-            sync=True,
-            data=data,
-        ),
-        mocker.call(
-            user_id=guest.id,
-            user_email=guest.email,
-            sync=True,
-            data=data,
-        ),
-    ])
+    websocket_service_init_mock.assert_called_once_with(
+        logo_lg=account.logo_lg,
+        account_id=account.id,
+        logging=account.log_api_requests,
+    )
+    websocket_notification_mock.assert_called_once_with(
+        method_name=NotificationMethod.event_created,
+        user_ids=[
+            account_owner.id,
+            member.id,
+            guest.id,
+        ],
+        sync=True,
+        data=data,
+    )
 
 
 def test_send_event_created__system_workflow_event__ok(mocker):
@@ -168,7 +145,7 @@ def test_send_event_created__system_workflow_event__ok(mocker):
     )
     websocket_notification_mock = mocker.patch(
         'src.notifications.services.websockets.'
-        'WebSocketService.send_event_created',
+        'WebSocketService.send_to_users',
     )
 
     # act
@@ -180,34 +157,20 @@ def test_send_event_created__system_workflow_event__ok(mocker):
     )
 
     # assert
-    assert websocket_notification_mock.call_count == 2
-    assert websocket_service_init_mock.call_count == 2
-    websocket_service_init_mock.assert_has_calls([
-        mocker.call(
-            logo_lg=account.logo_lg,
-            account_id=account.id,
-            logging=account.log_api_requests,
-        ),
-        mocker.call(
-            logo_lg=account.logo_lg,
-            account_id=account.id,
-            logging=account.log_api_requests,
-        ),
-    ])
-    websocket_notification_mock.assert_has_calls([
-        mocker.call(
-            user_id=account_owner.id,
-            user_email=account_owner.email,
-            sync=True,
-            data=data,
-        ),
-        mocker.call(
-            user_id=member.id,
-            user_email=member.email,
-            sync=True,
-            data=data,
-        ),
-    ])
+    websocket_service_init_mock.assert_called_once_with(
+        logo_lg=account.logo_lg,
+        account_id=account.id,
+        logging=account.log_api_requests,
+    )
+    websocket_notification_mock.assert_called_once_with(
+        method_name=NotificationMethod.event_created,
+        user_ids=[
+            account_owner.id,
+            member.id,
+        ],
+        sync=True,
+        data=data,
+    )
 
 
 def test_send_event_created__user_task_event__ok(mocker):
@@ -250,7 +213,7 @@ def test_send_event_created__user_task_event__ok(mocker):
     )
     websocket_notification_mock = mocker.patch(
         'src.notifications.services.websockets.'
-        'WebSocketService.send_event_created',
+        'WebSocketService.send_to_users',
     )
 
     # act
@@ -262,45 +225,21 @@ def test_send_event_created__user_task_event__ok(mocker):
     )
 
     # assert
-    assert websocket_notification_mock.call_count == 3
-    assert websocket_service_init_mock.call_count == 3
-    websocket_service_init_mock.assert_has_calls([
-        mocker.call(
-            logo_lg=account.logo_lg,
-            account_id=account.id,
-            logging=account.log_api_requests,
-        ),
-        mocker.call(
-            logo_lg=account.logo_lg,
-            account_id=account.id,
-            logging=account.log_api_requests,
-        ),
-        mocker.call(
-            logo_lg=account.logo_lg,
-            account_id=account.id,
-            logging=account.log_api_requests,
-        ),
-    ])
-    websocket_notification_mock.assert_has_calls([
-        mocker.call(
-            user_id=account_owner.id,
-            user_email=account_owner.email,
-            sync=True,
-            data=data,
-        ),
-        mocker.call(
-            user_id=member.id,
-            user_email=member.email,
-            sync=True,
-            data=data,
-        ),
-        mocker.call(
-            user_id=guest.id,
-            user_email=guest.email,
-            sync=True,
-            data=data,
-        ),
-    ])
+    websocket_service_init_mock.assert_called_once_with(
+        logo_lg=account.logo_lg,
+        account_id=account.id,
+        logging=account.log_api_requests,
+    )
+    websocket_notification_mock.assert_called_once_with(
+        method_name=NotificationMethod.event_created,
+        user_ids=[
+            account_owner.id,
+            member.id,
+            guest.id,
+        ],
+        sync=True,
+        data=data,
+    )
 
 
 def test_send_event_created__comment_event__ok(mocker):
@@ -344,7 +283,7 @@ def test_send_event_created__comment_event__ok(mocker):
     )
     websocket_notification_mock = mocker.patch(
         'src.notifications.services.websockets.'
-        'WebSocketService.send_event_created',
+        'WebSocketService.send_to_users',
     )
 
     # act
@@ -356,45 +295,21 @@ def test_send_event_created__comment_event__ok(mocker):
     )
 
     # assert
-    assert websocket_notification_mock.call_count == 3
-    assert websocket_service_init_mock.call_count == 3
-    websocket_service_init_mock.assert_has_calls([
-        mocker.call(
-            logo_lg=account.logo_lg,
-            account_id=account.id,
-            logging=account.log_api_requests,
-        ),
-        mocker.call(
-            logo_lg=account.logo_lg,
-            account_id=account.id,
-            logging=account.log_api_requests,
-        ),
-        mocker.call(
-            logo_lg=account.logo_lg,
-            account_id=account.id,
-            logging=account.log_api_requests,
-        ),
-    ])
-    websocket_notification_mock.assert_has_calls([
-        mocker.call(
-            user_id=account_owner.id,
-            user_email=account_owner.email,
-            sync=True,
-            data=data,
-        ),
-        mocker.call(
-            user_id=member.id,
-            user_email=member.email,
-            sync=True,
-            data=data,
-        ),
-        mocker.call(
-            user_id=guest.id,
-            user_email=guest.email,
-            sync=True,
-            data=data,
-        ),
-    ])
+    websocket_service_init_mock.assert_called_once_with(
+        logo_lg=account.logo_lg,
+        account_id=account.id,
+        logging=account.log_api_requests,
+    )
+    websocket_notification_mock.assert_called_once_with(
+        method_name=NotificationMethod.event_created,
+        user_ids=[
+            account_owner.id,
+            member.id,
+            guest.id,
+        ],
+        sync=True,
+        data=data,
+    )
 
 
 def test_send_event_created__directly_deleted_guest__skip(mocker):
@@ -429,7 +344,7 @@ def test_send_event_created__directly_deleted_guest__skip(mocker):
     )
     websocket_notification_mock = mocker.patch(
         'src.notifications.services.websockets.'
-        'WebSocketService.send_event_created',
+        'WebSocketService.send_to_users',
     )
 
     # act
@@ -441,23 +356,19 @@ def test_send_event_created__directly_deleted_guest__skip(mocker):
     )
 
     # assert
-    assert websocket_service_init_mock.call_count == 1
-    assert websocket_notification_mock.call_count == 1
-    websocket_service_init_mock.assert_has_calls([
-        mocker.call(
-            logo_lg=account.logo_lg,
-            account_id=account.id,
-            logging=account.log_api_requests,
-        ),
-    ])
-    websocket_notification_mock.assert_has_calls([
-        mocker.call(
-            user_id=account_owner.id,
-            user_email=account_owner.email,
-            sync=True,
-            data=data,
-        ),
-    ])
+    websocket_service_init_mock.assert_called_once_with(
+        logo_lg=account.logo_lg,
+        account_id=account.id,
+        logging=account.log_api_requests,
+    )
+    websocket_notification_mock.assert_called_once_with(
+        method_name=NotificationMethod.event_created,
+        user_ids=[
+            account_owner.id,
+        ],
+        sync=True,
+        data=data,
+    )
 
 
 def test_send_event_created__another_task_guest__ok(mocker):
@@ -506,7 +417,7 @@ def test_send_event_created__another_task_guest__ok(mocker):
     )
     websocket_notification_mock = mocker.patch(
         'src.notifications.services.websockets.'
-        'WebSocketService.send_event_created',
+        'WebSocketService.send_to_users',
     )
 
     # act
@@ -518,24 +429,19 @@ def test_send_event_created__another_task_guest__ok(mocker):
     )
 
     # assert
-    assert websocket_notification_mock.call_count == 2
-    assert websocket_service_init_mock.call_count == 2
-    websocket_notification_mock.assert_has_calls(
-        [
-            mocker.call(
-                user_id=account_owner.id,
-                user_email=account_owner.email,
-                sync=True,
-                data=data,
-            ),
-            mocker.call(
-                user_id=guest_1.id,
-                user_email=guest_1.email,
-                sync=True,
-                data=data,
-            ),
+    websocket_service_init_mock.assert_called_once_with(
+        logo_lg=account.logo_lg,
+        account_id=account.id,
+        logging=account.log_api_requests,
+    )
+    websocket_notification_mock.assert_called_once_with(
+        method_name=NotificationMethod.event_created,
+        user_ids=[
+            account_owner.id,
+            guest_1.id,
         ],
-        any_order=True,
+        sync=True,
+        data=data,
     )
 
 
@@ -576,7 +482,7 @@ def test_send_event_created__another_account_guest__ok(mocker):
     )
     websocket_notification_mock = mocker.patch(
         'src.notifications.services.websockets.'
-        'WebSocketService.send_event_created',
+        'WebSocketService.send_to_users',
     )
 
     # act
@@ -588,23 +494,19 @@ def test_send_event_created__another_account_guest__ok(mocker):
     )
 
     # assert
-    assert websocket_notification_mock.call_count == 1
-    assert websocket_service_init_mock.call_count == 1
-    websocket_service_init_mock.assert_has_calls([
-        mocker.call(
-            logo_lg=account.logo_lg,
-            account_id=account.id,
-            logging=account.log_api_requests,
-        ),
-    ])
-    websocket_notification_mock.assert_has_calls([
-        mocker.call(
-            user_id=account_owner.id,
-            user_email=account_owner.email,
-            sync=True,
-            data=data,
-        ),
-    ])
+    websocket_service_init_mock.assert_called_once_with(
+        logo_lg=account.logo_lg,
+        account_id=account.id,
+        logging=account.log_api_requests,
+    )
+    websocket_notification_mock.assert_called_once_with(
+        method_name=NotificationMethod.event_created,
+        user_ids=[
+            account_owner.id,
+        ],
+        sync=True,
+        data=data,
+    )
 
 
 def test_send_event_created__workflow_deleted__no_notification(mocker):
@@ -626,7 +528,7 @@ def test_send_event_created__workflow_deleted__no_notification(mocker):
 
     websocket_notification_mock = mocker.patch(
         'src.notifications.services.websockets.'
-        'WebSocketService.send_event_created',
+        'WebSocketService.send_to_users',
     )
 
     # act
@@ -647,7 +549,7 @@ def test_send_event_created__missing_workflow_id__no_notification(mocker):
     account = create_test_account()
     websocket_notification_mock = mocker.patch(
         'src.notifications.services.websockets.'
-        'WebSocketService.send_event_created',
+        'WebSocketService.send_to_users',
     )
 
     # act
@@ -681,7 +583,7 @@ def test_send_event_updated__workflow_deleted__no_notification(mocker):
 
     websocket_notification_mock = mocker.patch(
         'src.notifications.services.websockets.'
-        'WebSocketService.send_event_updated',
+        'WebSocketService.send_to_users',
     )
 
     # act
@@ -702,7 +604,7 @@ def test_send_event_updated__missing_workflow_id__no_notification(mocker):
     account = create_test_account()
     websocket_notification_mock = mocker.patch(
         'src.notifications.services.websockets.'
-        'WebSocketService.send_event_updated',
+        'WebSocketService.send_to_users',
     )
 
     # act
@@ -19,6 +19,7 @@ from src.openapi.parameters import (
     DATE_RANGE_PARAMS,
     GROUPS_LIST_PARAMS,
     HIGHLIGHTS_PARAMS,
+    KEYSET_PARAMS,
     LIMIT_OFFSET_PARAMS,
     RESET_PASSWORD_TOKEN_PARAMS,
     TASK_LIST_PARAMS,
@@ -149,6 +150,7 @@ __all__ = (
     'FORBIDDEN',
     'GROUPS_LIST_PARAMS',
     'HIGHLIGHTS_PARAMS',
+    'KEYSET_PARAMS',
     'LIMIT_OFFSET_LEGACY_NOTE',
     'LIMIT_OFFSET_PARAMS',
     'NOT_FOUND',
@@ -32,6 +32,24 @@ LIMIT_OFFSET_PARAMS = [
     ),
 ]
 
+KEYSET_PARAMS = [
+    query_param(
+        'cursor',
+        description=(
+            'Keyset pagination cursor from the "next" link. '
+            'Pass an empty value for the first page. '
+            'Offset is ignored.'
+        ),
+    ),
+    query_param(
+        'with_count', OpenApiTypes.BOOL,
+        description=(
+            'With cursor only: calculate the total "count", '
+            'otherwise it is null.'
+        ),
+    ),
+]
+
 DATE_RANGE_PARAMS = [
     query_param(
         'date_from_tsp', OpenApiTypes.NUMBER,
@@ -106,6 +124,7 @@ WORKFLOW_LIST_PARAMS = [
         description='Filter by external/internal workflows.',
     ),
     *LIMIT_OFFSET_PARAMS,
+    *KEYSET_PARAMS,
 ]
 
 WORKFLOW_FIELDS_PARAMS = [
@@ -188,6 +207,7 @@ TASK_LIST_PARAMS = [
         description='Filter by the task step API name.',
     ),
     *LIMIT_OFFSET_PARAMS,
+    *KEYSET_PARAMS,
 ]
 
 COUNTS_BY_STARTER_PARAMS = [
@@ -353,6 +373,16 @@ HIGHLIGHTS_PARAMS = [
         'date_after_tsp', OpenApiTypes.NUMBER,
         description='Return highlights after this timestamp.',
     ),
+    *LIMIT_OFFSET_PARAMS,
+    query_param(
+        'cursor',
+        description=(
+            'Keyset pagination cursor from the "next" link. '
+            'Pass an empty value for the first page. '
+            'Offset is ignored. Not supported with the performer '
+            'filters.'
+        ),
+    ),
 ]
 
 DATASETS_LIST_PARAMS = [
@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class PermissionsConfig(AppConfig):
     name = 'src.permissions'
     verbose_name = 'Permissions'
+
+    def ready(self):
+        from src.permissions.registry import (  # noqa: PLC0415
+            PermissionRegistry,
+        )
+
+        # Content types and permissions may be recreated by migrations
+        post_migrate.connect(
+            PermissionRegistry.clear,
+            dispatch_uid='permission_registry_clear',
+        )
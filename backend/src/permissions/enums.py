@@ -35,3 +35,23 @@ class PermissionSource:
         WORKFLOW_VIEWER,
         VACATION,
     ]
+
+
+class WorkflowAclPerm:
+    """Permission kind in the ``workflow_acl`` table.
+
+    Mirrors the workflow Guardian codenames as small integers.
+    """
+
+    VIEW = 1
+    CHANGE = 2
+
+    CHOICES = (
+        (VIEW, 'view_workflow'),
+        (CHANGE, 'change_workflow'),
+    )
+
+    BY_CODENAME = {
+        'view_workflow': VIEW,
+        'change_workflow': CHANGE,
+    }
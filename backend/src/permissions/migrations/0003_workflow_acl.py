@@ -0,0 +1,73 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('permissions', '0002_user_object_permission'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkflowAcl',
+            fields=[
+                ('id', models.AutoField(
+                    auto_created=True,
+                    primary_key=True,
+                    serialize=False,
+                    verbose_name='ID',
+                )),
+                ('workflow_id', models.IntegerField()),
+                ('perm', models.PositiveSmallIntegerField(
+                    choices=[(1, 'view_workflow'), (2, 'change_workflow')],
+                )),
+                ('source_type', models.CharField(
+                    choices=[
+                        ('Performer', 'Performer'),
+                        ('PerformerGroup', 'Performer Group'),
+                        ('Mention', 'Mention'),
+                        ('TemplateOwner', 'Template Owner'),
+                        ('WorkflowViewer', 'Workflow Viewer'),
+                        ('Vacation', 'Vacation substitute'),
+                    ],
+                    max_length=50,
+                )),
+                ('source_id', models.IntegerField()),
+                ('user', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='+',
+                    to=settings.AUTH_USER_MODEL,
+                )),
+            ],
+            options={
+                'db_table': 'workflow_acl',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='workflowacl',
+            index=models.Index(
+                fields=['user', 'perm', 'workflow_id'],
+                name='workflow_acl_user_perm_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='workflowacl',
+            index=models.Index(
+                fields=['workflow_id', 'perm'],
+                name='workflow_acl_wf_perm_idx',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='workflowacl',
+            constraint=models.UniqueConstraint(
+                fields=(
+                    'workflow_id', 'user', 'perm',
+                    'source_type', 'source_id',
+                ),
+                name='workflow_acl_unique',
+            ),
+        ),
+    ]
@@ -7,7 +7,7 @@ from guardian.managers import GroupObjectPermissionManager
 from guardian.models import UserObjectPermissionAbstract
 
 from src.accounts.models import UserGroup
-from src.permissions.enums import PermissionSource
+from src.permissions.enums import PermissionSource, WorkflowAclPerm
 
 
 UserModel = get_user_model()
@@ -127,3 +127,59 @@ class GroupObjectPermission(models.Model):
             f"group={self.group_id} | perm={self.permission_id} | "
             f"ct={self.content_type_id} obj={self.object_pk}"
         )
+
+
+class WorkflowAcl(models.Model):
+    """Integer-keyed copy of the workflow Guardian permissions.
+
+    Guardian stores ``object_pk`` as varchar, so joining workflows
+    needs a cast which no btree index can serve. Rows are written by
+    ``WorkflowPermissionService`` next to every ``UserObjectPermission``
+    row of a workflow; list queries join this table instead.
+
+    Use ``backfill_workflow_acl`` command to fill and verify the table.
+    """
+
+    class Meta:
+        db_table = 'workflow_acl'
+        indexes = [
+            models.Index(
+                fields=['user', 'perm', 'workflow_id'],
+                name='workflow_acl_user_perm_idx',
+            ),
+            models.Index(
+                fields=['workflow_id', 'perm'],
+                name='workflow_acl_wf_perm_idx',
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    'workflow_id', 'user', 'perm',
+                    'source_type', 'source_id',
+                ],
+                name='workflow_acl_unique',
+            ),
+        ]
+
+    workflow_id = models.IntegerField()
+    user = models.ForeignKey(
+        UserModel,
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    perm = models.PositiveSmallIntegerField(
+        choices=WorkflowAclPerm.CHOICES,
+    )
+    source_type = models.CharField(
+        max_length=50,
+        choices=PermissionSource.CHOICES,
+    )
+    source_id = models.IntegerField()
+
+    def __str__(self):
+        return (
+            f"user={self.user_id} | perm={self.perm} | "
+            f"workflow={self.workflow_id} | "
+            f"{self.source_type}:{self.source_id}"
+        )
@@ -0,0 +1,94 @@
+from threading import Lock
+from typing import Dict, Tuple
+
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+
+
+class PermissionRegistry:
+    """Process-wide cache of ContentType ids and Permission objects.
+
+    Both never change after migrations, but were fetched from the database
+    each time a Guardian-based query was built. The registry resolves them
+    once per process.
+
+    Call ``clear()`` when the tables may be recreated: it is connected
+    to ``post_migrate`` and can be used by tests directly.
+    """
+
+    _lock = Lock()
+    _content_type_ids: Dict[Tuple[str, str], int] = {}
+    _permissions: Dict[Tuple[str, str, str], Permission] = {}
+
+    @classmethod
+    def get_content_type_id(cls, app_label: str, model: str) -> int:
+        key = (app_label, model)
+        ct_id = cls._content_type_ids.get(key)
+        if ct_id is None:
+            ct_id = ContentType.objects.get(
+                app_label=app_label,
+                model=model,
+            ).id
+            with cls._lock:
+                cls._content_type_ids[key] = ct_id
+        return ct_id
+
+    @classmethod
+    def get_permission(
+        cls,
+        app_label: str,
+        model: str,
+        codename: str,
+    ) -> Permission:
+        key = (app_label, model, codename)
+        perm = cls._permissions.get(key)
+        if perm is None:
+            perm = Permission.objects.get(
+                codename=codename,
+                content_type_id=cls.get_content_type_id(app_label, model),
+            )
+            with cls._lock:
+                cls._permissions[key] = perm
+        return perm
+
+    @classmethod
+    def get_permission_id(
+        cls,
+        app_label: str,
+        model: str,
+        codename: str,
+    ) -> int:
+        return cls.get_permission(app_label, model, codename).id
+
+    @classmethod
+    def clear(cls, **kwargs):
+        with cls._lock:
+            cls._content_type_ids.clear()
+            cls._permissions.clear()
+
+
+class WorkflowPermissionRegistry:
+    """Shortcuts for the workflow model.
+
+    Resolved by app_label/model (not get_for_model(Workflow))
+    to avoid circular import: Workflow -> querysets -> queries.
+    """
+
+    APP_LABEL = 'processes'
+    MODEL = 'workflow'
+
+    @classmethod
+    def get_content_type_id(cls) -> int:
+        return PermissionRegistry.get_content_type_id(cls.APP_LABEL, cls.MODEL)
+
+    @classmethod
+    def get_permission(cls, codename: str) -> Permission:
+        return PermissionRegistry.get_permission(
+            cls.APP_LABEL,
+            cls.MODEL,
+            codename,
+        )
+
+    @classmethod
+    def get_permission_id(cls, codename: str) -> int:
+        return cls.get_permission(codename).id
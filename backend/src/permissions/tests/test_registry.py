@@ -0,0 +1,82 @@
+import pytest
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+
+from src.permissions.registry import (
+    PermissionRegistry,
+    WorkflowPermissionRegistry,
+)
+from src.processes.enums import WorkflowPermission
+from src.processes.queries import (
+    GuardianOwnerJoinMixin,
+    WorkflowPermissionQuery,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_permission_id__cached__without_queries(
+    django_assert_num_queries,
+):
+
+    # arrange
+    PermissionRegistry.clear()
+    ct = ContentType.objects.get(app_label='processes', model='workflow')
+    perm = Permission.objects.get(
+        codename=WorkflowPermission.CHANGE,
+        content_type=ct,
+    )
+    WorkflowPermissionRegistry.get_permission_id(WorkflowPermission.CHANGE)
+
+    # act
+    with django_assert_num_queries(0):
+        ct_id = WorkflowPermissionRegistry.get_content_type_id()
+        perm_id = WorkflowPermissionRegistry.get_permission_id(
+            WorkflowPermission.CHANGE,
+        )
+
+    # assert
+    assert ct_id == ct.id
+    assert perm_id == perm.id
+
+
+def test_clear__ok(django_assert_num_queries):
+
+    # arrange
+    WorkflowPermissionRegistry.get_permission_id(WorkflowPermission.VIEW)
+
+    # act
+    PermissionRegistry.clear()
+
+    # assert
+    with django_assert_num_queries(2):
+        WorkflowPermissionRegistry.get_permission_id(WorkflowPermission.VIEW)
+
+
+def test_guardian_owner_join__warm_registry__without_queries(
+    django_assert_num_queries,
+):
+
+    # arrange
+    WorkflowPermissionRegistry.get_permission_id(WorkflowPermission.CHANGE)
+    WorkflowPermissionRegistry.get_permission_id(WorkflowPermission.VIEW)
+    params = {}
+
+    # act
+    with django_assert_num_queries(0):
+        GuardianOwnerJoinMixin._guardian_owner_join(
+            alias='wo',
+            workflow_col='pw.id',
+            params=params,
+        )
+        WorkflowPermissionQuery.viewer_q(user_id=1)
+
+    # assert
+    assert params['_guardian_ct_id'] == (
+        WorkflowPermissionRegistry.get_content_type_id()
+    )
+    assert params['_guardian_perm_id'] == (
+        WorkflowPermissionRegistry.get_permission_id(
+            WorkflowPermission.CHANGE,
+        )
+    )
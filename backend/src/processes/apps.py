@@ -1,6 +1,53 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_save
 
 
 class ProcessesConfig(AppConfig):
     name = 'src.processes'
     verbose_name = 'Processes'
+
+    def ready(self):
+        from src.accounts.models import (  # noqa: PLC0415
+            User,
+            UserGroup,
+            UserVacation,
+        )
+        from src.datasets.models import Dataset  # noqa: PLC0415
+        from src.processes.models.templates.template import (  # noqa: PLC0415
+            Template,
+        )
+        from src.processes.models.workflows.task import (  # noqa: PLC0415
+            Delay,
+            Task,
+        )
+        from src.processes.services.timers import (  # noqa: PLC0415
+            TimerService,
+        )
+        from src.processes.services.workflows import (  # noqa: PLC0415
+            instantiation,
+        )
+
+        # Timers follow the delays, due dates and vacations
+        post_save.connect(
+            TimerService.on_delay_save,
+            sender=Delay,
+            dispatch_uid='timer_delay_save',
+        )
+        post_save.connect(
+            TimerService.on_task_save,
+            sender=Task,
+            dispatch_uid='timer_task_save',
+        )
+        post_save.connect(
+            TimerService.on_vacation_save,
+            sender=UserVacation,
+            dispatch_uid='timer_vacation_save',
+        )
+
+        # Cached instantiation plans follow the in-place template changes
+        for sender in (Template, User, UserGroup, Dataset):
+            post_save.connect(
+                instantiation.InstantiationPlanService.on_account_data_save,
+                sender=sender,
+                dispatch_uid=f'instantiation_plan_{sender.__name__}_save',
+            )
@@ -1,3 +1,4 @@
 
 WORKFLOW_NAME_LENGTH = 120
 TEMPLATE_NAME_LENGTH = 120
+WORKFLOW_RUN_BATCH_MAX_SIZE = 100
@@ -624,6 +624,27 @@ class WorkflowEventType:
         TASK_DELEGATION,
     )
 
+    # Shown in the highlights feed
+    HIGHLIGHT_TYPES = (
+        COMMENT,
+        TASK_COMPLETE,
+        RUN,
+        COMPLETE,
+        ENDED,
+        TASK_REVERT,
+        REVERT,
+        URGENT,
+        NOT_URGENT,
+        TASK_PERFORMER_CREATED,
+        TASK_PERFORMER_DELETED,
+        TASK_PERFORMER_GROUP_CREATED,
+        TASK_PERFORMER_GROUP_DELETED,
+        FORCE_DELAY,
+        FORCE_RESUME,
+        DUE_DATE_CHANGED,
+        SUB_WORKFLOW_RUN,
+    )
+
     CHOICES = (
         (RUN, 'Workflow started'),
         (COMPLETE, 'Workflow completed'),
@@ -784,3 +805,12 @@ class FieldSetRuleType:
     )
 
     LITERALS = Literal[SUM_EQUAL]
+
+
+class TimerType:
+
+    DELAY = 'delay'
+    DUE_DATE = 'due_date'
+    VACATION = 'vacation'
+
+    LITERALS = Literal[DELAY, DUE_DATE, VACATION]
@@ -0,0 +1,132 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from src.permissions.enums import WorkflowAclPerm
+from src.permissions.models import UserObjectPermission, WorkflowAcl
+from src.permissions.registry import WorkflowPermissionRegistry
+from src.processes.models.workflows.workflow import Workflow
+
+
+class Command(BaseCommand):
+    help = (
+        'Backfill the workflow_acl table from Guardian workflow '
+        'permissions and verify that both are in sync'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--account-ids',
+            type=str,
+            default='',
+            help='Comma-separated list of account IDs (default: all)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of workflows processed per transaction',
+        )
+        parser.add_argument(
+            '--verify-only',
+            action='store_true',
+            help='Only report differences, do not write',
+        )
+
+    def _get_perm_map(self) -> dict:
+        return {
+            WorkflowPermissionRegistry.get_permission_id(codename): perm
+            for codename, perm in WorkflowAclPerm.BY_CODENAME.items()
+        }
+
+    def _guardian_rows(self, workflow_ids, perm_map) -> set:
+        rows = UserObjectPermission.objects.filter(
+            content_type_id=WorkflowPermissionRegistry.get_content_type_id(),
+            permission_id__in=perm_map.keys(),
+            object_pk__in=[str(wid) for wid in workflow_ids],
+        ).values_list(
+            'object_pk', 'user_id', 'permission_id',
+            'source_type', 'source_id',
+        )
+        return {
+            (int(pk), uid, perm_map[perm_id], source_type, source_id)
+            for pk, uid, perm_id, source_type, source_id in rows
+        }
+
+    def _acl_rows(self, workflow_ids) -> set:
+        return set(
+            WorkflowAcl.objects.filter(
+                workflow_id__in=workflow_ids,
+            ).values_list(
+                'workflow_id', 'user_id', 'perm',
+                'source_type', 'source_id',
+            ),
+        )
+
+    def _sync(self, missing: set, extra: set):
+        with transaction.atomic():
+            for wf_id, uid, perm, source_type, source_id in extra:
+                WorkflowAcl.objects.filter(
+                    workflow_id=wf_id,
+                    user_id=uid,
+                    perm=perm,
+                    source_type=source_type,
+                    source_id=source_id,
+                ).delete()
+            WorkflowAcl.objects.bulk_create(
+                [
+                    WorkflowAcl(
+                        workflow_id=wf_id,
+                        user_id=uid,
+                        perm=perm,
+                        source_type=source_type,
+                        source_id=source_id,
+                    )
+                    for wf_id, uid, perm, source_type, source_id in missing
+                ],
+                ignore_conflicts=True,
+            )
+
+    def handle(self, *args, **options):
+        account_ids = [
+            int(x.strip())
+            for x in options['account_ids'].split(',')
+            if x.strip()
+        ]
+        batch_size = options['batch_size']
+        verify_only = options['verify_only']
+
+        # Soft-deleted workflows keep their Guardian rows, include them
+        workflows = Workflow._base_manager.order_by('id')
+        if account_ids:
+            workflows = workflows.filter(account_id__in=account_ids)
+        workflow_ids = list(workflows.values_list('id', flat=True))
+        perm_map = self._get_perm_map()
+
+        total_missing = 0
+        total_extra = 0
+        for i in range(0, len(workflow_ids), batch_size):
+            batch_ids = workflow_ids[i:i + batch_size]
+            guardian_rows = self._guardian_rows(batch_ids, perm_map)
+            acl_rows = self._acl_rows(batch_ids)
+            missing = guardian_rows - acl_rows
+            extra = acl_rows - guardian_rows
+            total_missing += len(missing)
+            total_extra += len(extra)
+            if not verify_only and (missing or extra):
+                self._sync(missing=missing, extra=extra)
+
+        self.stdout.write(f'Workflows checked: {len(workflow_ids)}')
+        self.stdout.write(f'  - Missing ACL rows: {total_missing}')
+        self.stdout.write(f'  - Extra ACL rows: {total_extra}')
+        if not total_missing and not total_extra:
+            self.stdout.write(self.style.SUCCESS(
+                'workflow_acl is in sync with Guardian.',
+            ))
+        elif verify_only:
+            self.stdout.write(self.style.ERROR(
+                'workflow_acl is out of sync with Guardian!',
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                'workflow_acl has been synced with Guardian.',
+            ))
@@ -0,0 +1,100 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from src.executor import RawSqlExecutor, RowFormat
+from src.processes.models.workflows.event import WorkflowLastEvent
+from src.processes.models.workflows.workflow import Workflow
+from src.processes.queries import LatestHighlightEventsQuery
+from src.processes.services.workflows.last_event import (
+    WorkflowLastEventService,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Backfill the workflow_last_event table from the workflow '
+        'events and verify that both are in sync'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--account-ids',
+            type=str,
+            default='',
+            help='Comma-separated list of account IDs (default: all)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of workflows processed per transaction',
+        )
+        parser.add_argument(
+            '--verify-only',
+            action='store_true',
+            help='Only report differences, do not write',
+        )
+
+    def _event_rows(self, workflow_ids) -> set:
+        query = LatestHighlightEventsQuery(workflow_ids)
+        return {
+            (workflow_id, event_id)
+            for workflow_id, _, event_id, _ in RawSqlExecutor.fetch(
+                *query.get_sql(),
+                row_format=RowFormat.TUPLE,
+            )
+        }
+
+    def _projection_rows(self, workflow_ids) -> set:
+        return set(
+            WorkflowLastEvent.objects.filter(
+                workflow_id__in=workflow_ids,
+            ).values_list('workflow_id', 'event_id'),
+        )
+
+    def handle(self, *args, **options):
+        account_ids = [
+            int(x.strip())
+            for x in options['account_ids'].split(',')
+            if x.strip()
+        ]
+        batch_size = options['batch_size']
+        verify_only = options['verify_only']
+
+        # Soft-deleted workflows are not shown in the feed
+        workflows = Workflow.objects.order_by('id')
+        if account_ids:
+            workflows = workflows.filter(account_id__in=account_ids)
+        workflow_ids = list(workflows.values_list('id', flat=True))
+
+        total_missing = 0
+        total_extra = 0
+        for i in range(0, len(workflow_ids), batch_size):
+            batch_ids = workflow_ids[i:i + batch_size]
+            event_rows = self._event_rows(batch_ids)
+            projection_rows = self._projection_rows(batch_ids)
+            missing = event_rows - projection_rows
+            extra = projection_rows - event_rows
+            total_missing += len(missing)
+            total_extra += len(extra)
+            if not verify_only and (missing or extra):
+                with transaction.atomic():
+                    WorkflowLastEventService.refresh(
+                        workflow_id for workflow_id, _ in missing | extra
+                    )
+
+        self.stdout.write(f'Workflows checked: {len(workflow_ids)}')
+        self.stdout.write(f'  - Missing rows: {total_missing}')
+        self.stdout.write(f'  - Stale rows: {total_extra}')
+        if not total_missing and not total_extra:
+            self.stdout.write(self.style.SUCCESS(
+                'workflow_last_event is in sync with the events.',
+            ))
+        elif verify_only:
+            self.stdout.write(self.style.ERROR(
+                'workflow_last_event is out of sync with the events!',
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                'workflow_last_event has been synced with the events.',
+            ))
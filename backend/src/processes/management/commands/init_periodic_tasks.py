@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from django_celery_beat.models import (
     PeriodicTask,
@@ -9,6 +10,8 @@ import pytz
 
 class Command(BaseCommand):
     help = 'Initialize the system on startup'
+    # Schedule of the polling tasks with the timer service
+    sweep_minutes = 15
 
     def handle(self, *args, **options):
         self.stdout.write(
@@ -34,6 +37,7 @@ class Command(BaseCommand):
             self._ensure_reminder_task_notification,
             self._ensure_process_vacations,
             self._ensure_delegate_vacation_tasks,
+            self._ensure_dispatch_timers,
         )
 
         for task_func in tasks:
@@ -61,6 +65,53 @@ class Command(BaseCommand):
             self.style.SUCCESS(f"Task '{name}' has been created."),
         )
 
+    def _create_or_update_sweep(
+        self,
+        name: str,
+        task_path: str,
+        schedule_obj,
+        schedule_field: str = "interval",
+    ) -> None:
+        """
+        With the timer service the polling task becomes a rare
+        reconciliation sweep, the existing schedule is replaced.
+        Without it the sweep schedule is replaced back.
+        """
+        is_sweep = PeriodicTask.objects.filter(
+            name=name,
+            interval__every=self.sweep_minutes,
+            interval__period=IntervalSchedule.MINUTES,
+        ).exists()
+        if settings.TIMER_SERVICE:
+            schedule_obj, _ = IntervalSchedule.objects.get_or_create(
+                every=self.sweep_minutes,
+                period=IntervalSchedule.MINUTES,
+            )
+            schedule_field = "interval"
+        elif not is_sweep:
+            self._create_or_skip_task(
+                name=name,
+                task_path=task_path,
+                schedule_obj=schedule_obj,
+                schedule_field=schedule_field,
+            )
+            return
+
+        # The name is unique, there may be several entries of the task
+        _, created = PeriodicTask.objects.update_or_create(
+            name=name,
+            defaults={
+                "task": task_path,
+                "interval": None,
+                "crontab": None,
+                schedule_field: schedule_obj,
+            },
+        )
+        if created:
+            self.stdout.write(
+                self.style.SUCCESS(f"Task '{name}' has been created."),
+            )
+
     # ──────────────────────────────────────────────
     #  Specific tasks
     # ──────────────────────────────────────────────
@@ -81,7 +132,7 @@ class Command(BaseCommand):
             every=1,
             period=IntervalSchedule.MINUTES,
         )
-        self._create_or_skip_task(
+        self._create_or_update_sweep(
             name="Send overdue task notifications",
             task_path="src.notifications.tasks.send_overdue_task_notification",
             schedule_obj=schedule,
@@ -142,7 +193,7 @@ class Command(BaseCommand):
             minute="*/1",
             timezone=pytz.timezone("UTC"),
         )
-        self._create_or_skip_task(
+        self._create_or_update_sweep(
             name="continue_delayed_processes",
             task_path="src.processes.tasks.delay.continue_delayed_workflows",
             schedule_obj=schedule,
@@ -167,7 +218,7 @@ class Command(BaseCommand):
             minute="*/15",
             timezone=pytz.timezone("UTC"),
         )
-        self._create_or_skip_task(
+        self._create_or_update_sweep(
             name="Process vacation schedules",
             task_path=(
                 "src.accounts.tasks.process_vacations"
@@ -189,3 +240,14 @@ class Command(BaseCommand):
             schedule_obj=schedule,
             schedule_field="crontab",
         )
+
+    def _ensure_dispatch_timers(self):
+        schedule, _ = IntervalSchedule.objects.get_or_create(
+            every=1,
+            period=IntervalSchedule.MINUTES,
+        )
+        self._create_or_skip_task(
+            name="Dispatch timers",
+            task_path="src.processes.tasks.timers.dispatch_timers",
+            schedule_obj=schedule,
+        )
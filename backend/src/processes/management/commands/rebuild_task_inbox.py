@@ -0,0 +1,100 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from src.executor import RawSqlExecutor, RowFormat
+from src.processes.models.workflows.task import Task, TaskInbox
+from src.processes.queries import (
+    RefreshTaskInboxQuery,
+    TaskInboxSourceQuery,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuild the task_inbox table from the task performers '
+        'and verify that both are in sync'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--account-ids',
+            type=str,
+            default='',
+            help='Comma-separated list of account IDs (default: all)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of tasks processed per transaction',
+        )
+        parser.add_argument(
+            '--verify-only',
+            action='store_true',
+            help='Only report differences, do not write',
+        )
+
+    def _source_rows(self, task_ids) -> set:
+        query = TaskInboxSourceQuery(task_ids)
+        return set(
+            RawSqlExecutor.fetch(
+                *query.get_sql(),
+                row_format=RowFormat.TUPLE,
+            ),
+        )
+
+    def _projection_rows(self, task_ids) -> set:
+        return set(
+            TaskInbox.objects.on_tasks(task_ids).values_list(
+                *TaskInboxSourceQuery.COLUMNS,
+            ),
+        )
+
+    def handle(self, *args, **options):
+        account_ids = [
+            int(x.strip())
+            for x in options['account_ids'].split(',')
+            if x.strip()
+        ]
+        batch_size = options['batch_size']
+        verify_only = options['verify_only']
+
+        # Deleted tasks are checked too, their rows must be removed
+        tasks = Task._base_manager.order_by('id')
+        if account_ids:
+            tasks = tasks.filter(account_id__in=account_ids)
+        task_ids = list(tasks.values_list('id', flat=True))
+
+        total_missing = 0
+        total_extra = 0
+        for i in range(0, len(task_ids), batch_size):
+            batch_ids = task_ids[i:i + batch_size]
+            source_rows = self._source_rows(batch_ids)
+            projection_rows = self._projection_rows(batch_ids)
+            missing = source_rows - projection_rows
+            extra = projection_rows - source_rows
+            total_missing += len(missing)
+            total_extra += len(extra)
+            if not verify_only and (missing or extra):
+                # The task_id is the second column of the rows
+                changed_ids = {row[1] for row in missing | extra}
+                with transaction.atomic():
+                    RawSqlExecutor.execute(
+                        *RefreshTaskInboxQuery(changed_ids).get_sql(),
+                    )
+
+        self.stdout.write(f'Tasks checked: {len(task_ids)}')
+        self.stdout.write(f'  - Missing rows: {total_missing}')
+        self.stdout.write(f'  - Stale rows: {total_extra}')
+        if not total_missing and not total_extra:
+            self.stdout.write(self.style.SUCCESS(
+                'task_inbox is in sync with the task performers.',
+            ))
+        elif verify_only:
+            self.stdout.write(self.style.ERROR(
+                'task_inbox is out of sync with the task performers!',
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                'task_inbox has been synced with the task performers.',
+            ))
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from src.processes.models.templates.template import Template
+from src.processes.services.workflows.version_propagation import (
+    WorkflowVersionPropagation,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Show the progress of the template version update '
+        'in the running workflows'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('template_id', type=int)
+        parser.add_argument(
+            '--template-version',
+            type=int,
+            default=None,
+            help='Template version (default: the current one)',
+        )
+
+    def handle(self, *args, **options):
+        template_id = options['template_id']
+        version = options['template_version']
+        if version is None:
+            version = (
+                Template.objects
+                .filter(id=template_id)
+                .values_list('version', flat=True)
+                .first()
+            )
+            if version is None:
+                raise CommandError(f'Template {template_id} not found.')
+        progress = WorkflowVersionPropagation(
+            template_id=template_id,
+            version=version,
+        ).get_progress()
+        if progress['total'] is None:
+            self.stdout.write(
+                f'No propagation of the template {template_id} '
+                f'version {version}.',
+            )
+            return
+        status = 'completed' if progress['is_completed'] else 'in progress'
+        self.stdout.write(
+            f'Template {template_id} version {version}: '
+            f'{progress["processed"]} of {progress["total"]} '
+            f'workflows updated, {status}.',
+        )
@@ -0,0 +1,41 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('processes', '0259_populate_fieldset_title_from_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkflowLastEvent',
+            fields=[
+                ('workflow', models.OneToOneField(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    primary_key=True,
+                    related_name='+',
+                    serialize=False,
+                    to='processes.Workflow',
+                )),
+                ('account_id', models.IntegerField()),
+                ('created', models.DateTimeField()),
+                ('event', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='+',
+                    to='processes.WorkflowEvent',
+                )),
+            ],
+            options={
+                'db_table': 'workflow_last_event',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='workflowlastevent',
+            index=models.Index(
+                fields=['account_id', '-created', '-event'],
+                name='workflow_last_event_feed_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('processes', '0260_workflow_last_event'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkflowEventWatched',
+            fields=[
+                ('id', models.AutoField(
+                    auto_created=True,
+                    primary_key=True,
+                    serialize=False,
+                    verbose_name='ID',
+                )),
+                ('date', models.DateTimeField()),
+                ('event', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='watched_receipts',
+                    to='processes.WorkflowEvent',
+                )),
+                ('user', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='+',
+                    to=settings.AUTH_USER_MODEL,
+                )),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='workfloweventwatched',
+            constraint=models.UniqueConstraint(
+                fields=('event', 'user'),
+                name='processes_workfloweventwatched_event_user_unique',
+            ),
+        ),
+        migrations.RunSQL(
+            sql="""
+                INSERT INTO processes_workfloweventwatched
+                  (event_id, user_id, date)
+                SELECT
+                  we.id,
+                  au.id,
+                  MIN((w.value ->> 'date')::timestamptz)
+                FROM processes_workflowevent we
+                  CROSS JOIN LATERAL unnest(we.watched) AS w(value)
+                  JOIN accounts_user au
+                    ON au.id = (w.value ->> 'user_id')::int
+                WHERE w.value ->> 'date' IS NOT NULL
+                GROUP BY we.id, au.id
+                ON CONFLICT (event_id, user_id) DO NOTHING;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RemoveField(
+            model_name='workflowevent',
+            name='watched',
+        ),
+    ]
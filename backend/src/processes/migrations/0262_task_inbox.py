@@ -0,0 +1,433 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('accounts', '0145_apikey_secure_storage'),
+        ('processes', '0261_workflow_event_watched'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskInbox',
+            fields=[
+                ('id', models.AutoField(
+                    auto_created=True,
+                    primary_key=True,
+                    serialize=False,
+                    verbose_name='ID',
+                )),
+                ('account_id', models.IntegerField()),
+                ('workflow_id', models.IntegerField()),
+                ('template_id', models.IntegerField(null=True)),
+                ('api_name', models.CharField(max_length=200)),
+                ('is_urgent', models.BooleanField()),
+                ('due_date', models.DateTimeField(null=True)),
+                ('date_started', models.DateTimeField(null=True)),
+                ('date_completed', models.DateTimeField(null=True)),
+                ('task_performer_id', models.IntegerField()),
+                ('is_active', models.BooleanField()),
+                ('is_completed', models.BooleanField()),
+                ('task', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='+',
+                    to='processes.Task',
+                )),
+                ('user', models.ForeignKey(
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='+',
+                    to=settings.AUTH_USER_MODEL,
+                )),
+            ],
+            options={
+                'db_table': 'task_inbox',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='taskinbox',
+            constraint=models.UniqueConstraint(
+                fields=('user', 'task'),
+                name='task_inbox_user_task_unique',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='taskinbox',
+            index=models.Index(
+                fields=['user', 'is_active', '-date_started'],
+                name='task_inbox_active_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='taskinbox',
+            index=models.Index(
+                fields=['user', 'is_completed', '-date_completed'],
+                name='task_inbox_completed_idx',
+            ),
+        ),
+        # The rows the table should have: user performers and
+        # members of the group performers of the not deleted tasks
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE VIEW task_inbox_source AS
+                SELECT
+                  a.user_id,
+                  pt.id AS task_id,
+                  pw.account_id,
+                  pw.id AS workflow_id,
+                  pw.template_id,
+                  pt.api_name,
+                  pt.is_urgent,
+                  pt.due_date,
+                  pt.date_started,
+                  MAX(a.date_completed) AS date_completed,
+                  MAX(a.task_performer_id) AS task_performer_id,
+                  (
+                    pt.status = 'active'
+                    AND pw.status = 0
+                    AND BOOL_OR(a.is_completed IS FALSE)
+                    AND BOOL_OR(completed.value) IS NOT TRUE
+                  ) AS is_active,
+                  (
+                    BOOL_OR(a.is_completed)
+                    OR BOOL_OR(completed.value) IS TRUE
+                  ) AS is_completed
+                FROM (
+                  SELECT
+                    ptp.task_id,
+                    ptp.user_id,
+                    ptp.id AS task_performer_id,
+                    ptp.is_completed,
+                    ptp.date_completed
+                  FROM processes_taskperformer ptp
+                  WHERE ptp.type = 'user'
+                    AND ptp.is_deleted IS FALSE
+                    AND ptp.directly_status != 1
+                  UNION ALL
+                  SELECT
+                    ptp.task_id,
+                    aug.user_id,
+                    ptp.id AS task_performer_id,
+                    ptp.is_completed,
+                    ptp.date_completed
+                  FROM processes_taskperformer ptp
+                    JOIN accounts_usergroup_users aug
+                      ON aug.usergroup_id = ptp.group_id
+                    JOIN accounts_usergroup ag
+                      ON ag.id = aug.usergroup_id
+                      AND ag.is_deleted IS FALSE
+                  WHERE ptp.type = 'group'
+                    AND ptp.is_deleted IS FALSE
+                    AND ptp.directly_status != 1
+                ) a
+                JOIN processes_task pt
+                  ON pt.id = a.task_id
+                  AND pt.is_deleted IS FALSE
+                JOIN processes_workflow pw ON pw.id = pt.workflow_id
+                -- The user has completed the task personally
+                LEFT JOIN LATERAL (
+                  SELECT TRUE AS value
+                  FROM processes_taskperformer ptpc
+                  WHERE ptpc.task_id = pt.id
+                    AND ptpc.user_id = a.user_id
+                    AND ptpc.is_completed IS TRUE
+                    AND ptpc.type IN ('user', 'group_user')
+                    AND ptpc.is_deleted IS FALSE
+                    AND ptpc.directly_status != 1
+                  LIMIT 1
+                ) completed ON TRUE
+                GROUP BY a.user_id, pt.id, pw.id;
+            """,
+            reverse_sql="DROP VIEW IF EXISTS task_inbox_source;",
+        ),
+        # Recalculate the rows of the tasks. When the users are given
+        # only the rows of these users are touched
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION task_inbox_refresh(
+                  task_ids INT[],
+                  user_ids INT[] DEFAULT NULL
+                )
+                RETURNS void AS
+                $BODY$
+                BEGIN
+                  IF COALESCE(CARDINALITY(task_ids), 0) = 0 THEN
+                    RETURN;
+                  END IF;
+                  WITH src AS (
+                    SELECT *
+                    FROM task_inbox_source s
+                    WHERE s.task_id = ANY(task_ids)
+                      AND (user_ids IS NULL OR s.user_id = ANY(user_ids))
+                  ),
+                  deleted AS (
+                    DELETE FROM task_inbox ti
+                    WHERE ti.task_id = ANY(task_ids)
+                      AND (user_ids IS NULL OR ti.user_id = ANY(user_ids))
+                      AND NOT EXISTS (
+                        SELECT 1
+                        FROM src
+                        WHERE src.task_id = ti.task_id
+                          AND src.user_id = ti.user_id
+                      )
+                  )
+                  INSERT INTO task_inbox (
+                    user_id, task_id, account_id, workflow_id, template_id,
+                    api_name, is_urgent, due_date, date_started,
+                    date_completed, task_performer_id, is_active,
+                    is_completed
+                  )
+                  SELECT
+                    user_id, task_id, account_id, workflow_id, template_id,
+                    api_name, is_urgent, due_date, date_started,
+                    date_completed, task_performer_id, is_active,
+                    is_completed
+                  FROM src
+                  ON CONFLICT (user_id, task_id) DO UPDATE SET
+                    account_id = EXCLUDED.account_id,
+                    workflow_id = EXCLUDED.workflow_id,
+                    template_id = EXCLUDED.template_id,
+                    api_name = EXCLUDED.api_name,
+                    is_urgent = EXCLUDED.is_urgent,
+                    due_date = EXCLUDED.due_date,
+                    date_started = EXCLUDED.date_started,
+                    date_completed = EXCLUDED.date_completed,
+                    task_performer_id = EXCLUDED.task_performer_id,
+                    is_active = EXCLUDED.is_active,
+                    is_completed = EXCLUDED.is_completed
+                  WHERE (
+                    task_inbox.account_id, task_inbox.workflow_id,
+                    task_inbox.template_id, task_inbox.api_name,
+                    task_inbox.is_urgent, task_inbox.due_date,
+                    task_inbox.date_started, task_inbox.date_completed,
+                    task_inbox.task_performer_id, task_inbox.is_active,
+                    task_inbox.is_completed
+                  ) IS DISTINCT FROM (
+                    EXCLUDED.account_id, EXCLUDED.workflow_id,
+                    EXCLUDED.template_id, EXCLUDED.api_name,
+                    EXCLUDED.is_urgent, EXCLUDED.due_date,
+                    EXCLUDED.date_started, EXCLUDED.date_completed,
+                    EXCLUDED.task_performer_id, EXCLUDED.is_active,
+                    EXCLUDED.is_completed
+                  );
+                END;
+                $BODY$ LANGUAGE plpgsql;
+            """,
+            reverse_sql="DROP FUNCTION IF EXISTS task_inbox_refresh;",
+        ),
+        # Performers: any change of the task performers
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION task_inbox_on_taskperformer()
+                RETURNS trigger AS
+                $BODY$
+                BEGIN
+                  IF TG_OP = 'INSERT' THEN
+                    PERFORM task_inbox_refresh(
+                      ARRAY(SELECT DISTINCT task_id FROM new_rows)
+                    );
+                  ELSIF TG_OP = 'DELETE' THEN
+                    PERFORM task_inbox_refresh(
+                      ARRAY(SELECT DISTINCT task_id FROM old_rows)
+                    );
+                  ELSE
+                    PERFORM task_inbox_refresh(
+                      ARRAY(
+                        SELECT task_id FROM new_rows
+                        UNION
+                        SELECT task_id FROM old_rows
+                      )
+                    );
+                  END IF;
+                  RETURN NULL;
+                END;
+                $BODY$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER task_inbox_taskperformer_insert
+                AFTER INSERT ON processes_taskperformer
+                REFERENCING NEW TABLE AS new_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION task_inbox_on_taskperformer();
+
+                CREATE TRIGGER task_inbox_taskperformer_update
+                AFTER UPDATE ON processes_taskperformer
+                REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION task_inbox_on_taskperformer();
+
+                CREATE TRIGGER task_inbox_taskperformer_delete
+                AFTER DELETE ON processes_taskperformer
+                REFERENCING OLD TABLE AS old_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION task_inbox_on_taskperformer();
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS task_inbox_taskperformer_insert
+                  ON processes_taskperformer;
+                DROP TRIGGER IF EXISTS task_inbox_taskperformer_update
+                  ON processes_taskperformer;
+                DROP TRIGGER IF EXISTS task_inbox_taskperformer_delete
+                  ON processes_taskperformer;
+                DROP FUNCTION IF EXISTS task_inbox_on_taskperformer;
+            """,
+        ),
+        # Tasks: status transitions and the copied columns
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION task_inbox_on_task()
+                RETURNS trigger AS
+                $BODY$
+                BEGIN
+                  PERFORM task_inbox_refresh(
+                    ARRAY(
+                      SELECT n.id
+                      FROM new_rows n
+                        JOIN old_rows o ON o.id = n.id
+                      WHERE (
+                        n.status, n.is_deleted, n.is_urgent, n.due_date,
+                        n.date_started, n.api_name, n.workflow_id
+                      ) IS DISTINCT FROM (
+                        o.status, o.is_deleted, o.is_urgent, o.due_date,
+                        o.date_started, o.api_name, o.workflow_id
+                      )
+                    )
+                  );
+                  RETURN NULL;
+                END;
+                $BODY$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER task_inbox_task_update
+                AFTER UPDATE ON processes_task
+                REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION task_inbox_on_task();
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS task_inbox_task_update
+                  ON processes_task;
+                DROP FUNCTION IF EXISTS task_inbox_on_task;
+            """,
+        ),
+        # Workflows: status transitions and the template
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION task_inbox_on_workflow()
+                RETURNS trigger AS
+                $BODY$
+                BEGIN
+                  PERFORM task_inbox_refresh(
+                    ARRAY(
+                      SELECT pt.id
+                      FROM new_rows n
+                        JOIN old_rows o ON o.id = n.id
+                        JOIN processes_task pt ON pt.workflow_id = n.id
+                      WHERE (n.status, n.template_id, n.account_id)
+                        IS DISTINCT FROM
+                        (o.status, o.template_id, o.account_id)
+                    )
+                  );
+                  RETURN NULL;
+                END;
+                $BODY$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER task_inbox_workflow_update
+                AFTER UPDATE ON processes_workflow
+                REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION task_inbox_on_workflow();
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS task_inbox_workflow_update
+                  ON processes_workflow;
+                DROP FUNCTION IF EXISTS task_inbox_on_workflow;
+            """,
+        ),
+        # Groups: deletion of the group and changes of the members
+        migrations.RunSQL(
+            sql="""
+                CREATE OR REPLACE FUNCTION task_inbox_on_usergroup()
+                RETURNS trigger AS
+                $BODY$
+                BEGIN
+                  PERFORM task_inbox_refresh(
+                    ARRAY(
+                      SELECT DISTINCT ptp.task_id
+                      FROM new_rows n
+                        JOIN old_rows o ON o.id = n.id
+                        JOIN processes_taskperformer ptp
+                          ON ptp.group_id = n.id
+                      WHERE n.is_deleted IS DISTINCT FROM o.is_deleted
+                        AND ptp.type = 'group'
+                        AND ptp.is_deleted IS FALSE
+                    )
+                  );
+                  RETURN NULL;
+                END;
+                $BODY$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER task_inbox_usergroup_update
+                AFTER UPDATE ON accounts_usergroup
+                REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION task_inbox_on_usergroup();
+
+                CREATE OR REPLACE FUNCTION task_inbox_on_usergroup_users()
+                RETURNS trigger AS
+                $BODY$
+                BEGIN
+                  IF TG_OP = 'INSERT' THEN
+                    PERFORM task_inbox_refresh(
+                      ARRAY(
+                        SELECT DISTINCT ptp.task_id
+                        FROM new_rows m
+                          JOIN processes_taskperformer ptp
+                            ON ptp.group_id = m.usergroup_id
+                        WHERE ptp.type = 'group'
+                          AND ptp.is_deleted IS FALSE
+                      ),
+                      ARRAY(SELECT DISTINCT user_id FROM new_rows)
+                    );
+                  ELSE
+                    PERFORM task_inbox_refresh(
+                      ARRAY(
+                        SELECT DISTINCT ptp.task_id
+                        FROM old_rows m
+                          JOIN processes_taskperformer ptp
+                            ON ptp.group_id = m.usergroup_id
+                        WHERE ptp.type = 'group'
+                          AND ptp.is_deleted IS FALSE
+                      ),
+                      ARRAY(SELECT DISTINCT user_id FROM old_rows)
+                    );
+                  END IF;
+                  RETURN NULL;
+                END;
+                $BODY$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER task_inbox_usergroup_users_insert
+                AFTER INSERT ON accounts_usergroup_users
+                REFERENCING NEW TABLE AS new_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION task_inbox_on_usergroup_users();
+
+                CREATE TRIGGER task_inbox_usergroup_users_delete
+                AFTER DELETE ON accounts_usergroup_users
+                REFERENCING OLD TABLE AS old_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION task_inbox_on_usergroup_users();
+            """,
+            reverse_sql="""
+                DROP TRIGGER IF EXISTS task_inbox_usergroup_update
+                  ON accounts_usergroup;
+                DROP TRIGGER IF EXISTS task_inbox_usergroup_users_insert
+                  ON accounts_usergroup_users;
+                DROP TRIGGER IF EXISTS task_inbox_usergroup_users_delete
+                  ON accounts_usergroup_users;
+                DROP FUNCTION IF EXISTS task_inbox_on_usergroup;
+                DROP FUNCTION IF EXISTS task_inbox_on_usergroup_users;
+            """,
+        ),
+    ]
@@ -44,6 +44,8 @@ from src.processes.models.workflows.conditions import (
 from src.processes.models.workflows.event import (
     WorkflowEvent,
     WorkflowEventAction,
+    WorkflowEventWatched,
+    WorkflowLastEvent,
 )
 from src.processes.models.workflows.fields import (
     FieldSelection,
@@ -56,6 +58,7 @@ from src.processes.models.workflows.task import (
     Delay,
     Task,
     TaskForList,
+    TaskInbox,
     TaskPerformer,
 )
 from src.processes.models.workflows.workflow import Workflow
@@ -90,6 +93,7 @@ __all__ = [
     'Task',
     'TaskField',
     'TaskForList',
+    'TaskInbox',
     'TaskPerformer',
     'TaskTemplate',
     'Template',
@@ -102,4 +106,6 @@ __all__ = [
     'Workflow',
     'WorkflowEvent',
     'WorkflowEventAction',
+    'WorkflowEventWatched',
+    'WorkflowLastEvent',
 ]
@@ -1,9 +1,7 @@
 from django.contrib.auth import get_user_model
-from django.contrib.postgres.fields import (
-    ArrayField,
-    JSONField,
-)
+from django.contrib.postgres.fields import JSONField
 from django.db import models
+from django.db.models import UniqueConstraint
 
 from src.accounts.models import AccountBaseMixin
 from src.generics.managers import BaseSoftDeleteManager
@@ -18,6 +16,7 @@ from src.processes.models.workflows.workflow import Workflow
 from src.processes.querysets import (
     WorkflowEventActionQuerySet,
     WorkflowEventQuerySet,
+    WorkflowEventWatchedQuerySet,
 )
 
 UserModel = get_user_model()
@@ -63,7 +62,6 @@ class WorkflowEvent(
         null=True,
     )
     delay_json = JSONField(null=True)
-    watched = ArrayField(JSONField(), default=list)
     reactions = JSONField(default=dict)
     target_user_id = models.IntegerField(null=True)
     target_group_id = models.IntegerField(null=True)
@@ -93,3 +91,75 @@ class WorkflowEventAction(
     objects = BaseSoftDeleteManager.from_queryset(
         WorkflowEventActionQuerySet,
     )()
+
+
+class WorkflowEventWatched(models.Model):
+
+    """ Receipt that the user has watched the comment.
+        Rows are only inserted by the periodic task from
+        the WorkflowEventAction records, one per user and event """
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(
+                fields=['event', 'user'],
+                name='processes_workfloweventwatched_event_user_unique',
+            ),
+        ]
+
+    event = models.ForeignKey(
+        WorkflowEvent,
+        on_delete=models.CASCADE,
+        related_name='watched_receipts',
+    )
+    user = models.ForeignKey(
+        UserModel,
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    date = models.DateTimeField()
+
+    objects = WorkflowEventWatchedQuerySet.as_manager()
+
+    def __str__(self):
+        return f'event={self.event_id} | user={self.user_id}'
+
+
+class WorkflowLastEvent(models.Model):
+
+    """ Projection of the latest highlight event of every workflow.
+
+        The highlights feed reads one row per workflow from here
+        instead of "DISTINCT ON" over the whole event history.
+        Rows are written by WorkflowLastEventService when a highlight
+        event is created and recalculated when it is deleted.
+
+        Use "backfill_workflow_last_event" command to fill and verify
+        the table. """
+
+    class Meta:
+        db_table = 'workflow_last_event'
+        indexes = [
+            models.Index(
+                fields=['account_id', '-created', '-event'],
+                name='workflow_last_event_feed_idx',
+            ),
+        ]
+
+    workflow = models.OneToOneField(
+        Workflow,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='+',
+    )
+    account_id = models.IntegerField()
+    event = models.ForeignKey(
+        WorkflowEvent,
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    # Copy of the event "created" for the feed ordering
+    created = models.DateTimeField()
+
+    def __str__(self):
+        return f'workflow={self.workflow_id} | event={self.event_id}'
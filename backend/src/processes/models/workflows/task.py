@@ -1,6 +1,6 @@
 # ruff: noqa: PLC0415
 from collections import defaultdict
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 from django.contrib.auth import get_user_model
 from django.db import models
@@ -34,6 +34,7 @@ from src.processes.models.workflows.workflow import Workflow
 from src.processes.queries import GetTaskPerformersQuery
 from src.processes.querysets import (
     DelayBaseQuerySet,
+    TaskInboxQuerySet,
     TaskPerformerQuerySet,
     TaskQuerySet,
 )
@@ -440,70 +441,18 @@ class Task(
                 elif field.group_id:
                     group_ids[field.group_id].extend(api_names[field.api_name])
 
-        created_performers_user_ids = []
-        created_performers_group_ids = []
-        if user_ids:
-            for user_id, raw_performers_ in user_ids.items():
-                task_performer, created = TaskPerformer.objects.get_or_create(
-                    type=PerformerType.USER,
-                    task_id=self.id,
-                    user_id=user_id,
-                )
-                if created:
-                    created_performers_user_ids.append(user_id)
-                if task_performer.directly_status == DirectlyStatus.NO_STATUS:
-                    for raw_performer_ in raw_performers_:
-                        raw_performer_.task_performer_id = task_performer.id
-                        raw_performers_for_update.append(raw_performer_)
-                elif (
-                    task_performer.directly_status == DirectlyStatus.DELETED
-                    and restore_performers
-                ):
-                    restore_performer = False
-                    for raw_performer_ in raw_performers_:
-                        if raw_performer_.type == PerformerType.FIELD:
-                            raw_performer_.task_performer_id = (
-                                task_performer.id
-                            )
-                            raw_performers_for_update.append(raw_performer_)
-                            restore_performer = True
-                    if restore_performer:
-                        task_performer.directly_status = (
-                            DirectlyStatus.NO_STATUS
-                        )
-                        task_performer.save(update_fields=('directly_status',))
-                        created_performers_user_ids.append(user_id)
-        if group_ids:
-            for group_id, raw_performers_ in group_ids.items():
-                task_performer, created = TaskPerformer.objects.get_or_create(
-                    type=PerformerType.GROUP,
-                    task_id=self.id,
-                    group_id=group_id,
-                )
-                if created:
-                    created_performers_group_ids.append(group_id)
-                if task_performer.directly_status == DirectlyStatus.NO_STATUS:
-                    for raw_performer_ in raw_performers_:
-                        raw_performer_.task_performer_id = task_performer.id
-                        raw_performers_for_update.append(raw_performer_)
-                elif (
-                    task_performer.directly_status == DirectlyStatus.DELETED
-                    and restore_performers
-                ):
-                    restore_performer = False
-                    for raw_performer_ in raw_performers_:
-                        if raw_performer_.type == PerformerType.FIELD:
-                            raw_performer_.task_performer_id = (
-                                task_performer.id
-                            )
-                            raw_performers_for_update.append(raw_performer_)
-                            restore_performer = True
-                    if restore_performer:
-                        task_performer.directly_status = (
-                            DirectlyStatus.NO_STATUS
-                        )
-                        task_performer.save(update_fields=('directly_status',))
-                        created_performers_group_ids.append(group_id)
+        created_performers_user_ids = self._upsert_performers(
+            performer_type=PerformerType.USER,
+            raw_performers_by_id=user_ids,
+            restore_performers=restore_performers,
+            raw_performers_for_update=raw_performers_for_update,
+        )
+        created_performers_group_ids = self._upsert_performers(
+            performer_type=PerformerType.GROUP,
+            raw_performers_by_id=group_ids,
+            restore_performers=restore_performers,
+            raw_performers_for_update=raw_performers_for_update,
+        )
         if raw_performers_for_update:
             from src.processes.models.workflows.raw_performer import (
                 RawPerformer,
@@ -553,6 +502,88 @@ class Task(
             deleted_performers_group_ids,
         )
 
+    def _upsert_performers(
+        self,
+        performer_type: PerformerType,
+        raw_performers_by_id: Dict[int, list],
+        restore_performers: bool,
+        raw_performers_for_update: list,
+    ) -> List[int]:
+
+        """ Create the missing performers of the type in one query
+            and restore the deleted ones pointed by the user fields.
+            Links the raw performers to the performers.
+
+            Returns the created and restored performers users
+            or groups ids """
+
+        if not raw_performers_by_id:
+            return []
+        id_field = (
+            'user_id' if performer_type == PerformerType.USER
+            else 'group_id'
+        )
+        performers_qst = TaskPerformer.objects.by_task(self.id).filter(
+            type=performer_type,
+            **{f'{id_field}__in': list(raw_performers_by_id.keys())},
+        )
+        performers = {
+            getattr(performer, id_field): performer
+            for performer in performers_qst
+        }
+        existing_ids = set(performers.keys())
+        new_ids = [
+            id_ for id_ in raw_performers_by_id if id_ not in existing_ids
+        ]
+        if new_ids:
+            # Skips the performers created by a concurrent request,
+            # the ids are not returned so the performers are reread
+            TaskPerformer.objects.bulk_create(
+                (
+                    TaskPerformer(
+                        type=performer_type,
+                        task_id=self.id,
+                        **{id_field: id_},
+                    )
+                    for id_ in new_ids
+                ),
+                ignore_conflicts=True,
+            )
+            performers = {
+                getattr(performer, id_field): performer
+                for performer in performers_qst.all()
+            }
+        created_ids = []
+        restored_performer_ids = []
+        for id_, raw_performers in raw_performers_by_id.items():
+            performer = performers.get(id_)
+            if performer is None:
+                continue
+            if id_ not in existing_ids:
+                created_ids.append(id_)
+            if performer.directly_status == DirectlyStatus.NO_STATUS:
+                for raw_performer in raw_performers:
+                    raw_performer.task_performer_id = performer.id
+                    raw_performers_for_update.append(raw_performer)
+            elif (
+                performer.directly_status == DirectlyStatus.DELETED
+                and restore_performers
+            ):
+                restore_performer = False
+                for raw_performer in raw_performers:
+                    if raw_performer.type == PerformerType.FIELD:
+                        raw_performer.task_performer_id = performer.id
+                        raw_performers_for_update.append(raw_performer)
+                        restore_performer = True
+                if restore_performer:
+                    restored_performer_ids.append(performer.id)
+                    created_ids.append(id_)
+        if restored_performer_ids:
+            TaskPerformer.objects.filter(
+                id__in=restored_performer_ids,
+            ).update(directly_status=DirectlyStatus.NO_STATUS)
+        return created_ids
+
     def _delete_orphaned_performers(self) -> Tuple[List[int], List[int]]:
 
         """ delete orphan performers (if there are no raw performers
@@ -887,3 +918,66 @@ class TaskPerformer(SoftDeleteModel):
         return self.type == PerformerType.GROUP
 
     objects = BaseSoftDeleteManager.from_queryset(TaskPerformerQuerySet)()
+
+
+class TaskInbox(models.Model):
+
+    """ Projection of the tasks assigned to the user directly
+        or via group: one row per user and task.
+
+        The task list, the tasks counter and the tasks digest read
+        the assignments from here instead of joining the performers
+        and the group members. Rows are recalculated by the
+        "task_inbox_*" database triggers on the performers, tasks,
+        workflows, groups and group members.
+
+        Use "rebuild_task_inbox" command to fill and verify the table """
+
+    class Meta:
+        db_table = 'task_inbox'
+        constraints = [
+            UniqueConstraint(
+                fields=['user', 'task'],
+                name='task_inbox_user_task_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['user', 'is_active', '-date_started'],
+                name='task_inbox_active_idx',
+            ),
+            models.Index(
+                fields=['user', 'is_completed', '-date_completed'],
+                name='task_inbox_completed_idx',
+            ),
+        ]
+
+    user = models.ForeignKey(
+        UserModel,
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    task = models.ForeignKey(
+        Task,
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    account_id = models.IntegerField()
+    workflow_id = models.IntegerField()
+    template_id = models.IntegerField(null=True)
+    api_name = models.CharField(max_length=200)
+    is_urgent = models.BooleanField()
+    due_date = models.DateTimeField(null=True)
+    date_started = models.DateTimeField(null=True)
+    # Latest completion date of the user's performer records
+    date_completed = models.DateTimeField(null=True)
+    task_performer_id = models.IntegerField()
+    # The task is waiting for the user in the running workflow
+    is_active = models.BooleanField()
+    # The user or the user's group has completed the task
+    is_completed = models.BooleanField()
+
+    objects = TaskInboxQuerySet.as_manager()
+
+    def __str__(self):
+        return f'user={self.user_id} | task={self.task_id}'
@@ -1,9 +1,12 @@
-from src.generics.paginations import DefaultPagination
+from src.generics.paginations import DefaultPagination, KeysetPaginationMixin
 
 
-class WorkflowListPagination(DefaultPagination):
+class WorkflowListPagination(KeysetPaginationMixin, DefaultPagination):
 
     def paginate_queryset(self, queryset, request, view=None):
+        if self.is_keyset(queryset, request):
+            return self.paginate_keyset(queryset, request)
+
         self.limit = self.get_limit(request)
         if self.limit is None:
             return None
@@ -1,11 +1,10 @@
 # ruff: noqa: PLC0415
 from ast import literal_eval
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.contrib.auth.models import Permission
-from django.contrib.contenttypes.models import ContentType
 from django.db.models import IntegerField, Q, Subquery
 from django.db.models.functions import Cast
 
@@ -16,7 +15,10 @@ from src.generics.mixins.queries import (
     DereferencedOwnersMixin,
     DereferencedPerformersMixin,
 )
-from src.permissions.models import UserObjectPermission
+from src.generics.paginations import KeysetPagination
+from src.permissions.enums import WorkflowAclPerm
+from src.permissions.models import UserObjectPermission, WorkflowAcl
+from src.permissions.registry import WorkflowPermissionRegistry
 from src.processes.enums import (
     DirectlyStatus,
     OwnerRole,
@@ -37,6 +39,7 @@ from src.processes.messages.workflow import (
 )
 from src.processes.paginations import WorkflowListPagination
 from src.queries import (
+    KeysetPaginationMixin,
     OrderByMixin,
     SqlQueryObject,
 )
@@ -55,6 +58,9 @@ class GuardianOwnerJoinMixin:
 
     Uses parameterized content_type_id and permission_id
     instead of subqueries for better performance.
+
+    With WORKFLOW_ACL_QUERIES enabled joins the integer-keyed
+    workflow_acl table instead: same `user_id` column, no cast.
     """
 
     @staticmethod
@@ -63,15 +69,23 @@ class GuardianOwnerJoinMixin:
         workflow_col: str,
         params: dict,
     ) -> str:
-        ct = ContentType.objects.get(
-            app_label='processes', model='workflow',
+        if settings.WORKFLOW_ACL_QUERIES:
+            params['_acl_change_perm'] = WorkflowAclPerm.CHANGE
+            table = WorkflowAcl._meta.db_table
+            return f"""
+                LEFT JOIN {table} {alias} ON (
+                    {alias}.workflow_id = {workflow_col}
+                    AND {alias}.perm = %(_acl_change_perm)s
+                )
+            """
+        params['_guardian_ct_id'] = (
+            WorkflowPermissionRegistry.get_content_type_id()
         )
-        perm = Permission.objects.get(
-            codename=WorkflowPermission.CHANGE,
-            content_type=ct,
+        params['_guardian_perm_id'] = (
+            WorkflowPermissionRegistry.get_permission_id(
+                WorkflowPermission.CHANGE,
+            )
         )
-        params['_guardian_ct_id'] = ct.id
-        params['_guardian_perm_id'] = perm.id
         table = UserObjectPermission._meta.db_table
         return f"""
             LEFT JOIN {table} {alias} ON (
@@ -118,8 +132,11 @@ class WorkflowListQuery(
     SqlQueryObject,
     SearchSqlQueryMixin,
     OrderByMixin,
+    KeysetPaginationMixin,
 ):
     ordering_map = WorkflowOrdering.MAP
+    keyset_alias = 'workflows'
+    keyset_nullable = frozenset({'nearest_due_date'})
 
     def __init__(
         self,
@@ -137,6 +154,7 @@ class WorkflowListQuery(
         is_external: Optional[bool] = None,
         search: Optional[str] = None,
         ancestor_task_id: Optional[int] = None,
+        cursor: Optional[Dict[str, Any]] = None,
     ):
         self.params = {
             'account_id': account_id,
@@ -171,6 +189,27 @@ class WorkflowListQuery(
         self.is_external = is_external
         self.ancestor_task_id = ancestor_task_id
         self.user_id = user_id
+        self._set_keyset_cursor(cursor)
+        if self.is_keyset:
+            # One more row shows that the next page exists
+            self.offset = None
+            limit = limit or WorkflowListPagination.default_limit
+            self.params['limit'] = limit + 1
+
+    def get_keyset_columns(self) -> List[Tuple[str, bool]]:
+        columns = []
+        if self.search_tsquery:
+            columns.append(('search_rank', True))
+        if self.ordering == WorkflowOrdering.URGENT_FIRST:
+            columns.append(('is_urgent', True))
+            columns.append(('date_created', True))
+        elif self.ordering in self.ordering_map:
+            field = self.ordering_map[self.ordering].split('.')[-1]
+            columns.append((field, self.ordering.startswith('-')))
+        else:
+            columns.append(('date_created', True))
+        columns.append(('id', columns[-1][1]))
+        return columns
 
     def _get_search(self):
         return str(
@@ -382,18 +421,23 @@ class WorkflowListQuery(
         return result
 
     def get_sql(self) -> str:
-        pre_columns = None
-        post_columns = None
-        default_column = 'workflows.date_created DESC'
-        if self.ordering == WorkflowOrdering.URGENT_FIRST:
-            post_columns = default_column
-        if self.search_tsquery:
-            pre_columns = 'workflows.search_rank DESC'
-        order_by = self.get_order_by(
-            pre_columns=pre_columns,
-            default_column=default_column,
-            post_columns=post_columns,
-        )
+        if self.is_keyset:
+            keyset_where = self.get_keyset_where()
+            order_by = self.get_keyset_order_by()
+        else:
+            keyset_where = ''
+            pre_columns = None
+            post_columns = None
+            default_column = 'workflows.date_created DESC'
+            if self.ordering == WorkflowOrdering.URGENT_FIRST:
+                post_columns = default_column
+            if self.search_tsquery:
+                pre_columns = 'workflows.search_rank DESC'
+            order_by = self.get_order_by(
+                pre_columns=pre_columns,
+                default_column=default_column,
+                post_columns=post_columns,
+            )
         return f"""
             SELECT *
             FROM (
@@ -403,6 +447,7 @@ class WorkflowListQuery(
                 GROUP BY pw.id
                 ORDER BY pw.id
             ) AS workflows
+            {keyset_where}
             {order_by}
             LIMIT %(limit)s {self._get_offset()}
         """
@@ -1068,8 +1113,11 @@ class TaskListQuery(
     SqlQueryObject,
     SearchSqlQueryMixin,
     OrderByMixin,
+    KeysetPaginationMixin,
 ):
     ordering_map = TaskOrdering.MAP
+    keyset_alias = 'tasks'
+    keyset_nullable = frozenset({'due_date', 'date_started', 'date_completed'})
 
     def __init__(
         self,
@@ -1080,10 +1128,13 @@ class TaskListQuery(
         assigned_to: Optional[int] = None,
         search: Optional[str] = None,
         is_completed: bool = False,
+        limit: Optional[int] = None,
+        cursor: Optional[Dict[str, Any]] = None,
         **kwargs,
     ):
 
-        """ Search string should be validated """
+        """ Search string should be validated
+            The cursor enables keyset pagination by the limit """
 
         self.assigned_to = user.id if assigned_to is None else assigned_to
         self.params = {
@@ -1100,6 +1151,25 @@ class TaskListQuery(
         self.template_task_api_name = template_task_api_name
         self.ordering = ordering
         self.is_completed = bool(is_completed)
+        self._set_keyset_cursor(cursor)
+        if self.is_keyset:
+            # One more row shows that the next page exists
+            limit = limit or KeysetPagination.keyset_default_limit
+            self.params['limit'] = limit + 1
+
+    def get_keyset_columns(self) -> List[Tuple[str, bool]]:
+        columns = []
+        if self.search_tsquery:
+            columns.append(('search_rank', True))
+        if not self.is_completed:
+            columns.append(('is_urgent', True))
+        if self.ordering in self.ordering_map:
+            field = self.ordering_map[self.ordering].split('.')[-1]
+            columns.append((field, self.ordering.startswith('-')))
+        else:
+            columns.append(('date_started', True))
+        columns.append(('id', columns[-1][1]))
+        return columns
 
     def _get_search(self):
         return str(
@@ -1257,6 +1327,15 @@ class TaskListQuery(
         """
 
     def get_sql(self):
+        if self.is_keyset:
+            return f"""
+                SELECT *
+                FROM ({self._get_inner_sql()}) AS tasks
+                {self.get_keyset_where()}
+                {self.get_keyset_order_by()}
+                LIMIT %(limit)s
+            """, self.params
+
         pre_columns = []
         if self.search_tsquery:
             pre_columns.append('tasks.search_rank DESC')
@@ -1274,14 +1353,137 @@ class TaskListQuery(
         """
         return s, self.params
 
+    def get_count_sql(self):
+        return f"""
+            SELECT
+                1 AS id,
+                COUNT(*) AS count
+            FROM ({self._get_inner_sql()}) AS tasks
+        """, self.params
+
+
+class TaskInboxListQuery(TaskListQuery):
+
+    """ The same list read from the task_inbox projection:
+        the assignment and completion flags are precalculated
+        per user, so the performers and the group members
+        are not joined and the rows are not grouped """
+
+    def get_is_completed_where(self):
+        if self.is_completed:
+            return 'ti.is_completed IS TRUE'
+        return 'ti.is_active IS TRUE'
+
+    def _get_template_task_api_name(self):
+        self.params['template_task_api_name'] = self.template_task_api_name
+        return 'ti.api_name = %(template_task_api_name)s'
+
+    def _get_inner_where(self):
+        where = f"""
+            WHERE ti.user_id = %(assigned_to)s
+            AND ti.account_id = %(account_id)s
+            AND {self.get_is_completed_where()}
+        """
+        if self.template_task_api_name:
+            where += f' AND {self._get_template_task_api_name()}'
+        if self.template_id:
+            where += f' AND {self._get_template_id()}'
+        return where
+
+    def _get_from(self):
+        result = """
+            FROM task_inbox ti
+            INNER JOIN processes_task pt ON pt.id = ti.task_id
+            INNER JOIN processes_workflow pw ON pw.id = ti.workflow_id
+        """
+        if self.search_tsquery:
+            # ! Does not change
+            # "ps.is_deleted = FALSE" to a "ps.is_deleted IS FALSE"
+            # it breaks using gin index
+            result += f"""
+                INNER JOIN processes_searchcontent ps ON (
+                  (
+                    ti.task_id = ps.task_id
+                    OR (
+                        ti.workflow_id = ps.workflow_id
+                        AND ps.type = '{SearchContentType.WORKFLOW}'
+                    )
+                  )
+                  AND ps.is_deleted = FALSE
+                  AND ps.account_id = %(account_id)s
+                  AND {self._get_search()}
+                )
+            """
+        if self.template_id:
+            result += """
+                LEFT JOIN processes_template t ON (
+                  t.id = ti.template_id AND
+                  t.is_deleted IS FALSE
+                )
+            """
+        return result
+
+    def _get_select(self):
+        # Only the completed performers have the completion date
+        date_completed = (
+            'ti.date_completed' if self.is_completed
+            else 'NULL::timestamptz'
+        )
+        result = f"""
+         SELECT
+            ti.task_id AS id,
+            pt.name,
+            ti.workflow_id,
+            pw.name AS workflow_name,
+            ti.due_date,
+            EXTRACT(
+              EPOCH FROM ti.due_date AT TIME ZONE 'UTC'
+            ) AS due_date_tsp,
+            ti.date_started,
+            EXTRACT(
+              EPOCH FROM ti.date_started AT TIME ZONE 'UTC'
+            ) AS date_started_tsp,
+            ti.task_performer_id,
+            {date_completed} AS date_completed,
+            EXTRACT(
+              EPOCH FROM pt.date_completed AT TIME ZONE 'UTC'
+            ) AS date_completed_tsp,
+            ti.template_id,
+            ti.api_name AS template_task_api_name,
+            ti.api_name,
+            ti.is_urgent,
+            pt.status{',' if self.search_tsquery else ''}
+        """
+        if self.search_tsquery:
+            result += f"""
+                MAX(ts_rank(ps.content, {self.search_tsquery})) AS search_rank
+            """
+        return result
+
+    def _get_inner_sql(self):
+        # The search content rows of the task and the workflow
+        # are joined both, so they are grouped to the one rank
+        group_by = ''
+        if self.search_tsquery:
+            group_by = 'GROUP BY ti.id, pt.id, pw.id'
+        return f"""
+            {self._get_select()}
+            {self._get_from()}
+            {self._get_inner_where()}
+            {group_by}
+            ORDER BY ti.task_id
+        """
+
 
 class TemplateListQuery(
     SqlQueryObject,
     SearchSqlQueryMixin,
     OrderByMixin,
     DereferencedOwnersMixin,
+    KeysetPaginationMixin,
 ):
     ordering_map = TemplateOrdering.MAP
+    keyset_alias = 'templates'
 
     def __init__(
         self,
@@ -1291,6 +1493,8 @@ class TemplateListQuery(
         search_text: Optional[str] = None,
         is_active: Optional[bool] = None,
         is_public: Optional[bool] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[Dict[str, Any]] = None,
     ):
 
         self.user_id = user_id
@@ -1309,6 +1513,25 @@ class TemplateListQuery(
         self.is_active = is_active
         self.is_public = is_public
         self.ordering = ordering
+        self._set_keyset_cursor(cursor)
+        if self.is_keyset:
+            # One more row shows that the next page exists
+            limit = limit or KeysetPagination.keyset_default_limit
+            self.params['limit'] = limit + 1
+
+    def get_keyset_columns(self) -> List[Tuple[str, bool]]:
+        columns = []
+        if self.search_tsquery:
+            columns.append(('search_rank', True))
+        columns.append(('is_active', True))
+        if self.ordering in self.ordering_map:
+            field = self.ordering_map[self.ordering].split('.')[-1]
+            is_desc = self.ordering.startswith('-')
+            columns.append((field, is_desc))
+            columns.append(('id', is_desc))
+        else:
+            columns.append(('id', False))
+        return columns
 
     def _get_search(self):
         return f"""
@@ -1500,6 +1723,15 @@ class TemplateListQuery(
         """
 
     def get_sql(self):
+        if self.is_keyset:
+            return f"""
+            SELECT *
+            FROM ({self._get_inner_sql()}) templates
+            {self.get_keyset_where()}
+            {self.get_keyset_order_by()}
+            LIMIT %(limit)s
+            """, self.params
+
         pre_columns = []
         if self.search_tsquery:
             pre_columns.append('templates.search_rank DESC')
@@ -1515,6 +1747,14 @@ class TemplateListQuery(
         {order_by}
         """, self.params
 
+    def get_count_sql(self):
+        return f"""
+        SELECT
+            1 AS id,
+            COUNT(*) AS count
+        FROM ({self._get_inner_sql()}) templates
+        """, self.params
+
 
 class TemplateListByOwnersQuery(
     SqlQueryObject,
@@ -1966,26 +2206,20 @@ class TemplateStepsQuery(
         """, self.params
 
 
+def parse_highlights_templates(templates: str):
+
+    """ Parses the "templates" filter: "1" or "1, 2" """
+
+    from rest_framework.exceptions import ValidationError
+
+    try:
+        return literal_eval(templates)
+    except (SyntaxError, ValueError) as ex:
+        raise ValidationError(MSG_PW_0024('templates')) from ex
+
+
 class HighlightsQuery(GuardianOwnerJoinMixin, SqlQueryObject):
-    event_types = (
-        WorkflowEventType.COMMENT,
-        WorkflowEventType.TASK_COMPLETE,
-        WorkflowEventType.RUN,
-        WorkflowEventType.COMPLETE,
-        WorkflowEventType.ENDED,
-        WorkflowEventType.TASK_REVERT,
-        WorkflowEventType.REVERT,
-        WorkflowEventType.URGENT,
-        WorkflowEventType.NOT_URGENT,
-        WorkflowEventType.TASK_PERFORMER_CREATED,
-        WorkflowEventType.TASK_PERFORMER_DELETED,
-        WorkflowEventType.TASK_PERFORMER_GROUP_CREATED,
-        WorkflowEventType.TASK_PERFORMER_GROUP_DELETED,
-        WorkflowEventType.FORCE_DELAY,
-        WorkflowEventType.FORCE_RESUME,
-        WorkflowEventType.DUE_DATE_CHANGED,
-        WorkflowEventType.SUB_WORKFLOW_RUN,
-    )
+    event_types = WorkflowEventType.HIGHLIGHT_TYPES
 
     def __init__(
         self,
@@ -2005,10 +2239,7 @@ class HighlightsQuery(GuardianOwnerJoinMixin, SqlQueryObject):
         self.sql_params = {'account_id': account_id, 'user_id': user_id}
 
         if templates is not None:
-            try:
-                self.templates = literal_eval(templates)
-            except (SyntaxError, ValueError) as ex:
-                raise ValidationError(MSG_PW_0024('templates')) from ex
+            self.templates = parse_highlights_templates(templates)
 
         if current_performer_ids is not None:
             try:
@@ -2163,9 +2394,221 @@ class HighlightsQuery(GuardianOwnerJoinMixin, SqlQueryObject):
         """, self.sql_params
 
 
-class UpdateWorkflowEventWatchedQuery(SqlQueryObject):
-    """ Construct ARRAY[]::jsonb[] from newly created
-        WorkflowEventAction records and add to WorkflowEvent.watched array """
+class LatestHighlightEventsQuery(SqlQueryObject):
+
+    """ The latest highlight event of the given workflows,
+        the expected content of the workflow_last_event projection """
+
+    def __init__(self, workflow_ids: List[int]):
+        self.workflow_ids = workflow_ids
+        self.params = {}
+
+    def get_sql(self):
+        workflows, params = self._to_sql_list(self.workflow_ids, 'workflow')
+        self.params.update(params)
+        types, params = self._to_sql_list(
+            WorkflowEventType.HIGHLIGHT_TYPES,
+            'type',
+        )
+        self.params.update(params)
+        return f"""
+          SELECT DISTINCT ON (we.workflow_id)
+            we.workflow_id,
+            we.account_id,
+            we.id AS event_id,
+            we.created
+          FROM processes_workflowevent we
+          WHERE we.workflow_id IN {workflows}
+            AND we.is_deleted IS FALSE
+            AND we.type IN {types}
+          ORDER BY we.workflow_id, we.created DESC, we.id DESC
+        """, self.params
+
+
+class UpsertWorkflowLastEventQuery(SqlQueryObject):
+
+    """ Moves the workflow_last_event row to the created event.
+        An older event (e.g. created in a concurrent transaction
+        with an earlier timestamp) does not replace the newer one """
+
+    def __init__(
+        self,
+        workflow_id: int,
+        account_id: int,
+        event_id: int,
+        created: datetime,
+    ):
+        self.params = {
+            'workflow_id': workflow_id,
+            'account_id': account_id,
+            'event_id': event_id,
+            'created': created,
+        }
+
+    def get_sql(self):
+        return """
+          INSERT INTO workflow_last_event
+            (workflow_id, account_id, event_id, created)
+          VALUES (
+            %(workflow_id)s,
+            %(account_id)s,
+            %(event_id)s,
+            %(created)s
+          )
+          ON CONFLICT (workflow_id) DO UPDATE SET
+            event_id = EXCLUDED.event_id,
+            created = EXCLUDED.created
+          WHERE (workflow_last_event.created, workflow_last_event.event_id)
+            < (EXCLUDED.created, EXCLUDED.event_id)
+        """, self.params
+
+
+class RefreshWorkflowLastEventQuery(SqlQueryObject):
+
+    """ Recalculates the workflow_last_event rows of the given
+        workflows from their events. A workflow without highlight
+        events loses its row """
+
+    def __init__(self, workflow_ids: List[int]):
+        self.workflow_ids = workflow_ids
+
+    def get_sql(self):
+        latest_sql, params = LatestHighlightEventsQuery(
+            self.workflow_ids,
+        ).get_sql()
+        workflows, workflow_params = self._to_sql_list(
+            self.workflow_ids,
+            'workflow',
+        )
+        params.update(workflow_params)
+        return f"""
+          WITH latest AS ({latest_sql}),
+          deleted AS (
+            DELETE FROM workflow_last_event wle
+            WHERE wle.workflow_id IN {workflows}
+              AND wle.workflow_id NOT IN (SELECT workflow_id FROM latest)
+          )
+          INSERT INTO workflow_last_event
+            (workflow_id, account_id, event_id, created)
+          SELECT workflow_id, account_id, event_id, created
+          FROM latest
+          ON CONFLICT (workflow_id) DO UPDATE SET
+            account_id = EXCLUDED.account_id,
+            event_id = EXCLUDED.event_id,
+            created = EXCLUDED.created
+        """, params
+
+
+class WorkflowLastEventHighlightsQuery(
+    GuardianOwnerJoinMixin,
+    TemplateOwnerRoleMixin,
+    SqlQueryObject,
+    KeysetPaginationMixin,
+):
+
+    """ Highlights feed read from the workflow_last_event projection:
+        one row per workflow, the newest first.
+        The cursor enables keyset pagination by the limit.
+
+        Filtering by the event author needs the latest event
+        of the author, not of the workflow: use HighlightsQuery """
+
+    keyset_alias = 'highlights'
+
+    def __init__(
+        self,
+        account_id: int,
+        user_id: int,
+        *,
+        templates: Optional[str] = None,
+        date_before_tsp: Optional[datetime] = None,
+        date_after_tsp: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[Dict[str, Any]] = None,
+    ):
+        self.params = {'account_id': account_id, 'user_id': user_id}
+        self.templates = (
+            parse_highlights_templates(templates)
+            if templates is not None else None
+        )
+        self.date_before_tsp = date_before_tsp
+        self.date_after_tsp = date_after_tsp
+        self._set_keyset_cursor(cursor)
+        if self.is_keyset:
+            # One more row shows that the next page exists
+            limit = limit or KeysetPagination.keyset_default_limit
+            self.params['limit'] = limit + 1
+
+    def get_keyset_columns(self) -> List[Tuple[str, bool]]:
+        return [('created', True), ('id', True)]
+
+    def _get_owner_allowed(self) -> str:
+        return f"""EXISTS (
+            SELECT 1 FROM processes_workflow wfa
+            {self._guardian_owner_join('wfo', 'wfa.id', self.params)}
+            WHERE wfa.id = pw.id
+              AND wfo.user_id = %(user_id)s
+        )"""
+
+    def _get_where(self) -> str:
+        where = [
+            'wle.account_id = %(account_id)s',
+            'we.is_deleted IS FALSE',
+            'pw.is_deleted IS FALSE',
+            'ptmp.is_deleted IS FALSE',
+            f"""(
+              {self._get_owner_allowed()}
+              OR {self._get_template_owner_role_allowed(OwnerRole.VIEWER)}
+              OR (
+                pw.workflow_starter_id = %(user_id)s
+                AND {self._get_template_owner_role_allowed(OwnerRole.STARTER)}
+              )
+            )""",
+        ]
+        if self.templates is not None:
+            result, params = self._to_sql_list(self.templates, 'template')
+            self.params.update(params)
+            where.append(f'pw.template_id IN {result}')
+        if self.date_before_tsp is not None:
+            self.params['date_before_tsp'] = self.date_before_tsp
+            where.append('wle.created <= %(date_before_tsp)s')
+        if self.date_after_tsp is not None:
+            self.params['date_after_tsp'] = self.date_after_tsp
+            where.append('wle.created >= %(date_after_tsp)s')
+        return ' AND '.join(where)
+
+    def get_sql(self):
+        limit = 'LIMIT %(limit)s' if self.is_keyset else ''
+        return f"""
+          SELECT highlights.*
+          FROM (
+            SELECT
+              wle.event_id AS id,
+              we.type,
+              we.task_json,
+              we.delay_json,
+              we.text,
+              wle.created,
+              we.user_id,
+              we.target_user_id,
+              we.target_group_id,
+              wle.workflow_id
+            FROM workflow_last_event wle
+            INNER JOIN processes_workflowevent we ON we.id = wle.event_id
+            INNER JOIN processes_workflow pw ON pw.id = wle.workflow_id
+            INNER JOIN processes_template ptmp ON ptmp.id = pw.template_id
+            WHERE {self._get_where()}
+          ) highlights
+          {self.get_keyset_where()}
+          {self.get_keyset_order_by()}
+          {limit}
+        """, self.params
+
+
+class InsertWorkflowEventWatchedQuery(SqlQueryObject):
+    """ Insert the watched receipts from newly created WorkflowEventAction
+        records. Already watched events are skipped,
+        so only the new receipts are returned """
 
     def __init__(
         self,
@@ -2181,34 +2624,68 @@ class UpdateWorkflowEventWatchedQuery(SqlQueryObject):
 
     def get_sql(self) -> Tuple[str, dict]:
         query = f"""
-        UPDATE processes_workflowevent
-        SET watched = updated.watched
-        FROM (
-          SELECT
-            we.id,
-            (
-              array_agg(wea.new_watched)::jsonb[]
-              || COALESCE(we.watched, ARRAY[]::jsonb[])
-            ) AS watched
-          FROM (
-              SELECT
-                event_id,
-                json_build_object(
-                  'date_tsp', EXTRACT(EPOCH FROM (created AT TIME ZONE 'UTC')),
-                  'date', created,
-                  'user_id', user_id) AS new_watched
-              FROM processes_workfloweventaction
-              WHERE id IN {self.get_actions_ids()}
-            ) AS wea
-            JOIN processes_workflowevent we ON we.id = wea.event_id
-          GROUP BY we.id
-        ) AS updated
-        WHERE processes_workflowevent.id = updated.id
-        RETURNING processes_workflowevent.id
+        INSERT INTO processes_workfloweventwatched (event_id, user_id, date)
+        SELECT DISTINCT ON (event_id, user_id)
+          event_id,
+          user_id,
+          created
+        FROM processes_workfloweventaction
+        WHERE id IN {self.get_actions_ids()}
+          AND user_id IS NOT NULL
+        ORDER BY event_id, user_id, created
+        ON CONFLICT (event_id, user_id) DO NOTHING
+        RETURNING id, event_id, user_id, date
         """
         return query, self.params
 
 
+class TaskInboxSourceQuery(SqlQueryObject):
+
+    """ The expected task_inbox rows of the given tasks
+        calculated by the "task_inbox_source" view """
+
+    COLUMNS = (
+        'user_id',
+        'task_id',
+        'account_id',
+        'workflow_id',
+        'template_id',
+        'api_name',
+        'is_urgent',
+        'due_date',
+        'date_started',
+        'date_completed',
+        'task_performer_id',
+        'is_active',
+        'is_completed',
+    )
+
+    def __init__(self, task_ids: List[int]):
+        self.task_ids = task_ids
+
+    def get_sql(self):
+        tasks, params = self._to_sql_list(self.task_ids, 'task')
+        return f"""
+          SELECT {', '.join(self.COLUMNS)}
+          FROM task_inbox_source
+          WHERE task_id IN {tasks}
+        """, params
+
+
+class RefreshTaskInboxQuery(SqlQueryObject):
+
+    """ Recalculates the task_inbox rows of the given tasks,
+        the same function is called by the database triggers """
+
+    def __init__(self, task_ids: List[int]):
+        self.task_ids = task_ids
+
+    def get_sql(self):
+        return """
+          SELECT task_inbox_refresh(%(task_ids)s::INT[])
+        """, {'task_ids': list(self.task_ids)}
+
+
 class TemplateTitlesByEventsQuery(SqlQueryObject):
     event_types = [
         WorkflowEventType.COMMENT,
@@ -2541,19 +3018,29 @@ class WorkflowPermissionQuery:
         Guardian stores ``object_pk`` as varchar; casting inside the
         subquery keeps the outer ``__in`` lookup type-safe.
 
-        ContentType is resolved by app_label/model (not
-        get_for_model(Workflow)) to avoid circular import:
-        Workflow -> querysets -> queries.
+        Ids come from WorkflowPermissionRegistry, so building the filter
+        does not query the database and the subquery filters by
+        permission_id without joining auth_permission.
+
+        With WORKFLOW_ACL_QUERIES enabled reads integer workflow ids
+        from the workflow_acl table instead.
         """
-        ct = ContentType.objects.get(
-            app_label='processes',
-            model='workflow',
-        )
+        if settings.WORKFLOW_ACL_QUERIES:
+            return Subquery(
+                WorkflowAcl.objects.filter(
+                    user_id=user_id,
+                    perm=WorkflowAclPerm.BY_CODENAME[codename],
+                ).values('workflow_id'),
+            )
         return Subquery(
             UserObjectPermission.objects.filter(
                 user_id=user_id,
-                permission__codename=codename,
-                content_type=ct,
+                permission_id=WorkflowPermissionRegistry.get_permission_id(
+                    codename,
+                ),
+                content_type_id=(
+                    WorkflowPermissionRegistry.get_content_type_id()
+                ),
             ).annotate(
                 object_pk_int=Cast('object_pk', IntegerField()),
             ).values('object_pk_int'),
@@ -1,7 +1,8 @@
 # ruff: noqa: PLC0415
 from datetime import datetime
-from typing import Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.db.models import (
@@ -13,7 +14,9 @@ from django.db.models import (
     OuterRef,
     Prefetch,
     Q,
+    Subquery,
 )
+from django.db.models.functions import Coalesce
 
 from src.accounts.enums import UserType
 from src.accounts.models import UserGroup
@@ -42,6 +45,7 @@ from src.processes.queries import (
     TemplateExportQuery,
     TemplateListByOwnersQuery,
     TemplateListQuery,
+    WorkflowLastEventHighlightsQuery,
     WorkflowListQuery,
 )
 
@@ -269,7 +273,14 @@ class TemplateQuerySet(WorkflowsBaseQuerySet):
         search: Optional[str] = None,
         is_active: Optional[bool] = None,
         is_public: Optional[bool] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[Dict[str, Any]] = None,
+        with_count: bool = False,
     ):
+
+        """ The cursor enables keyset pagination, for which
+            the count is calculated only if "with_count" is set """
+
         from src.processes.models.templates.owner import TemplateOwner
         from src.processes.models.templates.fields import FieldTemplate
         from src.processes.models.templates.kickoff import Kickoff
@@ -285,8 +296,10 @@ class TemplateQuerySet(WorkflowsBaseQuerySet):
             search_text=search,
             is_active=is_active,
             is_public=is_public,
+            limit=limit,
+            cursor=cursor,
         )
-        return (
+        raw_qst = (
             self.execute_raw(query)
             .prefetch_related(
                 Prefetch(
@@ -329,6 +342,11 @@ class TemplateQuerySet(WorkflowsBaseQuerySet):
                 ),
             )
         )
+        if query.is_keyset:
+            raw_qst.keyset_query = query
+            if with_count:
+                raw_qst.count = self.raw(*query.get_count_sql())[0].count
+        return raw_qst
 
     def raw_list_by_owners_query(
         self,
@@ -616,8 +634,14 @@ class WorkflowQuerySet(WorkflowsBaseQuerySet):
         search: Optional[str] = None,
         fields: Optional[List[str]] = None,
         ancestor_task_id: Optional[int] = None,
+        cursor: Optional[Dict[str, Any]] = None,
+        with_count: bool = False,
         using: str = 'default',
     ):
+
+        """ The cursor enables keyset pagination, for which
+            the count is calculated only if "with_count" is set """
+
         if current_performer:
             performer_group_ids = UserGroup.objects.filter(
                 users__in=current_performer,
@@ -644,6 +668,7 @@ class WorkflowQuerySet(WorkflowsBaseQuerySet):
             account_id=account_id,
             user_id=user_id,
             ancestor_task_id=ancestor_task_id,
+            cursor=cursor,
         )
         from src.processes.models.templates.template import (
             Template,
@@ -718,11 +743,14 @@ class WorkflowQuerySet(WorkflowsBaseQuerySet):
                 using=using,
             ).prefetch_related(*prefetch_args)
         )
-        raw_qst.count = self.raw(
-            raw_query=query.get_count_sql(),
-            params=query.params,
-            using=using,
-        )[0].count
+        if query.is_keyset:
+            raw_qst.keyset_query = query
+        if not query.is_keyset or with_count:
+            raw_qst.count = self.raw(
+                raw_query=query.get_count_sql(),
+                params=query.params,
+                using=using,
+            )[0].count
         return raw_qst
 
 
@@ -1221,6 +1249,18 @@ class TaskPerformerQuerySet(BaseQuerySet, BaseHardQuerySet):
         return (direct_users | group_users).distinct()
 
 
+class TaskInboxQuerySet(BaseHardQuerySet):
+
+    def by_user(self, user_id: int):
+        return self.filter(user_id=user_id)
+
+    def active(self):
+        return self.filter(is_active=True)
+
+    def on_tasks(self, task_ids: Iterable[int]):
+        return self.filter(task_id__in=task_ids)
+
+
 class ChecklistTemplateQuerySet(BaseQuerySet):
     pass
 
@@ -1314,7 +1354,31 @@ class WorkflowEventQuerySet(AccountBaseQuerySet):
         current_performer_group_ids: Optional[List[int]] = None,
         date_before_tsp: Optional[datetime] = None,
         date_after_tsp: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[Dict[str, Any]] = None,
     ):
+
+        """ The projection query supports keyset pagination
+            by the cursor, the performers filter needs the latest
+            event of the performers and scans the event history """
+
+        if settings.HIGHLIGHTS_PROJECTION_QUERIES and not (
+            current_performer_ids or current_performer_group_ids
+        ):
+            query = WorkflowLastEventHighlightsQuery(
+                account_id=account_id,
+                user_id=user_id,
+                templates=templates,
+                date_before_tsp=date_before_tsp,
+                date_after_tsp=date_after_tsp,
+                limit=limit,
+                cursor=cursor,
+            )
+            queryset = self.execute_raw(query)
+            if query.is_keyset:
+                queryset.keyset_query = query
+            return queryset
+
         # TODO refactoring need
 
         from src.processes.queries import HighlightsQuery
@@ -1341,12 +1405,30 @@ class WorkflowEventQuerySet(AccountBaseQuerySet):
     def by_user(self, user_id: int):
         return self.filter(user_id=user_id)
 
-    def update_watched_from(self, actions_ids: List[int]):
-        from src.processes.queries import (
-            UpdateWorkflowEventWatchedQuery,
+    def with_watched(self, user_id: int):
+
+        """ Annotate the watched receipts count
+            and whether the user has watched the event """
+
+        from src.processes.models.workflows.event import (
+            WorkflowEventWatched,
+        )
+        receipts = WorkflowEventWatched.objects.filter(
+            event_id=OuterRef('id'),
+        )
+        return self.annotate(
+            watched_count=Coalesce(
+                Subquery(
+                    receipts
+                    .order_by()
+                    .values('event_id')
+                    .annotate(count=Count('id'))
+                    .values('count')[:1],
+                ),
+                0,
+            ),
+            is_watched=Exists(receipts.filter(user_id=user_id)),
         )
-        query = UpdateWorkflowEventWatchedQuery(actions_ids)
-        return self.execute_raw(query)
 
 
 class WorkflowEventActionQuerySet(AccountBaseQuerySet):
@@ -1358,6 +1440,28 @@ class WorkflowEventActionQuerySet(AccountBaseQuerySet):
         return self.values_list('id', flat=True)
 
 
+class WorkflowEventWatchedQuerySet(BaseHardQuerySet):
+
+    def create_from_actions(self, actions_ids: List[int]):
+        from src.processes.queries import (
+            InsertWorkflowEventWatchedQuery,
+        )
+        query = InsertWorkflowEventWatchedQuery(actions_ids)
+        return self.execute_raw(query)
+
+    def on_events(self, event_ids: Iterable[int]):
+        return self.filter(event_id__in=event_ids)
+
+    def counts_by_event(self) -> Dict[int, int]:
+        return dict(
+            self
+            .order_by()
+            .values('event_id')
+            .annotate(count=Count('id'))
+            .values_list('event_id', 'count'),
+        )
+
+
 class ConditionQuerySet(BaseQuerySet):
 
     def start_task(self):
@@ -2,8 +2,8 @@ import contextlib
 from typing import Any, Dict, List, Optional, Set
 
 from django.contrib.auth import get_user_model
-from django.db import IntegrityError, transaction
-from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, models, transaction
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
 from rest_framework.serializers import Serializer
 
 from src.processes.messages.fieldset import MSG_FS_0013
@@ -52,17 +52,41 @@ class CreateOrUpdateInstanceMixin:
                 data[field_name] = validated_data[field_name]
         return data
 
+    @staticmethod
+    def _is_changed(instance, field_name: str, value: Any) -> bool:
+
+        """ Compare the value with the loaded instance without
+            fetching the related objects. Not model fields
+            are not saved, so they never change the row """
+
+        try:
+            field = instance._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return False
+        if field.many_to_one or field.one_to_one:
+            if isinstance(value, models.Model):
+                value = value.pk
+            return getattr(instance, field.attname) != value
+        return getattr(instance, field_name) != value
+
     def _update(
         self,
         instance,
         validated_data: Dict[str, Any],
     ):
 
+        """ The row is saved only if any of the fields are changed,
+            the unchanged elements of the template do not touch the db """
+
         data = self._get_create_or_update_data(validated_data)
+        changed = False
         for field_name, field_value in data.items():
+            if self._is_changed(instance, field_name, field_value):
+                changed = True
             setattr(instance, field_name, field_value)
-        with transaction.atomic():
-            instance.save()
+        if changed:
+            with transaction.atomic():
+                instance.save()
 
     def _create(
         self,
@@ -110,50 +134,56 @@ class CreateOrUpdateRelatedMixin:
             )
         return api_primary_field
 
+    @staticmethod
+    def _get_existent_instances(model_cls, ancestors_data) -> list:
+
+        """ Load all related records of the ancestors with one query.
+            The order is the same as for the ".first()" lookup """
+
+        queryset = model_cls.objects.filter(**ancestors_data)
+        if not queryset.ordered:
+            queryset = queryset.order_by('pk')
+        return list(queryset)
+
     def _get_related_serializer(
         self,
         slz_cls,
         data,
         ancestors_data,
+        existent_instances,
         slz_context=None,
     ) -> Serializer:
 
-        """ This method checks existing of object either by id or api_name.
+        """ This method checks existing of object by api_name
+            in the loaded related records.
             If objects exists then returns serializer
             for update else for create. """
 
         slz_context = {} if slz_context is None else slz_context
-        model_cls = slz_cls.Meta.model
-        slz = None
         api_primary_field = self._get_api_primary_field(slz_cls)
         primary_value = data.get(api_primary_field)
+        instance = None
         if primary_value:
-            obj_filter = ancestors_data.copy()
-            obj_filter[api_primary_field] = primary_value
-            instance = model_cls.objects.filter(**obj_filter).first()
-            if instance:
-                slz = slz_cls(instance, data=data, context=slz_context)
-        if slz is None:
-            data.pop('id', None)
-            for field_name, value in ancestors_data.items():
-                data[field_name] = value
-            slz = slz_cls(data=data, context=slz_context)
-        return slz
+            instance = existent_instances.get(primary_value)
+        if instance:
+            return slz_cls(instance, data=data, context=slz_context)
+        data.pop('id', None)
+        for field_name, value in ancestors_data.items():
+            data[field_name] = value
+        return slz_cls(data=data, context=slz_context)
 
     def _get_related_one_serializer(
         self,
         slz_cls,
         data,
         ancestors_data,
+        instance=None,
         slz_context=None,
     ):
-        """ This method checks existing of one related object.
-            If objects exists then returns serializer
-            for update else for create. """
+        """ Returns serializer for update of the existing related object
+            else for create. """
 
         slz_context = {} if slz_context is None else slz_context
-        model_cls = slz_cls.Meta.model
-        instance = model_cls.objects.filter(**ancestors_data).first()
         if instance:
             slz = slz_cls(instance, data=data, context=slz_context)
         else:
@@ -175,6 +205,8 @@ class CreateOrUpdateRelatedMixin:
             and delete prev record
             If not the data - then all prev records are deleted """
 
+        model_cls = slz_cls.Meta.model
+        instances = self._get_existent_instances(model_cls, ancestors_data)
         existent_ids = set()
         if data:
             slz = self._get_related_one_serializer(
@@ -182,14 +214,17 @@ class CreateOrUpdateRelatedMixin:
                 slz_context=slz_context,
                 data=data,
                 ancestors_data=ancestors_data,
+                instance=instances[0] if instances else None,
             )
             slz.is_valid(raise_exception=True)
             obj = slz.save()
             existent_ids.add(obj.id)
-        model_cls = slz_cls.Meta.model
-        model_cls.objects.filter(**ancestors_data).exclude(
-            id__in=existent_ids,
-        ).delete()
+        deleted_ids = {
+            instance.id for instance in instances
+            if instance.id not in existent_ids
+        }
+        if deleted_ids:
+            model_cls.objects.filter(id__in=deleted_ids).delete()
 
     def create_or_update_related(
         self,
@@ -201,32 +236,47 @@ class CreateOrUpdateRelatedMixin:
 
         """ Create or update foreign key related records
             in right order and delete prev record
-            If not the data - then all prev records are deleted """
+            If not the data - then all prev records are deleted
+
+            The existent records are loaded once and compared with
+            the data by the api_name: only the records missing
+            in the data are deleted and only the changed ones are saved """
 
         model_cls = slz_cls.Meta.model
-        if data:
-            existent_ids = set()
-            api_primary_field = self._get_api_primary_field(slz_cls)
-            for elem in data:
-                primary_value = elem.get(api_primary_field)
-                if primary_value:
-                    existent_ids.add(primary_value)
-            model_cls.objects.filter(**ancestors_data).exclude(
-                **{f'{api_primary_field}__in': existent_ids},
-            ).delete()
-        else:
-            model_cls.objects.filter(**ancestors_data).delete()
+        api_primary_field = self._get_api_primary_field(slz_cls)
+        data = data or []
+        primary_values = set()
+        for elem in data:
+            primary_value = elem.get(api_primary_field)
+            if primary_value:
+                primary_values.add(primary_value)
+        existent_instances = {}
+        deleted_ids = set()
+        for instance in self._get_existent_instances(
+            model_cls,
+            ancestors_data,
+        ):
+            primary_value = getattr(instance, api_primary_field)
+            if primary_value in primary_values:
+                existent_instances.setdefault(primary_value, instance)
+            else:
+                deleted_ids.add(instance.id)
+        if deleted_ids:
+            model_cls.objects.filter(id__in=deleted_ids).delete()
 
-        if data:
-            for el in data:
-                slz = self._get_related_serializer(
-                    slz_cls=slz_cls,
-                    slz_context=slz_context,
-                    data=el,
-                    ancestors_data=ancestors_data,
-                )
-                slz.is_valid(raise_exception=True)
-                slz.save()
+        for el in data:
+            primary_value = el.get(api_primary_field)
+            slz = self._get_related_serializer(
+                slz_cls=slz_cls,
+                slz_context=slz_context,
+                data=el,
+                ancestors_data=ancestors_data,
+                existent_instances=existent_instances,
+            )
+            slz.is_valid(raise_exception=True)
+            obj = slz.save()
+            if primary_value:
+                existent_instances[primary_value] = obj
 
 
 class CustomValidationApiNameMixin:
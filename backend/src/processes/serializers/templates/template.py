@@ -21,6 +21,7 @@ from rest_framework.serializers import (
 
 from src.generics.exceptions import BaseServiceException
 from src.generics.fields import (
+    KeysetCursorField,
     TimeStampField,
 )
 from src.generics.mixins.serializers import (
@@ -798,6 +799,8 @@ class TemplateListFilterSerializer(
     ordering = ChoiceField(required=False, choices=TemplateOrdering.CHOICES)
     limit = IntegerField(min_value=0, required=False)
     offset = IntegerField(min_value=0, required=False)
+    cursor = KeysetCursorField(required=False)
+    with_count = BooleanField(required=False, default=False)
 
     def validate_search(self, value: str) -> str:
         removed_chars_regex = r'\s\s+'
@@ -1,8 +1,13 @@
+from typing import Optional
+
 from rest_framework import serializers
 
 from src.generics.fields import TimeStampField
 from src.processes.enums import WorkflowEventType
-from src.processes.models.workflows.event import WorkflowEvent
+from src.processes.models.workflows.event import (
+    WorkflowEvent,
+    WorkflowEventWatched,
+)
 from src.processes.models.workflows.task import Delay, Task
 from src.processes.models.workflows.workflow import Workflow
 from src.processes.serializers.workflows.field import (
@@ -126,7 +131,8 @@ class WorkflowEventSerializer(serializers.ModelSerializer):
             'task',
             'workflow_id',
             'is_urgent',
-            'watched',
+            'watched_count',
+            'is_watched',
             'reactions',
         )
     task = serializers.JSONField(source='task_json')
@@ -137,3 +143,37 @@ class WorkflowEventSerializer(serializers.ModelSerializer):
         source='workflow.is_urgent',
         read_only=True,
     )
+    watched_count = serializers.SerializerMethodField()
+    is_watched = serializers.SerializerMethodField()
+
+    def get_watched_count(self, instance) -> int:
+        if hasattr(instance, 'watched_count'):
+            return instance.watched_count
+        return instance.watched_receipts.count()
+
+    def get_is_watched(self, instance) -> Optional[bool]:
+
+        """ None when the data is not built for the particular user,
+            e.g. the same websocket message is sent to many users """
+
+        if hasattr(instance, 'is_watched'):
+            return instance.is_watched
+        request = self.context.get('request')
+        if request is None or not request.user.is_authenticated:
+            return None
+        return instance.watched_receipts.filter(
+            user_id=request.user.id,
+        ).exists()
+
+
+class WorkflowEventWatchedSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = WorkflowEventWatched
+        fields = (
+            'user_id',
+            'date',
+            'date_tsp',
+        )
+
+    date_tsp = TimeStampField(source='date')
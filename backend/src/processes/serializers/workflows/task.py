@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
-from src.generics.fields import TimeStampField
+from src.generics.fields import KeysetCursorField, TimeStampField
 from src.generics.serializers import CustomValidationErrorMixin
 from src.processes.enums import (
     OwnerRole,
@@ -285,6 +285,8 @@ class TaskListFilterSerializer(
     template_task_api_name = serializers.CharField(required=False)
     limit = serializers.IntegerField(required=False)
     offset = serializers.IntegerField(required=False)
+    cursor = KeysetCursorField(required=False)
+    with_count = serializers.BooleanField(required=False, default=False)
 
     def validate_search(self, value: str) -> Optional[str]:
         removed_chars_regex = r'\s\s+'
@@ -13,6 +13,7 @@ from rest_framework.serializers import ValidationError
 from src.datasets.models import DatasetItem
 from src.generics.fields import (
     AccountPrimaryKeyRelatedField,
+    KeysetCursorField,
     TimeStampField,
 )
 from src.generics.mixins.serializers import (
@@ -21,6 +22,7 @@ from src.generics.mixins.serializers import (
     ValidationUtilsMixin,
 )
 from src.generics.paginations import DefaultPagination
+from src.processes.consts import WORKFLOW_RUN_BATCH_MAX_SIZE
 from src.processes.enums import (
     OwnerRole,
     OwnerType,
@@ -212,6 +214,20 @@ class WorkflowCreateSerializer(
         return data
 
 
+class WorkflowBatchCreateSerializer(
+    CustomValidationErrorMixin,
+    serializers.Serializer,
+):
+
+    """ Use the same context vars as WorkflowCreateSerializer """
+
+    workflows = serializers.ListField(
+        child=WorkflowCreateSerializer(),
+        min_length=1,
+        max_length=WORKFLOW_RUN_BATCH_MAX_SIZE,
+    )
+
+
 class WorkflowUpdateSerializer(
     CustomValidationErrorMixin,
     WorkflowSerializerMixin,
@@ -538,6 +554,8 @@ class WorkflowListFilterSerializer(
         required=False,
         min_value=0,
     )
+    cursor = KeysetCursorField(required=False)
+    with_count = serializers.BooleanField(required=False, default=False)
 
     def validate_template_id(self, value):
         return self.get_valid_list_integers(value)
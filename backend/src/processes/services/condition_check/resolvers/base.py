@@ -1,6 +1,13 @@
+from typing import Optional
+
 from src.processes.enums import PredicateOperator
 from src.processes.models.workflows.conditions import Predicate
+from src.processes.models.workflows.fields import TaskField
 from src.processes.services.condition_check.comparator import Comparator
+from src.processes.services.condition_check.snapshot import (
+    WorkflowConditionSnapshot,
+    get_condition_fields_queryset,
+)
 
 
 class Resolver:
@@ -8,12 +15,26 @@ class Resolver:
     field_value = None
     _predicate = None
     _workflow_id = None
+    _snapshot = None
 
-    def __init__(self, predicate: Predicate, workflow_id: int):
+    def __init__(
+        self,
+        predicate: Predicate,
+        workflow_id: int,
+        snapshot: Optional[WorkflowConditionSnapshot] = None,
+    ):
         self._predicate = predicate
         self._workflow_id = workflow_id
+        self._snapshot = snapshot
         self._prepare_args()
 
+    def _get_field(self) -> TaskField:
+        if self._snapshot is not None:
+            return self._snapshot.get_field(self._predicate.field)
+        return get_condition_fields_queryset(self._workflow_id).get(
+            api_name=self._predicate.field,
+        )
+
     def _prepare_args(self):
         raise NotImplementedError
 
@@ -1,20 +1,13 @@
-from django.db.models import Q
-
 from src.processes.enums import (
     PredicateOperator,
 )
-from src.processes.models.workflows.fields import TaskField
 
 from .base import Resolver
 
 
 class CheckboxResolver(Resolver):
     def _prepare_args(self):
-        field = TaskField.objects.get(
-            Q(task__workflow_id=self._workflow_id) |
-            Q(kickoff__workflow_id=self._workflow_id),
-            api_name=self._predicate.field,
-        )
+        field = self._get_field()
         self.field_value = field.value.split(',') if field.value else []
         if self._predicate.operator in {
             PredicateOperator.EQUAL,
@@ -2,9 +2,6 @@ import contextlib
 from datetime import datetime
 from datetime import timezone as tz
 
-from django.db.models import Q
-
-from src.processes.models.workflows.fields import TaskField
 from src.processes.services.condition_check.resolvers.base import Resolver
 
 
@@ -22,9 +19,5 @@ class DateResolver(Resolver):
 
     def _prepare_args(self):
         self.predicate_value = self._get_date(self._predicate.value)
-        field = TaskField.objects.get(
-            Q(task__workflow_id=self._workflow_id) |
-            Q(kickoff__workflow_id=self._workflow_id),
-            api_name=self._predicate.field,
-        )
+        field = self._get_field()
         self.field_value = self._get_date(field.value)
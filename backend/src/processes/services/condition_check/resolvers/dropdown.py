@@ -1,16 +1,8 @@
-from django.db.models import Q
-
-from src.processes.models.workflows.fields import TaskField
-
 from .base import Resolver
 
 
 class DropdownResolver(Resolver):
     def _prepare_args(self):
-        field = TaskField.objects.get(
-            Q(task__workflow_id=self._workflow_id) |
-            Q(kickoff__workflow_id=self._workflow_id),
-            api_name=self._predicate.field,
-        )
+        field = self._get_field()
         self.field_value = field.value or None
         self.predicate_value = self._predicate.value
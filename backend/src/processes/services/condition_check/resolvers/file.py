@@ -1,15 +1,7 @@
-from django.db.models import Q
-
-from src.processes.models.workflows.fields import TaskField
-
 from .base import Resolver
 
 
 class FileResolver(Resolver):
     def _prepare_args(self):
-        field = TaskField.objects.get(
-            Q(task__workflow_id=self._workflow_id) |
-            Q(kickoff__workflow_id=self._workflow_id),
-            api_name=self._predicate.field,
-        )
-        self.field_value = field.storage_attachments.exists() or None
+        field = self._get_field()
+        self.field_value = field.has_attachments or None
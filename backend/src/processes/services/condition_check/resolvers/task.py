@@ -1,4 +1,4 @@
-from src.processes.enums import PredicateOperator
+from src.processes.enums import PredicateOperator, TaskStatus
 from src.processes.models.workflows.task import Task
 
 from .base import Resolver
@@ -6,15 +6,23 @@ from .base import Resolver
 
 class TaskResolver(Resolver):
 
-    def _prepare_args(self):
+    def _get_task_status(self) -> str:
+        if self._snapshot is not None:
+            return self._snapshot.get_task_status(self._predicate.field)
         task = Task.objects.only('status').get(
             api_name=self._predicate.field,
             workflow_id=self._workflow_id,
         )
+        return task.status
+
+    def _prepare_args(self):
+        status = self._get_task_status()
+        is_completed = status == TaskStatus.COMPLETED
+        is_skipped = status == TaskStatus.SKIPPED
         operator = self._predicate.operator
         if operator == PredicateOperator.SKIPPED:
-            self.field_value = task.is_skipped
+            self.field_value = is_skipped
         elif operator == PredicateOperator.COMPLETED:
-            self.field_value = task.is_completed
+            self.field_value = is_completed
         else:
-            self.field_value = (task.is_completed or task.is_skipped)
+            self.field_value = (is_completed or is_skipped)
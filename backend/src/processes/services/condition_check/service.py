@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from src.processes.enums import PredicateType
 from src.processes.models.workflows.conditions import (
@@ -30,6 +30,9 @@ from src.processes.services.condition_check.resolvers.string import (
 )
 from src.processes.services.condition_check.resolvers.task import TaskResolver
 from src.processes.services.condition_check.resolvers.user import UserResolver
+from src.processes.services.condition_check.snapshot import (
+    WorkflowConditionSnapshot,
+)
 
 
 class ConditionCheckService:
@@ -51,8 +54,17 @@ class ConditionCheckService:
     }
 
     @classmethod
-    def _check_predicate(cls, predicate: Predicate, workflow_id: int) -> bool:
-        resolver = cls.RESOLVERS[predicate.field_type](predicate, workflow_id)
+    def _check_predicate(
+        cls,
+        predicate: Predicate,
+        workflow_id: int,
+        snapshot: Optional[WorkflowConditionSnapshot] = None,
+    ) -> bool:
+        resolver = cls.RESOLVERS[predicate.field_type](
+            predicate,
+            workflow_id,
+            snapshot=snapshot,
+        )
         return resolver.resolve()
 
     @classmethod
@@ -60,21 +72,37 @@ class ConditionCheckService:
         cls,
         predicates: List[Predicate],
         workflow_id: int,
+        snapshot: Optional[WorkflowConditionSnapshot] = None,
     ) -> bool:
         for predicate in predicates:
-            if not cls._check_predicate(predicate, workflow_id):
+            if not cls._check_predicate(predicate, workflow_id, snapshot):
                 return False
         return True
 
     @classmethod
-    def _check_rules(cls, rules: List[Rule], workflow_id: int) -> bool:
+    def _check_rules(
+        cls,
+        rules: List[Rule],
+        workflow_id: int,
+        snapshot: Optional[WorkflowConditionSnapshot] = None,
+    ) -> bool:
         for rule in rules:
             predicates = rule.predicates.all()
-            if cls._check_predicates(predicates, workflow_id):
+            if cls._check_predicates(predicates, workflow_id, snapshot):
                 return True
         return False
 
     @classmethod
-    def check(cls, condition: Condition, workflow_id: int) -> bool:
+    def check(
+        cls,
+        condition: Condition,
+        workflow_id: int,
+        snapshot: Optional[WorkflowConditionSnapshot] = None,
+    ) -> bool:
+
+        """ Without snapshot every predicate loads its own data.
+            Pass the snapshot to evaluate a lot of conditions
+            of the same workflow without extra queries. """
+
         rules = condition.rules.all()
-        return cls._check_rules(rules, workflow_id)
+        return cls._check_rules(rules, workflow_id, snapshot)
@@ -0,0 +1,107 @@
+from collections import defaultdict
+from typing import Dict, List
+
+from django.db.models import Exists, OuterRef, Q
+
+from src.processes.enums import ConditionAction
+from src.processes.models.workflows.conditions import Condition
+from src.processes.models.workflows.fields import TaskField
+from src.processes.models.workflows.task import Task
+from src.storage.models import Attachment
+
+
+def get_condition_fields_queryset(workflow_id: int):
+
+    """ Fields of the workflow (task outputs and kickoff) with the data
+        needed by the condition resolvers """
+
+    return (
+        TaskField.objects
+        .filter(
+            Q(task__workflow_id=workflow_id) |
+            Q(kickoff__workflow_id=workflow_id),
+        )
+        .annotate(
+            has_attachments=Exists(
+                Attachment.objects.filter(output_id=OuterRef('id')),
+            ),
+        )
+        .only('id', 'api_name', 'value', 'user_id', 'group_id')
+    )
+
+
+class WorkflowConditionSnapshot:
+
+    """ In-memory state of a workflow for the condition evaluation.
+
+        Fields, task statuses and all conditions with rules and predicates
+        are loaded in a fixed number of queries. The caller is responsible
+        for keeping the task statuses up to date via "set_task_status"
+        and for dropping the snapshot when the fields values change. """
+
+    SKIP_ACTIONS = (
+        ConditionAction.SKIP_TASK,
+        ConditionAction.END_WORKFLOW,
+    )
+
+    def __init__(self, workflow_id: int):
+        self.workflow_id = workflow_id
+        self._fields: Dict[str, TaskField] = {}
+        self._duplicated_fields = set()
+        self._task_statuses: Dict[str, str] = {}
+        self._conditions: Dict[int, List[Condition]] = defaultdict(list)
+        self._load()
+
+    def _load(self):
+        for field in get_condition_fields_queryset(self.workflow_id):
+            if field.api_name in self._fields:
+                self._duplicated_fields.add(field.api_name)
+            self._fields[field.api_name] = field
+
+        tasks = (
+            Task.objects
+            .filter(workflow_id=self.workflow_id)
+            .values_list('api_name', 'status')
+        )
+        self._task_statuses = dict(tasks)
+
+        conditions = (
+            Condition.objects
+            .filter(task__workflow_id=self.workflow_id)
+            .prefetch_related('rules__predicates')
+        )
+        for condition in conditions:
+            self._conditions[condition.task_id].append(condition)
+
+    def get_field(self, api_name: str) -> TaskField:
+
+        """ Same contract as TaskField.objects.get(...) used
+            by the resolvers before the snapshot existed """
+
+        if api_name in self._duplicated_fields:
+            raise TaskField.MultipleObjectsReturned
+        try:
+            return self._fields[api_name]
+        except KeyError as ex:
+            raise TaskField.DoesNotExist from ex
+
+    def get_task_status(self, api_name: str) -> str:
+        try:
+            return self._task_statuses[api_name]
+        except KeyError as ex:
+            raise Task.DoesNotExist from ex
+
+    def set_task_status(self, api_name: str, status: str):
+        self._task_statuses[api_name] = status
+
+    def get_start_conditions(self, task_id: int) -> List[Condition]:
+        return [
+            condition for condition in self._conditions[task_id]
+            if condition.action == ConditionAction.START_TASK
+        ]
+
+    def get_skip_conditions(self, task_id: int) -> List[Condition]:
+        return [
+            condition for condition in self._conditions[task_id]
+            if condition.action in self.SKIP_ACTIONS
+        ]
@@ -23,6 +23,7 @@ from src.processes.enums import (
 from src.processes.models.workflows.event import (
     WorkflowEvent,
     WorkflowEventAction,
+    WorkflowEventWatched,
 )
 from src.processes.models.workflows.task import (
     Delay,
@@ -44,6 +45,9 @@ from src.processes.services.exceptions import (
 from src.processes.services.workflow_permissions import (
     WorkflowPermissionService,
 )
+from src.processes.services.workflows.last_event import (
+    WorkflowLastEventService,
+)
 from src.processes.utils.common import MENTION_RE
 from src.services.markdown import MarkdownPatterns, MarkdownService
 from src.storage.services.attachments import (
@@ -59,6 +63,12 @@ UserModel = get_user_model()
 
 class WorkflowEventService:
 
+    @classmethod
+    def _create_event(cls, **kwargs) -> WorkflowEvent:
+        event = WorkflowEvent.objects.create(**kwargs)
+        WorkflowLastEventService.event_created(event)
+        return event
+
     @classmethod
     def _after_create_actions(cls, event: WorkflowEvent):
 
@@ -81,7 +91,7 @@ class WorkflowEventService:
     ) -> WorkflowEvent:
 
         with_attachments = task.output.with_attachments().exists()
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_COMPLETE,
             account=user.account,
             task=task,
@@ -107,7 +117,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_REVERT,
             text=text,
             clear_text=clear_text or text,
@@ -133,7 +143,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_DELAY,
             account=user.account,
             task=task,
@@ -156,7 +166,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.ENDED,
             account=user.account,
             workflow=workflow,
@@ -175,7 +185,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.FORCE_DELAY,
             account=user.account,
             user=user,
@@ -194,7 +204,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.FORCE_RESUME,
             account=user.account,
             user=user,
@@ -212,7 +222,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             account=user.account,
             type=WorkflowEventType.REVERT,
             workflow=task.workflow,
@@ -237,7 +247,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             account=user.account,
             type=WorkflowEventType.COMMENT,
             text=text,
@@ -264,7 +274,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=event_type,
             account=user.account,
             workflow=workflow,
@@ -283,7 +293,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_PERFORMER_CREATED,
             account=user.account,
             task=task,
@@ -310,7 +320,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_PERFORMER_GROUP_CREATED,
             account=user.account,
             task=task,
@@ -338,7 +348,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_PERFORMER_DELETED,
             account=user.account,
             task=task,
@@ -365,7 +375,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_PERFORMER_GROUP_DELETED,
             account=user.account,
             task=task,
@@ -392,7 +402,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.DUE_DATE_CHANGED,
             account=user.account,
             workflow=task.workflow,
@@ -414,7 +424,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_SKIP,
             account=task.account,
             workflow=task.workflow,
@@ -435,7 +445,7 @@ class WorkflowEventService:
         user: Optional[UserModel] = None,
     ) -> WorkflowEvent:
 
-        return WorkflowEvent.objects.create(
+        return cls._create_event(
             type=WorkflowEventType.RUN,
             account=workflow.account,
             workflow=workflow,
@@ -451,7 +461,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.SUB_WORKFLOW_RUN,
             account=workflow.account,
             workflow=workflow,
@@ -478,7 +488,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.COMPLETE,
             account=workflow.account,
             task=task,
@@ -502,7 +512,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.ENDED_BY_CONDITION,
             account=workflow.account,
             task=task,
@@ -525,7 +535,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.DELAY,
             account=workflow.account,
             workflow=workflow,
@@ -542,7 +552,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_START,
             account=task.account,
             task=task,
@@ -563,7 +573,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_SKIP_NO_PERFORMERS,
             account=task.account,
             workflow=task.workflow,
@@ -588,7 +598,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_DELEGATION,
             account=task.account,
             task=task,
@@ -890,8 +900,11 @@ class CommentService(BaseModelService):
 
         self._validate_comment_action()
         if self.user != self.instance.user:
-            watched = {el['user_id'] for el in self.instance.watched}
-            if self.user.id not in watched:
+            already_watched = WorkflowEventWatched.objects.filter(
+                event_id=self.instance.id,
+                user_id=self.user.id,
+            ).exists()
+            if not already_watched:
                 WorkflowEventAction.objects.get_or_create(
                     event=self.instance,
                     user=self.user,
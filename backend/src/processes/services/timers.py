@@ -0,0 +1,179 @@
+from datetime import datetime, time, timedelta
+from typing import Optional
+
+import pytz
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+from django_redis import get_redis_connection
+from pytz.exceptions import UnknownTimeZoneError
+
+from src.accounts.models import UserVacation
+from src.processes.enums import TimerType
+
+
+class TimerService:
+
+    """ Durable timers for the delays, due dates and vacations.
+
+        A timer is a member "<type>:<object id>" of a Redis sorted set
+        scored by the fire time. Timers firing within the horizon are
+        sent to celery with an ETA at once, the rest wait in the set
+        until dispatch() moves them to celery. A broker holds ETA tasks
+        in the worker memory, so long ETAs are not sent directly.
+
+        Each timer fires an idempotent job which checks the object
+        state again, so a moved or cancelled timer only fires a no-op.
+        The periodic sweeps catch the timers lost on the way. """
+
+    key = 'timers'
+    horizon = timedelta(minutes=5)
+    # Against the clock skew between the hosts
+    lag = timedelta(seconds=1)
+
+    @classmethod
+    def _get_client(cls):
+        return get_redis_connection('default')
+
+    @classmethod
+    def _get_key(cls) -> str:
+        return caches['default'].make_key(cls.key)
+
+    @classmethod
+    def _send(
+        cls,
+        timer_type: TimerType.LITERALS,
+        object_id: int,
+        fire_at: datetime,
+    ):
+        from src.processes.tasks.timers import (  # noqa: PLC0415
+            fire_timer,
+        )
+        fire_timer.apply_async(
+            kwargs={'timer_type': timer_type, 'object_id': object_id},
+            eta=fire_at + cls.lag,
+        )
+
+    @classmethod
+    def _schedule(
+        cls,
+        timer_type: TimerType.LITERALS,
+        object_id: int,
+        fire_at: datetime,
+    ):
+        member = f'{timer_type}:{object_id}'
+        client = cls._get_client()
+        if fire_at <= timezone.now() + cls.horizon:
+            client.zrem(cls._get_key(), member)
+            cls._send(timer_type, object_id, fire_at)
+        else:
+            client.zadd(cls._get_key(), {member: fire_at.timestamp()})
+
+    @classmethod
+    def schedule(
+        cls,
+        timer_type: TimerType.LITERALS,
+        object_id: int,
+        fire_at: datetime,
+    ):
+
+        """ Sets or moves the timer after the transaction commit """
+
+        if not settings.TIMER_SERVICE:
+            return
+        transaction.on_commit(
+            lambda: cls._schedule(timer_type, object_id, fire_at),
+        )
+
+    @classmethod
+    def dispatch(cls) -> int:
+
+        """ Sends the timers firing within the horizon to celery
+            Returns the number of sent timers """
+
+        max_score = (timezone.now() + cls.horizon).timestamp()
+        pipe = cls._get_client().pipeline()
+        pipe.zrangebyscore(cls._get_key(), '-inf', max_score, withscores=True)
+        pipe.zremrangebyscore(cls._get_key(), '-inf', max_score)
+        timers, _ = pipe.execute()
+        for member, score in timers:
+            timer_type, object_id = member.decode().split(':')
+            cls._send(
+                timer_type,
+                int(object_id),
+                datetime.fromtimestamp(score, tz=pytz.utc),
+            )
+        return len(timers)
+
+    @classmethod
+    def get_vacation_fire_at(cls, vacation) -> Optional[datetime]:
+
+        """ Returns the next start or end of the vacation.
+            Vacation dates are in the user timezone, it starts at the
+            midnight of start_date and ends after the end_date """
+
+        try:
+            tz = pytz.timezone(vacation.user.timezone)
+        except UnknownTimeZoneError:
+            return None
+        now = timezone.now()
+        boundaries = []
+        if vacation.start_date:
+            boundaries.append(vacation.start_date)
+        if vacation.end_date:
+            boundaries.append(vacation.end_date + timedelta(days=1))
+        for boundary in boundaries:
+            fire_at = tz.localize(datetime.combine(boundary, time.min))
+            if fire_at > now:
+                return fire_at
+        return None
+
+    @classmethod
+    def on_delay_save(cls, instance, **kwargs):
+        if (
+            instance.estimated_end_date
+            and instance.end_date is None
+            and not instance.is_deleted
+        ):
+            cls.schedule(
+                timer_type=TimerType.DELAY,
+                object_id=instance.id,
+                fire_at=instance.estimated_end_date,
+            )
+
+    @classmethod
+    def on_task_save(cls, instance, update_fields=None, **kwargs):
+        if instance.due_date is None:
+            return
+        if update_fields is None:
+            # Overdue tasks saved for another reason are left to the sweep
+            if instance.due_date <= timezone.now():
+                return
+        elif 'due_date' not in update_fields:
+            return
+        cls.schedule(
+            timer_type=TimerType.DUE_DATE,
+            object_id=instance.id,
+            fire_at=instance.due_date,
+        )
+
+    @classmethod
+    def on_vacation_save(cls, instance, **kwargs):
+        if instance.is_deleted:
+            return
+        fire_at = cls.get_vacation_fire_at(instance)
+        if fire_at:
+            cls.schedule(
+                timer_type=TimerType.VACATION,
+                object_id=instance.user_id,
+                fire_at=fire_at,
+            )
+
+    @classmethod
+    def schedule_user_vacation(cls, user_id: int):
+        vacation = UserVacation.objects.filter(
+            user_id=user_id,
+        ).select_related('user').first()
+        if vacation:
+            cls.on_vacation_save(instance=vacation)
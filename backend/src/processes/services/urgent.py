@@ -15,6 +15,9 @@ from src.processes.models.workflows.workflow import Workflow
 from src.processes.services.events import (
     WorkflowEventService,
 )
+from src.processes.services.workflows.last_event import (
+    WorkflowLastEventService,
+)
 
 UserModel = get_user_model()
 
@@ -127,6 +130,7 @@ class UrgentService:
                 delete_period = tz.now() - tz.timedelta(minutes=1)
                 if prev_urgent_event.created >= delete_period:
                     prev_urgent_event.delete()
+                    WorkflowLastEventService.refresh([workflow.id])
                     cls._delete_urgent_notification(workflow, user)
                 else:
                     cls._create_urgent_actions(workflow, user)
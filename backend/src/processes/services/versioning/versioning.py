@@ -1,7 +1,10 @@
 from typing import Any, Dict, Type
 
+from django.db.models import Prefetch, prefetch_related_objects
 from rest_framework.serializers import Serializer
 
+from src.processes.models.templates.raw_performer import RawPerformerTemplate
+from src.processes.models.templates.task import TaskTemplate
 from src.processes.models.templates.template import (
     Template,
     TemplateVersion,
@@ -15,7 +18,35 @@ class TemplateVersioningService:
     ):
         self.schema = schema
 
+    @staticmethod
+    def _prefetch_graph(template: Template):
+
+        """ Load the whole template graph with one query per relation
+            instead of the queries per each task and each field.
+            The relations already loaded to the template are kept """
+
+        prefetch_related_objects(
+            [template],
+            'owners',
+            Prefetch(
+                'tasks',
+                queryset=TaskTemplate.objects.select_related('raw_due_date'),
+            ),
+            'tasks__fields__selections',
+            'tasks__fields__rules',
+            'tasks__fieldsets__fields__selections',
+            'tasks__fieldsets__fields__rules',
+            'tasks__fieldsets__rules',
+            'tasks__conditions__rules__predicates',
+            Prefetch(
+                'tasks__raw_performers',
+                queryset=RawPerformerTemplate.objects.select_related('field'),
+            ),
+            'tasks__checklists__selections',
+        )
+
     def map_to_dict(self, template: Template) -> Dict[str, Any]:
+        self._prefetch_graph(template)
         return self.schema(instance=template).data
 
     def get_template_dict(
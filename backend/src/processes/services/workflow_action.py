@@ -43,6 +43,9 @@ from src.processes.services import exceptions
 from src.processes.services.condition_check.service import (
     ConditionCheckService,
 )
+from src.processes.services.condition_check.snapshot import (
+    WorkflowConditionSnapshot,
+)
 from src.processes.services.events import (
     WorkflowEventService,
 )
@@ -89,6 +92,29 @@ class WorkflowActionService:
         self.is_superuser = is_superuser
         self.auth_type = auth_type
         self.sync = sync
+        self._conditions_snapshot = None
+
+    @property
+    def conditions_snapshot(self) -> WorkflowConditionSnapshot:
+
+        """ Built on the first condition check and reused by all
+            following checks while the action chain runs """
+
+        if self._conditions_snapshot is None:
+            self._conditions_snapshot = WorkflowConditionSnapshot(
+                workflow_id=self.workflow.id,
+            )
+        return self._conditions_snapshot
+
+    def _reset_conditions_snapshot(self):
+        self._conditions_snapshot = None
+
+    def _snapshot_task_status(self, task: Task):
+        if self._conditions_snapshot is not None:
+            self._conditions_snapshot.set_task_status(
+                api_name=task.api_name,
+                status=task.status,
+            )
 
     @staticmethod
     def _get_incompleted_performers_users(
@@ -150,6 +176,7 @@ class WorkflowActionService:
             for task in self.workflow.tasks.active():
                 task.status = TaskStatus.DELAYED
                 task.save(update_fields=['status'])
+                self._snapshot_task_status(task)
                 delay = task.get_active_delay()
 
                 if delay:
@@ -283,6 +310,7 @@ class WorkflowActionService:
             delay.save(update_fields=['end_date'])
             task.status = TaskStatus.ACTIVE
             task.save(update_fields=['status'])
+            self._snapshot_task_status(task)
 
         tasks_ids = self.workflow.tasks.only_ids()
         for task_id in tasks_ids:
@@ -376,10 +404,12 @@ class WorkflowActionService:
         if is_returned and task.parents:
             task.status = TaskStatus.PENDING
             task.save(update_fields=['status'])
+            self._snapshot_task_status(task)
             self._start_prev_tasks(task)
         else:
             task.status = TaskStatus.SKIPPED
             task.save(update_fields=['status'])
+            self._snapshot_task_status(task)
             self._start_next_tasks(parent_task=task)
 
     def _execute_skip_conditions(
@@ -388,10 +418,12 @@ class WorkflowActionService:
     ) -> Optional[Callable]:
 
         skip_task_condition_passed = False
-        for condition in task.conditions.skip_task():
+        snapshot = self.conditions_snapshot
+        for condition in snapshot.get_skip_conditions(task.id):
             condition_passed = ConditionCheckService.check(
                 condition=condition,
                 workflow_id=task.workflow_id,
+                snapshot=snapshot,
             )
             if condition_passed:
                 if condition.action == ConditionAction.END_WORKFLOW:
@@ -419,10 +451,12 @@ class WorkflowActionService:
 
         start_condition_passed = False
         start_condition_exists = False
-        for condition in task.conditions.start_task():
+        snapshot = self.conditions_snapshot
+        for condition in snapshot.get_start_conditions(task.id):
             start_condition_passed = ConditionCheckService.check(
                 condition=condition,
                 workflow_id=task.workflow_id,
+                snapshot=snapshot,
             )
             start_condition_exists = True
 
@@ -511,6 +545,7 @@ class WorkflowActionService:
             date_started=timezone.now(),
             force_save=True,
         )
+        self._snapshot_task_status(task)
         task_service.set_due_date_from_template()
         performers_qst = (
             TaskPerformer.objects
@@ -633,8 +668,9 @@ class WorkflowActionService:
         parent_task: Optional[Task] = None,
     ):
         by_complete_task = parent_task and parent_task.is_completed
-        if self.workflow.tasks.pending().exists():
-            for task in self.workflow.tasks.pending():
+        pending_tasks = list(self.workflow.tasks.pending())
+        if pending_tasks:
+            for task in pending_tasks:
                 action_method, by_condition = self.execute_conditions(task)
                 if action_method:
                     action_method(
@@ -654,6 +690,9 @@ class WorkflowActionService:
                 )
 
     def update_tasks_status(self):
+
+        # Fields and conditions may be changed by the version update
+        self._reset_conditions_snapshot()
         for task in self.workflow.tasks.apd_status():
             action_method, _ = self.execute_conditions(task)
             if action_method is not None:
@@ -677,6 +716,7 @@ class WorkflowActionService:
 
         task.status = TaskStatus.DELAYED
         task.save(update_fields=['status'])
+        self._snapshot_task_status(task)
         delay.start_date = timezone.now()
         delay.save(update_fields=['start_date'])
         WorkflowEventService.task_delay_event(
@@ -694,10 +734,12 @@ class WorkflowActionService:
         if is_returned and task.parents:
             task.status = TaskStatus.PENDING
             task.save(update_fields=['status'])
+            self._snapshot_task_status(task)
             self._start_prev_tasks(task)
         else:
             task.status = TaskStatus.SKIPPED
             task.save(update_fields=['status'])
+            self._snapshot_task_status(task)
             self._start_next_tasks(parent_task=task)
 
     def _task_skip_no_performers(
@@ -708,6 +750,7 @@ class WorkflowActionService:
         WorkflowEventService.task_skip_no_performers_event(task)
         task.status = TaskStatus.SKIPPED
         task.save(update_fields=('status',))
+        self._snapshot_task_status(task)
         if is_returned:
             self._start_prev_tasks(task)
         else:
@@ -810,6 +853,7 @@ class WorkflowActionService:
             user=self.user,
         )
         task_service.partial_update(**update_fields, force_save=True)
+        self._snapshot_task_status(task)
         # Not include guests
         incompleted_users = self._get_incompleted_performers_users(task=task)
         ws_recipients = [
@@ -968,6 +1012,7 @@ class WorkflowActionService:
                         auth_type=self.auth_type,
                     )
                     service.validate_rules()
+            self._reset_conditions_snapshot()
             AnalyticService.task_completed(
                 user=self.user,
                 is_superuser=self.is_superuser,
@@ -1134,6 +1179,7 @@ class WorkflowActionService:
                         'status',
                     ],
                 )
+                self._snapshot_task_status(task)
                 (
                     TaskPerformer.objects
                     .filter(task=task)
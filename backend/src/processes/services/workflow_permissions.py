@@ -1,7 +1,6 @@
 from collections import defaultdict
 from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
 
-from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
@@ -9,8 +8,9 @@ from django.db import transaction
 from django.utils.functional import cached_property
 
 from src.accounts.models import UserGroup
-from src.permissions.enums import PermissionSource
-from src.permissions.models import UserObjectPermission
+from src.permissions.enums import PermissionSource, WorkflowAclPerm
+from src.permissions.models import UserObjectPermission, WorkflowAcl
+from src.permissions.registry import WorkflowPermissionRegistry
 from src.processes.enums import (
     DirectlyStatus,
     PerformerType,
@@ -41,6 +41,9 @@ class WorkflowPermissionService:
         change_workflow — lifecycle actions + edit: resume, snooze,
                           finish, return_to, edit name/description
                           (replaces owners M2M)
+
+    Every change is mirrored to the integer-keyed ``WorkflowAcl``
+    table used by the list queries.
     """
 
     def __init__(self, workflow: 'Workflow'):
@@ -51,8 +54,9 @@ class WorkflowPermissionService:
     @classmethod
     def _get_content_type(cls) -> ContentType:
         """Get Workflow ContentType (Django caches internally)."""
-        workflow_model = apps.get_model('processes', 'Workflow')
-        return ContentType.objects.get_for_model(workflow_model)
+        return ContentType.objects.get_for_id(
+            WorkflowPermissionRegistry.get_content_type_id(),
+        )
 
     def _filter_account_user_ids(
         self,
@@ -69,18 +73,44 @@ class WorkflowPermissionService:
             ).values_list('id', flat=True),
         )
 
+    def _acl_rows(self, **filter_kwargs):
+        return WorkflowAcl.objects.filter(
+            workflow_id=self.workflow.id,
+            **filter_kwargs,
+        )
+
+    def _acl_create(
+        self,
+        user_ids: Iterable[int],
+        perms: Iterable[int],
+        source_type: PermissionSource.LITERALS,
+        source_id: int,
+    ):
+        WorkflowAcl.objects.bulk_create(
+            [
+                WorkflowAcl(
+                    workflow_id=self.workflow.id,
+                    user_id=uid,
+                    perm=perm,
+                    source_type=source_type,
+                    source_id=source_id,
+                )
+                for uid in user_ids
+                for perm in perms
+            ],
+            ignore_conflicts=True,
+        )
+
     @cached_property
     def _view_perm(self) -> Permission:
-        return Permission.objects.get(
-            codename=WorkflowPermission.VIEW,
-            content_type=self._ct,
+        return WorkflowPermissionRegistry.get_permission(
+            WorkflowPermission.VIEW,
         )
 
     @cached_property
     def _change_perm(self) -> Permission:
-        return Permission.objects.get(
-            codename=WorkflowPermission.CHANGE,
-            content_type=self._ct,
+        return WorkflowPermissionRegistry.get_permission(
+            WorkflowPermission.CHANGE,
         )
 
     def grant_view(
@@ -107,6 +137,12 @@ class WorkflowPermissionService:
             )],
             ignore_conflicts=True,
         )
+        self._acl_create(
+            user_ids=(user.id,),
+            perms=(WorkflowAclPerm.VIEW,),
+            source_type=source_type,
+            source_id=source_id,
+        )
 
     def grant_change(
         self,
@@ -135,6 +171,12 @@ class WorkflowPermissionService:
             ],
             ignore_conflicts=True,
         )
+        self._acl_create(
+            user_ids=(user.id,),
+            perms=(WorkflowAclPerm.VIEW, WorkflowAclPerm.CHANGE),
+            source_type=source_type,
+            source_id=source_id,
+        )
 
     def grant_view_bulk(
         self,
@@ -165,6 +207,12 @@ class WorkflowPermissionService:
             ],
             ignore_conflicts=True,
         )
+        self._acl_create(
+            user_ids=user_ids,
+            perms=(WorkflowAclPerm.VIEW,),
+            source_type=source_type,
+            source_id=source_id,
+        )
 
     def revoke_view(
         self,
@@ -184,6 +232,11 @@ class WorkflowPermissionService:
             source_type=source_type,
             source_id=source_id,
         ).delete()
+        self._acl_rows(
+            perm=WorkflowAclPerm.VIEW,
+            source_type=source_type,
+            source_id=source_id,
+        ).delete()
 
     def sync_view(
         self,
@@ -228,6 +281,12 @@ class WorkflowPermissionService:
                 source_id=source_id,
                 user_id__in=to_remove,
             ).delete()
+            self._acl_rows(
+                perm=WorkflowAclPerm.VIEW,
+                source_type=source_type,
+                source_id=source_id,
+                user_id__in=to_remove,
+            ).delete()
 
         if to_add:
             perm = self._view_perm
@@ -245,6 +304,12 @@ class WorkflowPermissionService:
                 ],
                 ignore_conflicts=True,
             )
+            self._acl_create(
+                user_ids=to_add,
+                perms=(WorkflowAclPerm.VIEW,),
+                source_type=source_type,
+                source_id=source_id,
+            )
 
         return to_add
 
@@ -277,6 +342,11 @@ class WorkflowPermissionService:
             object_pk=self._object_pk,
             source_type=PermissionSource.TEMPLATE_OWNER,
         ).delete()
+        self._acl_rows(perm=WorkflowAclPerm.CHANGE).delete()
+        self._acl_rows(
+            perm=WorkflowAclPerm.VIEW,
+            source_type=PermissionSource.TEMPLATE_OWNER,
+        ).delete()
 
         if not unique_ids:
             return
@@ -296,6 +366,12 @@ class WorkflowPermissionService:
             objs,
             ignore_conflicts=True,
         )
+        self._acl_create(
+            user_ids=unique_ids,
+            perms=(WorkflowAclPerm.CHANGE, WorkflowAclPerm.VIEW),
+            source_type=PermissionSource.TEMPLATE_OWNER,
+            source_id=source_id,
+        )
 
     @transaction.atomic
     def sync_performer_sources(self):
@@ -481,11 +557,11 @@ class WorkflowPermissionService:
         multiple sources) and returns sorted lists, matching
         ``get_users_with_change``.
         """
-        ct = WorkflowPermissionService._get_content_type()
-
         rows = UserObjectPermission.objects.filter(
-            permission__codename=WorkflowPermission.CHANGE,
-            content_type=ct,
+            permission_id=WorkflowPermissionRegistry.get_permission_id(
+                WorkflowPermission.CHANGE,
+            ),
+            content_type_id=WorkflowPermissionRegistry.get_content_type_id(),
             object_pk__in=[str(wid) for wid in workflow_ids],
         ).values_list('object_pk', 'user_id')
 
@@ -0,0 +1,481 @@
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Prefetch
+
+from src.generics.mixins.services import ClsCacheMixin
+from src.processes.enums import FieldType, PerformerType
+from src.processes.models.templates.fieldset import FieldsetTemplate
+from src.processes.models.templates.raw_performer import RawPerformerTemplate
+from src.processes.models.templates.task import TaskTemplate
+from src.processes.models.templates.template import Template
+from src.processes.models.workflows.checklist import (
+    Checklist,
+    ChecklistSelection,
+)
+from src.processes.models.workflows.conditions import (
+    Condition,
+    Predicate,
+    Rule,
+)
+from src.processes.models.workflows.fields import (
+    FieldSelection,
+    TaskField,
+)
+from src.processes.models.workflows.raw_due_date import RawDueDate
+from src.processes.models.workflows.raw_performer import RawPerformer
+from src.processes.models.workflows.task import Delay, Task
+from src.processes.models.workflows.workflow import Workflow
+from src.processes.services.workflows.fieldsets.fieldset import (
+    FieldSetService,
+)
+from src.processes.utils.common import create_api_name
+from src.services.markdown import MarkdownService
+from src.storage.utils import extract_file_ids_from_text, refresh_attachments
+
+UserModel = get_user_model()
+
+
+class InstantiationPlanService(ClsCacheMixin):
+
+    """ Compiles a template version to the "instantiation plan":
+        plain data of all task rows and their related rows.
+        The plan is cached by template id and version, so the template
+        tree is read from the database once per version.
+
+        Changes made in place without the version increment, like the
+        group or user deleted from the performers, reset the plans
+        of the whole account by changing its plans generation. """
+
+    cache_key_prefix = 'instantiation_plan'
+    cache_timeout = 86400  # 1 day
+
+    @classmethod
+    def _get_generation_key(cls, account_id: int) -> str:
+        return f'account:{account_id}'
+
+    @classmethod
+    def _get_plan_key(cls, template: Template) -> str:
+        generation = cls._get_cache(
+            key=cls._get_generation_key(template.account_id),
+            default=0,
+        )
+        return f'{template.id}:{template.version}:{generation}'
+
+    @classmethod
+    def get_plan(cls, template: Template) -> List[dict]:
+        if not settings.INSTANTIATION_PLAN_CACHE:
+            return cls.compile(template)
+        key = cls._get_plan_key(template)
+        plan = cls._get_cache(key=key)
+        if plan is None:
+            plan = cls.compile(template)
+            cls._set_cache(key=key, value=plan)
+        return plan
+
+    @classmethod
+    def delete_account_plans(cls, account_id: int):
+
+        """ Use after the templates data was changed in place
+            without the version increment """
+
+        # Generation lives as long as the plans, so the plans
+        # of the previous generations expire before it
+        cls._set_cache(
+            key=cls._get_generation_key(account_id),
+            value=uuid4().hex,
+        )
+
+    @classmethod
+    def on_account_data_save(cls, instance, update_fields=None, **kwargs):
+
+        """ Template saved or the user, group or dataset referenced
+            by the templates deleted """
+
+        if (
+            not isinstance(instance, Template)
+            and not (update_fields and 'is_deleted' in update_fields)
+        ):
+            return
+        account_id = instance.account_id
+        transaction.on_commit(lambda: cls.delete_account_plans(account_id))
+
+    @staticmethod
+    def _compile_task(task_template: TaskTemplate) -> dict:
+        fieldset_ids = [
+            fieldset.id for fieldset in task_template.fieldsets.all()
+        ]
+        fields = []
+        for field in task_template.fields.all():
+            if field.fieldset_id in fieldset_ids:
+                continue
+            fields.append({
+                'type': field.type,
+                'is_required': field.is_required,
+                'is_hidden': field.is_hidden,
+                'name': field.name,
+                'description': field.description,
+                'api_name': field.api_name,
+                'order': field.order,
+                'account_id': field.account_id,
+                'dataset_id': field.dataset_id,
+                'selections': [
+                    {
+                        'value': selection.value,
+                        'api_name': selection.api_name,
+                    } for selection in field.selections.all()
+                ] if field.type in FieldType.TYPES_WITH_SELECTIONS else [],
+            })
+
+        checklists = []
+        checklists_total = 0
+        for checklist in task_template.checklists.all():
+            selections = [
+                {
+                    'value': selection.value,
+                    'api_name': selection.api_name,
+                } for selection in checklist.selections.all()
+            ]
+            checklists_total += len(selections)
+            checklists.append({
+                'api_name': checklist.api_name,
+                'selections': selections,
+            })
+
+        conditions = []
+        for condition in task_template.conditions.all():
+            conditions.append({
+                'action': condition.action,
+                'order': condition.order,
+                'api_name': condition.api_name,
+                'rules': [
+                    {
+                        'api_name': rule.api_name,
+                        'predicates': [
+                            {
+                                'operator': predicate.operator,
+                                'field_type': predicate.field_type,
+                                'value': predicate.value,
+                                'field': predicate.field,
+                                'api_name': predicate.api_name,
+                                'user_id': predicate.user_id,
+                                'group_id': predicate.group_id,
+                            } for predicate in rule.predicates.all()
+                        ],
+                    } for rule in condition.rules.all()
+                ],
+            })
+
+        raw_due_date = getattr(task_template, 'raw_due_date', None)
+        description = task_template.description
+        return {
+            'task': {
+                'api_name': task_template.api_name,
+                'name': task_template.name,
+                'revert_task': task_template.revert_task,
+                'description': description,
+                'clear_description': MarkdownService.clear(description),
+                'number': task_template.number,
+                'require_completion_by_all': (
+                    task_template.require_completion_by_all
+                ),
+                'skip_for_starter': task_template.skip_for_starter,
+                'checklists_total': checklists_total,
+                'parents': task_template.parents,
+            },
+            'has_attachments': bool(extract_file_ids_from_text(description)),
+            'fields': fields,
+            'fieldset_ids': fieldset_ids,
+            'checklists': checklists,
+            'conditions': conditions,
+            'raw_performers': [
+                {
+                    'type': raw_performer.type,
+                    'user_id': raw_performer.user_id,
+                    'group_id': raw_performer.group_id,
+                    'api_name': raw_performer.api_name,
+                    'source_task_api_name': (
+                        raw_performer.source_task_api_name
+                    ),
+                    'field_api_name': (
+                        raw_performer.field.api_name
+                        if raw_performer.type == PerformerType.FIELD
+                        else None
+                    ),
+                } for raw_performer in task_template.raw_performers.all()
+            ],
+            'raw_due_date': {
+                'duration': raw_due_date.duration,
+                'duration_months': raw_due_date.duration_months,
+                'rule': raw_due_date.rule,
+                'source_id': raw_due_date.source_id,
+                'api_name': raw_due_date.api_name,
+            } if raw_due_date else None,
+            'delay': task_template.delay,
+        }
+
+    @classmethod
+    def compile(cls, template: Template) -> List[dict]:
+        tasks = (
+            template.tasks
+            .select_related('raw_due_date')
+            .prefetch_related(
+                'fields__selections',
+                'fieldsets',
+                'checklists__selections',
+                'conditions__rules__predicates',
+                Prefetch(
+                    'raw_performers',
+                    queryset=RawPerformerTemplate.objects.select_related(
+                        'field',
+                    ),
+                ),
+            )
+            .order_by('number')
+        )
+        return [cls._compile_task(task_template) for task_template in tasks]
+
+
+class WorkflowInstantiationService:
+
+    """ Creates the workflow tasks with all related rows from
+        the instantiation plan. Each kind of rows is inserted
+        with a single bulk query for all tasks of the workflow. """
+
+    def __init__(
+        self,
+        workflow: Workflow,
+        user: UserModel,
+    ):
+        self.workflow = workflow
+        self.user = user
+
+    def _create_tasks(self, plan: List[dict]) -> List[Task]:
+        tasks = [
+            Task(
+                account_id=self.workflow.account_id,
+                workflow=self.workflow,
+                name_template=task_data['task']['name'],
+                description_template=task_data['task']['description'],
+                is_urgent=self.workflow.is_urgent,
+                **task_data['task'],
+            ) for task_data in plan
+        ]
+        return Task.objects.bulk_create(tasks)
+
+    def _create_fields(self, plan: List[dict], tasks: List[Task]):
+        fields = []
+        selections_by_field = []
+        for task, task_data in zip(tasks, plan):
+            for field_data in task_data['fields']:
+                field_kwargs = field_data.copy()
+                selections_by_field.append(field_kwargs.pop('selections'))
+                fields.append(
+                    TaskField(
+                        task_id=task.id,
+                        workflow_id=self.workflow.id,
+                        **field_kwargs,
+                    ),
+                )
+        fields = TaskField.objects.bulk_create(fields)
+        selections = []
+        for field, selections_data in zip(fields, selections_by_field):
+            for selection_data in selections_data:
+                selections.append(
+                    FieldSelection(field_id=field.id, **selection_data),
+                )
+        FieldSelection.objects.bulk_create(selections)
+
+    def _create_fieldsets(self, plan: List[dict], tasks: List[Task]):
+
+        """ Fieldsets are rare, they keep the service
+            with the fields rules linkage """
+
+        task_by_fieldset_id = {}
+        for task, task_data in zip(tasks, plan):
+            for fieldset_id in task_data['fieldset_ids']:
+                task_by_fieldset_id[fieldset_id] = task
+        if not task_by_fieldset_id:
+            return
+        fieldsets = (
+            FieldsetTemplate.objects
+            .filter(id__in=task_by_fieldset_id.keys())
+            .prefetch_related('rules', 'fields')
+            .order_by('order')
+        )
+        for fieldset in fieldsets:
+            service = FieldSetService(user=self.user)
+            service.create(
+                instance_template=fieldset,
+                account_id=self.workflow.account_id,
+                workflow=self.workflow,
+                task=task_by_fieldset_id[fieldset.id],
+                order=fieldset.order,
+                skip_value=True,
+            )
+
+    def _create_checklists(self, plan: List[dict], tasks: List[Task]):
+        checklists = []
+        selections_by_checklist = []
+        for task, task_data in zip(tasks, plan):
+            for checklist_data in task_data['checklists']:
+                checklists.append(
+                    Checklist(api_name=checklist_data['api_name'], task=task),
+                )
+                selections_by_checklist.append(checklist_data['selections'])
+        checklists = Checklist.objects.bulk_create(checklists)
+        selections = []
+        for checklist, selections_data in zip(
+            checklists,
+            selections_by_checklist,
+        ):
+            for selection_data in selections_data:
+                selections.append(
+                    ChecklistSelection(
+                        checklist=checklist,
+                        api_name=selection_data['api_name'],
+                        value=selection_data['value'],
+                        value_template=selection_data['value'],
+                    ),
+                )
+        ChecklistSelection.objects.bulk_create(selections)
+
+    def _create_conditions(self, plan: List[dict], tasks: List[Task]):
+        conditions = []
+        rules_by_condition = []
+        for task, task_data in zip(tasks, plan):
+            for condition_data in task_data['conditions']:
+                conditions.append(
+                    Condition(
+                        action=condition_data['action'],
+                        order=condition_data['order'],
+                        api_name=condition_data['api_name'],
+                        task=task,
+                    ),
+                )
+                rules_by_condition.append(condition_data['rules'])
+        conditions = Condition.objects.bulk_create(conditions)
+
+        rules = []
+        predicates_by_rule = []
+        for condition, rules_data in zip(conditions, rules_by_condition):
+            for rule_data in rules_data:
+                rules.append(
+                    Rule(api_name=rule_data['api_name'], condition=condition),
+                )
+                predicates_by_rule.append(rule_data['predicates'])
+        rules = Rule.objects.bulk_create(rules)
+
+        predicates = []
+        for rule, predicates_data in zip(rules, predicates_by_rule):
+            for predicate_data in predicates_data:
+                predicates.append(Predicate(rule=rule, **predicate_data))
+        Predicate.objects.bulk_create(predicates)
+
+    def _get_performer_fields(self, plan: List[dict]) -> Dict[str, TaskField]:
+        api_names = {
+            raw_performer_data['field_api_name']
+            for task_data in plan
+            for raw_performer_data in task_data['raw_performers']
+            if raw_performer_data['type'] == PerformerType.FIELD
+        }
+        if not api_names:
+            return {}
+        return self.workflow.get_fields_as_dict(
+            fields_filter_kwargs={
+                'type': FieldType.USER,
+                'api_name__in': api_names,
+            },
+            dict_key='api_name',
+        )
+
+    def _create_raw_performers(
+        self,
+        plan: List[dict],
+        tasks: List[Task],
+        redefined_performer: Optional[UserModel] = None,
+    ):
+        if redefined_performer:
+            raw_performers = [
+                RawPerformer(
+                    account_id=self.workflow.account_id,
+                    task=task,
+                    workflow=self.workflow,
+                    api_name=create_api_name(RawPerformer.api_name_prefix),
+                    type=PerformerType.USER,
+                    user=redefined_performer,
+                ) for task in tasks
+            ]
+            RawPerformer.objects.bulk_create(raw_performers)
+            return
+
+        fields_dict = self._get_performer_fields(plan)
+        raw_performers = []
+        for task, task_data in zip(tasks, plan):
+            for raw_performer_data in task_data['raw_performers']:
+                if raw_performer_data['type'] == PerformerType.FIELD:
+                    field = fields_dict.get(
+                        raw_performer_data['field_api_name'],
+                    )
+                else:
+                    field = None
+                raw_performers.append(
+                    task._get_raw_performer(
+                        performer_type=raw_performer_data['type'],
+                        user_id=raw_performer_data['user_id'],
+                        group_id=raw_performer_data['group_id'],
+                        field=field,
+                        api_name=raw_performer_data['api_name'],
+                        source_task_api_name=(
+                            raw_performer_data['source_task_api_name']
+                        ),
+                    ),
+                )
+        RawPerformer.objects.bulk_create(raw_performers)
+
+    def _create_raw_due_dates(self, plan: List[dict], tasks: List[Task]):
+        RawDueDate.objects.bulk_create([
+            RawDueDate(task=task, **task_data['raw_due_date'])
+            for task, task_data in zip(tasks, plan)
+            if task_data['raw_due_date']
+        ])
+
+    def _create_delays(self, plan: List[dict], tasks: List[Task]):
+        Delay.objects.bulk_create([
+            Delay(
+                task=task,
+                duration=task_data['delay'],
+                workflow=self.workflow,
+            )
+            for task, task_data in zip(tasks, plan)
+            if task_data['delay']
+        ])
+
+    def create_tasks(
+        self,
+        plan: List[dict],
+        redefined_performer: Optional[UserModel] = None,
+    ) -> List[Task]:
+
+        """ redefined_performer - the user who will be appointed
+            as the performer of all tasks instead of performers
+            from the plan """
+
+        tasks = self._create_tasks(plan)
+        self._create_fields(plan, tasks)
+        self._create_fieldsets(plan, tasks)
+        self._create_conditions(plan, tasks)
+        self._create_checklists(plan, tasks)
+        self._create_raw_performers(plan, tasks, redefined_performer)
+        self._create_raw_due_dates(plan, tasks)
+        self._create_delays(plan, tasks)
+
+        # The new task has no attachments, nothing to refresh
+        # until the description contains file links
+        for task, task_data in zip(tasks, plan):
+            if task_data['has_attachments']:
+                refresh_attachments(task, self.user)
+        return tasks
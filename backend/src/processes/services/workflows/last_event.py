@@ -0,0 +1,41 @@
+from typing import Iterable
+
+from src.executor import RawSqlExecutor
+from src.processes.enums import WorkflowEventType
+from src.processes.models.workflows.event import WorkflowEvent
+from src.processes.queries import (
+    RefreshWorkflowLastEventQuery,
+    UpsertWorkflowLastEventQuery,
+)
+
+
+class WorkflowLastEventService:
+
+    """ Maintains the workflow_last_event projection read
+        by the highlights feed. The rows are written in the
+        transaction of the event, so they never point to
+        an event which is rolled back. """
+
+    @classmethod
+    def event_created(cls, event: WorkflowEvent):
+        if event.type not in WorkflowEventType.HIGHLIGHT_TYPES:
+            return
+        query = UpsertWorkflowLastEventQuery(
+            workflow_id=event.workflow_id,
+            account_id=event.account_id,
+            event_id=event.id,
+            created=event.created,
+        )
+        RawSqlExecutor.execute(*query.get_sql())
+
+    @classmethod
+    def refresh(cls, workflow_ids: Iterable[int]):
+
+        """ Call after a highlight event is deleted
+            or its workflow events are changed in bulk """
+
+        workflow_ids = list(set(workflow_ids))
+        if not workflow_ids:
+            return
+        query = RefreshWorkflowLastEventQuery(workflow_ids)
+        RawSqlExecutor.execute(*query.get_sql())
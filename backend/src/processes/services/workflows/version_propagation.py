@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from contextlib import suppress
+from threading import Lock
+from typing import List, Optional, Tuple
+
+from src.generics.mixins.services import ClsCacheMixin
+from src.processes.models.templates.template import TemplateVersion
+from src.processes.models.workflows.workflow import Workflow
+
+
+class WorkflowVersionPropagation(ClsCacheMixin):
+
+    """ State of a template version update in the running workflows.
+        Workflows are updated in chunks by parallel celery tasks.
+        Each chunk keeps the id of the last updated workflow
+        as a checkpoint, so a retried chunk continues from it.
+        Progress is kept by template id and version. """
+
+    cache_key_prefix = 'wf_version_propagation'
+    cache_timeout = 86400  # 1 day
+    chunk_size = 100
+
+    # The version data is loaded once per worker process
+    # and shared by all the chunks of the version
+    _lock = Lock()
+    _versions: 'OrderedDict[Tuple[int, int], dict]' = OrderedDict()
+    versions_cache_size = 16
+
+    def __init__(self, template_id: int, version: int):
+        self.template_id = template_id
+        self.version = version
+
+    def _get_key(self, name: str) -> str:
+        return f'{self.template_id}:{self.version}:{name}'
+
+    def get_version_data(self) -> Optional[dict]:
+        key = (self.template_id, self.version)
+        with self._lock:
+            if key in self._versions:
+                self._versions.move_to_end(key)
+                return self._versions[key]
+        template_version = TemplateVersion.objects.filter(
+            template_id=self.template_id,
+            version=self.version,
+        ).first()
+        if template_version is None:
+            return None
+        with self._lock:
+            self._versions[key] = template_version.data
+            if len(self._versions) > self.versions_cache_size:
+                self._versions.popitem(last=False)
+        return template_version.data
+
+    def start(self) -> List[List[int]]:
+
+        """ Returns the workflow ids split into chunks
+            A restarted propagation of the same version keeps
+            the processed counter, the chunks continue from their
+            checkpoints and do not count the same workflows again """
+
+        workflow_ids = list(
+            Workflow.objects.filter(
+                template_id=self.template_id,
+            ).order_by('id').values_list('id', flat=True),
+        )
+        self._set_cache(value=len(workflow_ids), key=self._get_key('total'))
+        self.cache.add(
+            self._get_cache_key(self._get_key('processed')),
+            0,
+            timeout=self.cache_timeout,
+        )
+        return [
+            workflow_ids[i:i + self.chunk_size]
+            for i in range(0, len(workflow_ids), self.chunk_size)
+        ]
+
+    def get_checkpoint(self, chunk_id: int) -> int:
+        return self._get_cache(
+            key=self._get_key(f'chunk_{chunk_id}'),
+            default=0,
+        )
+
+    def set_checkpoint(self, chunk_id: int, workflow_id: int):
+        self._set_cache(
+            value=workflow_id,
+            key=self._get_key(f'chunk_{chunk_id}'),
+        )
+        key = self._get_cache_key(self._get_key('processed'))
+        # ValueError if the progress is expired
+        with suppress(ValueError):
+            self.cache.incr(key)
+
+    def get_progress(self) -> dict:
+        total = self._get_cache(key=self._get_key('total'))
+        processed = self._get_cache(key=self._get_key('processed'))
+        return {
+            'total': total,
+            'processed': processed,
+            'is_completed': total is not None and processed == total,
+        }
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._versions.clear()
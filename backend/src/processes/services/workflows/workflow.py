@@ -19,7 +19,6 @@ from src.processes.serializers.workflows.kickoff_value import (
 from src.processes.services.base import (
     BaseWorkflowService,
 )
-from src.processes.services.tasks.task import TaskService
 from src.processes.services.templates.integrations import (
     TemplateIntegrationsService,
 )
@@ -32,6 +31,10 @@ from src.processes.utils.common import (
 from src.processes.services.workflow_permissions import (
     WorkflowPermissionService,
 )
+from src.processes.services.workflows.instantiation import (
+    InstantiationPlanService,
+    WorkflowInstantiationService,
+)
 from src.storage.tasks import (
     schedule_sync_workflow_attachment_permissions,
 )
@@ -186,13 +189,14 @@ class WorkflowService(
         **kwargs,
     ):
 
-        for task_template in instance_template.tasks.order_by('number'):
-            task_service = TaskService(user=self.user)
-            task_service.create(
-                instance_template=task_template,
-                workflow=self.instance,
-                redefined_performer=kwargs.get('redefined_performer'),
-            )
+        plan = InstantiationPlanService.get_plan(instance_template)
+        WorkflowInstantiationService(
+            workflow=self.instance,
+            user=self.user,
+        ).create_tasks(
+            plan=plan,
+            redefined_performer=kwargs.get('redefined_performer'),
+        )
         self.update_owners()
 
         # Update attachments for workflow
@@ -1,7 +1,11 @@
 from celery import shared_task
+from django.conf import settings
 
 from src.celery_app import periodic_lock
+from src.processes.enums import TimerType
+from src.processes.tasks.timers import fire_timer
 from src.processes.utils.workflows import (
+    get_expired_delay_ids,
     resume_delayed_workflows,
 )
 
@@ -11,4 +15,13 @@ def continue_delayed_workflows() -> None:
     with periodic_lock('continue_delayed_workflows') as acquired:
         if not acquired:
             return
-        resume_delayed_workflows()
+        if settings.TIMER_SERVICE:
+            # Reconciliation sweep, the delays missed by their timers
+            # are resumed by separate jobs
+            for delay_id in get_expired_delay_ids():
+                fire_timer.delay(
+                    timer_type=TimerType.DELAY,
+                    object_id=delay_id,
+                )
+        else:
+            resume_delayed_workflows()
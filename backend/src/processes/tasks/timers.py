@@ -0,0 +1,36 @@
+from celery import shared_task
+from django.conf import settings
+
+from src.accounts.tasks import process_user_vacation
+from src.notifications.tasks import _send_overdue_task_notification
+from src.processes.enums import TimerType
+from src.processes.services.timers import TimerService
+from src.processes.utils.workflows import resume_delayed_workflow
+
+
+def _fire_vacation_timer(user_id: int):
+    process_user_vacation(user_id)
+    # The vacation start is followed by its end
+    TimerService.schedule_user_vacation(user_id)
+
+
+def _fire_due_date_timer(task_id: int):
+    _send_overdue_task_notification(task_ids=[task_id])
+
+
+TIMER_HANDLERS = {
+    TimerType.DELAY: resume_delayed_workflow,
+    TimerType.DUE_DATE: _fire_due_date_timer,
+    TimerType.VACATION: _fire_vacation_timer,
+}
+
+
+@shared_task(acks_late=True, ignore_result=True)
+def fire_timer(timer_type: TimerType.LITERALS, object_id: int):
+    TIMER_HANDLERS[timer_type](object_id)
+
+
+@shared_task(ignore_result=True)
+def dispatch_timers():
+    if settings.TIMER_SERVICE:
+        TimerService.dispatch()
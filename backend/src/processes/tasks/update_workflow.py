@@ -1,18 +1,18 @@
 from typing import List
 
-from celery import shared_task
+from celery import group, shared_task
 from django.db import transaction
 
 from src.authentication.enums import AuthTokenType
 from src.processes.enums import WorkflowStatus
-from src.processes.models.templates.template import (
-    Template,
-    TemplateVersion,
-)
+from src.processes.models.templates.template import Template
 from src.processes.models.workflows.workflow import Workflow
 from src.processes.services.workflow_permissions import (
     WorkflowPermissionService,
 )
+from src.processes.services.workflows.version_propagation import (
+    WorkflowVersionPropagation,
+)
 from src.processes.services.workflows.workflow_version import (
     WorkflowUpdateVersionService,
 )
@@ -22,9 +22,51 @@ from src.storage.tasks import (
 )
 
 
-def _update_workflows(
+def _update_workflow(
+    workflow_id: int,
+    version: int,
+    version_dict: dict,
+    updated_by: UserModel,
+    sync: bool,
+    auth_type: AuthTokenType,
+    is_superuser: bool,
+):
+    with transaction.atomic():
+        workflow = Workflow.objects.select_for_update().filter(
+            id=workflow_id,
+        ).first()
+        if workflow is None or not workflow.is_version_lower(version):
+            return
+        if workflow.status == WorkflowStatus.DONE:
+            template_owner_ids = Template.objects.filter(
+                id=workflow.template_id,
+            ).get_owners_as_users()
+            # Guardian: set change + TEMPLATE_OWNER view
+            perm_svc = WorkflowPermissionService(workflow)
+            perm_svc.set_view_and_change(
+                user_ids=list(template_owner_ids),
+            )
+            schedule_sync_workflow_attachment_permissions(
+                workflow.id,
+            )
+        else:
+            version_service = WorkflowUpdateVersionService(
+                instance=workflow,
+                user=updated_by,
+                auth_type=auth_type,
+                is_superuser=is_superuser,
+                sync=sync,
+            )
+            version_service.update_from_version(
+                data=version_dict,
+                version=version,
+            )
+
+
+def _update_workflows_chunk(
     template_id: int,
     version: int,
+    workflow_ids: List[int],
     updated_by: int,
     sync: bool,
     auth_type: AuthTokenType,
@@ -34,46 +76,71 @@ def _update_workflows(
     if not template or template.version > version:
         return
 
+    propagation = WorkflowVersionPropagation(
+        template_id=template_id,
+        version=version,
+    )
+    version_dict = propagation.get_version_data()
+    if version_dict is None:
+        return
     updated_by = UserModel.objects.get(id=updated_by)
-    template_version = TemplateVersion.objects.filter(
+    chunk_id = workflow_ids[0]
+    checkpoint = propagation.get_checkpoint(chunk_id)
+    for workflow_id in workflow_ids:
+        if workflow_id <= checkpoint:
+            continue
+        _update_workflow(
+            workflow_id=workflow_id,
+            version=version,
+            version_dict=version_dict,
+            updated_by=updated_by,
+            sync=sync,
+            auth_type=auth_type,
+            is_superuser=is_superuser,
+        )
+        propagation.set_checkpoint(chunk_id, workflow_id)
+
+
+def _update_workflows(
+    template_id: int,
+    version: int,
+    updated_by: int,
+    auth_type: AuthTokenType,
+    is_superuser: bool,
+):
+    template = Template.objects.by_id(template_id).first()
+    if not template or template.version > version:
+        return
+
+    propagation = WorkflowVersionPropagation(
         template_id=template_id,
         version=version,
-    ).first()
-    if template_version is None:
+    )
+    if propagation.get_version_data() is None:
         return
-    version_dict = template_version.data
+    group(
+        update_workflows_chunk.si(
+            template_id=template_id,
+            version=version,
+            workflow_ids=workflow_ids,
+            updated_by=updated_by,
+            auth_type=auth_type,
+            is_superuser=is_superuser,
+        )
+        for workflow_ids in propagation.start()
+    ).apply_async()
 
-    for _workflow in template.workflows.all().only('id'):
-        with transaction.atomic():
-            workflow = Workflow.objects.select_for_update().get(
-                id=_workflow.id,
-            )
-            if not workflow.is_version_lower(version):
-                continue
-            if workflow.status == WorkflowStatus.DONE:
-                template_owner_ids = Template.objects.filter(
-                    id=workflow.template_id,
-                ).get_owners_as_users()
-                # Guardian: set change + TEMPLATE_OWNER view
-                perm_svc = WorkflowPermissionService(workflow)
-                perm_svc.set_view_and_change(
-                    user_ids=list(template_owner_ids),
-                )
-                schedule_sync_workflow_attachment_permissions(
-                    workflow.id,
-                )
-            else:
-                version_service = WorkflowUpdateVersionService(
-                    instance=workflow,
-                    user=updated_by,
-                    auth_type=auth_type,
-                    is_superuser=is_superuser,
-                    sync=sync,
-                )
-                version_service.update_from_version(
-                    data=version_dict,
-                    version=version,
-                )
+
+@shared_task(
+    acks_late=True,
+    autoretry_for=(Exception, ),
+    retry_kwargs={
+        'max_retries': 3,
+        'countdown': 2,
+    },
+)
+def update_workflows_chunk(**kwargs):
+    _update_workflows_chunk(sync=True, **kwargs)
 
 
 @shared_task(
@@ -85,7 +152,21 @@ def _update_workflows(
     },
 )
 def update_workflows(**kwargs):
-    _update_workflows(sync=True, **kwargs)
+    _update_workflows(**kwargs)
+
+
+def _update_workflow_owners_chunk(
+    template_owner_ids: List[int],
+    workflow_ids: List[int],
+):
+    workflows = Workflow.objects.filter(
+        id__in=workflow_ids,
+    ).only('id', 'account_id', 'template_id')
+    for workflow in workflows:
+        WorkflowPermissionService(workflow).set_view_and_change(
+            user_ids=template_owner_ids,
+        )
+        schedule_sync_workflow_attachment_permissions(workflow.id)
 
 
 @shared_task(
@@ -96,13 +177,28 @@ def update_workflows(**kwargs):
         'countdown': 2,
     },
 )
-def update_workflow_owners(template_ids: List[int]):
+def update_workflow_owners_chunk(**kwargs):
+    _update_workflow_owners_chunk(**kwargs)
+
+
+@shared_task(
+    acks_late=True,
+    autoretry_for=(Exception,),
+    retry_kwargs={
+        'max_retries': 3,
+        'countdown': 2,
+    },
+)
+def update_workflow_owners(template_ids: List[int], sync: bool = False):
     """Rebuild Guardian change_workflow when template owners change.
 
     Only updates TEMPLATE_OWNER / change rows via set_view_and_change.
     Performer UOP is unchanged when owners change — do not call
     sync_performer_sources here (avoids double work with reassign
     members sync and unnecessary load).
+
+    Workflows are processed in parallel chunks, ``sync=True``
+    updates all of them in the current process.
     """
     for template_id in template_ids:
         template_owner_ids = list(
@@ -110,12 +206,28 @@ def update_workflow_owners(template_ids: List[int]):
                 id=template_id,
             ).get_owners_as_users(),
         )
-        workflows = Workflow.objects.filter(
-            template_id=template_id,
-            is_deleted=False,
-        ).only('id', 'account_id', 'template_id')
-        for workflow in workflows:
-            WorkflowPermissionService(workflow).set_view_and_change(
-                user_ids=template_owner_ids,
-            )
-            schedule_sync_workflow_attachment_permissions(workflow.id)
+        workflow_ids = list(
+            Workflow.objects.filter(
+                template_id=template_id,
+                is_deleted=False,
+            ).order_by('id').values_list('id', flat=True),
+        )
+        chunk_size = WorkflowVersionPropagation.chunk_size
+        chunks = [
+            workflow_ids[i:i + chunk_size]
+            for i in range(0, len(workflow_ids), chunk_size)
+        ]
+        if sync:
+            for chunk in chunks:
+                _update_workflow_owners_chunk(
+                    template_owner_ids=template_owner_ids,
+                    workflow_ids=chunk,
+                )
+        else:
+            group(
+                update_workflow_owners_chunk.si(
+                    template_owner_ids=template_owner_ids,
+                    workflow_ids=chunk,
+                )
+                for chunk in chunks
+            ).apply_async()
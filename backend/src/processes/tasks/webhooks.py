@@ -1,10 +1,14 @@
+from typing import List, Optional
+
 import requests
 from celery import shared_task
 from celery.task import Task as CeleryTask
+from celery.utils.time import get_exponential_backoff_interval
 from django.contrib.auth import get_user_model
 from django.db.models import ObjectDoesNotExist
 
 from src.webhooks.enums import HookEvent
+from src.webhooks.exceptions import WebhookDeliveryError
 from src.webhooks.services import WebhookDeliverer
 
 UserModel = get_user_model()
@@ -21,57 +25,112 @@ class WebhookTask(CeleryTask):
     retry_kwargs = {'max_retries': 2}
 
 
-@shared_task(base=WebhookTask)
+def _send_webhook(
+    task: WebhookTask,
+    event: HookEvent.LITERALS,
+    user_id: int,
+    account_id: int,
+    payload: dict,
+    hook_ids: Optional[List[int]] = None,
+):
+
+    """ Only the failed hooks are retried,
+        the delivered ones are not sent twice """
+
+    try:
+        WebhookDeliverer().send(
+            event=event,
+            user_id=user_id,
+            account_id=account_id,
+            payload=payload,
+            hook_ids=hook_ids,
+        )
+    except WebhookDeliveryError as ex:
+        raise task.retry(
+            kwargs={
+                'user_id': user_id,
+                'account_id': account_id,
+                'payload': payload,
+                'hook_ids': ex.hook_ids,
+            },
+            exc=ex,
+            countdown=get_exponential_backoff_interval(
+                factor=1,
+                retries=task.request.retries,
+                maximum=task.retry_backoff_max,
+                full_jitter=True,
+            ),
+            **task.retry_kwargs,
+        ) from ex
+
+
+@shared_task(base=WebhookTask, bind=True)
 def send_workflow_started_webhook(
+    self,
     user_id: int,
     account_id: int,
     payload: dict,
+    hook_ids: Optional[List[int]] = None,
 ):
-    WebhookDeliverer().send(
+    _send_webhook(
+        task=self,
         event=HookEvent.WORKFLOW_STARTED,
         user_id=user_id,
         account_id=account_id,
         payload=payload,
+        hook_ids=hook_ids,
     )
 
 
-@shared_task(base=WebhookTask)
+@shared_task(base=WebhookTask, bind=True)
 def send_workflow_completed_webhook(
+    self,
     user_id: int,
     account_id: int,
     payload: dict,
+    hook_ids: Optional[List[int]] = None,
 ):
-    WebhookDeliverer().send(
+    _send_webhook(
+        task=self,
         event=HookEvent.WORKFLOW_COMPLETED,
         user_id=user_id,
         account_id=account_id,
         payload=payload,
+        hook_ids=hook_ids,
     )
 
 
-@shared_task(base=WebhookTask)
+@shared_task(base=WebhookTask, bind=True)
 def send_task_completed_webhook(
+    self,
     user_id: int,
     account_id: int,
     payload: dict,
+    hook_ids: Optional[List[int]] = None,
 ):
-    WebhookDeliverer().send(
+    _send_webhook(
+        task=self,
         event=HookEvent.TASK_COMPLETED,
         user_id=user_id,
         account_id=account_id,
         payload=payload,
+        hook_ids=hook_ids,
     )
 
 
-@shared_task(base=WebhookTask)
+@shared_task(base=WebhookTask, bind=True)
 def send_task_returned_webhook(
+    self,
     user_id: int,
     account_id: int,
     payload: dict,
+    hook_ids: Optional[List[int]] = None,
 ):
-    WebhookDeliverer().send(
+    _send_webhook(
+        task=self,
         event=HookEvent.TASK_RETURNED,
         user_id=user_id,
         account_id=account_id,
         payload=payload,
+        hook_ids=hook_ids,
     )
@@ -7,6 +7,7 @@ from django.utils import timezone
 from src.authentication.enums import AuthTokenType
 from src.processes.enums import (
     TaskStatus,
+    TimerType,
 )
 from src.processes.models.workflows.task import Delay
 from src.processes.services.workflow_action import (
@@ -45,6 +46,39 @@ def test_continue_delayed_workflows__ok(mocker):
     resume_delayed_workflows_mock.assert_called_once()
 
 
+def test_continue_delayed_workflows__timer_service__fire_timers(
+    mocker,
+    settings,
+):
+
+    # arrange
+    settings.TIMER_SERVICE = True
+    periodic_lock_mock = mocker.patch(
+        'src.celery_app.periodic_lock',
+    )
+    periodic_lock_mock.__enter__.return_value = True
+    mocker.patch(
+        'src.processes.tasks.delay.get_expired_delay_ids',
+        return_value=[1],
+    )
+    fire_timer_mock = mocker.patch(
+        'src.processes.tasks.delay.fire_timer.delay',
+    )
+    resume_delayed_workflows_mock = mocker.patch(
+        'src.processes.tasks.delay.resume_delayed_workflows',
+    )
+
+    # act
+    continue_delayed_workflows()
+
+    # assert
+    fire_timer_mock.assert_called_once_with(
+        timer_type=TimerType.DELAY,
+        object_id=1,
+    )
+    resume_delayed_workflows_mock.assert_not_called()
+
+
 def test_resume_delayed_workflows__delay_expired__resume(
     mocker,
     api_client,
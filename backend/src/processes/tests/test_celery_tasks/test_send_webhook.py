@@ -0,0 +1,53 @@
+import pytest
+from celery.exceptions import Retry
+
+from src.processes.tasks.webhooks import (
+    _send_webhook,
+    send_task_completed_webhook,
+)
+from src.webhooks.enums import HookEvent
+from src.webhooks.exceptions import WebhookDeliveryError
+
+pytestmark = pytest.mark.django_db
+
+
+def test_send_webhook__failed_hooks__retry_only_them(mocker):
+
+    # arrange
+    payload = {'task': 'value'}
+    send_mock = mocker.patch(
+        'src.processes.tasks.webhooks.WebhookDeliverer.send',
+        side_effect=WebhookDeliveryError(hook_ids=[2]),
+    )
+    retry_mock = mocker.patch.object(
+        send_task_completed_webhook,
+        'retry',
+        return_value=Retry(),
+    )
+
+    # act
+    with pytest.raises(Retry):
+        _send_webhook(
+            task=send_task_completed_webhook,
+            event=HookEvent.TASK_COMPLETED,
+            user_id=1,
+            account_id=3,
+            payload=payload,
+        )
+
+    # assert
+    send_mock.assert_called_once_with(
+        event=HookEvent.TASK_COMPLETED,
+        user_id=1,
+        account_id=3,
+        payload=payload,
+        hook_ids=None,
+    )
+    retry_mock.assert_called_once()
+    assert retry_mock.call_args[1]['kwargs'] == {
+        'user_id': 1,
+        'account_id': 3,
+        'payload': payload,
+        'hook_ids': [2],
+    }
+    assert retry_mock.call_args[1]['max_retries'] == 2
@@ -17,7 +17,13 @@ from src.processes.services.versioning.versioning import (
 from src.processes.services.workflow_permissions import (
     WorkflowPermissionService,
 )
-from src.processes.tasks.update_workflow import update_workflows
+from src.processes.services.workflows.version_propagation import (
+    WorkflowVersionPropagation,
+)
+from src.processes.tasks.update_workflow import (
+    update_workflows,
+    update_workflows_chunk,
+)
 from src.processes.tests.fixtures import (
     create_test_account,
     create_test_admin,
@@ -327,3 +333,110 @@ def test_update_workflows__skips_current_continues_others(
     outdated_task = wf_outdated.tasks.get(number=1)
     assert outdated_task.name == 'Updated task name'
     schedule_sync_mock.assert_not_called()
+
+
+def test_update_workflows__progress__ok():
+
+    # arrange
+    account = create_test_account()
+    owner = create_test_owner(account=account)
+    template = create_test_template(
+        user=owner,
+        is_active=True,
+        tasks_count=1,
+    )
+    create_test_workflow(user=owner, template=template)
+    create_test_workflow(user=owner, template=template)
+    template.version += 1
+    template.save()
+    TemplateVersioningService(TemplateSchemaV1).save(template)
+
+    # act
+    update_workflows(
+        template_id=template.id,
+        version=template.version,
+        updated_by=owner.id,
+        auth_type=AuthTokenType.USER,
+        is_superuser=False,
+    )
+
+    # assert
+    progress = WorkflowVersionPropagation(
+        template_id=template.id,
+        version=template.version,
+    ).get_progress()
+    assert progress == {
+        'total': 2,
+        'processed': 2,
+        'is_completed': True,
+    }
+
+
+def test_update_workflows_chunk__retry__continue_from_checkpoint(mocker):
+
+    # arrange
+    account = create_test_account()
+    owner = create_test_owner(account=account)
+    template = create_test_template(
+        user=owner,
+        is_active=True,
+        tasks_count=1,
+    )
+    wf_done = create_test_workflow(user=owner, template=template)
+    wf_next = create_test_workflow(user=owner, template=template)
+    template.version += 1
+    template.save()
+    TemplateVersioningService(TemplateSchemaV1).save(template)
+    propagation = WorkflowVersionPropagation(
+        template_id=template.id,
+        version=template.version,
+    )
+    propagation.set_checkpoint(wf_done.id, wf_done.id)
+    update_mock = mocker.patch(
+        'src.processes.tasks.update_workflow._update_workflow',
+    )
+
+    # act
+    update_workflows_chunk(
+        template_id=template.id,
+        version=template.version,
+        workflow_ids=[wf_done.id, wf_next.id],
+        updated_by=owner.id,
+        auth_type=AuthTokenType.USER,
+        is_superuser=False,
+    )
+
+    # assert
+    update_mock.assert_called_once()
+    assert update_mock.call_args[1]['workflow_id'] == wf_next.id
+    assert propagation.get_checkpoint(wf_done.id) == wf_next.id
+
+
+def test_propagation_start__restarted__keep_processed():
+
+    # arrange
+    account = create_test_account()
+    owner = create_test_owner(account=account)
+    template = create_test_template(
+        user=owner,
+        is_active=True,
+        tasks_count=1,
+    )
+    workflow = create_test_workflow(user=owner, template=template)
+    create_test_workflow(user=owner, template=template)
+    propagation = WorkflowVersionPropagation(
+        template_id=template.id,
+        version=template.version,
+    )
+    chunks = propagation.start()
+    propagation.set_checkpoint(chunks[0][0], workflow.id)
+
+    # act
+    propagation.start()
+
+    # assert
+    assert propagation.get_progress() == {
+        'total': 2,
+        'processed': 1,
+        'is_completed': False,
+    }
@@ -0,0 +1,98 @@
+"""Tests for backfill_workflow_acl."""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from src.permissions.enums import WorkflowAclPerm
+from src.permissions.models import WorkflowAcl
+from src.processes.tests.fixtures import (
+    create_test_owner,
+    create_test_workflow,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_backfill__missing_rows__created():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    WorkflowAcl.objects.filter(workflow_id=workflow.id).delete()
+    out = StringIO()
+
+    # act
+    call_command(
+        'backfill_workflow_acl',
+        account_ids=str(owner.account_id),
+        stdout=out,
+    )
+
+    # assert
+    assert WorkflowAcl.objects.filter(
+        workflow_id=workflow.id,
+        user=owner,
+        perm=WorkflowAclPerm.CHANGE,
+    ).exists()
+    assert 'synced with Guardian' in out.getvalue()
+
+
+def test_backfill__extra_rows__deleted():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    extra = WorkflowAcl.objects.filter(workflow_id=workflow.id).first()
+    extra.pk = None
+    extra.source_id = -1
+    extra.save()
+
+    # act
+    call_command(
+        'backfill_workflow_acl',
+        account_ids=str(owner.account_id),
+        stdout=StringIO(),
+    )
+
+    # assert
+    assert not WorkflowAcl.objects.filter(
+        workflow_id=workflow.id,
+        source_id=-1,
+    ).exists()
+
+
+def test_backfill__verify_only__no_writes():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    WorkflowAcl.objects.filter(workflow_id=workflow.id).delete()
+    out = StringIO()
+
+    # act
+    call_command(
+        'backfill_workflow_acl',
+        account_ids=str(owner.account_id),
+        verify_only=True,
+        stdout=out,
+    )
+
+    # assert
+    assert not WorkflowAcl.objects.filter(workflow_id=workflow.id).exists()
+    assert 'out of sync' in out.getvalue()
+
+
+def test_backfill__in_sync__ok():
+    # arrange
+    owner = create_test_owner()
+    create_test_workflow(user=owner, tasks_count=1)
+    out = StringIO()
+
+    # act
+    call_command(
+        'backfill_workflow_acl',
+        account_ids=str(owner.account_id),
+        verify_only=True,
+        stdout=out,
+    )
+
+    # assert
+    assert 'in sync with Guardian' in out.getvalue()
@@ -0,0 +1,131 @@
+"""Tests for backfill_workflow_last_event."""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from src.processes.enums import WorkflowEventType
+from src.processes.models.workflows.event import WorkflowLastEvent
+from src.processes.tests.fixtures import (
+    create_test_event,
+    create_test_owner,
+    create_test_workflow,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_backfill__missing_rows__created():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    event = create_test_event(
+        workflow=workflow,
+        user=owner,
+        type_event=WorkflowEventType.COMMENT,
+    )
+    WorkflowLastEvent.objects.filter(workflow_id=workflow.id).delete()
+    out = StringIO()
+
+    # act
+    call_command(
+        'backfill_workflow_last_event',
+        account_ids=str(owner.account_id),
+        stdout=out,
+    )
+
+    # assert
+    assert WorkflowLastEvent.objects.get(
+        workflow_id=workflow.id,
+    ).event_id == event.id
+    assert 'synced with the events' in out.getvalue()
+
+
+def test_backfill__stale_row__updated():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    event = create_test_event(
+        workflow=workflow,
+        user=owner,
+        type_event=WorkflowEventType.COMMENT,
+    )
+    WorkflowLastEvent.objects.update_or_create(
+        workflow_id=workflow.id,
+        defaults={
+            'account_id': owner.account_id,
+            'event_id': create_test_event(
+                workflow=workflow,
+                user=owner,
+                type_event=WorkflowEventType.TASK_START,
+            ).id,
+            'created': event.created,
+        },
+    )
+
+    # act
+    call_command(
+        'backfill_workflow_last_event',
+        account_ids=str(owner.account_id),
+        stdout=StringIO(),
+    )
+
+    # assert
+    assert WorkflowLastEvent.objects.get(
+        workflow_id=workflow.id,
+    ).event_id == event.id
+
+
+def test_backfill__verify_only__no_writes():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    create_test_event(
+        workflow=workflow,
+        user=owner,
+        type_event=WorkflowEventType.COMMENT,
+    )
+    WorkflowLastEvent.objects.filter(workflow_id=workflow.id).delete()
+    out = StringIO()
+
+    # act
+    call_command(
+        'backfill_workflow_last_event',
+        account_ids=str(owner.account_id),
+        verify_only=True,
+        stdout=out,
+    )
+
+    # assert
+    assert not WorkflowLastEvent.objects.filter(
+        workflow_id=workflow.id,
+    ).exists()
+    assert 'out of sync' in out.getvalue()
+
+
+def test_backfill__in_sync__ok():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    create_test_event(
+        workflow=workflow,
+        user=owner,
+        type_event=WorkflowEventType.COMMENT,
+    )
+    call_command(
+        'backfill_workflow_last_event',
+        account_ids=str(owner.account_id),
+        stdout=StringIO(),
+    )
+    out = StringIO()
+
+    # act
+    call_command(
+        'backfill_workflow_last_event',
+        account_ids=str(owner.account_id),
+        verify_only=True,
+        stdout=out,
+    )
+
+    # assert
+    assert 'in sync with the events' in out.getvalue()
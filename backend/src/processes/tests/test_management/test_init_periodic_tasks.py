@@ -0,0 +1,94 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django_celery_beat.models import IntervalSchedule, PeriodicTask
+
+pytestmark = pytest.mark.django_db
+
+OVERDUE_TASK_PATH = (
+    'src.notifications.tasks.send_overdue_task_notification'
+)
+DELAYS_TASK_PATH = 'src.processes.tasks.delay.continue_delayed_workflows'
+
+
+def test_init__timer_service__sweep_schedule(settings):
+
+    # arrange
+    settings.TIMER_SERVICE = False
+    call_command('init_periodic_tasks', stdout=StringIO())
+    settings.TIMER_SERVICE = True
+
+    # act
+    call_command('init_periodic_tasks', stdout=StringIO())
+
+    # assert
+    task = PeriodicTask.objects.get(task=OVERDUE_TASK_PATH)
+    assert task.interval.every == 15
+    assert task.interval.period == IntervalSchedule.MINUTES
+    task = PeriodicTask.objects.get(task=DELAYS_TASK_PATH)
+    assert task.interval.every == 15
+    assert task.crontab is None
+
+
+def test_init__timer_service_disabled__schedule_restored(settings):
+
+    # arrange
+    settings.TIMER_SERVICE = True
+    call_command('init_periodic_tasks', stdout=StringIO())
+    settings.TIMER_SERVICE = False
+
+    # act
+    call_command('init_periodic_tasks', stdout=StringIO())
+
+    # assert
+    task = PeriodicTask.objects.get(task=OVERDUE_TASK_PATH)
+    assert task.interval.every == 1
+    assert task.interval.period == IntervalSchedule.MINUTES
+    task = PeriodicTask.objects.get(task=DELAYS_TASK_PATH)
+    assert task.interval is None
+    assert task.crontab.minute == '*/1'
+
+
+def test_init__custom_schedule__not_changed(settings):
+
+    # arrange
+    settings.TIMER_SERVICE = False
+    call_command('init_periodic_tasks', stdout=StringIO())
+    schedule, _ = IntervalSchedule.objects.get_or_create(
+        every=2,
+        period=IntervalSchedule.MINUTES,
+    )
+    PeriodicTask.objects.filter(task=OVERDUE_TASK_PATH).update(
+        interval=schedule,
+    )
+
+    # act
+    call_command('init_periodic_tasks', stdout=StringIO())
+
+    # assert
+    task = PeriodicTask.objects.get(task=OVERDUE_TASK_PATH)
+    assert task.interval_id == schedule.id
+
+
+def test_init__timer_service__duplicate_task_entry__ok(settings):
+
+    # arrange
+    settings.TIMER_SERVICE = False
+    call_command('init_periodic_tasks', stdout=StringIO())
+    task = PeriodicTask.objects.get(task=OVERDUE_TASK_PATH)
+    duplicate = PeriodicTask.objects.create(
+        name='Overdue tasks copy',
+        task=OVERDUE_TASK_PATH,
+        interval=task.interval,
+    )
+    settings.TIMER_SERVICE = True
+
+    # act
+    call_command('init_periodic_tasks', stdout=StringIO())
+
+    # assert
+    task.refresh_from_db()
+    assert task.interval.every == 15
+    duplicate.refresh_from_db()
+    assert duplicate.interval.every == 1
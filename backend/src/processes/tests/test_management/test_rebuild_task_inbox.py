@@ -0,0 +1,87 @@
+"""Tests for rebuild_task_inbox."""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from src.processes.models.workflows.task import TaskInbox
+from src.processes.tests.fixtures import (
+    create_test_owner,
+    create_test_workflow,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_rebuild__missing_rows__created():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    TaskInbox.objects.on_tasks([task.id]).delete()
+    out = StringIO()
+
+    # act
+    call_command(
+        'rebuild_task_inbox',
+        account_ids=str(owner.account_id),
+        stdout=out,
+    )
+
+    # assert
+    row = TaskInbox.objects.get(task_id=task.id)
+    assert row.user_id == owner.id
+    assert row.is_active is True
+    assert 'synced with the task performers' in out.getvalue()
+
+
+def test_rebuild__stale_row__updated():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    TaskInbox.objects.on_tasks([task.id]).update(is_active=False)
+
+    # act
+    call_command(
+        'rebuild_task_inbox',
+        account_ids=str(owner.account_id),
+        stdout=StringIO(),
+    )
+
+    # assert
+    assert TaskInbox.objects.get(task_id=task.id).is_active is True
+
+
+def test_rebuild__verify_only__not_changed():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    TaskInbox.objects.on_tasks([task.id]).delete()
+    out = StringIO()
+
+    # act
+    call_command(
+        'rebuild_task_inbox',
+        verify_only=True,
+        stdout=out,
+    )
+
+    # assert
+    assert not TaskInbox.objects.on_tasks([task.id]).exists()
+    assert 'Missing rows: 1' in out.getvalue()
+    assert 'out of sync' in out.getvalue()
+
+
+def test_rebuild__in_sync__ok():
+    # arrange
+    owner = create_test_owner()
+    create_test_workflow(user=owner, tasks_count=1)
+    out = StringIO()
+
+    # act
+    call_command('rebuild_task_inbox', verify_only=True, stdout=out)
+
+    # assert
+    assert 'in sync with the task performers' in out.getvalue()
@@ -0,0 +1,66 @@
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from src.processes.services.workflows.version_propagation import (
+    WorkflowVersionPropagation,
+)
+from src.processes.tests.fixtures import (
+    create_test_owner,
+    create_test_template,
+    create_test_workflow,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_progress__in_progress__ok():
+
+    # arrange
+    owner = create_test_owner()
+    template = create_test_template(user=owner, tasks_count=1)
+    workflow = create_test_workflow(user=owner, template=template)
+    create_test_workflow(user=owner, template=template)
+    propagation = WorkflowVersionPropagation(
+        template_id=template.id,
+        version=template.version,
+    )
+    chunks = propagation.start()
+    propagation.set_checkpoint(chunks[0][0], workflow.id)
+    out = StringIO()
+
+    # act
+    call_command('version_propagation_progress', template.id, stdout=out)
+
+    # assert
+    assert out.getvalue() == (
+        f'Template {template.id} version {template.version}: '
+        f'1 of 2 workflows updated, in progress.\n'
+    )
+
+
+def test_progress__not_started__ok():
+
+    # arrange
+    owner = create_test_owner()
+    template = create_test_template(user=owner, tasks_count=1)
+    out = StringIO()
+
+    # act
+    call_command(
+        'version_propagation_progress',
+        template.id,
+        template_version=template.version + 1,
+        stdout=out,
+    )
+
+    # assert
+    assert 'No propagation' in out.getvalue()
+
+
+def test_progress__template_not_found__raise_exception():
+
+    # act
+    with pytest.raises(CommandError):
+        call_command('version_propagation_progress', 0, stdout=StringIO())
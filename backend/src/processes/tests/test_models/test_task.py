@@ -1890,6 +1890,49 @@ def test_update_performers__user_performer_exists__no_duplicate():
     assert task.taskperformer_set.count() == count_before
 
 
+def test_update_performers__many_users__bulk_created():
+    """
+    Several USER raw_performers — creates missing TaskPerformers
+    together, keeps existing and links raw_performers to them
+    """
+
+    # arrange
+    account = create_test_account()
+    user = create_test_owner(account=account)
+    workflow = create_test_workflow(
+        user=user,
+        tasks_count=1,
+    )
+    task = workflow.tasks.get(number=1)
+    task.update_performers()
+    users = [
+        create_test_not_admin(
+            account=account,
+            email=f'performer_{number}@pneumatic.app',
+        )
+        for number in range(3)
+    ]
+    for performer in users:
+        task.add_raw_performer(user=performer)
+
+    # act
+    created_user_ids, created_group_ids, deleted_user_ids, _ = (
+        task.update_performers()
+    )
+
+    # assert
+    assert sorted(created_user_ids) == [performer.id for performer in users]
+    assert created_group_ids == []
+    assert deleted_user_ids == []
+    assert task.taskperformer_set.filter(
+        type=PerformerType.USER,
+    ).count() == 4
+    assert not task.raw_performers.filter(
+        type=PerformerType.USER,
+        task_performer_id=None,
+    ).exists()
+
+
 def test_update_performers__group_raw_performer__ok():
     """
     GROUP type raw_performer — creates TaskPerformer with group
@@ -0,0 +1,199 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from src.processes.enums import (
+    DirectlyStatus,
+    PerformerType,
+    TaskStatus,
+    WorkflowStatus,
+)
+from src.processes.models.workflows.task import (
+    TaskInbox,
+    TaskPerformer,
+)
+from src.processes.tests.fixtures import (
+    create_test_admin,
+    create_test_group,
+    create_test_owner,
+    create_test_workflow,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_task_inbox__workflow_started__active_row_created():
+
+    # arrange
+    user = create_test_owner()
+
+    # act
+    workflow = create_test_workflow(user, tasks_count=1)
+
+    # assert
+    task = workflow.tasks.get(number=1)
+    row = TaskInbox.objects.get(user_id=user.id, task_id=task.id)
+    assert row.account_id == user.account_id
+    assert row.workflow_id == workflow.id
+    assert row.template_id == workflow.template_id
+    assert row.api_name == task.api_name
+    assert row.date_started == task.date_started
+    assert row.is_active is True
+    assert row.is_completed is False
+
+
+def test_task_inbox__performer_completed__row_completed():
+
+    # arrange
+    user = create_test_owner()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    date_completed = timezone.now()
+
+    # act
+    TaskPerformer.objects.filter(task_id=task.id, user_id=user.id).update(
+        is_completed=True,
+        date_completed=date_completed,
+    )
+
+    # assert
+    row = TaskInbox.objects.get(user_id=user.id, task_id=task.id)
+    assert row.is_active is False
+    assert row.is_completed is True
+    assert row.date_completed == date_completed
+
+
+def test_task_inbox__performer_deleted__row_deleted():
+
+    # arrange
+    user = create_test_owner()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+
+    # act
+    TaskPerformer.objects.filter(task_id=task.id).update(
+        directly_status=DirectlyStatus.DELETED,
+    )
+
+    # assert
+    assert not TaskInbox.objects.filter(task_id=task.id).exists()
+
+
+def test_task_inbox__task_updated__row_updated():
+
+    # arrange
+    user = create_test_owner()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    due_date = timezone.now() + timedelta(days=1)
+
+    # act
+    workflow.tasks.filter(id=task.id).update(
+        is_urgent=True,
+        due_date=due_date,
+    )
+
+    # assert
+    row = TaskInbox.objects.get(user_id=user.id, task_id=task.id)
+    assert row.is_urgent is True
+    assert row.due_date == due_date
+
+
+def test_task_inbox__task_not_active__row_not_active():
+
+    # arrange
+    user = create_test_owner()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+
+    # act
+    workflow.tasks.filter(id=task.id).update(status=TaskStatus.DELAYED)
+
+    # assert
+    row = TaskInbox.objects.get(user_id=user.id, task_id=task.id)
+    assert row.is_active is False
+    assert row.is_completed is False
+
+
+def test_task_inbox__task_deleted__row_deleted():
+
+    # arrange
+    user = create_test_owner()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+
+    # act
+    workflow.tasks.filter(id=task.id).update(is_deleted=True)
+
+    # assert
+    assert not TaskInbox.objects.filter(task_id=task.id).exists()
+
+
+def test_task_inbox__workflow_paused__row_not_active():
+
+    # arrange
+    user = create_test_owner()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+
+    # act
+    workflow.status = WorkflowStatus.DELAYED
+    workflow.save(update_fields=['status'])
+
+    # assert
+    row = TaskInbox.objects.get(user_id=user.id, task_id=task.id)
+    assert row.is_active is False
+
+
+def test_task_inbox__group_performer__rows_follow_members():
+
+    # arrange
+    owner = create_test_owner()
+    user = create_test_admin(account=owner.account)
+    another_user = create_test_admin(
+        account=owner.account,
+        email='another@pneumatic.app',
+    )
+    group = create_test_group(owner.account, users=[user])
+    workflow = create_test_workflow(owner, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    TaskPerformer.objects.create(
+        task_id=task.id,
+        type=PerformerType.GROUP,
+        group_id=group.id,
+    )
+
+    # act
+    group.users.add(another_user)
+    group.users.remove(user)
+
+    # assert
+    assert set(
+        TaskInbox.objects.on_tasks([task.id]).values_list(
+            'user_id',
+            flat=True,
+        ),
+    ) == {owner.id, another_user.id}
+
+
+def test_task_inbox__group_deleted__rows_deleted():
+
+    # arrange
+    owner = create_test_owner()
+    user = create_test_admin(account=owner.account)
+    group = create_test_group(owner.account, users=[user])
+    workflow = create_test_workflow(owner, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    TaskPerformer.objects.create(
+        task_id=task.id,
+        type=PerformerType.GROUP,
+        group_id=group.id,
+    )
+
+    # act
+    group.is_deleted = True
+    group.save(update_fields=['is_deleted'])
+
+    # assert
+    assert not TaskInbox.objects.by_user(user.id).exists()
@@ -14,6 +14,7 @@ from src.processes.messages import workflow as messages
 from src.processes.models.workflows.event import (
     WorkflowEvent,
     WorkflowEventAction,
+    WorkflowEventWatched,
 )
 from src.processes.serializers.workflows.events import (
     TaskEventJsonSerializer,
@@ -2827,13 +2828,11 @@ def test_watched__already_watched__skip(mocker):
         task=task,
         user=account_owner,
     )
-    event.watched = [
-        {
-            'date':  timezone.now().strftime('%Y-%m-%dT%H:%M'),
-            'user_id': user.id,
-        },
-    ]
-    event.save()
+    WorkflowEventWatched.objects.create(
+        event=event,
+        user=user,
+        date=timezone.now(),
+    )
     service = CommentService(
         instance=event,
         user=user,
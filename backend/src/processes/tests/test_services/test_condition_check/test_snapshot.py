@@ -0,0 +1,187 @@
+import pytest
+
+from src.processes.enums import (
+    ConditionAction,
+    FieldType,
+    PredicateOperator,
+    PredicateType,
+    TaskStatus,
+)
+from src.processes.models.workflows.conditions import (
+    Condition,
+    Predicate,
+    Rule,
+)
+from src.processes.models.workflows.fields import TaskField
+from src.processes.services.condition_check.service import (
+    ConditionCheckService,
+)
+from src.processes.services.condition_check.snapshot import (
+    WorkflowConditionSnapshot,
+)
+from src.processes.services.workflow_action import WorkflowActionService
+from src.processes.tests.fixtures import (
+    create_test_owner,
+    create_test_workflow,
+)
+from src.storage.enums import AccessType, SourceType
+from src.storage.models import Attachment
+
+pytestmark = pytest.mark.django_db
+
+
+def test_init__load_workflow_state__ok():
+
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=2)
+    task_1 = workflow.tasks.get(number=1)
+    task_2 = workflow.tasks.get(number=2)
+    field = TaskField.objects.create(
+        name='Text',
+        api_name='text-1',
+        task=task_1,
+        type=FieldType.STRING,
+        value='some',
+        workflow=workflow,
+        account=owner.account,
+    )
+    start_condition = Condition.objects.create(
+        task=task_2,
+        action=ConditionAction.START_TASK,
+        order=1,
+    )
+    skip_condition = Condition.objects.create(
+        task=task_2,
+        action=ConditionAction.END_WORKFLOW,
+        order=2,
+    )
+
+    # act
+    snapshot = WorkflowConditionSnapshot(workflow_id=workflow.id)
+
+    # assert
+    snapshot_field = snapshot.get_field(field.api_name)
+    assert snapshot_field.id == field.id
+    assert snapshot_field.value == 'some'
+    assert snapshot_field.has_attachments is False
+    assert snapshot.get_task_status(task_1.api_name) == TaskStatus.ACTIVE
+    assert snapshot.get_task_status(task_2.api_name) == TaskStatus.PENDING
+    assert snapshot.get_start_conditions(task_2.id) == [start_condition]
+    assert snapshot.get_skip_conditions(task_2.id) == [skip_condition]
+    assert snapshot.get_start_conditions(task_1.id) == []
+
+
+def test_get_field__not_existent__raise_exception():
+
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    snapshot = WorkflowConditionSnapshot(workflow_id=workflow.id)
+
+    # act
+    with pytest.raises(TaskField.DoesNotExist):
+        snapshot.get_field('undefined')
+
+
+def test_get_field__file_with_attachment__has_attachments():
+
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    field = TaskField.objects.create(
+        name='File',
+        api_name='file-1',
+        task=task,
+        type=FieldType.FILE,
+        value='file.jpg',
+        workflow=workflow,
+        account=owner.account,
+    )
+    Attachment.objects.create(
+        file_id='file.jpg',
+        account=owner.account,
+        source_type=SourceType.TASK,
+        access_type=AccessType.RESTRICTED,
+        task=task,
+        workflow=workflow,
+        output=field,
+    )
+    snapshot = WorkflowConditionSnapshot(workflow_id=workflow.id)
+
+    # act
+    result = snapshot.get_field(field.api_name)
+
+    # assert
+    assert result.has_attachments is True
+
+
+def test_check__with_snapshot__without_queries(django_assert_num_queries):
+
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=2)
+    task_1 = workflow.tasks.get(number=1)
+    task_2 = workflow.tasks.get(number=2)
+    field = TaskField.objects.create(
+        name='Number',
+        api_name='number-1',
+        task=task_1,
+        type=FieldType.NUMBER,
+        value='100',
+        workflow=workflow,
+        account=owner.account,
+    )
+    condition = Condition.objects.create(
+        task=task_2,
+        action=ConditionAction.SKIP_TASK,
+        order=1,
+    )
+    rule = Rule.objects.create(condition=condition)
+    Predicate.objects.create(
+        rule=rule,
+        operator=PredicateOperator.EQUAL,
+        field_type=PredicateType.NUMBER,
+        field=field.api_name,
+        value='100',
+    )
+    Predicate.objects.create(
+        rule=rule,
+        operator=PredicateOperator.COMPLETED,
+        field_type=PredicateType.TASK,
+        field=task_1.api_name,
+        value=None,
+    )
+    snapshot = WorkflowConditionSnapshot(workflow_id=workflow.id)
+    snapshot.set_task_status(task_1.api_name, TaskStatus.COMPLETED)
+    snapshot_condition = snapshot.get_skip_conditions(task_2.id)[0]
+
+    # act
+    with django_assert_num_queries(0):
+        result = ConditionCheckService.check(
+            condition=snapshot_condition,
+            workflow_id=workflow.id,
+            snapshot=snapshot,
+        )
+
+    # assert
+    assert result is True
+
+
+def test_set_task_status__snapshot_exists__update():
+
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    service = WorkflowActionService(user=owner, workflow=workflow)
+    snapshot = service.conditions_snapshot
+    task.status = TaskStatus.SKIPPED
+
+    # act
+    service._snapshot_task_status(task)
+
+    # assert
+    assert service.conditions_snapshot is snapshot
+    assert snapshot.get_task_status(task.api_name) == TaskStatus.SKIPPED
@@ -0,0 +1,192 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from src.processes.enums import TimerType
+from src.processes.services.timers import TimerService
+from src.processes.tasks.timers import fire_timer
+from src.processes.tests.fixtures import (
+    create_test_owner,
+    create_test_workflow,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def timer_service(settings):
+    settings.TIMER_SERVICE = True
+
+
+def test_schedule__within_horizon__send(mocker):
+
+    # arrange
+    client_mock = mocker.Mock()
+    mocker.patch(
+        'src.processes.services.timers.TimerService._get_client',
+        return_value=client_mock,
+    )
+    send_mock = mocker.patch(
+        'src.processes.services.timers.TimerService._send',
+    )
+    fire_at = timezone.now() + timedelta(minutes=1)
+
+    # act
+    TimerService._schedule(TimerType.DELAY, 1, fire_at)
+
+    # assert
+    client_mock.zrem.assert_called_once_with(
+        TimerService._get_key(),
+        'delay:1',
+    )
+    client_mock.zadd.assert_not_called()
+    send_mock.assert_called_once_with(TimerType.DELAY, 1, fire_at)
+
+
+def test_schedule__after_horizon__add_to_set(mocker):
+
+    # arrange
+    client_mock = mocker.Mock()
+    mocker.patch(
+        'src.processes.services.timers.TimerService._get_client',
+        return_value=client_mock,
+    )
+    send_mock = mocker.patch(
+        'src.processes.services.timers.TimerService._send',
+    )
+    fire_at = timezone.now() + timedelta(days=1)
+
+    # act
+    TimerService._schedule(TimerType.DUE_DATE, 1, fire_at)
+
+    # assert
+    client_mock.zadd.assert_called_once_with(
+        TimerService._get_key(),
+        {'due_date:1': fire_at.timestamp()},
+    )
+    send_mock.assert_not_called()
+
+
+def test_schedule__disabled__skip(mocker, settings):
+
+    # arrange
+    settings.TIMER_SERVICE = False
+    schedule_mock = mocker.patch(
+        'src.processes.services.timers.TimerService._schedule',
+    )
+
+    # act
+    TimerService.schedule(
+        TimerType.DELAY,
+        1,
+        timezone.now() + timedelta(days=1),
+    )
+
+    # assert
+    schedule_mock.assert_not_called()
+
+
+def test_dispatch__expired_timers__send(mocker):
+
+    # arrange
+    fire_at = timezone.now()
+    pipe_mock = mocker.Mock()
+    pipe_mock.execute.return_value = [
+        [(b'delay:1', fire_at.timestamp())],
+        1,
+    ]
+    client_mock = mocker.Mock()
+    client_mock.pipeline.return_value = pipe_mock
+    mocker.patch(
+        'src.processes.services.timers.TimerService._get_client',
+        return_value=client_mock,
+    )
+    send_mock = mocker.patch(
+        'src.processes.services.timers.TimerService._send',
+    )
+
+    # act
+    result = TimerService.dispatch()
+
+    # assert
+    assert result == 1
+    pipe_mock.zremrangebyscore.assert_called_once()
+    send_mock.assert_called_once()
+    timer_type, object_id, sent_fire_at = send_mock.call_args[0]
+    assert timer_type == TimerType.DELAY
+    assert object_id == 1
+    assert sent_fire_at.timestamp() == pytest.approx(fire_at.timestamp())
+
+
+def test_on_task_save__due_date_not_updated__skip(mocker):
+
+    # arrange
+    user = create_test_owner()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    task.due_date = timezone.now() + timedelta(days=1)
+    schedule_mock = mocker.patch(
+        'src.processes.services.timers.TimerService.schedule',
+    )
+
+    # act
+    TimerService.on_task_save(instance=task, update_fields={'status'})
+
+    # assert
+    schedule_mock.assert_not_called()
+
+
+def test_on_task_save__due_date_updated__schedule(mocker):
+
+    # arrange
+    user = create_test_owner()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    task.due_date = timezone.now() + timedelta(days=1)
+    schedule_mock = mocker.patch(
+        'src.processes.services.timers.TimerService.schedule',
+    )
+
+    # act
+    TimerService.on_task_save(instance=task, update_fields={'due_date'})
+
+    # assert
+    schedule_mock.assert_called_once_with(
+        timer_type=TimerType.DUE_DATE,
+        object_id=task.id,
+        fire_at=task.due_date,
+    )
+
+
+def test_fire_timer__due_date__send_overdue_notification(mocker):
+
+    # arrange
+    send_overdue_mock = mocker.patch(
+        'src.processes.tasks.timers._send_overdue_task_notification',
+    )
+
+    # act
+    fire_timer(timer_type=TimerType.DUE_DATE, object_id=1)
+
+    # assert
+    send_overdue_mock.assert_called_once_with(task_ids=[1])
+
+
+def test_fire_timer__vacation__process_and_schedule_next(mocker):
+
+    # arrange
+    process_vacation_mock = mocker.patch(
+        'src.processes.tasks.timers.process_user_vacation',
+    )
+    schedule_mock = mocker.patch(
+        'src.processes.services.timers.TimerService.'
+        'schedule_user_vacation',
+    )
+
+    # act
+    fire_timer(timer_type=TimerType.VACATION, object_id=1)
+
+    # assert
+    process_vacation_mock.assert_called_once_with(1)
+    schedule_mock.assert_called_once_with(1)
@@ -1,8 +1,15 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from src.processes.enums import PerformerType
 from src.processes.models.templates.raw_performer import RawPerformerTemplate
 from src.processes.services.versioning.schemas import (
     RawPerformerTemplateSchemaV1,
+    TemplateSchemaV1,
+)
+from src.processes.services.versioning.versioning import (
+    TemplateVersioningService,
 )
 from src.processes.tests.fixtures import (
     create_test_owner,
@@ -69,3 +76,23 @@ def test_raw_performer_schema__user__source_task_api_name_null():
     # assert
     assert serialized['source_task_api_name'] is None
     assert serialized['type'] == PerformerType.USER
+
+
+def test_map_to_dict__many_tasks__queries_not_depend_on_tasks_count():
+
+    # arrange
+    user = create_test_owner()
+    template_1 = create_test_template(user=user, tasks_count=1)
+    template_2 = create_test_template(user=user, tasks_count=5)
+    service = TemplateVersioningService(schema=TemplateSchemaV1)
+
+    # act
+    with CaptureQueriesContext(connection) as queries_1:
+        data_1 = service.map_to_dict(template_1)
+    with CaptureQueriesContext(connection) as queries_2:
+        data_2 = service.map_to_dict(template_2)
+
+    # assert
+    assert len(data_1['tasks']) == 1
+    assert len(data_2['tasks']) == 5
+    assert len(queries_1) == len(queries_2)
@@ -0,0 +1,351 @@
+from datetime import timedelta
+
+import pytest
+from django.test import override_settings
+
+from src.processes.enums import (
+    DueDateRule,
+    FieldType,
+    PerformerType,
+)
+from src.processes.models.templates.checklist import (
+    ChecklistTemplate,
+    ChecklistTemplateSelection,
+)
+from src.processes.models.templates.fields import (
+    FieldTemplate,
+    FieldTemplateSelection,
+)
+from src.processes.models.templates.raw_due_date import RawDueDateTemplate
+from src.processes.models.templates.raw_performer import (
+    RawPerformerTemplate,
+)
+from src.processes.models.workflows.conditions import Predicate
+from src.processes.models.workflows.raw_performer import RawPerformer
+from src.processes.models.workflows.workflow import Workflow
+from src.processes.services.workflows.instantiation import (
+    InstantiationPlanService,
+    WorkflowInstantiationService,
+)
+from src.processes.tests.fixtures import (
+    create_test_admin,
+    create_test_group,
+    create_test_owner,
+    create_test_template,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def _create_workflow(template, user) -> Workflow:
+    return Workflow.objects.create(
+        name=template.name,
+        template=template,
+        account=user.account,
+        version=template.version,
+        workflow_starter=user,
+    )
+
+
+def test_compile__all_related__ok():
+
+    # arrange
+    owner = create_test_owner()
+    template = create_test_template(user=owner, tasks_count=2)
+    task_template = template.tasks.get(number=1)
+    field_template = FieldTemplate.objects.create(
+        name='Radio',
+        type=FieldType.RADIO,
+        task=task_template,
+        template=template,
+        account=owner.account,
+    )
+    selection_template = FieldTemplateSelection.objects.create(
+        field_template=field_template,
+        value='First',
+        template=template,
+    )
+    checklist_template = ChecklistTemplate.objects.create(
+        task=task_template,
+        template=template,
+    )
+    ChecklistTemplateSelection.objects.create(
+        checklist=checklist_template,
+        value='Item',
+        template=template,
+    )
+    RawDueDateTemplate.objects.create(
+        task=task_template,
+        template=template,
+        duration=timedelta(hours=24),
+        rule=DueDateRule.AFTER_TASK_STARTED,
+        source_id=task_template.api_name,
+    )
+
+    # act
+    plan = InstantiationPlanService.compile(template)
+
+    # assert
+    assert len(plan) == 2
+    task_data = plan[0]
+    assert task_data['task']['api_name'] == task_template.api_name
+    assert task_data['task']['checklists_total'] == 1
+    assert task_data['fields'][0]['api_name'] == field_template.api_name
+    assert task_data['fields'][0]['selections'] == [{
+        'value': 'First',
+        'api_name': selection_template.api_name,
+    }]
+    assert task_data['checklists'][0]['api_name'] == (
+        checklist_template.api_name
+    )
+    assert task_data['raw_performers'][0]['user_id'] == owner.id
+    assert task_data['raw_due_date']['duration'] == timedelta(hours=24)
+    assert task_data['conditions'] == []
+    assert len(plan[1]['conditions'][0]['rules'][0]['predicates']) == 1
+
+
+@override_settings(INSTANTIATION_PLAN_CACHE=True)
+def test_get_plan__same_version__compile_once(mocker):
+
+    # arrange
+    owner = create_test_owner()
+    template = create_test_template(user=owner, tasks_count=1)
+    InstantiationPlanService.delete_account_plans(owner.account_id)
+    compile_spy = mocker.spy(InstantiationPlanService, 'compile')
+
+    # act
+    InstantiationPlanService.get_plan(template)
+    plan = InstantiationPlanService.get_plan(template)
+
+    # assert
+    assert compile_spy.call_count == 1
+    assert plan[0]['task']['number'] == 1
+
+
+@override_settings(INSTANTIATION_PLAN_CACHE=True)
+def test_delete_account_plans__ok(mocker):
+
+    # arrange
+    owner = create_test_owner()
+    template = create_test_template(user=owner, tasks_count=1)
+    InstantiationPlanService.get_plan(template)
+    compile_spy = mocker.spy(InstantiationPlanService, 'compile')
+
+    # act
+    InstantiationPlanService.delete_account_plans(owner.account_id)
+
+    # assert
+    InstantiationPlanService.get_plan(template)
+    assert compile_spy.call_count == 1
+
+
+@override_settings(INSTANTIATION_PLAN_CACHE=True)
+def test_get_plan__group_deleted__recompile(mocker):
+
+    # arrange
+    mocker.patch(
+        'src.processes.services.workflows.instantiation.'
+        'transaction.on_commit',
+        side_effect=lambda f: f(),
+    )
+    owner = create_test_owner()
+    group = create_test_group(owner.account)
+    template = create_test_template(user=owner, tasks_count=1)
+    task_template = template.tasks.get(number=1)
+    RawPerformerTemplate.objects.create(
+        template=template,
+        task=task_template,
+        account=owner.account,
+        type=PerformerType.GROUP,
+        group=group,
+    )
+    plan = InstantiationPlanService.get_plan(template)
+    assert group.id in [
+        raw_performer['group_id']
+        for raw_performer in plan[0]['raw_performers']
+    ]
+
+    # act
+    group.delete()
+
+    # assert
+    plan = InstantiationPlanService.get_plan(template)
+    assert group.id not in [
+        raw_performer['group_id']
+        for raw_performer in plan[0]['raw_performers']
+    ]
+
+
+@override_settings(INSTANTIATION_PLAN_CACHE=True)
+def test_get_plan__template_saved__recompile(mocker):
+
+    # arrange
+    mocker.patch(
+        'src.processes.services.workflows.instantiation.'
+        'transaction.on_commit',
+        side_effect=lambda f: f(),
+    )
+    owner = create_test_owner()
+    template = create_test_template(user=owner, tasks_count=1)
+    InstantiationPlanService.get_plan(template)
+    compile_spy = mocker.spy(InstantiationPlanService, 'compile')
+
+    # act
+    template.save(update_fields=['name'])
+
+    # assert
+    InstantiationPlanService.get_plan(template)
+    assert compile_spy.call_count == 1
+
+
+@override_settings(INSTANTIATION_PLAN_CACHE=True)
+def test_get_plan__user_updated__not_recompile(mocker):
+
+    # arrange
+    mocker.patch(
+        'src.processes.services.workflows.instantiation.'
+        'transaction.on_commit',
+        side_effect=lambda f: f(),
+    )
+    owner = create_test_owner()
+    template = create_test_template(user=owner, tasks_count=1)
+    InstantiationPlanService.get_plan(template)
+    compile_spy = mocker.spy(InstantiationPlanService, 'compile')
+
+    # act
+    owner.save(update_fields=['first_name'])
+
+    # assert
+    InstantiationPlanService.get_plan(template)
+    assert compile_spy.call_count == 0
+
+
+@override_settings(INSTANTIATION_PLAN_CACHE=True)
+def test_get_plan__other_account_plans_deleted__not_recompile(mocker):
+
+    # arrange
+    owner = create_test_owner()
+    another_owner = create_test_owner(email='another@pneumatic.app')
+    template = create_test_template(user=owner, tasks_count=1)
+    InstantiationPlanService.get_plan(template)
+    compile_spy = mocker.spy(InstantiationPlanService, 'compile')
+
+    # act
+    InstantiationPlanService.delete_account_plans(another_owner.account_id)
+
+    # assert
+    InstantiationPlanService.get_plan(template)
+    assert compile_spy.call_count == 0
+
+
+def test_create_tasks__all_related__ok():
+
+    # arrange
+    owner = create_test_owner()
+    template = create_test_template(user=owner, tasks_count=2)
+    task_template = template.tasks.get(number=1)
+    field_template = FieldTemplate.objects.create(
+        name='Radio',
+        type=FieldType.RADIO,
+        task=task_template,
+        template=template,
+        account=owner.account,
+    )
+    FieldTemplateSelection.objects.create(
+        field_template=field_template,
+        value='First',
+        template=template,
+    )
+    checklist_template = ChecklistTemplate.objects.create(
+        task=task_template,
+        template=template,
+    )
+    ChecklistTemplateSelection.objects.create(
+        checklist=checklist_template,
+        value='Item',
+        template=template,
+    )
+    RawDueDateTemplate.objects.create(
+        task=task_template,
+        template=template,
+        duration=timedelta(hours=24),
+        rule=DueDateRule.AFTER_TASK_STARTED,
+        source_id=task_template.api_name,
+    )
+    workflow = _create_workflow(template, owner)
+    plan = InstantiationPlanService.compile(template)
+    service = WorkflowInstantiationService(workflow=workflow, user=owner)
+
+    # act
+    tasks = service.create_tasks(plan=plan)
+
+    # assert
+    assert len(tasks) == 2
+    task = workflow.tasks.get(number=1)
+    assert task.api_name == task_template.api_name
+    assert task.checklists_total == 1
+    field = task.output.get()
+    assert field.api_name == field_template.api_name
+    assert field.selections.get().value == 'First'
+    assert task.checklists.get().selections.get().value == 'Item'
+    assert task.raw_due_date.duration == timedelta(hours=24)
+    raw_performer = task.raw_performers.get()
+    assert raw_performer.user_id == owner.id
+    task_2 = workflow.tasks.get(number=2)
+    assert task_2.parents == [task.api_name]
+    predicate = Predicate.objects.get(rule__condition__task=task_2)
+    assert predicate.field == task.api_name
+
+
+def test_create_tasks__field_performer__ok():
+
+    # arrange
+    owner = create_test_owner()
+    template = create_test_template(user=owner, tasks_count=2)
+    task_template_1 = template.tasks.get(number=1)
+    task_template_2 = template.tasks.get(number=2)
+    field_template = FieldTemplate.objects.create(
+        name='User',
+        type=FieldType.USER,
+        task=task_template_1,
+        template=template,
+        account=owner.account,
+    )
+    task_template_2.raw_performers.all().delete()
+    task_template_2.add_raw_performer(
+        field=field_template,
+        performer_type=PerformerType.FIELD,
+    )
+    workflow = _create_workflow(template, owner)
+    plan = InstantiationPlanService.compile(template)
+    service = WorkflowInstantiationService(workflow=workflow, user=owner)
+
+    # act
+    service.create_tasks(plan=plan)
+
+    # assert
+    task_2 = workflow.tasks.get(number=2)
+    raw_performer = task_2.raw_performers.get()
+    assert raw_performer.type == PerformerType.FIELD
+    assert raw_performer.field == workflow.tasks.get(number=1).output.get()
+
+
+def test_create_tasks__redefined_performer__ok():
+
+    # arrange
+    owner = create_test_owner()
+    admin = create_test_admin(account=owner.account)
+    template = create_test_template(user=owner, tasks_count=2)
+    workflow = _create_workflow(template, owner)
+    plan = InstantiationPlanService.compile(template)
+    service = WorkflowInstantiationService(workflow=workflow, user=owner)
+
+    # act
+    service.create_tasks(plan=plan, redefined_performer=admin)
+
+    # assert
+    raw_performers = RawPerformer.objects.filter(workflow=workflow)
+    assert raw_performers.count() == 2
+    for raw_performer in raw_performers:
+        assert raw_performer.user_id == admin.id
+        assert raw_performer.api_name
@@ -0,0 +1,136 @@
+from datetime import timedelta
+
+import pytest
+
+from src.processes.enums import WorkflowEventType
+from src.processes.models.workflows.event import WorkflowLastEvent
+from src.processes.services.events import WorkflowEventService
+from src.processes.services.workflows.last_event import (
+    WorkflowLastEventService,
+)
+from src.processes.tests.fixtures import (
+    create_test_event,
+    create_test_owner,
+    create_test_workflow,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_event_created__highlight_event__projection_updated():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+
+    # act
+    event = WorkflowEventService.comment_created_event(
+        user=owner,
+        task=task,
+        text='Comment',
+        clear_text='Comment',
+        after_create_actions=False,
+    )
+
+    # assert
+    last_event = WorkflowLastEvent.objects.get(workflow_id=workflow.id)
+    assert last_event.event_id == event.id
+    assert last_event.account_id == owner.account_id
+    assert last_event.created == event.created
+
+
+def test_event_created__not_highlight_event__projection_not_changed():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    comment = WorkflowEventService.comment_created_event(
+        user=owner,
+        task=task,
+        text='Comment',
+        clear_text='Comment',
+        after_create_actions=False,
+    )
+
+    # act
+    WorkflowEventService.task_started_event(
+        task=task,
+        after_create_actions=False,
+    )
+
+    # assert
+    last_event = WorkflowLastEvent.objects.get(workflow_id=workflow.id)
+    assert last_event.event_id == comment.id
+
+
+def test_event_created__older_event__projection_not_changed():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    newer = create_test_event(
+        workflow=workflow,
+        user=owner,
+        type_event=WorkflowEventType.COMMENT,
+    )
+    WorkflowLastEventService.event_created(newer)
+    older = create_test_event(
+        workflow=workflow,
+        user=owner,
+        type_event=WorkflowEventType.COMMENT,
+        data_create=newer.created - timedelta(minutes=1),
+    )
+
+    # act
+    WorkflowLastEventService.event_created(older)
+
+    # assert
+    last_event = WorkflowLastEvent.objects.get(workflow_id=workflow.id)
+    assert last_event.event_id == newer.id
+
+
+def test_refresh__latest_event_deleted__previous_event_restored():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    previous = create_test_event(
+        workflow=workflow,
+        user=owner,
+        type_event=WorkflowEventType.COMMENT,
+        data_create=workflow.date_created + timedelta(minutes=1),
+    )
+    latest = create_test_event(
+        workflow=workflow,
+        user=owner,
+        type_event=WorkflowEventType.URGENT,
+        data_create=workflow.date_created + timedelta(minutes=2),
+    )
+    WorkflowLastEventService.event_created(latest)
+    latest.delete()
+
+    # act
+    WorkflowLastEventService.refresh([workflow.id])
+
+    # assert
+    last_event = WorkflowLastEvent.objects.get(workflow_id=workflow.id)
+    assert last_event.event_id == previous.id
+
+
+def test_refresh__no_highlight_events__row_deleted():
+    # arrange
+    owner = create_test_owner()
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    event = create_test_event(
+        workflow=workflow,
+        user=owner,
+        type_event=WorkflowEventType.COMMENT,
+    )
+    WorkflowLastEventService.event_created(event)
+    workflow.events.update(is_deleted=True)
+
+    # act
+    WorkflowLastEventService.refresh([workflow.id])
+
+    # assert
+    assert not WorkflowLastEvent.objects.filter(
+        workflow_id=workflow.id,
+    ).exists()
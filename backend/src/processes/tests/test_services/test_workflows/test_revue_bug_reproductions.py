@@ -228,7 +228,8 @@ def test_send_event_created__foreign_account_uop__not_notified(
         source_id=workflow.pk,
     )
     notify_mock = mocker.patch(
-        'src.notifications.tasks._send_notification',
+        'src.notifications.services.websockets.'
+        'WebSocketService.send_to_users',
     )
 
     # act
@@ -244,10 +245,7 @@ def test_send_event_created__foreign_account_uop__not_notified(
     )
 
     # assert
-    notified_ids = {
-        kwargs['user_id']
-        for _args, kwargs in notify_mock.call_args_list
-    }
+    notified_ids = notify_mock.call_args[1]['user_ids']
     assert foreign_user.id not in notified_ids
 
 
@@ -0,0 +1,175 @@
+"""
+Tests for mirroring WorkflowPermissionService writes into
+the integer-keyed workflow_acl table and reading from it.
+"""
+
+import pytest
+from django.test import override_settings
+
+from src.permissions.enums import PermissionSource, WorkflowAclPerm
+from src.permissions.models import WorkflowAcl
+from src.processes.models.workflows.workflow import Workflow
+from src.processes.queries import WorkflowPermissionQuery
+from src.processes.services.workflow_permissions import (
+    WorkflowPermissionService,
+)
+from src.processes.tests.fixtures import (
+    create_test_account,
+    create_test_admin,
+    create_test_owner,
+    create_test_workflow,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_grant_change__acl_view_and_change():
+    # arrange
+    account = create_test_account()
+    owner = create_test_owner(account=account)
+    user = create_test_admin(account=account, email='user@test.test')
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+
+    # act
+    WorkflowPermissionService(workflow).grant_change(
+        user=user,
+        source_type=PermissionSource.TEMPLATE_OWNER,
+        source_id=workflow.template_id,
+    )
+
+    # assert
+    perms = set(
+        WorkflowAcl.objects.filter(
+            workflow_id=workflow.id,
+            user=user,
+        ).values_list('perm', flat=True),
+    )
+    assert perms == {WorkflowAclPerm.VIEW, WorkflowAclPerm.CHANGE}
+
+
+def test_set_view_and_change__acl_replaces_previous():
+    # arrange
+    account = create_test_account()
+    owner = create_test_owner(account=account)
+    new_owner = create_test_admin(
+        account=account, email='newowner@test.test',
+    )
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+
+    # act
+    WorkflowPermissionService(workflow).set_view_and_change(
+        user_ids=[new_owner.id],
+    )
+
+    # assert
+    change_user_ids = set(
+        WorkflowAcl.objects.filter(
+            workflow_id=workflow.id,
+            perm=WorkflowAclPerm.CHANGE,
+        ).values_list('user_id', flat=True),
+    )
+    assert change_user_ids == {new_owner.id}
+
+
+def test_sync_view__acl_add_and_remove():
+    # arrange
+    account = create_test_account()
+    owner = create_test_owner(account=account)
+    user_1 = create_test_admin(account=account, email='u1@test.test')
+    user_2 = create_test_admin(account=account, email='u2@test.test')
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    service = WorkflowPermissionService(workflow)
+    service.grant_view(
+        user=user_1,
+        source_type=PermissionSource.MENTION,
+        source_id=1,
+    )
+
+    # act
+    service.sync_view(
+        user_ids=[user_2.id],
+        source_type=PermissionSource.MENTION,
+        source_id=1,
+    )
+
+    # assert
+    user_ids = set(
+        WorkflowAcl.objects.filter(
+            workflow_id=workflow.id,
+            perm=WorkflowAclPerm.VIEW,
+            source_type=PermissionSource.MENTION,
+            source_id=1,
+        ).values_list('user_id', flat=True),
+    )
+    assert user_ids == {user_2.id}
+
+
+def test_revoke_view__acl_deleted():
+    # arrange
+    account = create_test_account()
+    owner = create_test_owner(account=account)
+    user = create_test_admin(account=account, email='user@test.test')
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    service = WorkflowPermissionService(workflow)
+    service.grant_view(
+        user=user,
+        source_type=PermissionSource.MENTION,
+        source_id=1,
+    )
+
+    # act
+    service.revoke_view(
+        source_type=PermissionSource.MENTION,
+        source_id=1,
+    )
+
+    # assert
+    assert not WorkflowAcl.objects.filter(
+        workflow_id=workflow.id,
+        user=user,
+    ).exists()
+
+
+@override_settings(WORKFLOW_ACL_QUERIES=True)
+def test_viewer_q__acl_queries__returns_permitted():
+    # arrange
+    account = create_test_account()
+    owner = create_test_owner(account=account)
+    outsider = create_test_admin(
+        account=account, email='outsider@test.test',
+    )
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+
+    # act
+    owner_qs = Workflow.objects.filter(
+        WorkflowPermissionQuery.viewer_q(user_id=owner.id),
+    )
+    outsider_qs = Workflow.objects.filter(
+        WorkflowPermissionQuery.viewer_q(user_id=outsider.id),
+    )
+
+    # assert
+    assert owner_qs.filter(pk=workflow.pk).exists()
+    assert not outsider_qs.filter(pk=workflow.pk).exists()
+
+
+@override_settings(WORKFLOW_ACL_QUERIES=True)
+def test_change_q__acl_queries__excludes_viewer_only():
+    # arrange
+    account = create_test_account()
+    owner = create_test_owner(account=account)
+    viewer = create_test_admin(account=account, email='viewer@test.test')
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    WorkflowPermissionService(workflow).grant_view(
+        user=viewer,
+        source_type=PermissionSource.MENTION,
+        source_id=1,
+    )
+
+    # act
+    qs = Workflow.objects.filter(
+        WorkflowPermissionQuery.change_q(user_id=viewer.id),
+    )
+
+    # assert
+    assert not qs.filter(pk=workflow.pk).exists()
@@ -8,7 +8,9 @@ from src.authentication.enums import AuthTokenType
 from src.processes.enums import FieldType
 from src.processes.messages.workflow import MSG_PW_0091
 from src.processes.models.templates.fields import FieldTemplate
-from src.processes.services.tasks.task import TaskService
+from src.processes.services.workflows.instantiation import (
+    WorkflowInstantiationService,
+)
 from src.processes.services.workflows.workflow import WorkflowService
 from src.processes.tests.fixtures import (
     create_test_account,
@@ -304,14 +306,20 @@ def test_create_related__ok(mocker):
         'src.processes.services.workflows.workflow.'
         'WorkflowService.update_owners',
     )
-    task_service_init_mock = mocker.patch.object(
-        TaskService,
+    plan = [{'task': {'api_name': 'task-1'}}]
+    get_plan_mock = mocker.patch(
+        'src.processes.services.workflows.workflow.'
+        'InstantiationPlanService.get_plan',
+        return_value=plan,
+    )
+    instantiation_service_init_mock = mocker.patch.object(
+        WorkflowInstantiationService,
         attribute='__init__',
         return_value=None,
     )
-    task_service_create_mock = mocker.patch(
+    create_tasks_mock = mocker.patch(
         'src.processes.services.workflows.workflow.'
-        'TaskService.create',
+        'WorkflowInstantiationService.create_tasks',
     )
 
     # act
@@ -321,10 +329,13 @@ def test_create_related__ok(mocker):
     )
 
     # assert
-    task_service_init_mock.assert_called_once_with(user=owner)
-    task_service_create_mock.assert_called_once_with(
-        instance_template=template.tasks.get(number=1),
+    get_plan_mock.assert_called_once_with(template)
+    instantiation_service_init_mock.assert_called_once_with(
         workflow=workflow,
+        user=owner,
+    )
+    create_tasks_mock.assert_called_once_with(
+        plan=plan,
         redefined_performer=None,
     )
     update_owners_mock.assert_called_once()
@@ -1,9 +1,12 @@
 from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 from django.utils import timezone
 
 from src.authentication.enums import AuthTokenType
+from src.generics.messages import MSG_GE_0021
+from src.generics.paginations import KeysetPaginationMixin
 from src.processes.enums import (
     DirectlyStatus,
     FieldType,
@@ -2440,3 +2443,54 @@ def test_list__filter_template_id_not_number__validation_error(api_client):
     assert response.data['message'] == message
     assert response.data['details']['reason'] == message
     assert response.data['details']['name'] == 'template_id'
+
+
+def test_list__cursor__pages_with_count(api_client):
+
+    # arrange
+    user = create_test_user()
+    workflow_1 = create_test_workflow(user, tasks_count=1)
+    task_1 = workflow_1.tasks.get(number=1)
+    workflow_2 = create_test_workflow(user, tasks_count=1)
+    task_2 = workflow_2.tasks.get(number=1)
+    api_client.token_authenticate(user=user)
+
+    # act
+    response_1 = api_client.get(
+        '/v3/tasks?ordering=date&cursor=&limit=1&with_count=true',
+    )
+    cursor = parse_qs(urlparse(response_1.data['next']).query)['cursor'][0]
+    response_2 = api_client.get(
+        f'/v3/tasks?ordering=date&cursor={cursor}&limit=1',
+    )
+
+    # assert
+    assert response_1.status_code == 200
+    assert response_1.data['count'] == 2
+    assert response_1.data['results'][0]['id'] == task_1.id
+    assert response_2.status_code == 200
+    assert response_2.data['count'] is None
+    assert response_2.data['results'][0]['id'] == task_2.id
+    assert response_2.data['next'] is None
+
+
+def test_list__cursor_value_wrong_type__validation_error(api_client):
+
+    # arrange
+    user = create_test_user()
+    create_test_workflow(user, tasks_count=1)
+    cursor = KeysetPaginationMixin.encode_cursor({
+        'is_urgent': False,
+        'date_started': '2024-01-02T03:04:05+00:00',
+        'id': 'abc',
+    })
+    api_client.token_authenticate(user=user)
+
+    # act
+    response = api_client.get(f'/v3/tasks?ordering=date&cursor={cursor}')
+
+    # assert
+    assert response.status_code == 400
+    assert response.data['code'] == ErrorCode.VALIDATION_ERROR
+    assert response.data['message'] == MSG_GE_0021
+    assert response.data['details']['name'] == 'cursor'
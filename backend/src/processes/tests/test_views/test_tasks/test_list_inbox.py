@@ -0,0 +1,164 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from src.processes.enums import (
+    DirectlyStatus,
+    PerformerType,
+    TaskStatus,
+)
+from src.processes.models.workflows.task import TaskPerformer
+from src.processes.tests.fixtures import (
+    create_test_group,
+    create_test_template,
+    create_test_user,
+    create_test_workflow,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def task_inbox_queries(settings):
+    settings.TASK_INBOX_QUERIES = True
+
+
+def test_list__default_ordering__ok(api_client):
+
+    # arrange
+    user = create_test_user()
+    workflow_1 = create_test_workflow(user, tasks_count=1)
+    task_11 = workflow_1.tasks.get(number=1)
+    workflow_2 = create_test_workflow(
+        user,
+        name='Workflow 2',
+        tasks_count=1,
+    )
+    task_21 = workflow_2.tasks.get(number=1)
+    task_11.due_date = task_11.date_first_started + timedelta(hours=1)
+    task_11.save(update_fields=['due_date'])
+
+    completed_workflow = create_test_workflow(user, tasks_count=1)
+    task = completed_workflow.tasks.get(number=1)
+    task.status = TaskStatus.COMPLETED
+    task.date_completed = timezone.now()
+    task.save(update_fields=['status', 'date_completed'])
+    TaskPerformer.objects.filter(task_id=task.id, user_id=user.id).update(
+        is_completed=True,
+        date_completed=task.date_completed,
+    )
+    api_client.token_authenticate(user=user)
+
+    # act
+    response = api_client.get('/v3/tasks')
+
+    # assert
+    assert response.status_code == 200
+    assert len(response.data) == 2
+
+    task_21_data = response.data[0]
+    assert task_21_data['id'] == task_21.id
+    assert task_21_data['name'] == task_21.name
+    assert task_21_data['api_name'] == task_21.api_name
+    assert task_21_data['workflow_name'] == workflow_2.name
+    assert task_21_data['due_date_tsp'] is None
+    assert task_21_data['date_started_tsp'] == task_21.date_started.timestamp()
+    assert task_21_data['date_completed_tsp'] is None
+    assert task_21_data['template_id'] == workflow_2.template_id
+    assert task_21_data['template_task_api_name'] == task_21.api_name
+    assert task_21_data['is_urgent'] is False
+    assert task_21_data['status'] == TaskStatus.ACTIVE
+
+    task_11_data = response.data[1]
+    assert task_11_data['id'] == task_11.id
+    assert task_11_data['due_date_tsp'] == task_11.due_date.timestamp()
+    assert task_11_data['status'] == TaskStatus.ACTIVE
+
+
+def test_list__user_in_group__ok(api_client):
+
+    # arrange
+    user = create_test_user()
+    another_user = create_test_user(
+        account=user.account,
+        email='another@pneumatic.app',
+    )
+    group = create_test_group(user.account, users=[another_user])
+    workflow_1 = create_test_workflow(user, tasks_count=1)
+    task_11 = workflow_1.tasks.get(number=1)
+    TaskPerformer.objects.filter(
+        task=task_11,
+    ).update(directly_status=DirectlyStatus.DELETED)
+    TaskPerformer.objects.create(
+        task_id=task_11.id,
+        type=PerformerType.GROUP,
+        group_id=group.id,
+        directly_status=DirectlyStatus.CREATED,
+    )
+    workflow_2 = create_test_workflow(user, tasks_count=1, is_urgent=True)
+    task_21 = workflow_2.tasks.get(number=1)
+    TaskPerformer.objects.create(
+        task_id=task_21.id,
+        type=PerformerType.GROUP,
+        group_id=group.id,
+        directly_status=DirectlyStatus.CREATED,
+    )
+    create_test_workflow(user, tasks_count=1)
+    api_client.token_authenticate(user=another_user)
+
+    # act
+    response = api_client.get('/v3/tasks')
+
+    # assert
+    assert response.status_code == 200
+    assert len(response.data) == 2
+    assert response.data[0]['id'] == task_21.id
+    assert response.data[1]['id'] == task_11.id
+
+
+def test_list__is_completed__ok(api_client):
+
+    # arrange
+    user = create_test_user()
+    create_test_workflow(user, tasks_count=1)
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    date_completed = timezone.now()
+    TaskPerformer.objects.filter(task_id=task.id, user_id=user.id).update(
+        is_completed=True,
+        date_completed=date_completed,
+    )
+    api_client.token_authenticate(user=user)
+
+    # act
+    response = api_client.get('/v3/tasks?is_completed=true')
+
+    # assert
+    assert response.status_code == 200
+    assert len(response.data) == 1
+    assert response.data[0]['id'] == task.id
+
+
+def test_list__filter_template_id__ok(api_client):
+
+    # arrange
+    user = create_test_user()
+    template_1 = create_test_template(user, is_active=True)
+    template_2 = create_test_template(user, is_active=True)
+
+    workflow_1 = create_test_workflow(user, template=template_1, tasks_count=1)
+    task_11 = workflow_1.tasks.get(number=1)
+    workflow_2 = create_test_workflow(user, template=template_1, tasks_count=1)
+    task_21 = workflow_2.tasks.get(number=1)
+    create_test_workflow(user, template=template_2, tasks_count=1)
+    api_client.token_authenticate(user=user)
+
+    # act
+    response = api_client.get(f'/v3/tasks?template_id={template_1.id}')
+
+    # assert
+    assert response.status_code == 200
+    assert len(response.data) == 2
+    assert response.data[0]['id'] == task_21.id
+    assert response.data[1]['id'] == task_11.id
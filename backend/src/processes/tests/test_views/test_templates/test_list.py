@@ -1,3 +1,5 @@
+from urllib.parse import parse_qs, urlparse
+
 import pytest
 from django.utils import timezone
 
@@ -1555,3 +1557,29 @@ def test_list__kickoff_multiple_fieldsets_ordered(api_client):
     assert fieldsets[0]['api_name'] == fieldset_1.api_name
     assert fieldsets[1]['order'] == fieldset_2.order
     assert fieldsets[1]['api_name'] == fieldset_2.api_name
+
+
+def test_list__cursor__pages(api_client):
+
+    # arrange
+    user = create_test_user()
+    template_1 = create_test_template(user=user, is_active=True)
+    template_2 = create_test_template(user=user, is_active=True)
+    template_3 = create_test_template(user=user, is_active=False)
+    api_client.token_authenticate(user)
+
+    # act
+    response_1 = api_client.get('/templates?cursor=&limit=2')
+    cursor = parse_qs(urlparse(response_1.data['next']).query)['cursor'][0]
+    response_2 = api_client.get(f'/templates?cursor={cursor}&limit=2')
+
+    # assert
+    assert response_1.status_code == 200
+    assert response_1.data['count'] is None
+    assert [t['id'] for t in response_1.data['results']] == [
+        template_1.id,
+        template_2.id,
+    ]
+    assert response_2.status_code == 200
+    assert [t['id'] for t in response_2.data['results']] == [template_3.id]
+    assert response_2.data['next'] is None
@@ -0,0 +1,140 @@
+import pytest
+
+from src.processes.consts import WORKFLOW_RUN_BATCH_MAX_SIZE
+from src.processes.enums import FieldType, TaskStatus
+from src.processes.models.templates.fields import FieldTemplate
+from src.processes.models.workflows.workflow import Workflow
+from src.processes.tests.fixtures import (
+    create_test_template,
+    create_test_user,
+)
+from src.utils.validation import ErrorCode
+
+pytestmark = pytest.mark.django_db
+
+
+def test_run_batch__ok(api_client, mocker):
+
+    # arrange
+    mocker.patch(
+        'src.processes.services.workflow_action.'
+        'WorkflowEventService.workflow_run_event',
+    )
+    mocker.patch(
+        'src.analysis.services.AnalyticService.'
+        'workflows_started',
+    )
+    mocker.patch(
+        'src.processes.services.templates.'
+        'integrations.TemplateIntegrationsService.api_request',
+    )
+    user = create_test_user()
+    api_client.token_authenticate(user)
+    template = create_test_template(
+        user=user,
+        is_active=True,
+        tasks_count=2,
+    )
+    field_template = FieldTemplate.objects.create(
+        name='Name',
+        type=FieldType.STRING,
+        is_required=True,
+        kickoff=template.kickoff_instance,
+        template=template,
+        account=user.account,
+    )
+
+    # act
+    response = api_client.post(
+        f'/templates/{template.id}/run-batch',
+        data={
+            'workflows': [
+                {
+                    'name': 'First',
+                    'kickoff': {field_template.api_name: 'John'},
+                },
+                {
+                    'name': 'Second',
+                    'kickoff': {field_template.api_name: 'Jane'},
+                },
+            ],
+        },
+    )
+
+    # assert
+    assert response.status_code == 200
+    assert len(response.data) == 2
+    assert response.data[0]['name'] == 'First'
+    assert response.data[1]['name'] == 'Second'
+    workflows = Workflow.objects.filter(template=template)
+    assert workflows.count() == 2
+    for workflow in workflows:
+        assert workflow.tasks.count() == 2
+        task = workflow.tasks.get(number=1)
+        assert task.status == TaskStatus.ACTIVE
+        assert task.performers.filter(id=user.id).exists()
+
+
+def test_run_batch__invalid_item__rollback(api_client, mocker):
+
+    # arrange
+    mocker.patch(
+        'src.processes.services.workflow_action.'
+        'WorkflowEventService.workflow_run_event',
+    )
+    user = create_test_user()
+    api_client.token_authenticate(user)
+    template = create_test_template(
+        user=user,
+        is_active=True,
+        tasks_count=1,
+    )
+    field_template = FieldTemplate.objects.create(
+        name='Name',
+        type=FieldType.STRING,
+        is_required=True,
+        kickoff=template.kickoff_instance,
+        template=template,
+        account=user.account,
+    )
+
+    # act
+    response = api_client.post(
+        f'/templates/{template.id}/run-batch',
+        data={
+            'workflows': [
+                {'kickoff': {field_template.api_name: 'John'}},
+                {'kickoff': {}},
+            ],
+        },
+    )
+
+    # assert
+    assert response.status_code == 400
+    assert response.data['code'] == ErrorCode.VALIDATION_ERROR
+    assert not Workflow.objects.filter(template=template).exists()
+
+
+def test_run_batch__over_max_size__validation_error(api_client):
+
+    # arrange
+    user = create_test_user()
+    api_client.token_authenticate(user)
+    template = create_test_template(
+        user=user,
+        is_active=True,
+        tasks_count=1,
+    )
+
+    # act
+    response = api_client.post(
+        f'/templates/{template.id}/run-batch',
+        data={
+            'workflows': [{}] * (WORKFLOW_RUN_BATCH_MAX_SIZE + 1),
+        },
+    )
+
+    # assert
+    assert response.status_code == 400
+    assert response.data['code'] == ErrorCode.VALIDATION_ERROR
+    assert not Workflow.objects.filter(template=template).exists()
@@ -2331,6 +2331,76 @@ class TestUpdateTemplateTask:
         assert response.data['details']['reason'] == message
         assert response.data['details']['api_name'] == task.api_name
 
+    def test_update__not_changed_tasks__not_saved(
+        self,
+        mocker,
+        api_client,
+    ):
+
+        # arrange
+        user = create_test_user()
+        api_client.token_authenticate(user)
+        template = create_test_template(
+            user=user,
+            tasks_count=2,
+            is_active=True,
+        )
+        task_1 = template.tasks.get(number=1)
+        task_2 = template.tasks.get(number=2)
+        mocker.patch(
+            'src.processes.services.templates.'
+            'integrations.TemplateIntegrationsService.template_updated',
+        )
+        request_data = {
+            'id': template.id,
+            'name': template.name,
+            'is_active': True,
+            'owners': [
+                {
+                    'type': OwnerType.USER,
+                    'source_id': user.id,
+                    'role': OwnerRole.OWNER,
+                },
+            ],
+            'kickoff': {},
+            'tasks': [
+                {
+                    'id': task.id,
+                    'number': task.number,
+                    'name': task.name,
+                    'api_name': task.api_name,
+                    'raw_performers': [
+                        {
+                            'type': PerformerType.USER,
+                            'source_id': user.id,
+                            'api_name': f'raw-performer-{task.number}',
+                        },
+                    ],
+                }
+                for task in (task_1, task_2)
+            ],
+        }
+        api_client.put(path=f'/templates/{template.id}', data=request_data)
+        request_data['tasks'][0]['name'] = 'Changed first step'
+        save_spy = mocker.spy(TaskTemplate, 'save')
+
+        # act
+        response = api_client.put(
+            path=f'/templates/{template.id}',
+            data=request_data,
+        )
+
+        # assert
+        assert response.status_code == 200
+        assert [call.args[0].id for call in save_spy.call_args_list] == [
+            task_1.id,
+        ]
+        task_1.refresh_from_db()
+        assert task_1.name == 'Changed first step'
+        task_2.refresh_from_db()
+        assert not task_2.is_deleted
+        assert task_2.raw_performers.get().api_name == 'raw-performer-2'
+
 
 class TestUpdateTemplateRawPerformer:
 
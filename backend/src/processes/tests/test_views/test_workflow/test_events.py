@@ -29,7 +29,10 @@ from src.processes.models.templates.fields import (
     FieldTemplate,
 )
 from src.processes.models.templates.owner import TemplateOwner
-from src.processes.models.workflows.event import WorkflowEvent
+from src.processes.models.workflows.event import (
+    WorkflowEvent,
+    WorkflowEventWatched,
+)
 from src.processes.models.workflows.task import (
     Delay,
     TaskPerformer,
@@ -1282,7 +1285,8 @@ def test_retrieve__comment__with_attachment__ok(api_client):
         },
     ]
     assert data['task']['output'] is None
-    assert data['watched'] == []
+    assert data['watched_count'] == 0
+    assert data['is_watched'] is False
     assert data['reactions'] == {}
 
 
@@ -1290,6 +1294,46 @@ def test_retrieve__comment__with_watched__ok(api_client):
 
     # arrange
     user = create_test_user()
+    another_user = create_test_user(
+        email='another@test.test',
+        account=user.account,
+        is_account_owner=False,
+    )
+    workflow = create_test_workflow(user=user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    event = WorkflowEventService.comment_created_event(
+        task=task,
+        user=another_user,
+        text='Some comment',
+        after_create_actions=False,
+    )
+    WorkflowEventWatched.objects.create(
+        event=event,
+        user=user,
+        date=timezone.now(),
+    )
+    api_client.token_authenticate(user)
+
+    # act
+    response = api_client.get(f'/workflows/{workflow.id}/events')
+
+    # assert
+    assert response.status_code == 200
+    data = response.data[0]
+    assert data['watched_count'] == 1
+    assert data['is_watched'] is True
+    assert 'watched' not in data
+
+
+def test_retrieve__comment__watched_by_another_user__ok(api_client):
+
+    # arrange
+    user = create_test_user()
+    another_user = create_test_user(
+        email='another@test.test',
+        account=user.account,
+        is_account_owner=False,
+    )
     workflow = create_test_workflow(user=user, tasks_count=1)
     task = workflow.tasks.get(number=1)
     event = WorkflowEventService.comment_created_event(
@@ -1298,13 +1342,11 @@ def test_retrieve__comment__with_watched__ok(api_client):
         text='Some comment',
         after_create_actions=False,
     )
-    event.watched = [
-        {
-            'date':  timezone.now().strftime('%Y-%m-%dT%H:%M'),
-            'user_id': user.id,
-        },
-    ]
-    event.save()
+    WorkflowEventWatched.objects.create(
+        event=event,
+        user=another_user,
+        date=timezone.now(),
+    )
     api_client.token_authenticate(user)
 
     # act
@@ -1313,9 +1355,8 @@ def test_retrieve__comment__with_watched__ok(api_client):
     # assert
     assert response.status_code == 200
     data = response.data[0]
-    assert len(data['watched']) == 1
-    assert data['watched'][0]['date'] is not None
-    assert data['watched'][0]['user_id'] == user.id
+    assert data['watched_count'] == 1
+    assert data['is_watched'] is False
 
 
 def test_retrieve__comment__with_reaction__ok(api_client):
@@ -2,6 +2,7 @@ from datetime import timedelta
 from django.urls import reverse
 from rest_framework import status
 from string import punctuation
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 from django.utils import timezone
@@ -3703,3 +3704,77 @@ def test_list__filter_current_performer_group_ids__with_group_user__ok(
     assert response.status_code == 200
     assert len(response.data['results']) == 1
     assert response.data['results'][0]['id'] == workflow.id
+
+
+def test_list__cursor__pages_without_count(api_client):
+
+    # arrange
+    user = create_test_user()
+    workflow_1 = create_test_workflow(user, tasks_count=1)
+    workflow_2 = create_test_workflow(user, tasks_count=1)
+    workflow_3 = create_test_workflow(user, tasks_count=1)
+    api_client.token_authenticate(user)
+
+    # act
+    response_1 = api_client.get('/workflows?cursor=&limit=2')
+    cursor = parse_qs(urlparse(response_1.data['next']).query)['cursor'][0]
+    response_2 = api_client.get(f'/workflows?cursor={cursor}&limit=2')
+
+    # assert
+    assert response_1.status_code == 200
+    assert response_1.data['count'] is None
+    assert [w['id'] for w in response_1.data['results']] == [
+        workflow_3.id,
+        workflow_2.id,
+    ]
+    assert response_2.status_code == 200
+    assert [w['id'] for w in response_2.data['results']] == [workflow_1.id]
+    assert response_2.data['next'] is None
+
+
+def test_list__cursor_overdue_first__nulls_last(api_client):
+
+    # arrange
+    user = create_test_user()
+    workflow_1 = create_test_workflow(user, tasks_count=1)
+    workflow_2 = create_test_workflow(user, tasks_count=1)
+    task = workflow_2.tasks.get(number=1)
+    task.due_date = timezone.now() + timedelta(hours=1)
+    task.save(update_fields=['due_date'])
+    workflow_3 = create_test_workflow(user, tasks_count=1)
+    api_client.token_authenticate(user)
+    ids = []
+
+    # act
+    response = api_client.get(
+        '/workflows?ordering=overdue&cursor=&limit=1&with_count=true',
+    )
+    count = response.data['count']
+    while True:
+        ids.extend(w['id'] for w in response.data['results'])
+        if not response.data['next']:
+            break
+        query = parse_qs(urlparse(response.data['next']).query)
+        response = api_client.get(
+            '/workflows?ordering=overdue&limit=1'
+            f'&cursor={query["cursor"][0]}',
+        )
+
+    # assert
+    assert count == 3
+    assert ids[0] == workflow_2.id
+    assert set(ids[1:]) == {workflow_1.id, workflow_3.id}
+
+
+def test_list__invalid_cursor__validation_error(api_client):
+
+    # arrange
+    user = create_test_user()
+    api_client.token_authenticate(user)
+
+    # act
+    response = api_client.get('/workflows?cursor=invalid')
+
+    # assert
+    assert response.status_code == 400
+    assert response.data['code'] == ErrorCode.VALIDATION_ERROR
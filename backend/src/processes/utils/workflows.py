@@ -1,26 +1,33 @@
+from typing import List
+
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.utils import timezone
 
 from src.authentication.enums import AuthTokenType
 from src.processes.enums import TaskStatus
-from src.processes.models.workflows.task import Delay
+from src.processes.models.workflows.task import Delay, Task
 from src.processes.services.workflow_action import WorkflowActionService
 
 UserModel = get_user_model()
 
 
-def resume_delayed_workflows():
-
-    """ Found a tasks with expired delay period and resume them """
-
-    for delay in Delay.objects.filter(
+def _get_expired_delays():
+    return Delay.objects.filter(
         estimated_end_date__lte=timezone.now(),
         end_date__isnull=True,
         task__status=TaskStatus.DELAYED,
-    ).prefetch_related(
-        'task__account',
-        'task__workflow',
-    ):
+    )
+
+
+def _resume_delay(delay: Delay):
+    with transaction.atomic():
+        # The delay can be resumed by the timer and the sweep at once
+        if not Task.objects.select_for_update().filter(
+            id=delay.task_id,
+            status=TaskStatus.DELAYED,
+        ).exists():
+            return
         workflow = delay.task.workflow
         service = WorkflowActionService(
             workflow=workflow,
@@ -29,3 +36,30 @@ def resume_delayed_workflows():
             auth_type=AuthTokenType.USER,
         )
         service.resume_task(delay.task)
+
+
+def get_expired_delay_ids() -> List[int]:
+    return list(_get_expired_delays().values_list('id', flat=True))
+
+
+def resume_delayed_workflow(delay_id: int):
+
+    """ Resume the task if its delay period is expired """
+
+    delay = _get_expired_delays().filter(id=delay_id).select_related(
+        'task__account',
+        'task__workflow',
+    ).first()
+    if delay:
+        _resume_delay(delay)
+
+
+def resume_delayed_workflows():
+
+    """ Found a tasks with expired delay period and resume them """
+
+    for delay in _get_expired_delays().prefetch_related(
+        'task__account',
+        'task__workflow',
+    ):
+        _resume_delay(delay)
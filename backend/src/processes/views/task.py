@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db.models import Prefetch
 from drf_spectacular.utils import extend_schema, extend_schema_view
@@ -22,6 +23,7 @@ from src.generics.filters import PneumaticFilterBackend
 from src.generics.mixins.views import (
     CustomViewSetMixin,
 )
+from src.generics.paginations import KeysetPagination
 from src.generics.permissions import (
     DenyAll,
     IsAuthenticated,
@@ -69,7 +71,7 @@ from src.processes.permissions import (
     TaskWorkflowMemberOrViewerPermission,
     TaskWorkflowOwnerPermission,
 )
-from src.processes.queries import TaskListQuery
+from src.processes.queries import TaskInboxListQuery, TaskListQuery
 from src.processes.serializers.comments import (
     CommentCreateSerializer,
 )
@@ -148,6 +150,7 @@ UserModel = get_user_model()
 class TasksListView(ListAPIView):
 
     serializer_class = TaskListSerializer
+    pagination_class = KeysetPagination
     permission_classes = (
         UserIsAuthenticated,
         ExpiredSubscriptionPermission,
@@ -161,11 +164,21 @@ class TasksListView(ListAPIView):
             context={'user': user},
         )
         filter_slz.is_valid(raise_exception=True)
-        query = TaskListQuery(
-            user=user,
-            **filter_slz.validated_data,
+        data = filter_slz.validated_data
+        if data.get('cursor') is not None:
+            data['limit'] = self.paginator.get_keyset_limit(request)
+        query_class = (
+            TaskInboxListQuery if settings.TASK_INBOX_QUERIES
+            else TaskListQuery
         )
+        query = query_class(user=user, **data)
         self.queryset = TaskForList.objects.execute_raw(query)
+        if query.is_keyset:
+            self.queryset.keyset_query = query
+            if data['with_count']:
+                self.queryset.count = TaskForList.objects.raw(
+                    *query.get_count_sql(),
+                )[0].count
         search_text = filter_slz.validated_data.get('search')
         if search_text:
             AnalyticService.search_search(
@@ -641,6 +654,7 @@ class TaskViewSet(
             .prefetch_related('storage_attachments')
             .on_task(task.id)
             .type_in(WorkflowEventType.TASK_EVENTS)
+            .with_watched(request.user.id)
         )
         qst = self.filter_queryset(qst)
         return self.paginated_response(qst)
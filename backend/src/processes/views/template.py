@@ -9,7 +9,6 @@ from drf_spectacular.utils import (
     extend_schema,
 )
 from rest_framework.decorators import action
-from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.viewsets import GenericViewSet
 
 from src.accounts.permissions import (
@@ -25,6 +24,7 @@ from src.executor import RawSqlExecutor
 from src.generics.mixins.views import (
     CustomViewSetMixin,
 )
+from src.generics.paginations import KeysetPagination
 from src.generics.permissions import UserIsAuthenticated
 from src.openapi import (
     ACCESS_ACCOUNT_OWNER,
@@ -36,6 +36,7 @@ from src.openapi import (
     ACCESS_TEMPLATE_OWNER,
     EMPTY,
     FORBIDDEN,
+    KEYSET_PARAMS,
     LIMIT_OFFSET_LEGACY_NOTE,
     NOT_FOUND,
     TEMPLATE_EXPORT_PARAMS,
@@ -105,6 +106,7 @@ from src.processes.serializers.templates.template import (
     TemplateTitlesSerializer,
 )
 from src.processes.serializers.workflows.workflow import (
+    WorkflowBatchCreateSerializer,
     WorkflowCreateSerializer,
     WorkflowDetailsSerializer,
 )
@@ -148,12 +150,13 @@ class TemplateViewSet(
     CustomViewSetMixin,
     GenericViewSet,
 ):
-    pagination_class = LimitOffsetPagination
+    pagination_class = KeysetPagination
     serializer_class = TemplateSerializer
     action_serializer_classes = {
         'list': TemplateListSerializer,
         'titles_by_owners': TemplateListSerializer,
         'run': WorkflowCreateSerializer,
+        'run_batch': WorkflowBatchCreateSerializer,
         'steps': TemplateStepNameSerializer,
         'ai': TemplateAiSerializer,
         'by_steps': TemplateByStepsSerializer,
@@ -202,7 +205,7 @@ class TemplateViewSet(
                 UserIsAdminOrAccountOwner(),
                 TemplateAdminOwnerPermission(),
             )
-        if self.action == 'run':
+        if self.action in ('run', 'run_batch'):
             return (
                 UserIsAuthenticated(),
                 ExpiredSubscriptionPermission(),
@@ -563,6 +566,7 @@ class TemplateViewSet(
                 location=OpenApiParameter.QUERY,
                 required=False,
             ),
+            *KEYSET_PARAMS,
         ],
         responses={
             # Item serializer; spectacular wraps with pagination.
@@ -580,7 +584,9 @@ class TemplateViewSet(
             pagination occurs at the Python level (not SQL)
 
             SQL pagination (by LIMIT, OFFSET) is not possible because
-            it is impossible to calculate response 'count' value """
+            it is impossible to calculate response 'count' value.
+            With the 'cursor' param the keyset pagination is
+            used at the SQL level, the count is optional """
 
         filter_slz = TemplateListFilterSerializer(data=request.GET)
         filter_slz.is_valid(raise_exception=True)
@@ -588,6 +594,7 @@ class TemplateViewSet(
         data = filter_slz.validated_data
         search_text = data.get('search')
         user = request.user
+        cursor = data.get('cursor')
         queryset = Template.objects.raw_list_query(
             user_id=user.id,
             account_id=user.account_id,
@@ -595,6 +602,12 @@ class TemplateViewSet(
             search=search_text,
             is_active=data.get('is_active'),
             is_public=data.get('is_public'),
+            limit=(
+                self.paginator.get_keyset_limit(request)
+                if cursor is not None else None
+            ),
+            cursor=cursor,
+            with_count=data['with_count'],
         )
         if search_text:
             AnalyticService.search_search(
@@ -706,6 +719,62 @@ class TemplateViewSet(
         slz = WorkflowDetailsSerializer(instance=workflow)
         return self.response_ok(slz.data)
 
+    @extend_schema(
+        tags=['Templates'],
+        summary='Run several workflows from template',
+        description=ACCESS_TEMPLATE_ACCESS,
+        request=WorkflowBatchCreateSerializer,
+        responses={
+            200: WorkflowDetailsSerializer(many=True),
+            400: VALIDATION_ERROR,
+            401: UNAUTHORIZED,
+            403: FORBIDDEN,
+            404: NOT_FOUND,
+        },
+    )
+    @action(methods=['POST'], detail=True, url_path='run-batch')
+    def run_batch(self, request, *args, **kwargs):
+
+        template = self.get_object()
+        request_slz = self.get_serializer(
+            data=request.data,
+            extra_fields={'template': template},
+        )
+        request_slz.is_valid(raise_exception=True)
+        user_agent = get_user_agent(request)
+        workflows = []
+        with transaction.atomic():
+            for data in request_slz.validated_data['workflows']:
+                service = WorkflowService(
+                    user=request.user,
+                    is_superuser=request.is_superuser,
+                    auth_type=request.token_type,
+                )
+                try:
+                    workflow = service.create(
+                        instance_template=template,
+                        kickoff_fields_data=data['kickoff'],
+                        workflow_starter=self.request.user,
+                        user_provided_name=data.get('name'),
+                        is_external=False,
+                        is_urgent=data['is_urgent'],
+                        due_date=data.get('due_date_tsp'),
+                        ancestor_task=data.get('ancestor_task_id'),
+                        user_agent=user_agent,
+                    )
+                except WorkflowServiceException as ex:
+                    raise_validation_error(ex.message)
+                workflow_action_service = WorkflowActionService(
+                    workflow=workflow,
+                    user=request.user,
+                    is_superuser=request.is_superuser,
+                    auth_type=request.token_type,
+                )
+                workflow_action_service.start_workflow()
+                workflows.append(workflow)
+        slz = WorkflowDetailsSerializer(instance=workflows, many=True)
+        return self.response_ok(slz.data)
+
     @extend_schema(
         tags=['Templates'],
         summary='Delete template',
@@ -612,7 +612,9 @@ class WorkflowViewSet(
             'workflow',
         ).on_workflow(
             workflow.id,
-        ).exclude_type(WorkflowEventType.RUN)
+        ).exclude_type(
+            WorkflowEventType.RUN,
+        ).with_watched(request.user.id)
         if self.request.user.type == UserType.GUEST:
             qst = qst.by_task(
                 self.request.task_id,
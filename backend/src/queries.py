@@ -1,5 +1,12 @@
+import math
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Tuple
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from django.utils.dateparse import parse_datetime
+
+from src.generics.messages import MSG_GE_0021
+from src.utils.validation import raise_validation_error
 
 
 class OrderByMixin:
@@ -61,6 +68,148 @@ class OrderByMixin:
         return ''
 
 
+class KeysetPaginationMixin:
+
+    """ Keyset ("seek") pagination for the outer select of list queries
+
+        Instead of OFFSET the query continues after the last row
+        of the previous page:
+            WHERE (k1, k2, id) > (v1, v2, last_id)
+        expanded column by column because the columns may have
+        different directions. Postgres does not have to materialize
+        and discard every preceding row.
+
+        Nullable keys are compared as COALESCE(key, 'infinity'):
+        it keeps the default NULL placement (last for ASC,
+        first for DESC).
+
+        Float keys are "real" values (e.g. ts_rank) which are passed
+        as text and cast back to "real", so the value from the cursor
+        is equal to the column and the rows with the same rank are not
+        skipped or repeated.
+
+        The cursor is a dict {field: value} of the last returned row.
+        A cursor which does not contain all keys of the current
+        ordering (e.g. the ordering was changed) starts from
+        the first page, a cursor value of a wrong type
+        is a validation error. """
+
+    keyset_alias: Optional[str] = None
+    keyset_nullable: FrozenSet[str] = frozenset()
+    # Cursor values types, datetimes are in the ISO format
+    keyset_types: Dict[str, type] = {
+        'id': int,
+        'search_rank': float,
+        'is_urgent': bool,
+        'is_active': bool,
+        'workflows_count': int,
+        'name': str,
+        'date_created': datetime,
+        'date_started': datetime,
+        'date_completed': datetime,
+        'due_date': datetime,
+        'nearest_due_date': datetime,
+        'created': datetime,
+    }
+    is_keyset = False
+    keyset_values: Optional[List[Any]] = None
+
+    def get_keyset_columns(self) -> List[Tuple[str, bool]]:
+
+        """ Returns (field, is_descending) pairs of the ordering.
+            The last one should be unique, e.g. the row id """
+
+        raise NotImplementedError
+
+    def _set_keyset_cursor(self, cursor: Optional[Dict[str, Any]]):
+        self.is_keyset = cursor is not None
+        self.keyset_values = None
+        if not cursor:
+            return
+        fields = [field for field, _ in self.get_keyset_columns()]
+        if not all(field in cursor for field in fields):
+            return
+        for field in fields:
+            if not self._is_keyset_value_valid(field, cursor[field]):
+                raise_validation_error(message=MSG_GE_0021, name='cursor')
+        self.keyset_values = [cursor[field] for field in fields]
+
+    def _is_keyset_value_valid(self, field: str, value: Any) -> bool:
+        if value is None:
+            return field in self.keyset_nullable
+        value_type = self.keyset_types.get(field)
+        if value_type is bool:
+            return isinstance(value, bool)
+        if isinstance(value, bool):
+            return False
+        if value_type is int:
+            return isinstance(value, int) and -2 ** 63 <= value < 2 ** 63
+        if value_type is float:
+            return isinstance(value, (int, float)) and math.isfinite(value)
+        if not isinstance(value, str) or '\x00' in value:
+            return False
+        if value_type is datetime:
+            try:
+                return parse_datetime(value) is not None
+            except ValueError:
+                return False
+        return value_type is str
+
+    def _get_keyset_param(self, field: str, index: int) -> str:
+        if self.keyset_types.get(field) is float:
+            return f'CAST(%(keyset_{index})s AS real)'
+        return f'%(keyset_{index})s'
+
+    def _get_keyset_expression(self, field: str) -> str:
+        column = f'{self.keyset_alias}.{field}'
+        if field in self.keyset_nullable:
+            return f"COALESCE({column}, 'infinity')"
+        return column
+
+    def get_keyset_order_by(self) -> str:
+        columns = ', '.join(
+            f'{self._get_keyset_expression(field)} '
+            f'{"DESC" if is_desc else "ASC"}'
+            for field, is_desc in self.get_keyset_columns()
+        )
+        return f'ORDER BY {columns}'
+
+    def get_keyset_where(self) -> str:
+        if not self.keyset_values:
+            return ''
+        columns = self.get_keyset_columns()
+        conditions = []
+        for i, (field, is_desc) in enumerate(columns):
+            value = self.keyset_values[i]
+            if value is None and field in self.keyset_nullable:
+                value = 'infinity'
+            elif self.keyset_types.get(field) is float:
+                # The shortest repr is read back as the same "real"
+                value = repr(float(value))
+            self.params[f'keyset_{i}'] = value
+            parts = [
+                f'{self._get_keyset_expression(prev_field)} = '
+                f'{self._get_keyset_param(prev_field, j)}'
+                for j, (prev_field, _) in enumerate(columns[:i])
+            ]
+            parts.append(
+                f'{self._get_keyset_expression(field)} '
+                f'{"<" if is_desc else ">"} '
+                f'{self._get_keyset_param(field, i)}',
+            )
+            conditions.append(f'({" AND ".join(parts)})')
+        return f'WHERE {" OR ".join(conditions)}'
+
+    def get_keyset_cursor(self, row) -> Dict[str, Any]:
+
+        """ Returns the cursor pointing after the given row """
+
+        return {
+            field: getattr(row, field)
+            for field, _ in self.get_keyset_columns()
+        }
+
+
 class SqlQueryObject(ABC):
 
     @abstractmethod
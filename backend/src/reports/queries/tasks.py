@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 from django.utils import timezone
 
@@ -369,9 +369,13 @@ class TasksDigestQuery(
         date_to: datetime,
         user_id: Optional[int],
         force: bool = False,
+        from_inbox: bool = False,
+        users_range: Optional[Tuple[int, int]] = None,
     ):
         self._force = force
         self._user_id = user_id
+        self._users_range = users_range
+        self._from_inbox = from_inbox
         self.params = {
             'date_from_tsp': date_from,
             'date_to_tsp': date_to,
@@ -394,8 +398,56 @@ class TasksDigestQuery(
         if self._user_id is not None:
             where = 'AND au.id = %(user_id)s '
             self.params['user_id'] = self._user_id
+        if self._users_range is not None:
+            where += 'AND au.id BETWEEN %(user_id_from)s AND %(user_id_to)s '
+            self.params['user_id_from'], self.params['user_id_to'] = (
+                self._users_range
+            )
         return where
 
+    def _get_from(self):
+
+        """ The task_inbox projection already has one row
+            per user and task, the group performers are expanded """
+
+        if self._from_inbox:
+            return """
+            FROM task_inbox ti
+            JOIN processes_task pt ON pt.id = ti.task_id
+            JOIN processes_workflow pw ON pt.workflow_id = pw.id
+            JOIN processes_template ptmp ON pw.template_id = ptmp.id
+            JOIN processes_tasktemplate tt
+              ON pt.api_name = tt.api_name
+              AND ptmp.id = tt.template_id
+            JOIN accounts_user au ON au.id = ti.user_id
+            JOIN accounts_account aa ON au.account_id = aa.id
+            """
+        return """
+        FROM processes_task pt
+        JOIN processes_taskperformer ptp ON pt.id = ptp.task_id
+        JOIN processes_workflow pw ON pt.workflow_id = pw.id
+        JOIN processes_template ptmp ON pw.template_id = ptmp.id
+        JOIN processes_tasktemplate tt
+          ON pt.api_name = tt.api_name
+          AND ptmp.id = tt.template_id
+        LEFT JOIN accounts_usergroup_users augu ON (
+          augu.usergroup_id = ptp.group_id
+        )
+        JOIN accounts_user au ON (
+          ptp.user_id = au.id OR
+          augu.user_id = au.id
+        )
+        JOIN accounts_account aa ON au.account_id = aa.id
+        """
+
+    def _get_performer_where(self):
+        if self._from_inbox:
+            return ''
+        return f"""
+          AND {self._assignment_performer_type_clause()}
+          AND ptp.directly_status NOT IN ('{DirectlyStatus.DELETED}')
+        """
+
     def get_sql(self):
         return f"""
         SELECT
@@ -417,21 +469,7 @@ class TasksDigestQuery(
           COUNT(DISTINCT pt.id) FILTER (
             {self._overdue_tasks_clause()}
           ) AS overdue
-        FROM processes_task pt
-        JOIN processes_taskperformer ptp ON pt.id = ptp.task_id
-        JOIN processes_workflow pw ON pt.workflow_id = pw.id
-        JOIN processes_template ptmp ON pw.template_id = ptmp.id
-        JOIN processes_tasktemplate tt
-          ON pt.api_name = tt.api_name
-          AND ptmp.id = tt.template_id
-        LEFT JOIN accounts_usergroup_users augu ON (
-          augu.usergroup_id = ptp.group_id
-        )
-        JOIN accounts_user au ON (
-          ptp.user_id = au.id OR
-          augu.user_id = au.id
-        )
-        JOIN accounts_account aa ON au.account_id = aa.id
+        {self._get_from()}
         WHERE
           ptmp.is_deleted IS FALSE AND
           ptmp.type IN ('{TemplateType.CUSTOM}', '{TemplateType.LIBRARY}') AND
@@ -439,9 +477,8 @@ class TasksDigestQuery(
           pw.is_deleted IS FALSE AND
           tt.is_deleted IS FALSE AND
           au.is_deleted IS FALSE AND
-          au.status = '{UserStatus.ACTIVE}' AND
-          {self._assignment_performer_type_clause()} AND
-          ptp.directly_status NOT IN ('{DirectlyStatus.DELETED}')
+          au.status = '{UserStatus.ACTIVE}'
+          {self._get_performer_where()}
           {self._get_subscriber_where()}
           {self._get_user_where()}
         GROUP BY au.id, ptmp.id, tt.id
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 from django.utils import timezone
 
@@ -246,9 +246,11 @@ class WorkflowDigestQuery(
         date_to: datetime,
         user_id: Optional[int],
         force=False,
+        users_range: Optional[Tuple[int, int]] = None,
     ):
         self._force = force
         self._user_id = user_id
+        self._users_range = users_range
         self.params = {
             'date_from_tsp': date_from,
             'date_to_tsp': date_to,
@@ -276,6 +278,11 @@ class WorkflowDigestQuery(
         if self._user_id is not None:
             where = 'AND au.id = %(user_id)s '
             self.params['user_id'] = self._user_id
+        if self._users_range is not None:
+            where += 'AND au.id BETWEEN %(user_id_from)s AND %(user_id_to)s '
+            self.params['user_id_from'], self.params['user_id_to'] = (
+                self._users_range
+            )
         return where
 
     def get_sql(self):
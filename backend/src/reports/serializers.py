@@ -1,7 +1,7 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
-from src.generics.fields import TimeStampField
+from src.generics.fields import KeysetCursorField, TimeStampField
 from src.generics.mixins.serializers import (
     CustomValidationErrorMixin,
     ValidationUtilsMixin,
@@ -88,6 +88,7 @@ class HighlightsFilterSerializer(
     current_performer_group_ids = serializers.CharField(required=False)
     date_before_tsp = TimeStampField(required=False, allow_null=True)
     date_after_tsp = TimeStampField(required=False, allow_null=True)
+    cursor = KeysetCursorField(required=False)
 
     def validate_users(self, value):
         return self.get_valid_list_integers(value)
@@ -1,17 +1,120 @@
 from abc import ABC, abstractmethod
+from contextlib import suppress
+from dataclasses import asdict
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
 
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from src.generics.mixins.services import ClsCacheMixin
 
 UserModel = get_user_model()
 
 
+class DigestRun(ClsCacheMixin):
+
+    """ State of a digest run split into shards of users.
+        Shards are sent by parallel celery tasks, each of them
+        saves its timing and the number of the sent digests. """
+
+    cache_key_prefix = 'digest_run'
+    cache_timeout = 86400 * 7  # 1 week
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+
+    def _get_key(self, name: str) -> str:
+        return f'{self.run_id}:{name}'
+
+    @classmethod
+    def create(cls, kind: str, shards_count: int) -> 'DigestRun':
+        run = cls(run_id=f'{kind}:{int(timezone.now().timestamp())}')
+        run._set_cache(value=shards_count, key=run._get_key('total'))
+        run._set_cache(value=0, key=run._get_key('finished'))
+        run._set_cache(value=0, key=run._get_key('sent'))
+        cls._set_cache(value=run.run_id, key=f'{kind}:last')
+        return run
+
+    @classmethod
+    def get_last(cls, kind: str) -> Optional['DigestRun']:
+        run_id = cls._get_cache(key=f'{kind}:last')
+        return cls(run_id) if run_id else None
+
+    def finish_shard(
+        self,
+        shard_id: int,
+        sent: int,
+        duration: float,
+    ) -> bool:
+
+        """ Returns 'True' if it was the last unfinished shard """
+
+        self._set_cache(
+            value={'sent': sent, 'duration': duration},
+            key=self._get_key(f'shard_{shard_id}'),
+        )
+        finished = None
+        # ValueError if the run is expired
+        with suppress(ValueError):
+            if sent:
+                self.cache.incr(
+                    self._get_cache_key(self._get_key('sent')),
+                    sent,
+                )
+            finished = self.cache.incr(
+                self._get_cache_key(self._get_key('finished')),
+            )
+        return finished == self._get_cache(key=self._get_key('total'))
+
+    def get_metrics(self) -> dict:
+        total = self._get_cache(key=self._get_key('total'))
+        return {
+            'total': total,
+            'finished': self._get_cache(key=self._get_key('finished')),
+            'sent': self._get_cache(key=self._get_key('sent')),
+            'shards': [
+                self._get_cache(key=self._get_key(f'shard_{shard_id}'))
+                for shard_id in range(total or 0)
+            ],
+        }
+
+
 class SendDigest(ABC):
 
-    def __init__(self, user_id=None, force=False):
+    # The field with the time of the last sent digest
+    last_send_time_field = None
+    subscriber_field = None
+    shard_size = 1000
+
+    def __init__(
+        self,
+        user_id=None,
+        force=False,
+        users_range: Optional[Tuple[int, int]] = None,
+    ):
         self._user_id = user_id
         self._force = force
+        self._users_range = users_range
         self._sent_digests_count = 0
 
+    @classmethod
+    def get_shards(cls) -> List[Tuple[int, int]]:
+
+        """ Returns the subscribers ids ranges with shard_size
+            users in each of them """
+
+        user_ids = list(
+            UserModel.objects.filter(
+                **{cls.subscriber_field: True},
+            ).order_by('id').values_list('id', flat=True),
+        )
+        chunks = (
+            user_ids[i:i + cls.shard_size]
+            for i in range(0, len(user_ids), cls.shard_size)
+        )
+        return [(chunk[0], chunk[-1]) for chunk in chunks]
+
     @abstractmethod
     def _fetch_data(self):
         pass
@@ -20,6 +123,40 @@ class SendDigest(ABC):
     def _process_data(self, data):
         pass
 
+    @abstractmethod
+    def _send_notifications(self, notifications: List[dict]):
+
+        """ Sends the digests of the chunk users in one celery task """
+
+    def _send_emails(self, digests: Dict[int, object]):
+        users = UserModel.objects.select_related(
+            'account',
+        ).by_ids(list(digests.keys()))
+        notifications = []
+        for user in users:
+            digest = digests.get(user.id)
+            if digest:
+                notifications.append({
+                    'user_id': user.id,
+                    'user_email': user.email,
+                    'account_id': user.account_id,
+                    'date_from': self._date_from.strftime('%d %b'),
+                    'date_to': (
+                        (self._date_to - timedelta(days=1))
+                        .strftime('%d %b, %Y')
+                    ),
+                    'digest': asdict(digest),
+                    'logo_lg': user.account.logo_lg,
+                })
+        if not notifications:
+            return
+        self._send_notifications(notifications)
+        user_ids = [notification['user_id'] for notification in notifications]
+        UserModel.objects.filter(id__in=user_ids).update(
+            **{self.last_send_time_field: self._now},
+        )
+        self._sent_digests_count += len(notifications)
+
     def send_digest(self):
         data = self._fetch_data()
         self._process_data(data)
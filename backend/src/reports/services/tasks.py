@@ -1,7 +1,6 @@
 from collections import defaultdict
-from dataclasses import asdict
 from datetime import timedelta
-from typing import Dict
+from typing import List, Optional, Tuple
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -23,15 +22,24 @@ from src.reports.queries.tasks import (
 from src.reports.services.base import (
     SendDigest,
 )
-from src.notifications.tasks import send_tasks_digest_notification
+from src.notifications.tasks import send_tasks_digest_notifications
 
 UserModel = get_user_model()
 
 
 class SendTasksDigest(SendDigest):
 
-    def __init__(self, user_id=None, force=None, fetch_size=50):
-        super().__init__(user_id, force)
+    last_send_time_field = 'last_tasks_digest_send_time'
+    subscriber_field = 'is_tasks_digest_subscriber'
+
+    def __init__(
+        self,
+        user_id=None,
+        force=None,
+        fetch_size=50,
+        users_range: Optional[Tuple[int, int]] = None,
+    ):
+        super().__init__(user_id, force, users_range)
         self._now = timezone.now()
         self._date_from = self._now.date() - timedelta(days=7)
         self._date_to = self._now
@@ -43,6 +51,8 @@ class SendTasksDigest(SendDigest):
             date_to=self._date_to,
             user_id=self._user_id,
             force=self._force,
+            from_inbox=settings.TASK_INBOX_QUERIES,
+            users_range=self._users_range,
         )
         sql, params = query.get_sql()
         return RawSqlExecutor.fetch(
@@ -113,31 +123,10 @@ class SendTasksDigest(SendDigest):
         user_digest.overdue += row['overdue']
         user_digest.completed += row['completed']
 
-    def _send_emails(self, digests: Dict[int, TasksDigest]):
-        users = UserModel.objects.select_related(
-            'account',
-        ).by_ids(list(digests.keys()))
-        for user in users:
-            digest = digests.get(user.id)
-
-            if digest:
-                send_tasks_digest_notification.delay(
-                    user_id=user.id,
-                    user_email=user.email,
-                    account_id=user.account_id,
-                    date_from=self._date_from.strftime('%d %b'),
-                    date_to=(
-                        (self._date_to - timedelta(days=1))
-                        .strftime('%d %b, %Y')
-                    ),
-                    digest=asdict(digest),
-                    logo_lg=user.account.logo_lg,
-                )
-                user.last_tasks_digest_send_time = self._now
-                user.save(update_fields=['last_tasks_digest_send_time'])
-                self._sent_digests_count += 1
+    def _send_notifications(self, notifications: List[dict]):
+        send_tasks_digest_notifications.delay(notifications=notifications)
 
-    def _process_data(self, data, bulk_size=10):
+    def _process_data(self, data, bulk_size=100):
         users_count = 0
         user_id = None
         digests = defaultdict(TasksDigest)
@@ -1,7 +1,6 @@
 from collections import defaultdict
-from dataclasses import asdict
 from datetime import timedelta
-from typing import Dict
+from typing import List, Optional, Tuple
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -18,15 +17,24 @@ from src.reports.queries.workflows import (
 from src.reports.services.base import (
     SendDigest,
 )
-from src.notifications.tasks import send_workflows_digest_notification
+from src.notifications.tasks import send_workflows_digest_notifications
 
 UserModel = get_user_model()
 
 
 class SendWorkflowsDigest(SendDigest):
 
-    def __init__(self, user_id=None, force=False, fetch_size=50):
-        super().__init__(user_id, force)
+    last_send_time_field = 'last_digest_send_time'
+    subscriber_field = 'is_digest_subscriber'
+
+    def __init__(
+        self,
+        user_id=None,
+        force=False,
+        fetch_size=50,
+        users_range: Optional[Tuple[int, int]] = None,
+    ):
+        super().__init__(user_id, force, users_range)
         self._fetch_size = fetch_size
         self._now = timezone.now()
         current_week_monday = (
@@ -41,6 +49,7 @@ class SendWorkflowsDigest(SendDigest):
             date_to=self._date_to,
             user_id=self._user_id,
             force=self._force,
+            users_range=self._users_range,
         )
         return RawSqlExecutor.fetch(
             *query.get_sql(),
@@ -65,30 +74,10 @@ class SendWorkflowsDigest(SendDigest):
             ),
         )
 
-    def _send_emails(self, digests: Dict[int, WorkflowsDigest]):
-        users = UserModel.objects.select_related(
-            'account',
-        ).by_ids(list(digests.keys()))
-        for user in users:
-            digest = digests.get(user.id)
-            if digest:
-                send_workflows_digest_notification.delay(
-                    user_id=user.id,
-                    user_email=user.email,
-                    account_id=user.account_id,
-                    date_from=self._date_from.strftime('%d %b'),
-                    date_to=(
-                        (self._date_to - timedelta(days=1))
-                        .strftime('%d %b, %Y')
-                    ),
-                    digest=asdict(digest),
-                    logo_lg=user.account.logo_lg,
-                )
-                user.last_digest_send_time = self._now
-                user.save(update_fields=['last_digest_send_time'])
-                self._sent_digests_count += 1
+    def _send_notifications(self, notifications: List[dict]):
+        send_workflows_digest_notifications.delay(notifications=notifications)
 
-    def _process_data(self, data, bulk_size=10):
+    def _process_data(self, data, bulk_size=100):
         users_count = 0
         user_id = None
         digests = defaultdict(WorkflowsDigest)
@@ -1,43 +1,157 @@
-from celery import shared_task
+import time
+from typing import Optional, Tuple, Type
+
+from celery import group, shared_task
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from slack import WebClient
 
+from src.reports.services.base import DigestRun, SendDigest
 from src.reports.services.tasks import SendTasksDigest
 from src.reports.services.workflows import SendWorkflowsDigest
 
 UserModel = get_user_model()
 
 
+def _slack_digest_enabled() -> bool:
+    return bool(settings.SLACK and settings.SLACK_CONFIG['DIGEST_CHANNEL'])
+
+
+def _start_digest_shards(
+    sender_cls: Type[SendDigest],
+    shard_task,
+    kind: str,
+    force: bool,
+    fetch_size: int,
+) -> bool:
+
+    """ Splits the subscribers into shards sent in parallel
+        Returns 'False' if there is nobody to send """
+
+    shards = sender_cls.get_shards()
+    if not shards:
+        return False
+    run = DigestRun.create(kind=kind, shards_count=len(shards))
+    group(
+        shard_task.si(
+            run_id=run.run_id,
+            shard_id=shard_id,
+            users_range=users_range,
+            force=force,
+            fetch_size=fetch_size,
+        )
+        for shard_id, users_range in enumerate(shards)
+    ).apply_async()
+    return True
+
+
+def _send_digest_shard(
+    sender_cls: Type[SendDigest],
+    run_id: str,
+    shard_id: int,
+    users_range: Tuple[int, int],
+    force: bool,
+    fetch_size: int,
+) -> Optional[int]:
+
+    """ Returns the number of digests sent by the whole run
+        if it was the last unfinished shard """
+
+    started = time.monotonic()
+    sender = sender_cls(
+        force=force,
+        fetch_size=fetch_size,
+        users_range=tuple(users_range),
+    )
+    count_digests_sent = sender.send_digest()
+    run = DigestRun(run_id)
+    is_last = run.finish_shard(
+        shard_id=shard_id,
+        sent=count_digests_sent,
+        duration=time.monotonic() - started,
+    )
+    if is_last:
+        return run.get_metrics()['sent']
+    return None
+
+
 @shared_task(ignore_result=True)
 def send_digest(user_id=None, force=False, fetch_size=50) -> None:
-    sender = SendWorkflowsDigest(
-        user_id=user_id,
+    if user_id:
+        SendWorkflowsDigest(
+            user_id=user_id,
+            force=force,
+            fetch_size=fetch_size,
+        ).send_digest()
+        return
+    started = _start_digest_shards(
+        sender_cls=SendWorkflowsDigest,
+        shard_task=send_digest_shard,
+        kind='workflows',
         force=force,
         fetch_size=fetch_size,
     )
-    count_digests_sent = sender.send_digest()
-    if (
-        not user_id
-        and settings.SLACK
-        and settings.SLACK_CONFIG['DIGEST_CHANNEL']
-    ):
+    if not started and _slack_digest_enabled():
+        send_digest_notification.delay(0)
+
+
+@shared_task(ignore_result=True)
+def send_digest_shard(
+    run_id: str,
+    shard_id: int,
+    users_range: Tuple[int, int],
+    force=False,
+    fetch_size=50,
+) -> None:
+    count_digests_sent = _send_digest_shard(
+        sender_cls=SendWorkflowsDigest,
+        run_id=run_id,
+        shard_id=shard_id,
+        users_range=users_range,
+        force=force,
+        fetch_size=fetch_size,
+    )
+    if count_digests_sent is not None and _slack_digest_enabled():
         send_digest_notification.delay(count_digests_sent)
 
 
 @shared_task(ignore_result=True)
 def send_tasks_digest(user_id=None, force=False, fetch_size=50) -> None:
-    sender = SendTasksDigest(
-        user_id=user_id,
+    if user_id:
+        SendTasksDigest(
+            user_id=user_id,
+            force=force,
+            fetch_size=fetch_size,
+        ).send_digest()
+        return
+    started = _start_digest_shards(
+        sender_cls=SendTasksDigest,
+        shard_task=send_tasks_digest_shard,
+        kind='tasks',
         force=force,
         fetch_size=fetch_size,
     )
-    count_digests_sent = sender.send_digest()
-    if (
-        not user_id
-        and settings.SLACK
-        and settings.SLACK_CONFIG['DIGEST_CHANNEL']
-    ):
+    if not started and _slack_digest_enabled():
+        send_tasks_digest_notification.delay(0)
+
+
+@shared_task(ignore_result=True)
+def send_tasks_digest_shard(
+    run_id: str,
+    shard_id: int,
+    users_range: Tuple[int, int],
+    force=False,
+    fetch_size=50,
+) -> None:
+    count_digests_sent = _send_digest_shard(
+        sender_cls=SendTasksDigest,
+        run_id=run_id,
+        shard_id=shard_id,
+        users_range=users_range,
+        force=force,
+        fetch_size=fetch_size,
+    )
+    if count_digests_sent is not None and _slack_digest_enabled():
         send_tasks_digest_notification.delay(count_digests_sent)
 
 
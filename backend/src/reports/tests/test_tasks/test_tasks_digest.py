@@ -115,7 +115,7 @@ class TestSendTasksDigest:
         second_workflow.save()
         email_service_tasks_digest = mocker.patch(
             'src.notifications.tasks.'
-            'send_tasks_digest_notification.delay',
+            'send_tasks_digest_notifications.delay',
         )
 
         # act
@@ -127,72 +127,78 @@ class TestSendTasksDigest:
         st_second_task = template_2.tasks.get(number=2)
         st_third_task = template_2.tasks.get(number=3)
         email_service_tasks_digest.assert_called_with(
-            user_id=user.id,
-            user_email=user.email,
-            account_id=user.account_id,
-            date_to=(date_to - timedelta(days=1)).strftime('%d %b, %Y'),
-            date_from=date_from.strftime('%d %b'),
-            digest={
-                'started': 5,
-                'in_progress': 5,
-                'overdue': 0,
-                'completed': 3,
-                'templates': [
-                    {
-                        'started': 4,
-                        'in_progress': 4,
+            notifications=[
+                {
+                    'user_id': user.id,
+                    'user_email': user.email,
+                    'account_id': user.account_id,
+                    'date_to': (
+                        (date_to - timedelta(days=1)).strftime('%d %b, %Y')
+                    ),
+                    'date_from': date_from.strftime('%d %b'),
+                    'digest': {
+                        'started': 5,
+                        'in_progress': 5,
                         'overdue': 0,
                         'completed': 3,
-                        'template_name': template_2.name,
-                        'template_id': template_2.id,
-                        'tasks': [
-                            {
-                                'task_id': st_first_task.id,
-                                'task_name': 'First Test',
-                                'started': 2,
-                                'in_progress': 2,
-                                'overdue': 0,
-                                'completed': 1,
-                            },
+                        'templates': [
                             {
-                                'task_id': st_second_task.id,
-                                'task_name': 'Second',
-                                'started': 1,
-                                'in_progress': 1,
+                                'started': 4,
+                                'in_progress': 4,
                                 'overdue': 0,
-                                'completed': 1,
+                                'completed': 3,
+                                'template_name': template_2.name,
+                                'template_id': template_2.id,
+                                'tasks': [
+                                    {
+                                        'task_id': st_first_task.id,
+                                        'task_name': 'First Test',
+                                        'started': 2,
+                                        'in_progress': 2,
+                                        'overdue': 0,
+                                        'completed': 1,
+                                    },
+                                    {
+                                        'task_id': st_second_task.id,
+                                        'task_name': 'Second',
+                                        'started': 1,
+                                        'in_progress': 1,
+                                        'overdue': 0,
+                                        'completed': 1,
+                                    },
+                                    {
+                                        'task_id': st_third_task.id,
+                                        'task_name': 'Third',
+                                        'started': 1,
+                                        'in_progress': 1,
+                                        'overdue': 0,
+                                        'completed': 1,
+                                    },
+                                ],
                             },
                             {
-                                'task_id': st_third_task.id,
-                                'task_name': 'Third',
-                                'started': 1,
-                                'in_progress': 1,
-                                'overdue': 0,
-                                'completed': 1,
-                            },
-                        ],
-                    },
-                    {
-                        'started': 1,
-                        'in_progress': 1,
-                        'overdue': 0,
-                        'completed': 0,
-                        'template_name': template_1.name,
-                        'template_id': template_1.id,
-                        'tasks': [
-                            {
-                                'task_id': ft_first_task.id,
-                                'task_name': 'First Test',
                                 'started': 1,
                                 'in_progress': 1,
                                 'overdue': 0,
                                 'completed': 0,
+                                'template_name': template_1.name,
+                                'template_id': template_1.id,
+                                'tasks': [
+                                    {
+                                        'task_id': ft_first_task.id,
+                                        'task_name': 'First Test',
+                                        'started': 1,
+                                        'in_progress': 1,
+                                        'overdue': 0,
+                                        'completed': 0,
+                                    },
+                                ],
                             },
                         ],
                     },
-                ],
-            },
-            logo_lg=None,
+                    'logo_lg': None,
+                },
+            ],
         )
 
     def test_send__deleted_performer__no_sent(
@@ -241,7 +247,7 @@ class TestSendTasksDigest:
         )
         email_service_tasks_digest = mocker.patch(
             'src.notifications.tasks.'
-            'send_tasks_digest_notification.delay',
+            'send_tasks_digest_notifications.delay',
         )
 
         # act
@@ -250,38 +256,44 @@ class TestSendTasksDigest:
         # assert
         datetime_patch.assert_called()
         email_service_tasks_digest.assert_called_once_with(
-            user_id=template_owner.id,
-            user_email=template_owner.email,
-            account_id=template_owner.account_id,
-            date_to=(date_to - timedelta(days=1)).strftime('%d %b, %Y'),
-            date_from=date_from.strftime('%d %b'),
-            digest={
-                'started': 1,
-                'in_progress': 1,
-                'overdue': 0,
-                'completed': 0,
-                'templates': [
-                    {
-                        'template_id': template.id,
-                        'template_name': template.name,
+            notifications=[
+                {
+                    'user_id': template_owner.id,
+                    'user_email': template_owner.email,
+                    'account_id': template_owner.account_id,
+                    'date_to': (
+                        (date_to - timedelta(days=1)).strftime('%d %b, %Y')
+                    ),
+                    'date_from': date_from.strftime('%d %b'),
+                    'digest': {
                         'started': 1,
                         'in_progress': 1,
                         'overdue': 0,
                         'completed': 0,
-                        'tasks': [
+                        'templates': [
                             {
-                                'task_id': task_template.id,
-                                'task_name': task_template.name,
+                                'template_id': template.id,
+                                'template_name': template.name,
                                 'started': 1,
                                 'in_progress': 1,
                                 'overdue': 0,
                                 'completed': 0,
+                                'tasks': [
+                                    {
+                                        'task_id': task_template.id,
+                                        'task_name': task_template.name,
+                                        'started': 1,
+                                        'in_progress': 1,
+                                        'overdue': 0,
+                                        'completed': 0,
+                                    },
+                                ],
                             },
                         ],
                     },
-                ],
-            },
-            logo_lg=None,
+                    'logo_lg': None,
+                },
+            ],
         )
 
     def test_send__already_sent__not_sent_again(
@@ -346,7 +358,7 @@ class TestSendTasksDigest:
             )
         email_service_tasks_digest = mocker.patch(
             'src.notifications.tasks.'
-            'send_tasks_digest_notification.delay',
+            'send_tasks_digest_notifications.delay',
         )
 
         # act
@@ -396,7 +408,7 @@ class TestSendTasksDigest:
         )
         email_service_tasks_digest = mocker.patch(
             'src.notifications.tasks.'
-            'send_tasks_digest_notification.delay',
+            'send_tasks_digest_notifications.delay',
         )
 
         # act
@@ -405,38 +417,44 @@ class TestSendTasksDigest:
         # assert
         task_1 = template_2.tasks.get(number=1)
         email_service_tasks_digest.assert_called_with(
-            user_id=user.id,
-            user_email=user.email,
-            account_id=user.account_id,
-            date_to=(date_to - timedelta(days=1)).strftime('%d %b, %Y'),
-            date_from=date_from.strftime('%d %b'),
-            digest={
-                'started': 1,
-                'in_progress': 1,
-                'overdue': 0,
-                'completed': 0,
-                'templates': [
-                    {
+            notifications=[
+                {
+                    'user_id': user.id,
+                    'user_email': user.email,
+                    'account_id': user.account_id,
+                    'date_to': (
+                        (date_to - timedelta(days=1)).strftime('%d %b, %Y')
+                    ),
+                    'date_from': date_from.strftime('%d %b'),
+                    'digest': {
                         'started': 1,
                         'in_progress': 1,
                         'overdue': 0,
                         'completed': 0,
-                        'template_name': template_2.name,
-                        'template_id': template_2.id,
-                        'tasks': [
+                        'templates': [
                             {
-                                'task_id': task_1.id,
-                                'task_name': 'First Test',
                                 'started': 1,
                                 'in_progress': 1,
                                 'overdue': 0,
                                 'completed': 0,
+                                'template_name': template_2.name,
+                                'template_id': template_2.id,
+                                'tasks': [
+                                    {
+                                        'task_id': task_1.id,
+                                        'task_name': 'First Test',
+                                        'started': 1,
+                                        'in_progress': 1,
+                                        'overdue': 0,
+                                        'completed': 0,
+                                    },
+                                ],
                             },
                         ],
                     },
-                ],
-            },
-            logo_lg=None,
+                    'logo_lg': None,
+                },
+            ],
         )
 
     def test_send__total_in_progress_is_nil__not_sent(
@@ -458,7 +476,7 @@ class TestSendTasksDigest:
         api_client.post('/templates', data=template_data)
         email_service_tasks_digest = mocker.patch(
             'src.notifications.tasks.'
-            'send_tasks_digest_notification.delay',
+            'send_tasks_digest_notifications.delay',
         )
 
         # act
@@ -558,7 +576,7 @@ class TestSendTasksDigest:
         second_workflow.save()
         email_service_tasks_digest = mocker.patch(
             'src.notifications.tasks.'
-            'send_tasks_digest_notification.delay',
+            'send_tasks_digest_notifications.delay',
         )
 
         # act
@@ -569,54 +587,60 @@ class TestSendTasksDigest:
         task_2 = template_2.tasks.get(number=2)
         task_3 = template_2.tasks.get(number=3)
         email_service_tasks_digest.assert_called_with(
-            user_id=user.id,
-            user_email=user.email,
-            account_id=user.account_id,
-            date_to=(date_to - timedelta(days=1)).strftime('%d %b, %Y'),
-            date_from=date_from.strftime('%d %b'),
-            digest={
-                'started': 4,
-                'in_progress': 4,
-                'overdue': 0,
-                'completed': 3,
-                'templates': [
-                    {
+            notifications=[
+                {
+                    'user_id': user.id,
+                    'user_email': user.email,
+                    'account_id': user.account_id,
+                    'date_to': (
+                        (date_to - timedelta(days=1)).strftime('%d %b, %Y')
+                    ),
+                    'date_from': date_from.strftime('%d %b'),
+                    'digest': {
                         'started': 4,
                         'in_progress': 4,
                         'overdue': 0,
                         'completed': 3,
-                        'template_name': template_2.name,
-                        'template_id': template_2.id,
-                        'tasks': [
-                            {
-                                'task_id': task_1.id,
-                                'task_name': 'First Test',
-                                'started': 2,
-                                'in_progress': 2,
-                                'overdue': 0,
-                                'completed': 1,
-                            },
-                            {
-                                'task_id': task_2.id,
-                                'task_name': 'Second',
-                                'started': 1,
-                                'in_progress': 1,
-                                'overdue': 0,
-                                'completed': 1,
-                            },
+                        'templates': [
                             {
-                                'task_id': task_3.id,
-                                'task_name': 'Third',
-                                'started': 1,
-                                'in_progress': 1,
+                                'started': 4,
+                                'in_progress': 4,
                                 'overdue': 0,
-                                'completed': 1,
+                                'completed': 3,
+                                'template_name': template_2.name,
+                                'template_id': template_2.id,
+                                'tasks': [
+                                    {
+                                        'task_id': task_1.id,
+                                        'task_name': 'First Test',
+                                        'started': 2,
+                                        'in_progress': 2,
+                                        'overdue': 0,
+                                        'completed': 1,
+                                    },
+                                    {
+                                        'task_id': task_2.id,
+                                        'task_name': 'Second',
+                                        'started': 1,
+                                        'in_progress': 1,
+                                        'overdue': 0,
+                                        'completed': 1,
+                                    },
+                                    {
+                                        'task_id': task_3.id,
+                                        'task_name': 'Third',
+                                        'started': 1,
+                                        'in_progress': 1,
+                                        'overdue': 0,
+                                        'completed': 1,
+                                    },
+                                ],
                             },
                         ],
                     },
-                ],
-            },
-            logo_lg=None,
+                    'logo_lg': None,
+                },
+            ],
         )
 
     def test_send__same_task_api_name_in_different_templates__ok(
@@ -651,7 +675,7 @@ class TestSendTasksDigest:
         )
         email_service_tasks_digest = mocker.patch(
             'src.notifications.tasks.'
-            'send_tasks_digest_notification.delay',
+            'send_tasks_digest_notifications.delay',
         )
         api_client.token_authenticate(user)
 
@@ -660,56 +684,62 @@ class TestSendTasksDigest:
 
         # assert
         email_service_tasks_digest.assert_called_with(
-            user_id=user.id,
-            user_email=user.email,
-            account_id=user.account_id,
-            date_to=(date_to - timedelta(days=1)).strftime('%d %b, %Y'),
-            date_from=date_from.strftime('%d %b'),
-            digest={
-                'started': 2,
-                'in_progress': 2,
-                'overdue': 0,
-                'completed': 0,
-                'templates': [
-                    {
-                        'started': 1,
-                        'in_progress': 1,
+            notifications=[
+                {
+                    'user_id': user.id,
+                    'user_email': user.email,
+                    'account_id': user.account_id,
+                    'date_to': (
+                        (date_to - timedelta(days=1)).strftime('%d %b, %Y')
+                    ),
+                    'date_from': date_from.strftime('%d %b'),
+                    'digest': {
+                        'started': 2,
+                        'in_progress': 2,
                         'overdue': 0,
                         'completed': 0,
-                        'template_name': template.name,
-                        'template_id': template.id,
-                        'tasks': [
+                        'templates': [
                             {
-                                'task_id': task.id,
-                                'task_name': task.name,
                                 'started': 1,
                                 'in_progress': 1,
                                 'overdue': 0,
                                 'completed': 0,
+                                'template_name': template.name,
+                                'template_id': template.id,
+                                'tasks': [
+                                    {
+                                        'task_id': task.id,
+                                        'task_name': task.name,
+                                        'started': 1,
+                                        'in_progress': 1,
+                                        'overdue': 0,
+                                        'completed': 0,
+                                    },
+                                ],
                             },
-                        ],
-                    },
-                    {
-                        'started': 1,
-                        'in_progress': 1,
-                        'overdue': 0,
-                        'completed': 0,
-                        'template_name': template_2.name,
-                        'template_id': template_2.id,
-                        'tasks': [
                             {
-                                'task_id': task_2.id,
-                                'task_name': task_2.name,
                                 'started': 1,
                                 'in_progress': 1,
                                 'overdue': 0,
                                 'completed': 0,
+                                'template_name': template_2.name,
+                                'template_id': template_2.id,
+                                'tasks': [
+                                    {
+                                        'task_id': task_2.id,
+                                        'task_name': task_2.name,
+                                        'started': 1,
+                                        'in_progress': 1,
+                                        'overdue': 0,
+                                        'completed': 0,
+                                    },
+                                ],
                             },
                         ],
                     },
-                ],
-            },
-            logo_lg=None,
+                    'logo_lg': None,
+                },
+            ],
         )
 
 
@@ -15,6 +15,9 @@ from src.processes.tests.fixtures import (
     create_test_workflow,
     get_workflow_create_data,
 )
+from src.reports.entities import WorkflowsDigest
+from src.reports.services.base import DigestRun
+from src.reports.services.workflows import SendWorkflowsDigest
 from src.reports.tasks import (
     send_digest,
 )
@@ -109,7 +112,7 @@ class TestSendDigest:
         second_workflow.save()
         email_service_digest = mocker.patch(
             'src.notifications.tasks.'
-            'send_workflows_digest_notification.delay',
+            'send_workflows_digest_notifications.delay',
         )
 
         # act
@@ -117,36 +120,42 @@ class TestSendDigest:
 
         # assert
         email_service_digest.assert_called_with(
-            user_id=user.id,
-            user_email=user.email,
-            account_id=user.account_id,
-            date_to=(date_to - timedelta(days=1)).strftime('%d %b, %Y'),
-            date_from=date_from.strftime('%d %b'),
-            digest={
-                'started': 3,
-                'in_progress': 3,
-                'overdue': 0,
-                'completed': 1,
-                'templates': [
-                    {
-                        'started': 2,
-                        'in_progress': 2,
+            notifications=[
+                {
+                    'user_id': user.id,
+                    'user_email': user.email,
+                    'account_id': user.account_id,
+                    'date_to': (
+                        (date_to - timedelta(days=1)).strftime('%d %b, %Y')
+                    ),
+                    'date_from': date_from.strftime('%d %b'),
+                    'digest': {
+                        'started': 3,
+                        'in_progress': 3,
                         'overdue': 0,
                         'completed': 1,
-                        'template_name': template_2.name,
-                        'template_id': template_2.id,
-                    },
-                    {
-                        'started': 1,
-                        'in_progress': 1,
-                        'overdue': 0,
-                        'completed': 0,
-                        'template_name': template_1.name,
-                        'template_id': template_1.id,
+                        'templates': [
+                            {
+                                'started': 2,
+                                'in_progress': 2,
+                                'overdue': 0,
+                                'completed': 1,
+                                'template_name': template_2.name,
+                                'template_id': template_2.id,
+                            },
+                            {
+                                'started': 1,
+                                'in_progress': 1,
+                                'overdue': 0,
+                                'completed': 0,
+                                'template_name': template_1.name,
+                                'template_id': template_1.id,
+                            },
+                        ],
                     },
-                ],
-            },
-            logo_lg=None,
+                    'logo_lg': None,
+                },
+            ],
         )
 
     def test_send__already_sent__not_sent_again(
@@ -211,7 +220,7 @@ class TestSendDigest:
             )
         email_service_digest = mocker.patch(
             'src.notifications.tasks.'
-            'send_workflows_digest_notification.delay',
+            'send_workflows_digest_notifications.delay',
         )
 
         # act
@@ -263,7 +272,7 @@ class TestSendDigest:
         )
         email_service_digest = mocker.patch(
             'src.notifications.tasks.'
-            'send_workflows_digest_notification.delay',
+            'send_workflows_digest_notifications.delay',
         )
 
         # act
@@ -271,28 +280,34 @@ class TestSendDigest:
 
         # assert
         email_service_digest.assert_called_with(
-            user_id=user.id,
-            user_email=user.email,
-            account_id=user.account_id,
-            date_to=(date_to - timedelta(days=1)).strftime('%d %b, %Y'),
-            date_from=date_from.strftime('%d %b'),
-            digest={
-                'started': 1,
-                'in_progress': 1,
-                'overdue': 0,
-                'completed': 0,
-                'templates': [
-                    {
+            notifications=[
+                {
+                    'user_id': user.id,
+                    'user_email': user.email,
+                    'account_id': user.account_id,
+                    'date_to': (
+                        (date_to - timedelta(days=1)).strftime('%d %b, %Y')
+                    ),
+                    'date_from': date_from.strftime('%d %b'),
+                    'digest': {
                         'started': 1,
                         'in_progress': 1,
                         'overdue': 0,
                         'completed': 0,
-                        'template_name': template_2.name,
-                        'template_id': template_2.id,
+                        'templates': [
+                            {
+                                'started': 1,
+                                'in_progress': 1,
+                                'overdue': 0,
+                                'completed': 0,
+                                'template_name': template_2.name,
+                                'template_id': template_2.id,
+                            },
+                        ],
                     },
-                ],
-            },
-            logo_lg=account.logo_lg,
+                    'logo_lg': account.logo_lg,
+                },
+            ],
         )
 
     def test_send__total_in_progress_is_nil__not_sent(
@@ -319,7 +334,7 @@ class TestSendDigest:
         api_client.post('/templates', data=template_data)
         email_service_digest = mocker.patch(
             'src.notifications.tasks.'
-            'send_workflows_digest_notification.delay',
+            'send_workflows_digest_notifications.delay',
         )
 
         # act
@@ -416,7 +431,7 @@ class TestSendDigest:
         second_workflow.save()
         email_service_digest = mocker.patch(
             'src.notifications.tasks.'
-            'send_workflows_digest_notification.delay',
+            'send_workflows_digest_notifications.delay',
         )
 
         # act
@@ -424,28 +439,34 @@ class TestSendDigest:
 
         # assert
         email_service_digest.assert_called_with(
-            user_id=user.id,
-            user_email=user.email,
-            account_id=user.account_id,
-            date_to=(date_to - timedelta(days=1)).strftime('%d %b, %Y'),
-            date_from=date_from.strftime('%d %b'),
-            digest={
-                'started': 2,
-                'in_progress': 2,
-                'overdue': 0,
-                'completed': 1,
-                'templates': [
-                    {
+            notifications=[
+                {
+                    'user_id': user.id,
+                    'user_email': user.email,
+                    'account_id': user.account_id,
+                    'date_to': (
+                        (date_to - timedelta(days=1)).strftime('%d %b, %Y')
+                    ),
+                    'date_from': date_from.strftime('%d %b'),
+                    'digest': {
                         'started': 2,
                         'in_progress': 2,
                         'overdue': 0,
                         'completed': 1,
-                        'template_name': template_2.name,
-                        'template_id': template_2.id,
+                        'templates': [
+                            {
+                                'started': 2,
+                                'in_progress': 2,
+                                'overdue': 0,
+                                'completed': 1,
+                                'template_name': template_2.name,
+                                'template_id': template_2.id,
+                            },
+                        ],
                     },
-                ],
-            },
-            logo_lg=None,
+                    'logo_lg': None,
+                },
+            ],
         )
 
     def test_send__in_progress__ok(self, mocker):
@@ -473,7 +494,7 @@ class TestSendDigest:
         )
         email_service_digest = mocker.patch(
             'src.notifications.tasks.'
-            'send_workflows_digest_notification.delay',
+            'send_workflows_digest_notifications.delay',
         )
         token_patch = mocker.patch(
             'src.accounts.tokens.UnsubscribeEmailToken.'
@@ -486,34 +507,153 @@ class TestSendDigest:
 
         # assert
         email_service_digest.assert_called_with(
-            user_id=user.id,
-            user_email=user.email,
-            account_id=user.account_id,
-            date_to=(date_to - timedelta(days=1)).strftime('%d %b, %Y'),
-            date_from=date_from.strftime('%d %b'),
-            digest={
-                'started': 2,
-                'in_progress': 2,
-                'overdue': 0,
-                'completed': 0,
-                'templates': [
-                    {
-                        'started': 1,
-                        'in_progress': 1,
-                        'overdue': 0,
-                        'completed': 0,
-                        'template_name': template.name,
-                        'template_id': template.id,
-                    },
-                    {
-                        'started': 1,
-                        'in_progress': 1,
+            notifications=[
+                {
+                    'user_id': user.id,
+                    'user_email': user.email,
+                    'account_id': user.account_id,
+                    'date_to': (
+                        (date_to - timedelta(days=1)).strftime('%d %b, %Y')
+                    ),
+                    'date_from': date_from.strftime('%d %b'),
+                    'digest': {
+                        'started': 2,
+                        'in_progress': 2,
                         'overdue': 0,
                         'completed': 0,
-                        'template_name': template.name,
-                        'template_id': template_2.id,
+                        'templates': [
+                            {
+                                'started': 1,
+                                'in_progress': 1,
+                                'overdue': 0,
+                                'completed': 0,
+                                'template_name': template.name,
+                                'template_id': template.id,
+                            },
+                            {
+                                'started': 1,
+                                'in_progress': 1,
+                                'overdue': 0,
+                                'completed': 0,
+                                'template_name': template.name,
+                                'template_id': template_2.id,
+                            },
+                        ],
                     },
-                ],
-            },
-            logo_lg=None,
+                    'logo_lg': None,
+                },
+            ],
         )
+
+    def test_send__many_shards__shards_sent_in_parallel(self, mocker):
+
+        # arrange
+        mocker.patch(
+            'src.reports.services.workflows.SendWorkflowsDigest.get_shards',
+            return_value=[(1, 10), (11, 20)],
+        )
+        send_digest_mock = mocker.patch(
+            'src.reports.services.workflows.SendWorkflowsDigest.send_digest',
+            return_value=3,
+        )
+        mocker.patch(
+            'src.reports.tasks._slack_digest_enabled',
+            return_value=True,
+        )
+        slack_notification_mock = mocker.patch(
+            'src.reports.tasks.send_digest_notification.delay',
+        )
+
+        # act
+        send_digest()
+
+        # assert
+        assert send_digest_mock.call_count == 2
+        slack_notification_mock.assert_called_once_with(6)
+        metrics = DigestRun.get_last('workflows').get_metrics()
+        assert metrics['total'] == 2
+        assert metrics['finished'] == 2
+        assert metrics['sent'] == 6
+        assert [shard['sent'] for shard in metrics['shards']] == [3, 3]
+
+    def test_send__no_subscribers__shards_not_started(self, mocker):
+
+        # arrange
+        mocker.patch(
+            'src.reports.services.workflows.SendWorkflowsDigest.get_shards',
+            return_value=[],
+        )
+        send_digest_mock = mocker.patch(
+            'src.reports.services.workflows.SendWorkflowsDigest.send_digest',
+        )
+
+        # act
+        send_digest()
+
+        # assert
+        send_digest_mock.assert_not_called()
+
+
+def test_get_shards__ok(mocker):
+
+    # arrange
+    account = create_test_account()
+    user_1 = create_test_user(account=account, email='t1@t.t')
+    user_2 = create_test_user(
+        account=account,
+        email='t2@t.t',
+        is_account_owner=False,
+    )
+    user_3 = create_test_user(
+        account=account,
+        email='t3@t.t',
+        is_account_owner=False,
+    )
+    not_subscriber = create_test_user(
+        account=account,
+        email='t4@t.t',
+        is_account_owner=False,
+    )
+    UserModel.objects.filter(id=not_subscriber.id).update(
+        is_digest_subscriber=False,
+    )
+    mocker.patch.object(SendWorkflowsDigest, 'shard_size', 2)
+
+    # act
+    shards = SendWorkflowsDigest.get_shards()
+
+    # assert
+    assert shards == [(user_1.id, user_2.id), (user_3.id, user_3.id)]
+
+
+def test_send_emails__chunk__one_task_and_bulk_update(mocker):
+
+    # arrange
+    account = create_test_account()
+    user_1 = create_test_user(account=account, email='t1@t.t')
+    user_2 = create_test_user(
+        account=account,
+        email='t2@t.t',
+        is_account_owner=False,
+    )
+    notifications_mock = mocker.patch(
+        'src.notifications.tasks.'
+        'send_workflows_digest_notifications.delay',
+    )
+    service = SendWorkflowsDigest()
+
+    # act
+    service._send_emails({
+        user_1.id: WorkflowsDigest(started=1),
+        user_2.id: WorkflowsDigest(completed=1),
+    })
+
+    # assert
+    notifications_mock.assert_called_once()
+    notifications = notifications_mock.call_args.kwargs['notifications']
+    assert {n['user_id'] for n in notifications} == {user_1.id, user_2.id}
+    user_1.refresh_from_db()
+    user_2.refresh_from_db()
+    assert user_1.last_digest_send_time == service._now
+    assert user_2.last_digest_send_time == service._now
+    assert service._sent_digests_count == 2
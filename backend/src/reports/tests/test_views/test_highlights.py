@@ -1,7 +1,9 @@
 from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.test import override_settings
 from django.utils import timezone
 
 from src.authentication.enums import AuthTokenType
@@ -1885,3 +1887,99 @@ def test_highlights__start_workflow_fieldset_absent__ok(api_client):
     assert event_data['type'] == WorkflowEventType.RUN
     assert event_data['workflow']['kickoff']['fieldsets'] == []
     assert event_data['workflow']['kickoff']['output'] == []
+
+
+@override_settings(HIGHLIGHTS_PROJECTION_QUERIES=True)
+def test_highlights__projection__latest_event_per_workflow(api_client):
+    # arrange
+    user = create_test_owner()
+    workflow_1 = create_test_workflow(user=user, tasks_count=1)
+    workflow_2 = create_test_workflow(user=user, tasks_count=1)
+    WorkflowEventService.comment_created_event(
+        text='First comment',
+        task=workflow_1.tasks.get(number=1),
+        user=user,
+        after_create_actions=False,
+    )
+    WorkflowEventService.comment_created_event(
+        text='Second comment',
+        task=workflow_2.tasks.get(number=1),
+        user=user,
+        after_create_actions=False,
+    )
+    event = WorkflowEventService.comment_created_event(
+        text='Third comment',
+        task=workflow_1.tasks.get(number=1),
+        user=user,
+        after_create_actions=False,
+    )
+    api_client.token_authenticate(user)
+
+    # act
+    response = api_client.get('/reports/highlights')
+
+    # assert
+    assert response.status_code == 200
+    assert len(response.data) == 2
+    assert response.data[0]['id'] == event.id
+    assert response.data[0]['workflow']['id'] == workflow_1.id
+    assert response.data[1]['text'] == 'Second comment'
+    assert response.data[1]['workflow']['id'] == workflow_2.id
+
+
+@override_settings(HIGHLIGHTS_PROJECTION_QUERIES=True)
+def test_highlights__projection_cursor__pages(api_client):
+    # arrange
+    user = create_test_owner()
+    workflow_1 = create_test_workflow(user=user, tasks_count=1)
+    workflow_2 = create_test_workflow(user=user, tasks_count=1)
+    WorkflowEventService.comment_created_event(
+        text='First comment',
+        task=workflow_1.tasks.get(number=1),
+        user=user,
+        after_create_actions=False,
+    )
+    WorkflowEventService.comment_created_event(
+        text='Second comment',
+        task=workflow_2.tasks.get(number=1),
+        user=user,
+        after_create_actions=False,
+    )
+    api_client.token_authenticate(user)
+
+    # act
+    response_1 = api_client.get('/reports/highlights?cursor=&limit=1')
+    cursor = parse_qs(urlparse(response_1.data['next']).query)['cursor'][0]
+    response_2 = api_client.get(
+        f'/reports/highlights?cursor={cursor}&limit=1',
+    )
+
+    # assert
+    assert response_1.status_code == 200
+    assert response_1.data['results'][0]['text'] == 'Second comment'
+    assert response_2.status_code == 200
+    assert response_2.data['results'][0]['text'] == 'First comment'
+    assert response_2.data['next'] is None
+
+
+@override_settings(HIGHLIGHTS_PROJECTION_QUERIES=True)
+def test_highlights__projection_not_workflow_member__empty(api_client):
+    # arrange
+    account = create_test_account()
+    owner = create_test_owner(account=account)
+    user = create_test_admin(account=account, email='admin@test.test')
+    workflow = create_test_workflow(user=owner, tasks_count=1)
+    WorkflowEventService.comment_created_event(
+        text='Comment',
+        task=workflow.tasks.get(number=1),
+        user=owner,
+        after_create_actions=False,
+    )
+    api_client.token_authenticate(user)
+
+    # act
+    response = api_client.get('/reports/highlights')
+
+    # assert
+    assert response.status_code == 200
+    assert response.data == []
@@ -8,6 +8,7 @@ from src.accounts.permissions import (
 )
 from src.processes.permissions import UserCanAccessHighlightsPermission
 from src.generics.mixins.views import BasePrefetchMixin
+from src.generics.paginations import KeysetPagination
 from src.generics.permissions import (
     UserIsAuthenticated,
 )
@@ -42,6 +43,7 @@ class HighlightsView(
     BasePrefetchMixin,
 ):
     serializer_class = EventHighlightsSerializer
+    pagination_class = KeysetPagination
     permission_classes = (
         UserIsAuthenticated,
         ExpiredSubscriptionPermission,
@@ -54,9 +56,16 @@ class HighlightsView(
             data=self.request.query_params,
         )
         filter_serializer.is_valid(raise_exception=True)
+        data = filter_serializer.validated_data
+        if data.get('cursor') is not None:
+            data['limit'] = self.paginator.get_keyset_limit(self.request)
         queryset = WorkflowEvent.objects.highlights(
             account_id=self.request.user.account.id,
             user_id=self.request.user.id,
-            **filter_serializer.validated_data,
+            **data,
         )
-        return self.prefetch_queryset(queryset)
+        keyset_query = getattr(queryset, 'keyset_query', None)
+        queryset = self.prefetch_queryset(queryset)
+        if keyset_query is not None:
+            queryset.keyset_query = keyset_query
+        return queryset
@@ -91,6 +91,15 @@ class Common(Configuration):
     # Auth
     AUTH_USER_MODEL = 'accounts.User'
     AUTH_TOKEN_ITERATIONS = int(env.get('AUTH_TOKEN_ITERATIONS', '1'))
+    # In seconds, 0 - disabled. Keeps the tokens data in the process memory
+    # to skip hashing and the auth cache request. Logout in another process
+    # is applied after the TTL
+    AUTH_TOKEN_LOCAL_CACHE_TTL = int(
+        env.get('AUTH_TOKEN_LOCAL_CACHE_TTL', '0'),
+    )
+    AUTH_TOKEN_LOCAL_CACHE_SIZE = int(
+        env.get('AUTH_TOKEN_LOCAL_CACHE_SIZE', '10000'),
+    )
     AUTHENTICATION_BACKENDS = (
         'django.contrib.auth.backends.ModelBackend',
         'guardian.backends.ObjectPermissionBackend',
@@ -238,6 +247,25 @@ class Common(Configuration):
 
     WSGI_APPLICATION = 'src.wsgi.application'
     ASGI_APPLICATION = 'src.asgi.application'
+
+    # ASGI
+    # Run sync views in a bounded thread pool instead of the event loop
+    ASGI_THREADED_VIEWS = env.get('ASGI_THREADED_VIEWS') == 'yes'
+    ASGI_THREAD_POOL_SIZE = int(env.get('ASGI_THREAD_POOL_SIZE', '8'))
+    # Requests waiting for the pool over this limit get 503
+    ASGI_MAX_PENDING_REQUESTS = int(
+        env.get('ASGI_MAX_PENDING_REQUESTS', '64'),
+    )
+    # In seconds, a view running longer gets 504
+    ASGI_REQUEST_TIMEOUT = int(env.get('ASGI_REQUEST_TIMEOUT', '180'))
+    # In seconds, 0 disables the event loop lag monitor
+    ASGI_LOOP_LAG_INTERVAL = float(env.get('ASGI_LOOP_LAG_INTERVAL', '1'))
+    ASGI_LOOP_LAG_THRESHOLD = float(
+        env.get('ASGI_LOOP_LAG_THRESHOLD', '0.5'),
+    )
+    # In seconds, how often the loop lag and the pool stats are published,
+    # see "asgi_metrics" command. 0 disables publishing
+    ASGI_METRICS_INTERVAL = float(env.get('ASGI_METRICS_INTERVAL', '60'))
     CHANNEL_LAYERS = {
         'default': {
             'BACKEND': 'channels.layers.InMemoryChannelLayer',
@@ -510,6 +538,32 @@ class Common(Configuration):
     # Attachments
     ATTACHMENT_SIGNED_URL_LIFETIME_MIN = 15
     ATTACHMENT_MAX_SIZE_BYTES = 104857600  # bites = 100 Mb
+    # In seconds, the workflow attachments ACL sync triggered
+    # several times within this window runs once
+    ATTACHMENT_ACL_SYNC_DELAY = int(env.get('ATTACHMENT_ACL_SYNC_DELAY', '5'))
+
+    # Workflows
+    # Cache the compiled templates used to create the workflows tasks
+    INSTANTIATION_PLAN_CACHE = (
+        env.get('INSTANTIATION_PLAN_CACHE', 'yes') == 'yes'
+    )
+    # Read the workflow permissions from the integer-keyed workflow_acl
+    # table. Enable after "backfill_workflow_acl --verify-only" passes
+    WORKFLOW_ACL_QUERIES = env.get('WORKFLOW_ACL_QUERIES') == 'yes'
+    # Read the highlights feed from the workflow_last_event projection.
+    # Enable after "backfill_workflow_last_event --verify-only" passes
+    HIGHLIGHTS_PROJECTION_QUERIES = (
+        env.get('HIGHLIGHTS_PROJECTION_QUERIES') == 'yes'
+    )
+    # Read the task list, the tasks counter and the tasks digest from
+    # the task_inbox projection. Enable after
+    # "rebuild_task_inbox --verify-only" passes
+    TASK_INBOX_QUERIES = env.get('TASK_INBOX_QUERIES') == 'yes'
+
+    # Resume delays, send overdue notifications and start vacations
+    # by timers in Redis. The periodic tasks become reconciliation
+    # sweeps, rerun "init_periodic_tasks" after enabling
+    TIMER_SERVICE = env.get('TIMER_SERVICE') == 'yes'
 
     # Notifications
     # In seconds - default 10 min
@@ -517,6 +571,21 @@ class Common(Configuration):
         env.get('UNREAD_NOTIFICATIONS_TIMEOUT', '600'),
     )
 
+    # Webhooks
+    # In seconds
+    WEBHOOK_CONNECT_TIMEOUT = int(env.get('WEBHOOK_CONNECT_TIMEOUT', '5'))
+    WEBHOOK_READ_TIMEOUT = int(env.get('WEBHOOK_READ_TIMEOUT', '15'))
+    # Hooks of one event are sent in parallel threads
+    WEBHOOK_MAX_WORKERS = int(env.get('WEBHOOK_MAX_WORKERS', '8'))
+    # Max parallel requests to one host from a worker process
+    WEBHOOK_TARGET_CONCURRENCY = int(
+        env.get('WEBHOOK_TARGET_CONCURRENCY', '4'),
+    )
+    # The host is skipped for WEBHOOK_CIRCUIT_TIMEOUT seconds
+    # after WEBHOOK_CIRCUIT_FAILURES failed requests in a row
+    WEBHOOK_CIRCUIT_FAILURES = int(env.get('WEBHOOK_CIRCUIT_FAILURES', '5'))
+    WEBHOOK_CIRCUIT_TIMEOUT = int(env.get('WEBHOOK_CIRCUIT_TIMEOUT', '60'))
+
     # Celery
     CELERY_BROKER_URL = env.get('CELERY_BROKER_URL')
     CELERY_IMPORTS = [
@@ -524,6 +593,7 @@ class Common(Configuration):
         'src.authentication.tasks',
         'src.processes.tasks.delay',
         'src.processes.tasks.tasks',
+        'src.processes.tasks.timers',
         'src.processes.tasks.update_workflow',
         'src.processes.tasks.webhooks',
         'src.reports.tasks',
@@ -665,6 +735,9 @@ class Testing(Common):
         },
     }
 
+    # Tests change the templates in place without the version increment
+    INSTANTIATION_PLAN_CACHE = False
+
 
 class Development(Common):
 
@@ -0,0 +1,5 @@
+# Max files in one check-permissions request of the file service
+CHECK_PERMISSIONS_MAX_SIZE = 100
+# The file service caches the permission decisions of an account
+# under this version, the version is incremented on any ACL change
+ATTACHMENT_ACL_VERSION_KEY = 'attachment_acl_version:{account_id}'
@@ -4,6 +4,7 @@ from rest_framework import serializers
 from rest_framework.serializers import ValidationError
 
 from src.generics.mixins.serializers import CustomValidationErrorMixin
+from src.storage.consts import CHECK_PERMISSIONS_MAX_SIZE
 from src.storage.messages import MSG_FS_0011
 from src.storage.models import Attachment
 from src.storage.paginations import AttachmentListPagination
@@ -48,6 +49,26 @@ class AttachmentCheckPermissionSerializer(
         return value.strip()
 
 
+class AttachmentCheckPermissionsSerializer(
+    CustomValidationErrorMixin,
+    serializers.Serializer,
+):
+    """Serializer for checking access permissions of several files."""
+
+    file_ids = serializers.ListField(
+        child=serializers.CharField(max_length=512),
+        min_length=1,
+        max_length=CHECK_PERMISSIONS_MAX_SIZE,
+        help_text='Unique file identifiers',
+    )
+
+    def validate_file_ids(self, value):
+        file_ids = [file_id.strip() for file_id in value]
+        if not all(file_ids):
+            raise ValidationError(MSG_FS_0011)
+        return file_ids
+
+
 class AttachmentListSerializer(serializers.ModelSerializer):
     """Serializer for attachment list."""
 
@@ -1,8 +1,11 @@
-from typing import Iterable, List, Optional
+from collections import defaultdict
+from contextlib import suppress
+from typing import Iterable, List, Optional, Set, Tuple
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
 from django.db import IntegrityError, models, transaction
 from django.db.models import Q
 from django.utils.functional import cached_property
@@ -13,6 +16,10 @@ from src.permissions.models import (
     UserObjectPermission,
 )
 from src.permissions.enums import PermissionSource
+from src.permissions.registry import (
+    PermissionRegistry,
+    WorkflowPermissionRegistry,
+)
 from src.processes.enums import (
     DirectlyStatus,
     OwnerType,
@@ -23,6 +30,7 @@ from src.processes.models.templates.owner import TemplateOwner
 from src.processes.models.templates.template import Template
 from src.processes.models.workflows.task import Task, TaskPerformer
 from src.processes.models.workflows.workflow import Workflow
+from src.storage.consts import ATTACHMENT_ACL_VERSION_KEY
 from src.storage.enums import AccessType, SourceType
 from src.storage.models import Attachment
 from src.processes.services.workflow_permissions import (
@@ -52,6 +60,36 @@ def clear_guardian_permissions_for_attachment_ids(
         content_type=ctype,
         object_pk__in=obj_pks,
     ).delete()
+    bump_attachment_acl_version(
+        Attachment.objects.filter(
+            id__in=attachment_ids,
+        ).values_list('account_id', flat=True).distinct(),
+    )
+
+
+def bump_attachment_acl_version(account_ids: Iterable[int]) -> None:
+    """
+    Invalidate the permission decisions cached by the file service.
+
+    The file service caches the decisions of an account under its
+    ACL version read from the auth cache. The version is incremented
+    after the current transaction commits, so a decision computed
+    from the old rows is never cached under the new version.
+    """
+    account_ids = set(account_ids)
+    if not account_ids:
+        return
+
+    def _bump():
+        cache = caches['auth']
+        for account_id in account_ids:
+            key = ATTACHMENT_ACL_VERSION_KEY.format(account_id=account_id)
+            if not cache.add(key, 1, timeout=None):
+                # ValueError if the key is evicted in between
+                with suppress(ValueError):
+                    cache.incr(key)
+
+    transaction.on_commit(_bump)
 
 
 class AttachmentService(BaseModelService):
@@ -60,11 +98,13 @@ class AttachmentService(BaseModelService):
     Automatically assigns access permissions on creation.
     """
 
+    permissions_batch_size = 1000
+
     @cached_property
     def _access_attachment_perm(self) -> Permission:
-        ctype = ContentType.objects.get_for_model(Attachment)
-        return Permission.objects.get(
-            content_type=ctype,
+        return PermissionRegistry.get_permission(
+            app_label=Attachment._meta.app_label,
+            model=Attachment._meta.model_name,
             codename='access_attachment',
         )
 
@@ -79,6 +119,7 @@ class AttachmentService(BaseModelService):
         """
         if self.instance.access_type == AccessType.RESTRICTED:
             self._assign_restricted_permissions()
+        bump_attachment_acl_version([self.instance.account_id])
 
     def assign_permissions(self, attachment: Attachment) -> None:
         """Public API: assign permissions for a newly created attachment.
@@ -98,6 +139,7 @@ class AttachmentService(BaseModelService):
         if attachment.access_type == AccessType.RESTRICTED:
             with transaction.atomic():
                 self._assign_restricted_permissions()
+            bump_attachment_acl_version([attachment.account_id])
 
     def _assign_restricted_permissions(self):
         """Assigns permissions for restricted access."""
@@ -177,6 +219,7 @@ class AttachmentService(BaseModelService):
         ctype = ContentType.objects.get_for_model(Attachment)
         perm = self._access_attachment_perm
 
+        attachments = list(attachments)
         att_pks = [str(att.pk) for att in attachments]
         if not att_pks:
             return
@@ -217,6 +260,7 @@ class AttachmentService(BaseModelService):
                     group_perms,
                     ignore_conflicts=True,
                 )
+        bump_attachment_acl_version(att.account_id for att in attachments)
 
     def rebuild_template_attachment_permissions(
         self,
@@ -232,16 +276,17 @@ class AttachmentService(BaseModelService):
           - template owners (GROUP)
           - active GROUP performers on tasks of those workflows
 
-        Clear + rebuild (not additive) so users who lost all
+        Synced to the desired set (not additive) so users who lost all
         workflow access also lose template file access, while
         users still on another workflow of the same template keep it.
+        Only the difference with the existing rows is written.
         """
         attachments = list(
             Attachment.objects.filter(
                 template_id=template_id,
                 source_type=SourceType.TEMPLATE,
                 access_type=AccessType.RESTRICTED,
-            ).only('id'),
+            ).only('id', 'account_id'),
         )
         if not attachments:
             return
@@ -280,14 +325,16 @@ class AttachmentService(BaseModelService):
         viewer_ids = set()
         perf_group_ids = set()
         if wf_ids:
-            wf_ct = ContentType.objects.get(
-                app_label='processes',
-                model='workflow',
-            )
             viewer_ids = set(
                 UserObjectPermission.objects.filter(
-                    content_type=wf_ct,
-                    permission__codename=WorkflowPermission.VIEW,
+                    content_type_id=(
+                        WorkflowPermissionRegistry.get_content_type_id()
+                    ),
+                    permission_id=(
+                        WorkflowPermissionRegistry.get_permission_id(
+                            WorkflowPermission.VIEW,
+                        )
+                    ),
                     object_pk__in=[str(wid) for wid in wf_ids],
                 ).values_list('user_id', flat=True),
             )
@@ -311,21 +358,190 @@ class AttachmentService(BaseModelService):
             ))
         desired_group_ids = owner_group_ids | perf_group_ids
 
+        obj_pks = [str(att.pk) for att in attachments]
+        self._sync_permissions(
+            obj_pks=obj_pks,
+            account_ids={att.account_id for att in attachments},
+            desired_users={
+                (obj_pk, uid, st, sid)
+                for uid, st, sid in desired_user_sources
+                for obj_pk in obj_pks
+            },
+            desired_groups={
+                (obj_pk, gid)
+                for gid in desired_group_ids
+                for obj_pk in obj_pks
+            },
+        )
+
+    def sync_workflow_restricted_permissions(
+        self,
+        workflow: Workflow,
+        attachments: Iterable[Attachment],
+    ) -> None:
+        """Recalc the ACL of the workflow restricted attachments at once.
+
+        Performers, viewers and template owners are loaded once
+        per workflow instead of once per attachment. The desired rows
+        of all attachments are compared with the existing ones and
+        only the difference is written.
+
+        TEMPLATE attachments of the workflow template are skipped:
+        they are shared by all the template workflows and are rebuilt
+        by ``rebuild_template_attachment_permissions``.
+        """
+
+        task_attachments = []
+        workflow_attachments = []
+        for attachment in attachments:
+            if attachment.access_type != AccessType.RESTRICTED:
+                continue
+            if attachment.source_type == SourceType.TASK:
+                if attachment.task_id:
+                    task_attachments.append(attachment)
+            elif attachment.source_type == SourceType.WORKFLOW:
+                workflow_attachments.append(attachment)
+            elif (
+                attachment.source_type == SourceType.TEMPLATE
+                and attachment.template_id != workflow.template_id
+            ):
+                self.reassign_restricted_permissions(attachment)
+        if not task_attachments and not workflow_attachments:
+            return
+
+        task_users = defaultdict(set)
+        task_groups = defaultdict(set)
+        performers = TaskPerformer.objects.filter(
+            task__workflow_id=workflow.id,
+            task__is_deleted=False,
+        ).exclude_directly_deleted().values_list(
+            'id', 'task_id', 'user_id', 'group_id',
+        )
+        for performer_id, task_id, user_id, group_id in performers:
+            if user_id:
+                task_users[task_id].add((
+                    user_id,
+                    PermissionSource.PERFORMER,
+                    performer_id,
+                ))
+            if group_id:
+                task_groups[task_id].add(group_id)
+
+        common_users = {
+            (uid, PermissionSource.WORKFLOW_VIEWER, workflow.pk)
+            for uid in WorkflowPermissionService(
+                workflow,
+            ).get_users_with_view()
+        }
+        common_groups = set()
+        if workflow.template_id:
+            template_owners = TemplateOwner.objects.filter(
+                template_id=workflow.template_id,
+                is_deleted=False,
+            ).values_list('id', 'type', 'user_id', 'group_id')
+            for owner_id, owner_type, user_id, group_id in template_owners:
+                if owner_type == OwnerType.USER and user_id:
+                    common_users.add((
+                        user_id,
+                        PermissionSource.TEMPLATE_OWNER,
+                        owner_id,
+                    ))
+                elif owner_type == OwnerType.GROUP and group_id:
+                    common_groups.add(group_id)
+
+        obj_pks = []
+        desired_users = set()
+        desired_groups = set()
+        for attachment in task_attachments:
+            obj_pk = str(attachment.pk)
+            obj_pks.append(obj_pk)
+            users = common_users | task_users[attachment.task_id]
+            groups = common_groups | task_groups[attachment.task_id]
+            desired_users.update((obj_pk, *user) for user in users)
+            desired_groups.update((obj_pk, gid) for gid in groups)
+
+        if workflow_attachments:
+            users = common_users.union(*task_users.values())
+            groups = common_groups.union(*task_groups.values())
+            for attachment in workflow_attachments:
+                obj_pk = str(attachment.pk)
+                obj_pks.append(obj_pk)
+                desired_users.update((obj_pk, *user) for user in users)
+                desired_groups.update((obj_pk, gid) for gid in groups)
+
+        self._sync_permissions(
+            obj_pks=obj_pks,
+            account_ids=[workflow.account_id],
+            desired_users=desired_users,
+            desired_groups=desired_groups,
+        )
+
+    def _sync_permissions(
+        self,
+        obj_pks: List[str],
+        account_ids: Iterable[int],
+        desired_users: Set[Tuple[str, int, str, int]],
+        desired_groups: Set[Tuple[str, int]],
+    ) -> None:
+        """Bring the ACL of the attachments to the desired rows.
+
+        desired_users: (object_pk, user_id, source_type, source_id)
+        desired_groups: (object_pk, group_id)
+
+        Rows that are not desired are deleted, missing ones are
+        inserted and the rest are kept untouched.
+        """
+
         ctype = ContentType.objects.get_for_model(Attachment)
         perm = self._access_attachment_perm
-        obj_pks = [str(att.pk) for att in attachments]
+
+        extra_user_perm_ids = []
+        kept_users = set()
+        user_rows = UserObjectPermission.objects.filter(
+            content_type=ctype,
+            object_pk__in=obj_pks,
+        ).values_list(
+            'id', 'permission_id', 'object_pk',
+            'user_id', 'source_type', 'source_id',
+        )
+        for row_id, perm_id, obj_pk, uid, st, sid in user_rows:
+            key = (obj_pk, uid, st, sid)
+            if perm_id == perm.id and key in desired_users:
+                kept_users.add(key)
+            else:
+                extra_user_perm_ids.append(row_id)
+
+        extra_group_perm_ids = []
+        kept_groups = set()
+        group_rows = GroupObjectPermission.objects.filter(
+            content_type=ctype,
+            object_pk__in=obj_pks,
+        ).values_list('id', 'permission_id', 'object_pk', 'group_id')
+        for row_id, perm_id, obj_pk, gid in group_rows:
+            key = (obj_pk, gid)
+            if perm_id == perm.id and key in desired_groups:
+                kept_groups.add(key)
+            else:
+                extra_group_perm_ids.append(row_id)
+
+        missing_users = desired_users - kept_users
+        missing_groups = desired_groups - kept_groups
+        if not (
+            extra_user_perm_ids or extra_group_perm_ids
+            or missing_users or missing_groups
+        ):
+            return
 
         with transaction.atomic():
-            UserObjectPermission.objects.filter(
-                content_type=ctype,
-                object_pk__in=obj_pks,
-            ).delete()
-            GroupObjectPermission.objects.filter(
-                content_type=ctype,
-                object_pk__in=obj_pks,
-            ).delete()
-
-            if desired_user_sources:
+            if extra_user_perm_ids:
+                UserObjectPermission.objects.filter(
+                    id__in=extra_user_perm_ids,
+                ).delete()
+            if extra_group_perm_ids:
+                GroupObjectPermission.objects.filter(
+                    id__in=extra_group_perm_ids,
+                ).delete()
+            if missing_users:
                 UserObjectPermission.objects.bulk_create(
                     [
                         UserObjectPermission(
@@ -336,13 +552,12 @@ class AttachmentService(BaseModelService):
                             source_type=st,
                             source_id=sid,
                         )
-                        for uid, st, sid in desired_user_sources
-                        for obj_pk in obj_pks
+                        for obj_pk, uid, st, sid in missing_users
                     ],
+                    batch_size=self.permissions_batch_size,
                     ignore_conflicts=True,
                 )
-
-            if desired_group_ids:
+            if missing_groups:
                 GroupObjectPermission.objects.bulk_create(
                     [
                         GroupObjectPermission(
@@ -351,11 +566,12 @@ class AttachmentService(BaseModelService):
                             content_type=ctype,
                             object_pk=obj_pk,
                         )
-                        for gid in desired_group_ids
-                        for obj_pk in obj_pks
+                        for obj_pk, gid in missing_groups
                     ],
+                    batch_size=self.permissions_batch_size,
                     ignore_conflicts=True,
                 )
+        bump_attachment_acl_version(account_ids)
 
     def _assign_task_permissions(self):
         """Assigns permissions for task."""
@@ -818,14 +1034,33 @@ class AttachmentService(BaseModelService):
 
         A single file_id may have multiple Attachment records (one per
         scope).  Access is granted if ANY live attachment permits it.
+        """
+
+        return file_id in self.check_user_permissions(
+            user_id=user_id,
+            account_id=account_id,
+            file_ids=[file_id],
+            public_template=public_template,
+        )
+
+    def check_user_permissions(
+        self,
+        user_id: Optional[int],
+        account_id: Optional[int],
+        file_ids: Iterable[str],
+        public_template: Optional[Template] = None,
+    ) -> Set[str]:
+        """
+        Returns the file ids the user has permission to access.
 
         Optimized: all checks are pushed into SQL (no Python-side
-        iteration over Attachment objects).
+        iteration over Attachment objects), the number of queries
+        does not depend on the number of files.
         """
 
-        base_qs = Attachment.objects.filter(file_id=file_id)
+        base_qs = Attachment.objects.filter(file_id__in=set(file_ids))
 
-        # Phase 1: single EXISTS — PUBLIC / ACCOUNT / public template
+        # Phase 1: PUBLIC / ACCOUNT / public template
         fast_q = Q(access_type=AccessType.PUBLIC)
         if account_id is not None:
             fast_q |= Q(
@@ -839,22 +1074,26 @@ class AttachmentService(BaseModelService):
                 template_id=public_template.id,
                 account_id=public_template.account_id,
             )
-        if base_qs.filter(fast_q).exists():
-            return True
+        allowed = set(
+            base_qs.filter(fast_q).values_list('file_id', flat=True),
+        )
 
         # Phase 2: RESTRICTED — guardian object-level permissions
         if user_id is None:
-            return False
+            return allowed
 
         # Fetch only PKs of RESTRICTED attachments (no full objects)
         restricted_qs = base_qs.filter(
             access_type=AccessType.RESTRICTED,
-        )
+        ).exclude(file_id__in=allowed)
         if account_id is not None:
             restricted_qs = restricted_qs.filter(account_id=account_id)
-        restricted_pks = list(restricted_qs.values_list('id', flat=True))
-        if not restricted_pks:
-            return False
+        file_ids_by_pk = {
+            str(pk): file_id
+            for pk, file_id in restricted_qs.values_list('id', 'file_id')
+        }
+        if not file_ids_by_pk:
+            return allowed
 
         # Resolve user (deferred until actually needed)
         if hasattr(self, 'user') and self.user and self.user.id == user_id:
@@ -863,27 +1102,38 @@ class AttachmentService(BaseModelService):
             try:
                 user = UserModel.objects.get(id=user_id)
             except UserModel.DoesNotExist:
-                return False
+                return allowed
 
         if not user.is_active:
-            return False
+            return allowed
 
         ctype = ContentType.objects.get_for_model(Attachment)
         perm_codename = 'access_attachment'
-        str_pks = [str(pk) for pk in restricted_pks]
 
-        if UserObjectPermission.objects.filter(
-            user=user,
-            object_pk__in=str_pks,
-            permission__content_type=ctype,
-            permission__codename=perm_codename,
-        ).exists():
-            return True
+        allowed.update(
+            file_ids_by_pk[pk]
+            for pk in UserObjectPermission.objects.filter(
+                user=user,
+                object_pk__in=list(file_ids_by_pk),
+                permission__content_type=ctype,
+                permission__codename=perm_codename,
+            ).values_list('object_pk', flat=True)
+        )
+        str_pks = [
+            pk for pk, file_id in file_ids_by_pk.items()
+            if file_id not in allowed
+        ]
+        if not str_pks:
+            return allowed
 
         user_group_ids = user.user_groups.values_list('id', flat=True)
-        return GroupObjectPermission.objects.filter(
-            group_id__in=user_group_ids,
-            object_pk__in=str_pks,
-            permission__content_type=ctype,
-            permission__codename=perm_codename,
-        ).exists()
+        allowed.update(
+            file_ids_by_pk[pk]
+            for pk in GroupObjectPermission.objects.filter(
+                group_id__in=user_group_ids,
+                object_pk__in=str_pks,
+                permission__content_type=ctype,
+                permission__codename=perm_codename,
+            ).values_list('object_pk', flat=True)
+        )
+        return allowed
@@ -1,4 +1,6 @@
 from celery import shared_task
+from django.conf import settings
+from django.core.cache import caches
 from django.db import transaction
 from django.db.models import Q
 
@@ -7,6 +9,30 @@ from src.storage.enums import AccessType
 from src.storage.models import Attachment
 from src.storage.services.attachments import AttachmentService
 
+SYNC_SCHEDULED_KEY = 'attachment_acl_sync_scheduled:{workflow_id}'
+
+
+def _get_sync_scheduled_key(workflow_id: int) -> str:
+    return SYNC_SCHEDULED_KEY.format(workflow_id=workflow_id)
+
+
+def _enqueue_sync_workflow_attachment_permissions(workflow_id: int):
+    delay = settings.ATTACHMENT_ACL_SYNC_DELAY
+    if delay:
+        # The key lives longer than the delay, so a lost task
+        # does not block the next syncs of the workflow for long
+        is_scheduled = not caches['default'].add(
+            _get_sync_scheduled_key(workflow_id),
+            1,
+            timeout=delay + 60,
+        )
+        if is_scheduled:
+            return
+    sync_workflow_attachment_permissions.apply_async(
+        args=(workflow_id,),
+        countdown=delay or None,
+    )
+
 
 def schedule_sync_workflow_attachment_permissions(
     workflow_id: int,
@@ -15,10 +41,14 @@ def schedule_sync_workflow_attachment_permissions(
 
     Safe with or without an open atomic block: Django runs the
     callback immediately when there is no active transaction.
+
+    The sync is delayed by ATTACHMENT_ACL_SYNC_DELAY seconds and
+    the triggers of the same workflow within that window are
+    collapsed into one run.
     """
     transaction.on_commit(
         lambda wid=workflow_id: (
-            sync_workflow_attachment_permissions.delay(wid)
+            _enqueue_sync_workflow_attachment_permissions(wid)
         ),
     )
 
@@ -47,6 +77,8 @@ def sync_workflow_attachment_permissions(workflow_id: int):
     template (desired-set across all live workflows).
     """
 
+    # Triggers after this point need a new run
+    caches['default'].delete(_get_sync_scheduled_key(workflow_id))
     try:
         workflow = Workflow.objects.get(
             id=workflow_id,
@@ -55,7 +87,6 @@ def sync_workflow_attachment_permissions(workflow_id: int):
     except Workflow.DoesNotExist:
         return
 
-    service = AttachmentService()
     # Task description files often have workflow_id=NULL (only task_id).
     # Event files usually set workflow_id, but include event__workflow
     # for safety. distinct() avoids duplicates when several FKs match.
@@ -64,10 +95,13 @@ def sync_workflow_attachment_permissions(workflow_id: int):
         | Q(task__workflow=workflow)
         | Q(event__workflow=workflow),
         access_type=AccessType.RESTRICTED,
-    ).distinct().select_related('task')
+    ).distinct()
 
-    for att in restricted_attachments:
-        service.reassign_restricted_permissions(att)
+    service = AttachmentService()
+    service.sync_workflow_restricted_permissions(
+        workflow=workflow,
+        attachments=restricted_attachments,
+    )
 
     if workflow.template_id:
         service.rebuild_template_attachment_permissions(
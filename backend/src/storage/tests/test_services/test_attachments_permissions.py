@@ -1,4 +1,5 @@
 import pytest
+from django.core.cache import caches
 
 from src.processes.enums import OwnerType
 from src.processes.models.templates.owner import TemplateOwner
@@ -14,7 +15,10 @@ from src.processes.tests.fixtures import (
     create_test_workflow,
 )
 from src.storage.enums import AccessType, SourceType
-from src.storage.services.attachments import AttachmentService
+from src.storage.services.attachments import (
+    AttachmentService,
+    bump_attachment_acl_version,
+)
 from src.storage.utils import reassign_restricted_permissions_for_task
 from src.permissions.enums import PermissionSource
 from src.processes.services.workflow_permissions import (
@@ -1279,3 +1283,136 @@ class TestAttachmentServiceBulkCreatePermissions:
                 account_id=owner.account_id,
                 file_id=attachment.file_id,
             )
+
+
+class TestAttachmentServiceCheckUserPermissions:
+    """Tests for the batch permission check."""
+
+    def test_check_user_permissions__mixed_access__return_allowed(self):
+        # arrange
+        user = create_test_admin()
+        workflow = create_test_workflow(user=user, tasks_count=1)
+        task = workflow.tasks.first()
+        other_account = create_test_account()
+        create_test_attachment(
+            user.account,
+            file_id='public_file',
+            access_type=AccessType.PUBLIC,
+            source_type=SourceType.ACCOUNT,
+        )
+        create_test_attachment(
+            user.account,
+            file_id='account_file',
+            access_type=AccessType.ACCOUNT,
+            source_type=SourceType.ACCOUNT,
+        )
+        create_test_attachment(
+            other_account,
+            file_id='other_account_file',
+            access_type=AccessType.ACCOUNT,
+            source_type=SourceType.ACCOUNT,
+        )
+        create_test_attachment(
+            user.account,
+            file_id='restricted_no_perm_file',
+            access_type=AccessType.RESTRICTED,
+            source_type=SourceType.ACCOUNT,
+        )
+        service = AttachmentService(user=user)
+        service.create(
+            file_id='task_file',
+            account=user.account,
+            access_type=AccessType.RESTRICTED,
+            source_type=SourceType.TASK,
+            task=task,
+        )
+
+        # act
+        result = AttachmentService(user=user).check_user_permissions(
+            user_id=user.id,
+            account_id=user.account_id,
+            file_ids=[
+                'public_file',
+                'account_file',
+                'other_account_file',
+                'restricted_no_perm_file',
+                'task_file',
+                'unknown_file',
+            ],
+        )
+
+        # assert
+        assert result == {'public_file', 'account_file', 'task_file'}
+
+    def test_check_user_permission__delegates_to_batch__ok(self, mocker):
+        # arrange
+        user = create_test_admin()
+        check_user_permissions_mock = mocker.patch(
+            'src.storage.services.attachments.AttachmentService.'
+            'check_user_permissions',
+            return_value={'file_1'},
+        )
+        service = AttachmentService(user=user)
+
+        # act
+        result = service.check_user_permission(
+            user_id=user.id,
+            account_id=user.account_id,
+            file_id='file_1',
+        )
+
+        # assert
+        assert result is True
+        check_user_permissions_mock.assert_called_once_with(
+            user_id=user.id,
+            account_id=user.account_id,
+            file_ids=['file_1'],
+            public_template=None,
+        )
+
+
+class TestBumpAttachmentAclVersion:
+    """Tests for the file service permission cache invalidation."""
+
+    def test_bump__new_and_existing_version__incremented(self, mocker):
+        # arrange
+        mocker.patch(
+            'src.storage.services.attachments.transaction.on_commit',
+            side_effect=lambda func: func(),
+        )
+        cache = caches['auth']
+        cache.set('attachment_acl_version:1', 5, timeout=None)
+        cache.delete('attachment_acl_version:2')
+
+        # act
+        bump_attachment_acl_version([1, 2])
+
+        # assert
+        assert cache.get('attachment_acl_version:1') == 6
+        assert cache.get('attachment_acl_version:2') == 1
+
+    def test_assign_task_permissions__bump_version__ok(self, mocker):
+        # arrange
+        user = create_test_admin()
+        workflow = create_test_workflow(user=user, tasks_count=1)
+        task = workflow.tasks.first()
+        bump_mock = mocker.patch(
+            'src.storage.services.attachments.bump_attachment_acl_version',
+        )
+        service = AttachmentService(user=user)
+
+        # act
+        service.create(
+            file_id='task_file',
+            account=user.account,
+            access_type=AccessType.RESTRICTED,
+            source_type=SourceType.TASK,
+            task=task,
+        )
+
+        # assert
+        assert bump_mock.called
+        assert all(
+            set(call.args[0]) == {user.account_id}
+            for call in bump_mock.call_args_list
+        )
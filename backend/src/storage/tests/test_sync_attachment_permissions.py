@@ -22,7 +22,10 @@ from src.permissions.models import UserObjectPermission
 from src.storage.enums import AccessType, SourceType
 from src.storage.models import Attachment
 from src.storage.services.attachments import AttachmentService
-from src.storage.tasks import sync_workflow_attachment_permissions
+from src.storage.tasks import (
+    schedule_sync_workflow_attachment_permissions,
+    sync_workflow_attachment_permissions,
+)
 
 
 @pytest.mark.django_db
@@ -588,3 +591,117 @@ def test_delete_orphaned_perfs__orphan__triggers_att_sync(
     sync_wf_att_perms_mock.assert_called_once_with(
         workflow.id,
     )
+
+
+@pytest.mark.django_db
+def test_sync_wf_att_perms__new_viewer__only_delta_written():
+    """Existing rows are kept as is, only the missing ones
+    are inserted."""
+
+    # arrange
+    account = create_test_account()
+    owner = create_test_owner(account=account)
+    viewer = create_test_not_admin(
+        account=account,
+        email='viewer@test.test',
+    )
+    template = create_test_template(
+        user=owner,
+        is_active=True,
+        tasks_count=1,
+    )
+    workflow = create_test_workflow(
+        user=owner,
+        template=template,
+    )
+    task = workflow.tasks.get(number=1)
+    task_attachment = create_test_attachment(
+        account=account,
+        file_id='task_doc.pdf',
+        task=task,
+        workflow=workflow,
+        access_type=AccessType.RESTRICTED,
+        source_type=SourceType.TASK,
+    )
+    workflow_attachment = create_test_attachment(
+        account=account,
+        file_id='workflow_doc.pdf',
+        workflow=workflow,
+        access_type=AccessType.RESTRICTED,
+        source_type=SourceType.WORKFLOW,
+    )
+    service = AttachmentService()
+    service.assign_permissions(task_attachment)
+    service.assign_permissions(workflow_attachment)
+    att_ct = ContentType.objects.get_for_model(Attachment)
+    obj_pks = [str(task_attachment.id), str(workflow_attachment.id)]
+    perm_ids_before = set(
+        UserObjectPermission.objects.filter(
+            content_type=att_ct,
+            object_pk__in=obj_pks,
+        ).values_list('id', flat=True),
+    )
+    WorkflowPermissionService(workflow).grant_view(
+        user=viewer,
+        source_type=PermissionSource.WORKFLOW_VIEWER,
+        source_id=workflow.id,
+    )
+
+    # act
+    sync_workflow_attachment_permissions(workflow.id)
+
+    # assert
+    perm_ids_after = set(
+        UserObjectPermission.objects.filter(
+            content_type=att_ct,
+            object_pk__in=obj_pks,
+        ).values_list('id', flat=True),
+    )
+    assert perm_ids_before < perm_ids_after
+    new_perms = UserObjectPermission.objects.filter(
+        id__in=perm_ids_after - perm_ids_before,
+    )
+    assert new_perms.count() == 2
+    assert set(new_perms.values_list('user_id', flat=True)) == {viewer.id}
+    for attachment in (task_attachment, workflow_attachment):
+        assert service.check_user_permission(
+            user_id=viewer.id,
+            account_id=viewer.account_id,
+            file_id=attachment.file_id,
+        )
+
+
+@pytest.mark.django_db
+def test_schedule_sync_wf_att_perms__repeated__enqueued_once(
+    mocker,
+    settings,
+):
+    """Triggers of the same workflow within the delay window
+    are collapsed into one task run."""
+
+    # arrange
+    settings.ATTACHMENT_ACL_SYNC_DELAY = 5
+    workflow_id = 1234567
+    mocker.patch(
+        'src.storage.tasks.transaction.on_commit',
+        side_effect=lambda func: func(),
+    )
+    apply_async_mock = mocker.patch(
+        'src.storage.tasks.sync_workflow_attachment_permissions.'
+        'apply_async',
+    )
+
+    # act
+    schedule_sync_workflow_attachment_permissions(workflow_id)
+    schedule_sync_workflow_attachment_permissions(workflow_id)
+
+    # assert
+    apply_async_mock.assert_called_once_with(
+        args=(workflow_id,),
+        countdown=5,
+    )
+
+    # The run resets the window, the next trigger is enqueued
+    sync_workflow_attachment_permissions(workflow_id)
+    schedule_sync_workflow_attachment_permissions(workflow_id)
+    assert apply_async_mock.call_count == 2
@@ -12,6 +12,7 @@ from src.processes.tests.fixtures import (
     create_test_attachment,
     create_test_template,
 )
+from src.storage.consts import CHECK_PERMISSIONS_MAX_SIZE
 from src.storage.enums import AccessType, SourceType
 from src.utils.validation import ErrorCode
 
@@ -377,3 +378,104 @@ class TestCheckPermissionView:
         assert response.status_code == 403
         get_token_mock.assert_called_once()
         get_template_mock.assert_called_once_with(token)
+
+
+class TestCheckPermissionsView:
+
+    def test_check_permissions__mixed_access__return_allowed(
+        self,
+        api_client,
+    ):
+        # arrange
+        user = create_test_admin()
+        api_client.token_authenticate(user)
+        create_test_attachment(
+            user.account,
+            file_id='account_file',
+            access_type=AccessType.ACCOUNT,
+            source_type=SourceType.ACCOUNT,
+        )
+        create_test_attachment(
+            user.account,
+            file_id='public_file',
+            access_type=AccessType.PUBLIC,
+            source_type=SourceType.ACCOUNT,
+        )
+        create_test_attachment(
+            user.account,
+            file_id='restricted_file',
+            access_type=AccessType.RESTRICTED,
+            source_type=SourceType.ACCOUNT,
+        )
+
+        # act
+        response = api_client.post(
+            '/attachments/check-permissions',
+            data={
+                'file_ids': [
+                    'restricted_file',
+                    'public_file',
+                    ' account_file ',
+                    'unknown_file',
+                ],
+            },
+        )
+
+        # assert
+        assert response.status_code == 200
+        assert response.data == {
+            'file_ids': ['account_file', 'public_file'],
+        }
+
+    def test_check_permissions__too_many_files__bad_request(
+        self,
+        api_client,
+    ):
+        # arrange
+        user = create_test_admin()
+        api_client.token_authenticate(user)
+
+        # act
+        response = api_client.post(
+            '/attachments/check-permissions',
+            data={
+                'file_ids': [
+                    f'file_{i}' for i in range(CHECK_PERMISSIONS_MAX_SIZE + 1)
+                ],
+            },
+        )
+
+        # assert
+        assert response.status_code == 400
+        assert response.data['code'] == ErrorCode.VALIDATION_ERROR
+
+    def test_check_permissions__empty_file_id__bad_request(
+        self,
+        api_client,
+    ):
+        # arrange
+        user = create_test_admin()
+        api_client.token_authenticate(user)
+
+        # act
+        response = api_client.post(
+            '/attachments/check-permissions',
+            data={'file_ids': ['file_1', '   ']},
+        )
+
+        # assert
+        assert response.status_code == 400
+        assert response.data['code'] == ErrorCode.VALIDATION_ERROR
+
+    def test_check_permissions__not_authenticated__unauthorized(
+        self,
+        api_client,
+    ):
+        # act
+        response = api_client.post(
+            '/attachments/check-permissions',
+            data={'file_ids': ['file_1']},
+        )
+
+        # assert
+        assert response.status_code == 401
@@ -22,6 +22,7 @@ from src.storage.permissions import (
 )
 from src.storage.serializers import (
     AttachmentCheckPermissionSerializer,
+    AttachmentCheckPermissionsSerializer,
     AttachmentListFilterSerializer,
     AttachmentListSerializer,
     AttachmentSerializer,
@@ -44,6 +45,7 @@ class AttachmentViewSet(
 
     action_serializer_classes = {
         'check_permission': AttachmentCheckPermissionSerializer,
+        'check_permissions': AttachmentCheckPermissionsSerializer,
         'list': AttachmentListSerializer,
     }
     action_paginator_classes = {
@@ -51,7 +53,7 @@ class AttachmentViewSet(
     }
 
     def get_permissions(self):
-        if self.action == 'check_permission':
+        if self.action in ('check_permission', 'check_permissions'):
             return (IsAuthenticatedOrPublicTemplate(),)
         return (IsAuthenticated(),)
 
@@ -74,7 +76,37 @@ class AttachmentViewSet(
         """
         slz = self.get_serializer(data=request.data)
         slz.is_valid(raise_exception=True)
+        file_id = slz.validated_data['file_id']
+        if file_id in self._get_allowed_file_ids([file_id]):
+            return self.response_ok()
+        return self.response_forbidden()
+
+    @extend_schema(exclude=True)
+    @action(
+        methods=['POST'],
+        detail=False,
+        url_path='check-permissions',
+    )
+    def check_permissions(self, request, *args, **kwargs):
+        """
+        Checks user permission to access several files at once.
+        Used by file service to authorize a page of files
+        with one request.
+
+        Returns:
+        - 200: {"file_ids": [...]} with the accessible files
+        - 400: Validation error
+        - 401: Not authenticated
+        """
+        slz = self.get_serializer(data=request.data)
+        slz.is_valid(raise_exception=True)
+        allowed_file_ids = self._get_allowed_file_ids(
+            slz.validated_data['file_ids'],
+        )
+        return self.response_ok({'file_ids': sorted(allowed_file_ids)})
 
+    def _get_allowed_file_ids(self, file_ids):
+        request = self.request
         public_template = getattr(request, 'public_template', None)
         if request.user.is_authenticated:
             user = request.user
@@ -89,17 +121,13 @@ class AttachmentViewSet(
             )
 
         service = AttachmentService(user=user)
-        has_permission = service.check_user_permission(
+        return service.check_user_permissions(
             user_id=user_id,
             account_id=account_id,
-            file_id=slz.validated_data['file_id'],
+            file_ids=file_ids,
             public_template=public_template,
         )
 
-        if has_permission:
-            return self.response_ok()
-        return self.response_forbidden()
-
     @extend_schema(
         tags=['Attachments'],
         summary='List attachments',
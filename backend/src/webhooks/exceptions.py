@@ -1,3 +1,5 @@
+from typing import List
+
 from src.generics.exceptions import BaseServiceException
 from src.webhooks.messages import MSG_WH_0001
 
@@ -5,3 +7,12 @@ from src.webhooks.messages import MSG_WH_0001
 class InvalidEventException(BaseServiceException):
 
     default_message = MSG_WH_0001
+
+
+class WebhookDeliveryError(ConnectionError):
+
+    """ Some hooks of the event should be retried """
+
+    def __init__(self, hook_ids: List[int]):
+        self.hook_ids = hook_ids
+        super().__init__(f'Error sending webhooks {hook_ids}')
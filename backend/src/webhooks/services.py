@@ -1,12 +1,21 @@
 import json
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 
 import requests
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
+from requests.adapters import HTTPAdapter
 
 from src.analysis.services import AnalyticService
-from src.generics.mixins.services import DefaultClsCacheMixin
+from src.generics.mixins.services import (
+    ClsCacheMixin,
+    DefaultClsCacheMixin,
+)
 from src.logs.enums import (
     AccountEventStatus,
 )
@@ -134,76 +143,191 @@ class WebhookService:
         return list(data.values())
 
 
+class WebhookCircuitBreaker(ClsCacheMixin):
+
+    """ Counts failed requests in a row to the target host. The counter
+        expires after the timeout and the host is tried again """
+
+    cache_key_prefix = 'wh_circuit'
+    cache_timeout = settings.WEBHOOK_CIRCUIT_TIMEOUT
+
+    @classmethod
+    def is_open(cls, host: str) -> bool:
+        failures = cls._get_cache(key=host, default=0)
+        return failures >= settings.WEBHOOK_CIRCUIT_FAILURES
+
+    @classmethod
+    def failure(cls, host: str):
+        # Parallel deliveries increment the counter atomically
+        key = cls._get_cache_key(host)
+        cls.cache.add(key, 0, timeout=cls.cache_timeout)
+        try:
+            cls.cache.incr(key)
+        except ValueError:
+            # Expired right after the add
+            cls.cache.add(key, 1, timeout=cls.cache_timeout)
+
+    @classmethod
+    def success(cls, host: str):
+        cls._delete_cache_value(key=cls._get_cache_key(host))
+
+
 class WebhookDeliverer:
 
-    def send(
+    """ Sends the event to the hooks in parallel with a shared connection
+        pool. A failed hook does not stop the other ones, the hooks
+        to retry are raised in WebhookDeliveryError """
+
+    _session: Optional[requests.Session] = None
+    _session_lock = Lock()
+    _target_limits: Dict[str, BoundedSemaphore] = {}
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_maxsize=settings.WEBHOOK_MAX_WORKERS,
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                cls._session = session
+            return cls._session
+
+    @classmethod
+    def _get_target_limit(cls, host: str) -> BoundedSemaphore:
+        with cls._session_lock:
+            if host not in cls._target_limits:
+                cls._target_limits[host] = BoundedSemaphore(
+                    settings.WEBHOOK_TARGET_CONCURRENCY,
+                )
+            return cls._target_limits[host]
+
+    def _post(
         self,
-        event: HookEvent.LITERALS,
-        user_id: int,
-        account_id: int,
-        payload: dict,
-    ):
+        hook: WebHook,
+        hook_payload: dict,
+    ) -> Tuple[Optional[requests.Response], Optional[Exception]]:
 
-        hooks = WebHook.objects.on_account(account_id).for_event(event)
-        for hook in hooks:
-            status = AccountEventStatus.SUCCESS
-            error = {}
-            hook_payload = {'hook': hook.dict(), **payload}
-            http_status = None
+        """ Runs in a thread, so does not touch the database """
+
+        host = urlparse(hook.target).netloc
+        with self._get_target_limit(host):
             try:
-                response = requests.post(
+                response = self.get_session().post(
                     url=hook.target,
-                    data=json.dumps(hook_payload),
+                    data=json.dumps(hook_payload, cls=DjangoJSONEncoder),
                     headers={'Content-Type': 'application/json'},
+                    timeout=(
+                        settings.WEBHOOK_CONNECT_TIMEOUT,
+                        settings.WEBHOOK_READ_TIMEOUT,
+                    ),
                 )
-            except ConnectionError as e:
+            except (ConnectionError, requests.RequestException) as ex:
+                return None, ex
+        return response, None
+
+    def _get_log(
+        self,
+        hook: WebHook,
+        hook_payload: dict,
+        response: Optional[requests.Response],
+        ex: Optional[Exception],
+    ) -> Tuple[dict, bool]:
+
+        """ Returns the log data and whether the hook should be retried """
+
+        status = AccountEventStatus.SUCCESS
+        error = {}
+        http_status = None
+        retry = False
+        if ex is not None:
+            capture_sentry_message(
+                message='HttpException sending webhook',
+                data={
+                    'request_url': hook.target,
+                    'exception': str(ex),
+                },
+                level=SentryLogLevel.INFO,
+            )
+            status = AccountEventStatus.FAILED
+            error['ConnectionError'] = str(ex)
+            retry = True
+        else:
+            http_status = response.status_code
+            if not response.ok:
+                data = {
+                    'request_url': hook.target,
+                    'response_status': response.status_code,
+                }
+                if response.status_code != 404:
+                    content_type = response.headers.get('content-type', '')
+                    if 'text' in content_type:
+                        data['response_text'] = response.text
+                    elif 'application/json' in content_type:
+                        data['response_json'] = response.json()
                 capture_sentry_message(
-                    message='HttpException sending webhook',
-                    data={
-                        'request_url': hook.target,
-                        'exception': str(e),
-                    },
+                    message='Error sending webhook',
+                    data=data,
                     level=SentryLogLevel.INFO,
                 )
                 status = AccountEventStatus.FAILED
-                error['ConnectionError'] = str(e)
-                raise e
+                error['response'] = data
+            retry = response.status_code >= 500
+        log = {
+            'title': f'Webhook: {hook.event}',
+            'path': hook.target,
+            'request_data': hook_payload,
+            'status': status,
+            'http_status': http_status,
+            'response_data': error,
+        }
+        return log, retry
+
+    def send(
+        self,
+        event: HookEvent.LITERALS,
+        user_id: int,
+        account_id: int,
+        payload: dict,
+        hook_ids: Optional[List[int]] = None,
+    ):
+
+        hooks = WebHook.objects.on_account(account_id).for_event(event)
+        if hook_ids is not None:
+            hooks = hooks.filter(id__in=hook_ids)
+        deliveries = []
+        retry_hook_ids = []
+        for hook in hooks:
+            if WebhookCircuitBreaker.is_open(urlparse(hook.target).netloc):
+                # The request is postponed till the next retry
+                retry_hook_ids.append(hook.id)
             else:
-                http_status = response.status_code
-                if not response.ok:
-                    data = {
-                        'request_url': hook.target,
-                        'response_status': response.status_code,
-                    }
-                    if response.status_code != 404:
-                        content_type = response.headers.get('content-type', '')
-                        if 'text' in content_type:
-                            data['response_text'] = response.text
-                        elif 'application/json' in content_type:
-                            data['response_json'] = response.json()
-                    capture_sentry_message(
-                        message='Error sending webhook',
-                        data=data,
-                        level=SentryLogLevel.INFO,
-                    )
-                    status = AccountEventStatus.FAILED
-                    http_status = response.status_code
-                    error['response'] = data
-                if response.status_code >= 500:
-                    raise ConnectionError(
-                        f'Error sending webhook ({response.status_code})',
-                    )
-            finally:
-                AccountLogService().webhook(
-                    title=f'Webhook: {hook.event}',
-                    path=hook.target,
-                    request_data=hook_payload,
-                    account_id=account_id,
-                    status=status,
-                    http_status=http_status,
-                    response_data=error,
-                    user_id=user_id,
+                deliveries.append((hook, {'hook': hook.dict(), **payload}))
+        if len(deliveries) > 1:
+            workers = min(len(deliveries), settings.WEBHOOK_MAX_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(lambda args: self._post(*args), deliveries),
                 )
+        else:
+            results = [self._post(*args) for args in deliveries]
+
+        logs = []
+        for (hook, hook_payload), (response, ex) in zip(deliveries, results):
+            log, retry = self._get_log(hook, hook_payload, response, ex)
+            logs.append({**log, 'account_id': account_id, 'user_id': user_id})
+            host = urlparse(hook.target).netloc
+            if retry:
+                WebhookCircuitBreaker.failure(host)
+                retry_hook_ids.append(hook.id)
+            else:
+                WebhookCircuitBreaker.success(host)
+        if logs:
+            AccountLogService().webhooks(logs)
+        if retry_hook_ids:
+            raise exceptions.WebhookDeliveryError(hook_ids=retry_hook_ids)
 
 
 class WebhookBufferService(DefaultClsCacheMixin):
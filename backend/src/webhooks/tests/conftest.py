@@ -3,6 +3,7 @@ import pytest
 from unittest.mock import Mock
 
 from src.generics.tests.clients import PneumaticApiClient
+from src.webhooks.services import WebhookCircuitBreaker
 
 
 def pytest_configure(config):
@@ -12,3 +13,11 @@ def pytest_configure(config):
 @pytest.fixture
 def api_client():
     return PneumaticApiClient(HTTP_USER_AGENT='Mozilla/5.0')
+
+
+@pytest.fixture(autouse=True)
+def reset_webhook_circuit():
+    # The circuit state of the test hosts is kept in the cache
+    yield
+    WebhookCircuitBreaker.success('test.test')
+    WebhookCircuitBreaker.success('other.test')
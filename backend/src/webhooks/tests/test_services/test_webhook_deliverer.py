@@ -1,6 +1,8 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
 
 from src.logs.enums import (
@@ -11,7 +13,10 @@ from src.processes.tests.fixtures import (
     create_test_user,
 )
 from src.webhooks.enums import HookEvent
-from src.webhooks.services import WebhookDeliverer
+from src.webhooks.services import (
+    WebhookCircuitBreaker,
+    WebhookDeliverer,
+)
 from src.webhooks.tests.fixtures import (
     create_test_webhook,
 )
@@ -30,11 +35,11 @@ def test_send__ok(mocker):
     response_mock = mocker.Mock(ok=True, status_code=204)
     post_mock = mocker.Mock(return_value=response_mock)
     mocker.patch(
-        'src.webhooks.services.requests',
-        post=post_mock,
+        'src.webhooks.services.WebhookDeliverer.get_session',
+        return_value=mocker.Mock(post=post_mock),
     )
     webhook_log_mock = mocker.patch(
-        'src.webhooks.services.AccountLogService.webhook',
+        'src.webhooks.services.AccountLogService.webhooks',
     )
     capture_sentry_mock = mocker.patch(
         'src.webhooks.services.capture_sentry_message',
@@ -64,24 +69,30 @@ def test_send__ok(mocker):
             cls=DjangoJSONEncoder,
         ),
         headers={'Content-Type': 'application/json'},
+        timeout=(
+            settings.WEBHOOK_CONNECT_TIMEOUT,
+            settings.WEBHOOK_READ_TIMEOUT,
+        ),
     )
-    webhook_log_mock.assert_called_once_with(
-        title=f'Webhook: {event}',
-        path=webhook.target,
-        request_data={
-            'hook': {
-                'id': webhook.id,
-                'event': event,
-                'target': webhook.target,
+    webhook_log_mock.assert_called_once_with([
+        {
+            'title': f'Webhook: {event}',
+            'path': webhook.target,
+            'request_data': {
+                'hook': {
+                    'id': webhook.id,
+                    'event': event,
+                    'target': webhook.target,
+                },
+                'workflow': 'value',
             },
-            'workflow': 'value',
+            'account_id': account.id,
+            'status': AccountEventStatus.SUCCESS,
+            'http_status': 204,
+            'response_data': {},
+            'user_id': user.id,
         },
-        account_id=account.id,
-        status=AccountEventStatus.SUCCESS,
-        http_status=204,
-        response_data={},
-        user_id=user.id,
-    )
+    ])
     capture_sentry_mock.assert_not_called()
 
 
@@ -94,11 +105,11 @@ def test_send__webhook_with_another_event__skip(mocker):
     payload = {'workflow': 'value'}
     post_mock = mocker.Mock()
     mocker.patch(
-        'src.webhooks.services.requests',
-        post=post_mock,
+        'src.webhooks.services.WebhookDeliverer.get_session',
+        return_value=mocker.Mock(post=post_mock),
     )
     webhook_log_mock = mocker.patch(
-        'src.webhooks.services.AccountLogService.webhook',
+        'src.webhooks.services.AccountLogService.webhooks',
     )
     service = WebhookDeliverer()
 
@@ -125,11 +136,11 @@ def test_send__webhook_with_another_account__skip(mocker):
     payload = {'workflow': 'value'}
     post_mock = mocker.Mock()
     mocker.patch(
-        'src.webhooks.services.requests',
-        post=post_mock,
+        'src.webhooks.services.WebhookDeliverer.get_session',
+        return_value=mocker.Mock(post=post_mock),
     )
     webhook_log_mock = mocker.patch(
-        'src.webhooks.services.AccountLogService.webhook',
+        'src.webhooks.services.AccountLogService.webhooks',
     )
     service = WebhookDeliverer()
 
@@ -154,13 +165,14 @@ def test_send__connection_error__create_log(mocker):
     event = HookEvent.WORKFLOW_STARTED
     webhook = create_test_webhook(user=user, event=event)
     payload = {'workflow': 'value'}
-    ex = ConnectionError('=(')
-    post_mock = mocker.patch(
-        'src.webhooks.services.requests.post',
-        side_effect=ex,
+    connection_error = ConnectionError('=(')
+    post_mock = mocker.Mock(side_effect=connection_error)
+    mocker.patch(
+        'src.webhooks.services.WebhookDeliverer.get_session',
+        return_value=mocker.Mock(post=post_mock),
     )
     webhook_log_mock = mocker.patch(
-        'src.webhooks.services.AccountLogService.webhook',
+        'src.webhooks.services.AccountLogService.webhooks',
     )
     capture_sentry_mock = mocker.patch(
         'src.webhooks.services.capture_sentry_message',
@@ -177,7 +189,8 @@ def test_send__connection_error__create_log(mocker):
         )
 
     # assert
-    assert str(ex.value) == '=('
+    assert str(ex.value) == f'Error sending webhooks [{webhook.id}]'
+    assert ex.value.hook_ids == [webhook.id]
     post_mock.assert_called_once_with(
         url=webhook.target,
         data=json.dumps(
@@ -192,24 +205,30 @@ def test_send__connection_error__create_log(mocker):
             cls=DjangoJSONEncoder,
         ),
         headers={'Content-Type': 'application/json'},
+        timeout=(
+            settings.WEBHOOK_CONNECT_TIMEOUT,
+            settings.WEBHOOK_READ_TIMEOUT,
+        ),
     )
-    webhook_log_mock.assert_called_once_with(
-        title=f'Webhook: {event}',
-        path=webhook.target,
-        request_data={
-            'hook': {
-                'id': webhook.id,
-                'event': event,
-                'target': webhook.target,
+    webhook_log_mock.assert_called_once_with([
+        {
+            'title': f'Webhook: {event}',
+            'path': webhook.target,
+            'request_data': {
+                'hook': {
+                    'id': webhook.id,
+                    'event': event,
+                    'target': webhook.target,
+                },
+                'workflow': 'value',
             },
-            'workflow': 'value',
+            'account_id': account.id,
+            'status': AccountEventStatus.FAILED,
+            'http_status': None,
+            'response_data': {'ConnectionError': str(connection_error)},
+            'user_id': user.id,
         },
-        account_id=account.id,
-        status=AccountEventStatus.FAILED,
-        http_status=None,
-        response_data={'ConnectionError': str(ex.value)},
-        user_id=user.id,
-    )
+    ])
     capture_sentry_mock.assert_called_once()
 
 
@@ -230,11 +249,11 @@ def test_send__bad_request_content_type_json__ok(mocker):
     )
     post_mock = mocker.Mock(return_value=response_mock)
     mocker.patch(
-        'src.webhooks.services.requests',
-        post=post_mock,
+        'src.webhooks.services.WebhookDeliverer.get_session',
+        return_value=mocker.Mock(post=post_mock),
     )
     webhook_log_mock = mocker.patch(
-        'src.webhooks.services.AccountLogService.webhook',
+        'src.webhooks.services.AccountLogService.webhooks',
     )
     capture_sentry_mock = mocker.patch(
         'src.webhooks.services.capture_sentry_message',
@@ -264,30 +283,36 @@ def test_send__bad_request_content_type_json__ok(mocker):
             cls=DjangoJSONEncoder,
         ),
         headers={'Content-Type': 'application/json'},
+        timeout=(
+            settings.WEBHOOK_CONNECT_TIMEOUT,
+            settings.WEBHOOK_READ_TIMEOUT,
+        ),
     )
-    webhook_log_mock.assert_called_once_with(
-        title=f'Webhook: {event}',
-        path=webhook.target,
-        request_data={
-            'hook': {
-                'id': webhook.id,
-                'event': event,
-                'target': webhook.target,
+    webhook_log_mock.assert_called_once_with([
+        {
+            'title': f'Webhook: {event}',
+            'path': webhook.target,
+            'request_data': {
+                'hook': {
+                    'id': webhook.id,
+                    'event': event,
+                    'target': webhook.target,
+                },
+                'workflow': 'value',
             },
-            'workflow': 'value',
-        },
-        account_id=account.id,
-        status=AccountEventStatus.FAILED,
-        http_status=400,
-        response_data={
-            'response': {
-                'request_url': webhook.target,
-                'response_status': 400,
-                'response_json': bad_response_data,
+            'account_id': account.id,
+            'status': AccountEventStatus.FAILED,
+            'http_status': 400,
+            'response_data': {
+                'response': {
+                    'request_url': webhook.target,
+                    'response_status': 400,
+                    'response_json': bad_response_data,
+                },
             },
+            'user_id': user.id,
         },
-        user_id=user.id,
-    )
+    ])
     capture_sentry_mock.assert_called_once()
 
 
@@ -308,11 +333,11 @@ def test_send__permission_denied_type_text__ok(mocker):
     )
     post_mock = mocker.Mock(return_value=response_mock)
     mocker.patch(
-        'src.webhooks.services.requests',
-        post=post_mock,
+        'src.webhooks.services.WebhookDeliverer.get_session',
+        return_value=mocker.Mock(post=post_mock),
     )
     webhook_log_mock = mocker.patch(
-        'src.webhooks.services.AccountLogService.webhook',
+        'src.webhooks.services.AccountLogService.webhooks',
     )
     capture_sentry_mock = mocker.patch(
         'src.webhooks.services.capture_sentry_message',
@@ -342,30 +367,36 @@ def test_send__permission_denied_type_text__ok(mocker):
             cls=DjangoJSONEncoder,
         ),
         headers={'Content-Type': 'application/json'},
+        timeout=(
+            settings.WEBHOOK_CONNECT_TIMEOUT,
+            settings.WEBHOOK_READ_TIMEOUT,
+        ),
     )
-    webhook_log_mock.assert_called_once_with(
-        title=f'Webhook: {event}',
-        path=webhook.target,
-        request_data={
-            'hook': {
-                'id': webhook.id,
-                'event': event,
-                'target': webhook.target,
+    webhook_log_mock.assert_called_once_with([
+        {
+            'title': f'Webhook: {event}',
+            'path': webhook.target,
+            'request_data': {
+                'hook': {
+                    'id': webhook.id,
+                    'event': event,
+                    'target': webhook.target,
+                },
+                'workflow': 'value',
             },
-            'workflow': 'value',
-        },
-        account_id=account.id,
-        status=AccountEventStatus.FAILED,
-        http_status=403,
-        response_data={
-            'response': {
-                'request_url': webhook.target,
-                'response_status': 403,
-                'response_text': bad_response_text,
+            'account_id': account.id,
+            'status': AccountEventStatus.FAILED,
+            'http_status': 403,
+            'response_data': {
+                'response': {
+                    'request_url': webhook.target,
+                    'response_status': 403,
+                    'response_text': bad_response_text,
+                },
             },
+            'user_id': user.id,
         },
-        user_id=user.id,
-    )
+    ])
     capture_sentry_mock.assert_called_once()
 
 
@@ -386,11 +417,11 @@ def test_send__not_found__ok(mocker):
     )
     post_mock = mocker.Mock(return_value=response_mock)
     mocker.patch(
-        'src.webhooks.services.requests',
-        post=post_mock,
+        'src.webhooks.services.WebhookDeliverer.get_session',
+        return_value=mocker.Mock(post=post_mock),
     )
     webhook_log_mock = mocker.patch(
-        'src.webhooks.services.AccountLogService.webhook',
+        'src.webhooks.services.AccountLogService.webhooks',
     )
     capture_sentry_mock = mocker.patch(
         'src.webhooks.services.capture_sentry_message',
@@ -420,29 +451,35 @@ def test_send__not_found__ok(mocker):
             cls=DjangoJSONEncoder,
         ),
         headers={'Content-Type': 'application/json'},
+        timeout=(
+            settings.WEBHOOK_CONNECT_TIMEOUT,
+            settings.WEBHOOK_READ_TIMEOUT,
+        ),
     )
-    webhook_log_mock.assert_called_once_with(
-        title=f'Webhook: {event}',
-        path=webhook.target,
-        request_data={
-            'hook': {
-                'id': webhook.id,
-                'event': event,
-                'target': webhook.target,
+    webhook_log_mock.assert_called_once_with([
+        {
+            'title': f'Webhook: {event}',
+            'path': webhook.target,
+            'request_data': {
+                'hook': {
+                    'id': webhook.id,
+                    'event': event,
+                    'target': webhook.target,
+                },
+                'workflow': 'value',
             },
-            'workflow': 'value',
-        },
-        account_id=account.id,
-        status=AccountEventStatus.FAILED,
-        http_status=404,
-        response_data={
-            'response': {
-                'request_url': webhook.target,
-                'response_status': 404,
+            'account_id': account.id,
+            'status': AccountEventStatus.FAILED,
+            'http_status': 404,
+            'response_data': {
+                'response': {
+                    'request_url': webhook.target,
+                    'response_status': 404,
+                },
             },
+            'user_id': user.id,
         },
-        user_id=user.id,
-    )
+    ])
     capture_sentry_mock.assert_called_once()
 
 
@@ -462,11 +499,11 @@ def test_send__internal_server_error__raise_exception(mocker):
     )
     post_mock = mocker.Mock(return_value=response_mock)
     mocker.patch(
-        'src.webhooks.services.requests',
-        post=post_mock,
+        'src.webhooks.services.WebhookDeliverer.get_session',
+        return_value=mocker.Mock(post=post_mock),
     )
     webhook_log_mock = mocker.patch(
-        'src.webhooks.services.AccountLogService.webhook',
+        'src.webhooks.services.AccountLogService.webhooks',
     )
     capture_sentry_mock = mocker.patch(
         'src.webhooks.services.capture_sentry_message',
@@ -483,7 +520,7 @@ def test_send__internal_server_error__raise_exception(mocker):
         )
 
     # assert
-    assert str(ex.value) == 'Error sending webhook (500)'
+    assert str(ex.value) == f'Error sending webhooks [{webhook.id}]'
     post_mock.assert_called_once_with(
         url=webhook.target,
         data=json.dumps(
@@ -498,28 +535,164 @@ def test_send__internal_server_error__raise_exception(mocker):
             cls=DjangoJSONEncoder,
         ),
         headers={'Content-Type': 'application/json'},
+        timeout=(
+            settings.WEBHOOK_CONNECT_TIMEOUT,
+            settings.WEBHOOK_READ_TIMEOUT,
+        ),
     )
-    webhook_log_mock.assert_called_once_with(
-        title=f'Webhook: {event}',
-        path=webhook.target,
-        request_data={
-            'hook': {
-                'id': webhook.id,
-                'event': event,
-                'target': webhook.target,
+    webhook_log_mock.assert_called_once_with([
+        {
+            'title': f'Webhook: {event}',
+            'path': webhook.target,
+            'request_data': {
+                'hook': {
+                    'id': webhook.id,
+                    'event': event,
+                    'target': webhook.target,
+                },
+                'workflow': 'value',
             },
-            'workflow': 'value',
-        },
-        account_id=account.id,
-        status=AccountEventStatus.FAILED,
-        http_status=500,
-        response_data={
-            'response': {
-                'request_url': webhook.target,
-                'response_status': 500,
-                'response_text': 'internal server error',
+            'account_id': account.id,
+            'status': AccountEventStatus.FAILED,
+            'http_status': 500,
+            'response_data': {
+                'response': {
+                    'request_url': webhook.target,
+                    'response_status': 500,
+                    'response_text': 'internal server error',
+                },
             },
+            'user_id': user.id,
         },
+    ])
+    capture_sentry_mock.assert_called_once()
+
+
+def test_send__one_hook_failed__deliver_others(mocker):
+
+    # arrange
+    account = create_test_account()
+    user = create_test_user(account=account)
+    event = HookEvent.WORKFLOW_STARTED
+    failed_webhook = create_test_webhook(user=user, event=event)
+    webhook = create_test_webhook(
+        user=user,
+        event=event,
+        url='http://other.test',
+    )
+
+    def post(url, **kwargs):
+        if url == failed_webhook.target:
+            raise ConnectionError('=(')
+        return mocker.Mock(ok=True, status_code=204)
+
+    post_mock = mocker.Mock(side_effect=post)
+    mocker.patch(
+        'src.webhooks.services.WebhookDeliverer.get_session',
+        return_value=mocker.Mock(post=post_mock),
+    )
+    webhook_log_mock = mocker.patch(
+        'src.webhooks.services.AccountLogService.webhooks',
+    )
+    mocker.patch('src.webhooks.services.capture_sentry_message')
+    service = WebhookDeliverer()
+
+    # act
+    with pytest.raises(ConnectionError) as ex:
+        service.send(
+            event=event,
+            user_id=user.id,
+            account_id=account.id,
+            payload={'workflow': 'value'},
+        )
+
+    # assert
+    assert ex.value.hook_ids == [failed_webhook.id]
+    assert post_mock.call_count == 2
+    logs = webhook_log_mock.call_args[0][0]
+    statuses = {log['path']: log['status'] for log in logs}
+    assert statuses == {
+        failed_webhook.target: AccountEventStatus.FAILED,
+        webhook.target: AccountEventStatus.SUCCESS,
+    }
+
+
+def test_send__hook_ids__send_only_them(mocker):
+
+    # arrange
+    account = create_test_account()
+    user = create_test_user(account=account)
+    event = HookEvent.WORKFLOW_STARTED
+    create_test_webhook(user=user, event=event)
+    webhook = create_test_webhook(
+        user=user,
+        event=event,
+        url='http://other.test',
+    )
+    post_mock = mocker.Mock(
+        return_value=mocker.Mock(ok=True, status_code=204),
+    )
+    mocker.patch(
+        'src.webhooks.services.WebhookDeliverer.get_session',
+        return_value=mocker.Mock(post=post_mock),
+    )
+    mocker.patch('src.webhooks.services.AccountLogService.webhooks')
+    service = WebhookDeliverer()
+
+    # act
+    service.send(
+        event=event,
         user_id=user.id,
+        account_id=account.id,
+        payload={'workflow': 'value'},
+        hook_ids=[webhook.id],
     )
-    capture_sentry_mock.assert_called_once()
+
+    # assert
+    post_mock.assert_called_once()
+    assert post_mock.call_args[1]['url'] == webhook.target
+
+
+def test_send__circuit_open__postpone(mocker):
+
+    # arrange
+    account = create_test_account()
+    user = create_test_user(account=account)
+    event = HookEvent.WORKFLOW_STARTED
+    webhook = create_test_webhook(user=user, event=event)
+    for _ in range(settings.WEBHOOK_CIRCUIT_FAILURES):
+        WebhookCircuitBreaker.failure('test.test')
+    post_mock = mocker.Mock()
+    mocker.patch(
+        'src.webhooks.services.WebhookDeliverer.get_session',
+        return_value=mocker.Mock(post=post_mock),
+    )
+    webhook_log_mock = mocker.patch(
+        'src.webhooks.services.AccountLogService.webhooks',
+    )
+    service = WebhookDeliverer()
+
+    # act
+    with pytest.raises(ConnectionError) as ex:
+        service.send(
+            event=event,
+            user_id=user.id,
+            account_id=account.id,
+            payload={'workflow': 'value'},
+        )
+
+    # assert
+    assert ex.value.hook_ids == [webhook.id]
+    post_mock.assert_not_called()
+    webhook_log_mock.assert_not_called()
+
+
+def test_circuit_breaker_failure__parallel__count_all():
+
+    # act
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(20):
+            executor.submit(WebhookCircuitBreaker.failure, 'test.test')
+
+    # assert
+    assert WebhookCircuitBreaker._get_cache(key='test.test') == 20
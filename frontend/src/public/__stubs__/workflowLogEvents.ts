@@ -34,7 +34,8 @@ export const makeLogEvent = (
     delay: null,
     targetUserId: null,
     targetGroupId: null,
-    watched: [],
+    watchedCount: 0,
+    isWatched: false,
     reactions: {},
     ...overrides,
   };
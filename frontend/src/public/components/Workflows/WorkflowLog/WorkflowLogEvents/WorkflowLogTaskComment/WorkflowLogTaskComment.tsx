@@ -47,7 +47,8 @@ export function WorkflowLogTaskComment({
   currentUserId,
   status,
   text,
-  watched,
+  watchedCount,
+  isWatched: isWatchedByUser,
   reactions,
   userId,
   created,
@@ -69,7 +70,7 @@ export function WorkflowLogTaskComment({
   const clickRef = useRef<HTMLButtonElement>(null);
   const [isShowTooltipEmoji, setIsShowTooltipEmoji] = useState(false);
   const [isShowEmoji, setIsShowEmoji] = useState(false);
-  const [isWatched, setIsWatched] = useState(false);
+  const [isWatched, setIsWatched] = useState(Boolean(isWatchedByUser));
   const [isDelete, setIsDelete] = useState(false);
   const [isEdit, setIsEdit] = useState(false);
   const [commentText, setCommentText] = useStatePromise('');
@@ -304,22 +305,10 @@ export function WorkflowLogTaskComment({
 
     return (
       <footer className={styles['comment__footer']} ref={clickRef}>
-        {watched.length ? (
-          <Tooltip
-            content={renderListUsers(watched.map((value) => value.userId))}
-            containerClassName={classnames(styles['comment__footer-item'], workflowModal && styles['is-modal'])}
-          >
-            <div>
-              <CommentWatchedIcon />
-              <span>{watched.length}</span>
-            </div>
-          </Tooltip>
-        ) : (
-          <div className={classnames(styles['comment__footer-item'], workflowModal && styles['is-modal'])}>
-            <CommentWatchedIcon />
-            <span>{watched.length}</span>
-          </div>
-        )}
+        <div className={classnames(styles['comment__footer-item'], workflowModal && styles['is-modal'])}>
+          <CommentWatchedIcon />
+          <span>{watchedCount}</span>
+        </div>
 
         {renderReaction()}
 
@@ -386,7 +375,7 @@ export enum ECommentStatus {
 
 export type TWorkflowLogTaskCommentProps = Pick<
   IWorkflowLogItem,
-  'id' | 'text' | 'userId' | 'status' | 'created' | 'watched' | 'reactions' | 'task'
+  'id' | 'text' | 'userId' | 'status' | 'created' | 'watchedCount' | 'isWatched' | 'reactions' | 'task'
 > & {
   currentUserId: number;
   workflowModal: boolean;
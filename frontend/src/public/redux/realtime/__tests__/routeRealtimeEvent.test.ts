@@ -4,8 +4,13 @@ import { routeRealtimeEvent } from '../utils/routeRealtimeEvent';
 import { handleRemoveTask } from '../../tasks/saga';
 import { ERealtimeEnvelopeType, IRealtimeWsEnvelope } from '../types';
 import { ETaskListCompletionStatus, ETaskStatus } from '../../../types/tasks';
+import { EWorkflowLogEvent } from '../../../types/workflow';
 import { getTasksSettings } from '../../selectors/tasks';
 import { activeUsersCountFetchFinished, upsertUserFromWs } from '../../accounts/slice';
+import { getTaskStore } from '../../selectors/task';
+import { getWorkflowsStore } from '../../selectors/workflows';
+import { updateWorkflowLogItem } from '../../workflows/slice';
+import { makeLogEvent } from '../../../__stubs__/workflowLogEvents';
 
 jest.mock('../../../utils/logger', () => ({
   logger: { info: jest.fn(), error: jest.fn() },
@@ -154,3 +159,29 @@ describe('routeRealtimeEvent — task_deleted list updates', () => {
     expect(gen.next().done).toBe(true);
   });
 });
+
+describe('routeRealtimeEvent — event_watched', () => {
+  it('EVENT_WATCHED patches watched count of the open workflow log item', () => {
+    const item = makeLogEvent(EWorkflowLogEvent.TaskComment, { id: 7, workflowId: 3, watchedCount: 1 });
+    const envelope = {
+      id: '7',
+      dateCreatedTsp: 0,
+      type: ERealtimeEnvelopeType.EVENT_WATCHED,
+      data: {
+        id: 7,
+        workflowId: 3,
+        watchedCount: 2,
+        watched: [{ userId: 5, date: '2024-01-01T01:00:00Z', dateTsp: 1704070800 }],
+      },
+    } as IRealtimeWsEnvelope;
+
+    const gen = routeRealtimeEvent(envelope);
+
+    expect(gen.next().value).toEqual(select(getTaskStore));
+    expect(gen.next({ data: null, workflowLog: { items: [] } } as never).value).toEqual(select(getWorkflowsStore));
+    expect(gen.next({ workflow: { id: 3 }, workflowLog: { items: [item] } } as never).value).toEqual(
+      put(updateWorkflowLogItem({ ...item, watchedCount: 2 })),
+    );
+    expect(gen.next().done).toBe(true);
+  });
+});
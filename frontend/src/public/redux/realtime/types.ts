@@ -14,6 +14,7 @@ export enum ERealtimeEnvelopeType {
   TASK_DELETED = 'task_deleted',
   EVENT_CREATED = 'event_created',
   EVENT_UPDATED = 'event_updated',
+  EVENT_WATCHED = 'event_watched',
   NOTIFICATION_CREATED = 'notification_created',
   USER_CREATED = 'user_created',
   USER_UPDATED = 'user_updated',
@@ -44,6 +45,7 @@ export type IRealtimeWsEnvelope =
   // process events
   | (IWsEnvelopeBase & { type: ERealtimeEnvelopeType.EVENT_CREATED; data: IWsEventCreatedData })
   | (IWsEnvelopeBase & { type: ERealtimeEnvelopeType.EVENT_UPDATED; data: IWsEventUpdatedData })
+  | (IWsEnvelopeBase & { type: ERealtimeEnvelopeType.EVENT_WATCHED; data: IWsEventWatchedData })
 
 
 
@@ -210,6 +212,13 @@ export type IWsEventCreatedData = IWorkflowLogItem;
 
 export type IWsEventUpdatedData = IWorkflowLogItem;
 
+export interface IWsEventWatchedData {
+  id: number;
+  workflowId: number;
+  watchedCount: number;
+  watched: { userId: number; date: string; dateTsp: number }[];
+}
+
 export interface IWsUserData {
   id: number;
   firstName: string;
@@ -25,7 +25,8 @@ describe('mapWsEnvelopeToWorkflowLogItem', () => {
         delay: null,
       },
       delay: null,
-      watched: [],
+      watchedCount: 0,
+      isWatched: null,
       reactions: {},
     };
 
@@ -55,7 +56,8 @@ describe('mapWsEnvelopeToWorkflowLogItem', () => {
       text: null,
       task: null,
       delay: null,
-      watched: [],
+      watchedCount: 0,
+      isWatched: null,
       reactions: {},
     };
 
@@ -84,7 +86,8 @@ describe('mapWsEnvelopeToWorkflowLogItem', () => {
       text: 'Updated',
       task: null,
       delay: null,
-      watched: [{ date: '2024-01-01T01:00:00Z', userId: 3 }],
+      watchedCount: 1,
+      isWatched: null,
       reactions: { '👍': [3] },
     };
 
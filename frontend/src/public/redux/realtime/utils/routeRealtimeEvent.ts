@@ -108,6 +108,23 @@ export function* routeRealtimeEvent(envelope: IRealtimeWsEnvelope) {
 
       break;
     }
+    case ERealtimeEnvelopeType.EVENT_WATCHED: {
+      const { id, workflowId, watchedCount } = envelope.data;
+      const { data, workflowLog: taskWorkflowLog }: IStoreTask = yield select(getTaskStore);
+      const { workflow, workflowLog }: IStoreWorkflows = yield select(getWorkflowsStore);
+
+      if (workflowId === workflow?.id) {
+        const item = workflowLog.items.find((logItem) => logItem.id === id);
+        if (item) yield put(updateWorkflowLogItem({ ...item, watchedCount }));
+      }
+
+      if (workflowId === data?.workflow.id) {
+        const item = taskWorkflowLog.items.find((logItem) => logItem.id === id);
+        if (item) yield put(updateTaskWorkflowLogItem({ ...item, watchedCount }));
+      }
+
+      break;
+    }
     case ERealtimeEnvelopeType.NOTIFICATION_CREATED: {
       const item = mapNotificationCreatedDataToListItem(envelope.data);
 
@@ -103,7 +103,8 @@ export interface IWorkflowLogItem {
   delay: IWorkflowDelay | null;
   targetUserId: number | null;
   targetGroupId: number | null;
-  watched: { date: string; userId: number }[];
+  watchedCount: number;
+  isWatched: boolean | null;
   reactions: { [value: string]: number[] };
 }
 
@@ -1,9 +1,11 @@
 """Application use cases."""
 
+from .file_access import CheckFileAccessUseCase
 from .file_download import DownloadFileUseCase
 from .file_upload import UploadFileUseCase
 
 __all__ = [
+    'CheckFileAccessUseCase',
     'DownloadFileUseCase',
     'UploadFileUseCase',
 ]
@@ -0,0 +1,129 @@
+"""File access check use case."""
+
+from typing import TYPE_CHECKING, Union
+
+from src.domain.entities import FileRecord
+from src.infra.access_cache import FileAccessCache
+from src.infra.http_client import HttpClient
+
+if TYPE_CHECKING:
+    from src.shared_kernel.auth.dependencies import AuthenticatedUser
+    from src.shared_kernel.middleware.auth_middleware import AuthUser
+
+
+class CheckFileAccessUseCase:
+    """Resolve which files the user can access.
+
+    Owners always have access (saves backend request), the other
+    decisions are taken from the cache or asked from the backend
+    with one request for all the files.
+    """
+
+    def __init__(
+        self,
+        http_client: HttpClient,
+        access_cache: FileAccessCache,
+    ) -> None:
+        """Initialize check file access use case.
+
+        Args:
+            http_client: HTTP client for backend permission checks.
+            access_cache: Permission decisions cache.
+
+        """
+        self._http_client = http_client
+        self._access_cache = access_cache
+
+    async def execute(
+        self,
+        user: Union['AuthUser', 'AuthenticatedUser'],
+        file_records: list[FileRecord],
+    ) -> set[str]:
+        """Get ids of the files the user has access to.
+
+        Args:
+            user: Current user.
+            file_records: Files to check.
+
+        Returns:
+            set[str]: Accessible file ids.
+
+        """
+        allowed, pending = await self._get_cached(user, file_records)
+        if not pending:
+            return allowed
+        granted = await self._check_backend(user, list(pending))
+        for file_id, version in pending.items():
+            self._access_cache.set_decision(
+                user,
+                file_id,
+                version,
+                allowed=file_id in granted,
+            )
+        return allowed | granted
+
+    @staticmethod
+    def is_owner(
+        user: Union['AuthUser', 'AuthenticatedUser'],
+        file_record: FileRecord,
+    ) -> bool:
+        """Check if user owns the file."""
+        if user.user_id is not None:
+            return file_record.user_id == user.user_id
+        # Public/Guest tokens can access files uploaded by Public/Guest
+        # tokens (user_id=None) in the same account
+        return (
+            file_record.user_id is None
+            and file_record.account_id == user.account_id
+        )
+
+    async def _get_cached(
+        self,
+        user: Union['AuthUser', 'AuthenticatedUser'],
+        file_records: list[FileRecord],
+    ) -> tuple[set[str], dict[str, int | None]]:
+        """Split files into allowed and not decided yet.
+
+        The not decided files are returned with the ACL version
+        of their account to cache the backend decision under.
+        """
+        allowed: set[str] = set()
+        pending: dict[str, int | None] = {}
+        versions: dict[int, int | None] = {}
+        for file_record in file_records:
+            if self.is_owner(user, file_record):
+                allowed.add(file_record.file_id)
+                continue
+            account_id = file_record.account_id
+            if account_id not in versions:
+                versions[
+                    account_id
+                ] = await self._access_cache.get_acl_version(account_id)
+            version = versions[account_id]
+            decision = self._access_cache.get_decision(
+                user,
+                file_record.file_id,
+                version,
+            )
+            if decision is None:
+                pending[file_record.file_id] = version
+            elif decision:
+                allowed.add(file_record.file_id)
+        return allowed, pending
+
+    async def _check_backend(
+        self,
+        user: Union['AuthUser', 'AuthenticatedUser'],
+        file_ids: list[str],
+    ) -> set[str]:
+        """Ask the backend which files the user has access to."""
+        if len(file_ids) > 1:
+            return await self._http_client.check_file_permissions(
+                user=user,
+                file_ids=file_ids,
+            )
+        has_access = await self._http_client.check_file_permission(
+            user=user,
+            file_id=file_ids[0],
+        )
+        return set(file_ids) if has_access else set()
@@ -4,6 +4,7 @@ from collections.abc import AsyncIterator
 
 from src.application.dto import DownloadFileQuery
 from src.domain.entities import FileRecord
+from src.infra.access_cache import FileAccessCache
 from src.infra.adapters.storage_service import StorageService
 from src.infra.repositories import FileRecordRepository
 from src.shared_kernel.exceptions import DomainFileNotFoundError
@@ -16,16 +17,19 @@ class DownloadFileUseCase:
         self,
         file_repository: FileRecordRepository,
         storage_service: StorageService,
+        access_cache: FileAccessCache | None = None,
     ) -> None:
         """Initialize download file use case.
 
         Args:
             file_repository: File repository.
             storage_service: File storage service.
+            access_cache: Optional file records cache.
 
         """
         self._file_repository = file_repository
         self._storage_service = storage_service
+        self._access_cache = access_cache
 
     async def get_metadata(self, query: DownloadFileQuery) -> FileRecord:
         """Get file metadata without loading the stream (fail fast).
@@ -40,11 +44,47 @@ class DownloadFileUseCase:
             DomainFileNotFoundError: If file not found.
 
         """
+        if self._access_cache is not None:
+            file_record = self._access_cache.get_file_record(query.file_id)
+            if file_record is not None:
+                return file_record
         file_record = await self._file_repository.get_by_id(query.file_id)
         if not file_record:
             raise DomainFileNotFoundError(query.file_id)
+        if self._access_cache is not None:
+            self._access_cache.set_file_record(file_record)
         return file_record
 
+    async def get_metadata_many(self, file_ids: list[str]) -> list[FileRecord]:
+        """Get metadata of several files, unknown ids are skipped.
+
+        Args:
+            file_ids: File identifiers.
+
+        Returns:
+            list[FileRecord]: Found file records.
+
+        """
+        file_records = []
+        missing_ids = []
+        for file_id in dict.fromkeys(file_ids):
+            file_record = (
+                self._access_cache.get_file_record(file_id)
+                if self._access_cache is not None
+                else None
+            )
+            if file_record is None:
+                missing_ids.append(file_id)
+            else:
+                file_records.append(file_record)
+        if missing_ids:
+            found = await self._file_repository.get_by_ids(missing_ids)
+            for file_record in found:
+                if self._access_cache is not None:
+                    self._access_cache.set_file_record(file_record)
+            file_records.extend(found)
+        return file_records
+
     async def get_stream(
         self,
         file_record: FileRecord,
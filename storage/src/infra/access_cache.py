@@ -0,0 +1,183 @@
+"""Per-worker cache of file metadata and permission decisions.
+
+File records never change after upload and are cached by file_id.
+Permission decisions are cached by (principal, file_id) under the
+ACL version of the file account. The Django backend increments the
+version on every attachment ACL change, so a stale decision is not
+used after the change, the short TTL bounds the other cases
+(group membership, user deactivation).
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Generic, TypeVar, Union
+
+from src.domain.entities import FileRecord
+from src.shared_kernel.auth import get_redis_client
+from src.shared_kernel.config import get_settings
+from src.shared_kernel.exceptions import (
+    RedisConnectionError,
+    RedisOperationError,
+)
+
+if TYPE_CHECKING:
+    from src.shared_kernel.auth.dependencies import AuthenticatedUser
+    from src.shared_kernel.middleware.auth_middleware import AuthUser
+
+logger = logging.getLogger(__name__)
+
+# Must match Django backend: src.storage.consts
+_ACL_VERSION_KEY = 'attachment_acl_version:{account_id}'
+
+_T = TypeVar('_T')
+
+
+class _TtlCache(Generic[_T]):
+    """Bounded LRU cache with expiring entries."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize cache.
+
+        Args:
+            maxsize: Max number of entries.
+            ttl: Entry lifetime in seconds, 0 disables the cache.
+
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[str, tuple[float, _T]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Check if the cache stores entries."""
+        return self._ttl > 0 and self._maxsize > 0
+
+    def get(self, key: str) -> _T | None:
+        """Get value or None if missing or expired."""
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: _T) -> None:
+        """Store value, evict the least recently used entry if full."""
+        if not self.enabled:
+            return
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+
+def _get_principal(user: Union['AuthUser', 'AuthenticatedUser']) -> str:
+    """Identify whom the backend permission decision is about.
+
+    Tokens without a user (public forms) are identified by the token
+    hash, the decision depends on the template of the token.
+    """
+    if user.user_id is not None:
+        return f'{user.auth_type}:{user.user_id}'
+    token_hash = hashlib.sha256((user.token or '').encode()).hexdigest()
+    return f'{user.auth_type}:{user.account_id}:{token_hash}'
+
+
+class FileAccessCache:
+    """Cache of file records and permission decisions."""
+
+    def __init__(
+        self,
+        record_ttl: float,
+        decision_ttl: float,
+        maxsize: int,
+    ) -> None:
+        """Initialize file access cache.
+
+        Args:
+            record_ttl: File record lifetime in seconds.
+            decision_ttl: Permission decision lifetime in seconds.
+            maxsize: Max entries of each cache.
+
+        """
+        self._records: _TtlCache[FileRecord] = _TtlCache(maxsize, record_ttl)
+        self._decisions: _TtlCache[bool] = _TtlCache(maxsize, decision_ttl)
+
+    def get_file_record(self, file_id: str) -> FileRecord | None:
+        """Get cached file record."""
+        return self._records.get(file_id)
+
+    def set_file_record(self, file_record: FileRecord) -> None:
+        """Cache file record."""
+        self._records.set(file_record.file_id, file_record)
+
+    async def get_acl_version(self, account_id: int) -> int | None:
+        """Get ACL version of the account.
+
+        Returns None if decisions can't be cached now
+        (cache disabled or Redis unavailable).
+        """
+        if not self._decisions.enabled:
+            return None
+        try:
+            return await get_redis_client().get_version(
+                _ACL_VERSION_KEY.format(account_id=account_id),
+            )
+        except (RedisConnectionError, RedisOperationError) as e:
+            logger.warning('Permission cache is bypassed: %s', e)
+            return None
+
+    def get_decision(
+        self,
+        user: Union['AuthUser', 'AuthenticatedUser'],
+        file_id: str,
+        version: int | None,
+    ) -> bool | None:
+        """Get cached decision, None if it must be asked from backend."""
+        if version is None:
+            return None
+        return self._decisions.get(
+            f'{version}:{_get_principal(user)}:{file_id}',
+        )
+
+    def set_decision(
+        self,
+        user: Union['AuthUser', 'AuthenticatedUser'],
+        file_id: str,
+        version: int | None,
+        *,
+        allowed: bool,
+    ) -> None:
+        """Cache decision taken under the ACL version."""
+        if version is None:
+            return
+        self._decisions.set(
+            f'{version}:{_get_principal(user)}:{file_id}',
+            allowed,
+        )
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._records.clear()
+        self._decisions.clear()
+
+
+@lru_cache
+def get_file_access_cache() -> FileAccessCache:
+    """Get or create file access cache singleton."""
+    settings = get_settings()
+    return FileAccessCache(
+        record_ttl=settings.FILE_RECORD_CACHE_TTL,
+        decision_ttl=settings.PERMISSION_CACHE_TTL,
+        maxsize=settings.PERMISSION_CACHE_SIZE,
+    )
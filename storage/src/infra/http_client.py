@@ -58,14 +58,16 @@ async def close_shared_client() -> None:
 class HttpClient:
     """HTTP client for Django backend requests."""
 
-    def __init__(self, base_url: str) -> None:
+    def __init__(self, base_url: str, batch_url: str | None = None) -> None:
         """Initialize HTTP client.
 
         Args:
             base_url: Base URL for HTTP requests.
+            batch_url: URL for batch permission checks.
 
         """
         self.base_url = base_url
+        self.batch_url = batch_url
 
     @property
     def client(self) -> httpx.AsyncClient:
@@ -78,15 +80,7 @@ class HttpClient:
         file_id: str,
     ) -> bool:
         """Check file permission based on user type and token."""
-        # Form headers based on user type
-        headers: dict[str, str] = {}
-
-        if user.auth_type == UserType.AUTHENTICATED and user.token:
-            headers['Authorization'] = f'Bearer {user.token}'
-        elif user.auth_type == UserType.GUEST_TOKEN and user.token:
-            headers['X-Guest-Authorization'] = user.token
-        elif user.auth_type == UserType.PUBLIC_TOKEN and user.token:
-            headers['X-Public-Authorization'] = f'Token {user.token}'
+        headers = self._get_auth_headers(user)
 
         try:
             response = await self.client.post(
@@ -109,6 +103,51 @@ class HttpClient:
             # 204 - access granted, 403 - access denied
             return response.status_code == HTTPStatus.NO_CONTENT
 
+    async def check_file_permissions(
+        self,
+        user: Union['AuthUser', 'AuthenticatedUser'],
+        file_ids: list[str],
+    ) -> set[str]:
+        """Check permissions of several files with one request.
+
+        Returns ids of the files the user has access to.
+        """
+        url = self.batch_url or self.base_url
+        try:
+            response = await self.client.post(
+                url=url,
+                json={'file_ids': file_ids},
+                headers=self._get_auth_headers(user),
+            )
+        except httpx.TimeoutException as e:
+            raise HttpTimeoutError(
+                url=url,
+                timeout=SharedClientHolder.TIMEOUT_SECONDS,
+                details=str(e),
+            ) from e
+        except httpx.RequestError as e:
+            raise HttpClientError(
+                url=url,
+                details=MSG_EXT_014.format(details=str(e)),
+            ) from e
+        if response.status_code != HTTPStatus.OK:
+            return set()
+        return set(response.json().get('file_ids', []))
+
+    @staticmethod
+    def _get_auth_headers(
+        user: Union['AuthUser', 'AuthenticatedUser'],
+    ) -> dict[str, str]:
+        """Form auth headers based on user type."""
+        headers: dict[str, str] = {}
+        if user.auth_type == UserType.AUTHENTICATED and user.token:
+            headers['Authorization'] = f'Bearer {user.token}'
+        elif user.auth_type == UserType.GUEST_TOKEN and user.token:
+            headers['X-Guest-Authorization'] = user.token
+        elif user.auth_type == UserType.PUBLIC_TOKEN and user.token:
+            headers['X-Public-Authorization'] = f'Token {user.token}'
+        return headers
+
     async def close(self) -> None:
         """Close HTTP client (intentionally no-op).
 
@@ -79,3 +79,27 @@ class FileRecordRepository:
                 operation='get_file_record_by_id',
                 details=str(e),
             ) from e
+
+    async def get_by_ids(self, file_ids: list[str]) -> list[FileRecord]:
+        """Get file records by IDs, missing ones are skipped."""
+        try:
+            stmt = select(FileRecordORM).where(
+                FileRecordORM.file_id.in_(file_ids),
+            )
+            result = await self.session.execute(stmt)
+            return [
+                self.mapper.orm_to_entity(orm_record)
+                for orm_record in result.scalars()
+            ]
+        except OperationalError as e:
+            raise DatabaseConnectionError(
+                details=MSG_DB_009.format(
+                    operation='get_by_ids',
+                    details=str(e),
+                ),
+            ) from e
+        except SQLAlchemyDatabaseError as e:
+            raise DatabaseOperationError(
+                operation='get_file_records_by_ids',
+                details=str(e),
+            ) from e
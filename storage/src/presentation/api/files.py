@@ -20,12 +20,16 @@ from src.application.dto import (
     UploadFileCommand,
 )
 from src.application.use_cases import (
+    CheckFileAccessUseCase,
     DownloadFileUseCase,
     UploadFileUseCase,
 )
 from src.domain.entities.file_record import FileRecord
-from src.infra.http_client import HttpClient
-from src.presentation.dto import FileUploadResponse
+from src.presentation.dto import (
+    CheckPermissionsRequest,
+    CheckPermissionsResponse,
+    FileUploadResponse,
+)
 from src.shared_kernel.auth.dependencies import (
     AuthenticatedUser,
     get_current_user,
@@ -33,7 +37,7 @@ from src.shared_kernel.auth.dependencies import (
 from src.shared_kernel.config import BaseAppSettings
 from src.shared_kernel.di import (
     get_download_use_case,
-    get_http_client,
+    get_file_access_use_case,
     get_settings_dep,
     get_upload_use_case,
 )
@@ -126,7 +130,10 @@ async def download_file(
     file_id: Annotated[str, Path(min_length=1, max_length=512)],
     current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     use_case: Annotated[DownloadFileUseCase, Depends(get_download_use_case)],
-    http_client: Annotated[HttpClient, Depends(get_http_client)],
+    access_use_case: Annotated[
+        CheckFileAccessUseCase,
+        Depends(get_file_access_use_case),
+    ],
     range_header: Annotated[str | None, Header(alias='Range')] = None,
 ) -> StreamingResponse:
     """Download file from storage.
@@ -135,7 +142,7 @@ async def download_file(
         file_id: File identifier.
         current_user: Current authenticated user.
         use_case: Download use case dependency.
-        http_client: HTTP client for permission checks.
+        access_use_case: File access check use case dependency.
         range_header: Optional HTTP Range header.
 
     Returns:
@@ -154,17 +161,12 @@ async def download_file(
     # Get file metadata first (fail fast, without loading the stream)
     file_record = await use_case.get_metadata(query)
 
-    # Check file owner (optimization: owner always has access)
-    is_owner = _check_file_ownership(current_user, file_record)
-
-    if not is_owner:
-        # Check permissions only for non-owners (saves backend request)
-        has_access = await http_client.check_file_permission(
-            user=current_user,
-            file_id=file_id,
-        )
-        if not has_access:
-            raise FileAccessDeniedError(file_id, current_user.user_id)
+    allowed_file_ids = await access_use_case.execute(
+        user=current_user,
+        file_records=[file_record],
+    )
+    if file_record.file_id not in allowed_file_ids:
+        raise FileAccessDeniedError(file_id, current_user.user_id)
 
     # Load the file stream only if access is granted
     file_stream = await use_case.get_stream(
@@ -191,18 +193,45 @@ async def download_file(
     )
 
 
-def _check_file_ownership(
-    current_user: AuthenticatedUser,
-    file_record: FileRecord,
-) -> bool:
-    """Check if current user owns the file."""
-    if current_user.user_id is not None:
-        return file_record.user_id == current_user.user_id
-    # Public/Guest tokens can access files uploaded by Public/Guest
-    # tokens (user_id=None) in the same account
-    return (
-        file_record.user_id is None
-        and file_record.account_id == current_user.account_id
+@router.post(
+    '/check-permissions',
+    dependencies=[Depends(is_authenticated)],
+)
+async def check_permissions(
+    data: CheckPermissionsRequest,
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+    use_case: Annotated[DownloadFileUseCase, Depends(get_download_use_case)],
+    access_use_case: Annotated[
+        CheckFileAccessUseCase,
+        Depends(get_file_access_use_case),
+    ],
+) -> CheckPermissionsResponse:
+    """Check access to several files with one backend request.
+
+    Lets a page with many files (e.g. thumbnails) authorize them
+    at once, the following downloads use the cached decisions.
+
+    Args:
+        data: Files to check.
+        current_user: Current authenticated user.
+        use_case: Download use case dependency.
+        access_use_case: File access check use case dependency.
+
+    Returns:
+        CheckPermissionsResponse: Files the user has access to.
+
+    """
+    file_records = await use_case.get_metadata_many(data.file_ids)
+    allowed_file_ids = await access_use_case.execute(
+        user=current_user,
+        file_records=file_records,
+    )
+    return CheckPermissionsResponse(
+        file_ids=[
+            file_id
+            for file_id in dict.fromkeys(data.file_ids)
+            if file_id in allowed_file_ids
+        ],
     )
 
 
@@ -1,11 +1,15 @@
 """Presentation DTOs."""
 
 from .api_dtos import (
+    CheckPermissionsRequest,
+    CheckPermissionsResponse,
     FileInfoResponse,
     FileUploadResponse,
 )
 
 __all__ = [
+    'CheckPermissionsRequest',
+    'CheckPermissionsResponse',
     'FileInfoResponse',
     'FileUploadResponse',
 ]
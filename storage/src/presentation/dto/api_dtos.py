@@ -2,7 +2,10 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+# Must match Django backend: CHECK_PERMISSIONS_MAX_SIZE
+CHECK_PERMISSIONS_MAX_SIZE = 100
 
 
 class FileUploadResponse(BaseModel):
@@ -24,3 +27,18 @@ class FileInfoResponse(BaseModel):
     user_id: int | None
     account_id: int
     created_at: datetime
+
+
+class CheckPermissionsRequest(BaseModel):
+    """Batch file permission check request."""
+
+    file_ids: list[str] = Field(
+        min_length=1,
+        max_length=CHECK_PERMISSIONS_MAX_SIZE,
+    )
+
+
+class CheckPermissionsResponse(BaseModel):
+    """Batch file permission check response."""
+
+    file_ids: list[str]  # Files the user has access to
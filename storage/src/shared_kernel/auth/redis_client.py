@@ -4,7 +4,7 @@ import builtins
 import io
 import pickle
 from functools import lru_cache
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import redis.asyncio as redis
 
@@ -13,10 +13,14 @@ from src.shared_kernel.exceptions import (
     MSG_EXT_011,
     MSG_EXT_012,
     MSG_EXT_013,
+    MSG_EXT_015,
     RedisConnectionError,
     RedisOperationError,
 )
 
+if TYPE_CHECKING:
+    from redis.commands.core import AsyncScript
+
 # Types that Django's django_redis PickleSerializer can produce
 # for PneumaticToken auth data (dict, list, str, int, bool, None).
 _SAFE_BUILTINS = frozenset(
@@ -34,6 +38,33 @@ _SAFE_BUILTINS = frozenset(
     }
 )
 
+# GCRA rate limit check: O(1), one key per client.
+# Stores the theoretical arrival time (TAT) of the next request,
+# the clock is Redis TIME so all the workers share it.
+# Takes the limit key, the emission interval (seconds per request)
+# and the window in seconds.
+# Returns the seconds to wait before retry, '0' if allowed.
+_GCRA_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+local allow_at = new_tat - window
+if allow_at > now then
+    return tostring(allow_at - now)
+end
+redis.call(
+    'SET', KEYS[1], tostring(new_tat),
+    'PX', math.ceil((new_tat - now) * 1000)
+)
+return '0'
+"""
+
 
 class _RestrictedUnpickler(pickle.Unpickler):
     """Unpickler that blocks arbitrary code execution.
@@ -91,6 +122,7 @@ class RedisAuthClient:
         """
         # Settings match Django: KEY_PREFIX = '' for auth cache
         self._client = redis.from_url(redis_url)  # type: ignore[no-untyped-call]
+        self._gcra_script: AsyncScript | None = None
 
     async def get(self, key: str) -> dict[str, Any] | list[str] | None:
         """Get value from cache."""
@@ -116,6 +148,68 @@ class RedisAuthClient:
                 details=MSG_EXT_013.format(key=key, details=str(e)),
             ) from e
 
+    async def get_version(self, key: str) -> int:
+        """Get integer version written by Django cache.incr().
+
+        django_redis stores integers unpickled, 0 if the key is missing.
+        """
+        try:
+            settings = get_settings()
+            value = await self._client.get(f'{settings.KEY_PREFIX_REDIS}{key}')
+        except redis.ConnectionError as e:
+            raise RedisConnectionError(
+                details=MSG_EXT_011.format(details=str(e)),
+            ) from e
+        except redis.RedisError as e:
+            raise RedisOperationError(
+                operation='get',
+                details=MSG_EXT_012.format(key=key, details=str(e)),
+            ) from e
+        if value is None:
+            return 0
+        try:
+            return int(value)
+        except ValueError as e:
+            raise RedisOperationError(
+                operation='get_version',
+                details=MSG_EXT_012.format(key=key, details=str(e)),
+            ) from e
+
+    async def acquire_rate_limit(
+        self,
+        key: str,
+        max_requests: int,
+        window_seconds: int,
+    ) -> float:
+        """Take one request from the client limit (GCRA).
+
+        Args:
+            key: Limit key, e.g. 'upload:10.0.0.1'.
+            max_requests: Requests allowed per window.
+            window_seconds: Window length in seconds.
+
+        Returns:
+            Seconds to wait before retry, 0 if the request is allowed.
+
+        """
+        if self._gcra_script is None:
+            self._gcra_script = self._client.register_script(_GCRA_SCRIPT)
+        try:
+            retry_after = await self._gcra_script(
+                keys=[f'rate_limit:{key}'],
+                args=[window_seconds / max_requests, window_seconds],
+            )
+        except redis.ConnectionError as e:
+            raise RedisConnectionError(
+                details=MSG_EXT_011.format(details=str(e)),
+            ) from e
+        except redis.RedisError as e:
+            raise RedisOperationError(
+                operation='rate_limit',
+                details=MSG_EXT_015.format(key=key, details=str(e)),
+            ) from e
+        return float(retry_after)
+
     async def close(self) -> None:
         """Close Redis connection pool."""
         await self._client.aclose()
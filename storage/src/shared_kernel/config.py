@@ -94,6 +94,8 @@ class BaseAppSettings(BaseSettings):
     RATE_LIMIT_UPLOAD_WINDOW: int = 60
     RATE_LIMIT_DOWNLOAD_REQUESTS: int = 100
     RATE_LIMIT_DOWNLOAD_WINDOW: int = 60
+    # Share the limits between the workers through Redis
+    RATE_LIMIT_REDIS: bool = True
 
     # ── File service ─────────────────────────────────────────
     FASTAPI_BASE_URL: str = 'http://localhost:8002'
@@ -101,6 +103,13 @@ class BaseAppSettings(BaseSettings):
     MAX_FILE_SIZE: int = 104857600
     CHUNK_SIZE: int = 1048576  # 1MB chunks for file streaming
 
+    # ── Permission cache ─────────────────────────────────────
+    # In seconds, 0 disables the cache
+    FILE_RECORD_CACHE_TTL: int = 300
+    PERMISSION_CACHE_TTL: int = 30
+    # Max entries of each cache per worker
+    PERMISSION_CACHE_SIZE: int = 10000
+
     # ── Redis ────────────────────────────────────────────────
     AUTH_REDIS_URL: str = 'redis://:redis_password@redis:6379/1'
     KEY_PREFIX_REDIS: str = ':1:'
@@ -128,6 +137,11 @@ class BaseAppSettings(BaseSettings):
         """Generate permission check URL."""
         return f'{self.BACKEND_PRIVATE_URL}/attachments/check-permission'
 
+    @property
+    def check_permissions_url(self) -> str:
+        """Generate batch permission check URL."""
+        return f'{self.BACKEND_PRIVATE_URL}/attachments/check-permissions'
+
     @property
     def database_url(self) -> str:
         """Generate database URL."""
@@ -146,6 +160,8 @@ class TestingSettings(BaseAppSettings):
     RATE_LIMIT_ENABLED: bool = False
     RELOAD: bool = False
     WORKERS: int = 1
+    FILE_RECORD_CACHE_TTL: int = 0
+    PERMISSION_CACHE_TTL: int = 0
 
 
 class DevelopmentSettings(BaseAppSettings):
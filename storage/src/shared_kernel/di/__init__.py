@@ -1,14 +1,18 @@
 """Dependency injection container."""
 
 from .container import (
+    get_access_cache,
     get_download_use_case,
+    get_file_access_use_case,
     get_http_client,
     get_settings_dep,
     get_upload_use_case,
 )
 
 __all__ = [
+    'get_access_cache',
     'get_download_use_case',
+    'get_file_access_use_case',
     'get_http_client',
     'get_settings_dep',
     'get_upload_use_case',
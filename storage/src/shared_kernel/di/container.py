@@ -7,9 +7,11 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.use_cases import (
+    CheckFileAccessUseCase,
     DownloadFileUseCase,
     UploadFileUseCase,
 )
+from src.infra.access_cache import FileAccessCache, get_file_access_cache
 from src.infra.adapters import (
     StorageService,
     StorageServiceHolder,
@@ -59,9 +61,15 @@ async def get_upload_use_case(
     )
 
 
+def get_access_cache() -> FileAccessCache:
+    """Get file access cache singleton."""
+    return get_file_access_cache()
+
+
 async def get_download_use_case(
     session: Annotated[AsyncSession, Depends(get_db_session)],
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
+    access_cache: Annotated[FileAccessCache, Depends(get_access_cache)],
 ) -> DownloadFileUseCase:
     """Get download use case."""
     file_repository = FileRecordRepository(session=session)
@@ -69,10 +77,25 @@ async def get_download_use_case(
     return DownloadFileUseCase(
         file_repository=file_repository,
         storage_service=storage_service,
+        access_cache=access_cache,
     )
 
 
 async def get_http_client() -> AsyncGenerator[HttpClient, None]:
     """Get HTTP client."""
     settings = get_settings()
-    yield HttpClient(base_url=settings.check_permission_url)
+    yield HttpClient(
+        base_url=settings.check_permission_url,
+        batch_url=settings.check_permissions_url,
+    )
+
+
+async def get_file_access_use_case(
+    http_client: Annotated[HttpClient, Depends(get_http_client)],
+    access_cache: Annotated[FileAccessCache, Depends(get_access_cache)],
+) -> CheckFileAccessUseCase:
+    """Get file access check use case."""
+    return CheckFileAccessUseCase(
+        http_client=http_client,
+        access_cache=access_cache,
+    )
@@ -37,6 +37,7 @@ from .error_messages import (
     MSG_EXT_012,
     MSG_EXT_013,
     MSG_EXT_014,
+    MSG_EXT_015,
 )
 from .exception_handler import (
     register_exception_handlers,
@@ -64,6 +65,7 @@ __all__ = [
     'MSG_EXT_012',
     'MSG_EXT_013',
     'MSG_EXT_014',
+    'MSG_EXT_015',
     'PERMISSION_ERROR_CODES',
     'VALIDATION_ERROR_CODES',
     'AuthenticationError',
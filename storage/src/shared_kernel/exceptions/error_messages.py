@@ -61,6 +61,7 @@ MSG_EXT_011 = 'Failed to connect to Redis: {details}'
 MSG_EXT_012 = 'Redis get operation failed for key "{key}": {details}'
 MSG_EXT_013 = 'Failed to unpickle value for key "{key}": {details}'
 MSG_EXT_014 = 'HTTP request failed: {details}'
+MSG_EXT_015 = 'Redis rate limit operation failed for key "{key}": {details}'
 
 # Validation errors
 MSG_VAL_001 = 'Invalid file size'
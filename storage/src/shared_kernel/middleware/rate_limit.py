@@ -1,22 +1,27 @@
-"""In-memory rate limiter middleware.
+"""Rate limiter middleware.
 
-Uses a sliding window counter per client IP.
-Zero external dependencies — no slowapi needed.
+Uses GCRA (token bucket) per client IP: one timestamp per client,
+O(1) per request. The limits are shared by all the workers through
+Redis, an in-memory limiter is used when Redis is unavailable.
 """
 
+import logging
+import math
 import time
-from collections import defaultdict
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from src.shared_kernel.auth import get_redis_client
 from src.shared_kernel.config import get_settings
+from src.shared_kernel.exceptions import (
+    RedisConnectionError,
+    RedisOperationError,
+)
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -26,22 +31,30 @@ class _RateLimit:
     max_requests: int
     window_seconds: int
 
+    @property
+    def emission_interval(self) -> float:
+        """Seconds between requests at the sustained rate."""
+        return self.window_seconds / self.max_requests
+
 
 @dataclass
-class _SlidingWindow:
-    """Sliding window counter for a client."""
+class _TokenBucket:
+    """GCRA state of a client for the in-memory limiter."""
 
-    timestamps: list[float] = field(default_factory=list)
+    # Theoretical arrival time of the next request
+    tat: float = 0.0
 
-    def count_in_window(self, now: float, window: int) -> int:
-        """Count requests within the time window."""
-        cutoff = now - window
-        self.timestamps = [ts for ts in self.timestamps if ts > cutoff]
-        return len(self.timestamps)
+    def acquire(self, now: float, limit: _RateLimit) -> float:
+        """Take one request from the bucket.
 
-    def record(self, now: float) -> None:
-        """Record a new request."""
-        self.timestamps.append(now)
+        Returns seconds to wait before retry, 0 if allowed.
+        """
+        new_tat = max(self.tat, now) + limit.emission_interval
+        allow_at = new_tat - limit.window_seconds
+        if allow_at > now:
+            return allow_at - now
+        self.tat = new_tat
+        return 0.0
 
 
 def _get_default_limits() -> dict[str, _RateLimit]:
@@ -96,17 +109,25 @@ def _get_client_ip(request: Request) -> str:
 
 
 _CLEANUP_INTERVAL_SECONDS = 60
+# Redis is not retried for this time after a failure,
+# the in-memory limiter is used meanwhile
+_REDIS_RETRY_SECONDS = 5
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware using sliding window."""
+class RateLimitMiddleware:
+    """Rate limiting middleware using GCRA.
+
+    Pure ASGI: the response body (e.g. a streamed download)
+    is passed through without wrapping.
+    """
 
     def __init__(
         self,
-        app: Callable,
+        app: ASGIApp,
         rate_limits: dict[str, _RateLimit] | None = None,
         *,
         enabled: bool = True,
+        use_redis: bool | None = None,
     ) -> None:
         """Initialize rate limiter.
 
@@ -114,68 +135,89 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             app: ASGI application.
             rate_limits: Custom rate limits (default: module-level).
             enabled: If False, skip rate limiting (for tests).
+            use_redis: Share the limits through Redis
+                (default: RATE_LIMIT_REDIS setting).
 
         """
-        super().__init__(app)
+        self.app = app
         self._limits = rate_limits or _get_default_limits()
         self._enabled = enabled
-        # {bucket:ip -> SlidingWindow}
-        self._windows: dict[
-            str,
-            _SlidingWindow,
-        ] = defaultdict(_SlidingWindow)
-        self._max_window_seconds = max(
-            (lim.window_seconds for lim in self._limits.values()),
-            default=60,
-        )
+        if use_redis is None:
+            use_redis = get_settings().RATE_LIMIT_REDIS
+        self._use_redis = use_redis
+        self._redis_retry_at = 0.0
+        # {bucket:ip -> TokenBucket}, the in-memory fallback
+        self._buckets: dict[str, _TokenBucket] = {}
         self._last_cleanup = time.monotonic()
 
-    async def dispatch(
+    async def __call__(
         self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
         """Check rate limit before processing request."""
-        if not self._enabled:
-            return await call_next(request)
-        bucket = _classify_route(
-            request.url.path,
-            request.method,
-        )
+        if not self._enabled or scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        bucket = _classify_route(scope['path'], scope['method'])
         if bucket is None or bucket not in self._limits:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         limit = self._limits[bucket]
-        client_ip = _get_client_ip(request)
-        key = f'{bucket}:{client_ip}'
-        now = time.monotonic()
-
-        self._maybe_evict_stale(now)
-
-        window = self._windows[key]
-        current = window.count_in_window(
-            now,
-            limit.window_seconds,
-        )
-
-        if current >= limit.max_requests:
-            retry_after = limit.window_seconds
-            return JSONResponse(
+        client_ip = _get_client_ip(Request(scope))
+        retry_after = await self._acquire(f'{bucket}:{client_ip}', limit)
+        if retry_after > 0:
+            retry_after_seconds = math.ceil(retry_after)
+            response = JSONResponse(
                 status_code=429,
                 content={
                     'detail': 'Rate limit exceeded',
-                    'retry_after': retry_after,
+                    'retry_after': retry_after_seconds,
                 },
                 headers={
-                    'Retry-After': str(retry_after),
+                    'Retry-After': str(retry_after_seconds),
                 },
             )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
 
-        window.record(now)
-        return await call_next(request)
+    async def _acquire(self, key: str, limit: _RateLimit) -> float:
+        """Take one request from the client limit.
+
+        Returns seconds to wait before retry, 0 if allowed.
+        """
+        now = time.monotonic()
+        if self._use_redis and now >= self._redis_retry_at:
+            try:
+                return await get_redis_client().acquire_rate_limit(
+                    key=key,
+                    max_requests=limit.max_requests,
+                    window_seconds=limit.window_seconds,
+                )
+            except (RedisConnectionError, RedisOperationError) as e:
+                logger.warning('Rate limit fallback to memory: %s', e)
+                self._redis_retry_at = now + _REDIS_RETRY_SECONDS
+        return self._acquire_local(key, limit, now)
+
+    def _acquire_local(
+        self,
+        key: str,
+        limit: _RateLimit,
+        now: float,
+    ) -> float:
+        """Take one request from the in-memory limit."""
+        self._maybe_evict_stale(now)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _TokenBucket()
+        return bucket.acquire(now, limit)
 
     def _maybe_evict_stale(self, now: float) -> None:
-        """Remove windows with no recent activity.
+        """Remove buckets that are back to the full capacity.
 
         Runs at most once per _CLEANUP_INTERVAL_SECONDS to avoid
         scanning the dict on every request.
@@ -183,11 +225,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         if now - self._last_cleanup < _CLEANUP_INTERVAL_SECONDS:
             return
         self._last_cleanup = now
-        cutoff = now - self._max_window_seconds
         stale_keys = [
-            key
-            for key, win in self._windows.items()
-            if not win.timestamps or win.timestamps[-1] <= cutoff
+            key for key, bucket in self._buckets.items() if bucket.tat <= now
         ]
         for key in stale_keys:
-            del self._windows[key]
+            del self._buckets[key]
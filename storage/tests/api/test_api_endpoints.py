@@ -883,3 +883,60 @@ def test_download__legacy_id__permission_check_receives_string(
     call_kwargs = mock_http_client_check_permission.call_args
     assert isinstance(call_kwargs.kwargs['file_id'], str)
     assert call_kwargs.kwargs['file_id'] == legacy_id
+
+
+def test_check_permissions__many_files__return_allowed(
+    e2e_client,
+    mock_auth_middleware,
+    mock_http_client_check_permissions,
+    auth_headers,
+    mock_download_use_case_get_metadata_many,
+):
+    # arrange
+    file_ids = ['file-1', 'file-2', 'file-3']
+    mock_download_use_case_get_metadata_many.return_value = [
+        FileRecord(
+            file_id=file_id,
+            filename='test_file.txt',
+            content_type='text/plain',
+            size=12,
+            user_id=999,
+            account_id=1,
+            created_at=datetime(2024, 1, 1, tzinfo=UTC),
+        )
+        for file_id in file_ids
+    ]
+    mock_http_client_check_permissions.return_value = {'file-1', 'file-3'}
+
+    # act
+    response = e2e_client.post(
+        '/check-permissions',
+        json={'file_ids': file_ids},
+        headers=auth_headers,
+    )
+
+    # assert
+    assert response.status_code == 200
+    assert response.json() == {'file_ids': ['file-1', 'file-3']}
+    mock_http_client_check_permissions.assert_called_once_with(
+        user=ANY,
+        file_ids=file_ids,
+    )
+
+
+def test_check_permissions__too_many_files__return_422(
+    e2e_client,
+    mock_auth_middleware,
+    mock_http_client_check_permissions,
+    auth_headers,
+):
+    # act
+    response = e2e_client.post(
+        '/check-permissions',
+        json={'file_ids': [f'file-{i}' for i in range(101)]},
+        headers=auth_headers,
+    )
+
+    # assert
+    assert response.status_code == 422
+    mock_http_client_check_permissions.assert_not_called()
@@ -268,26 +268,38 @@ def make_perm_user():
 
 
 @pytest.fixture
-def make_rate_request():
-    """Factory for mock rate-limit requests."""
+def make_rate_scope():
+    """Factory for rate-limit ASGI scopes."""
 
     def _factory(
         path='/upload',
         method='POST',
         client_ip='127.0.0.1',
     ):
-        request = MagicMock(spec=Request)
-        request.url = MagicMock()
-        request.url.path = path
-        request.method = method
-        request.headers = {}
-        request.client = MagicMock()
-        request.client.host = client_ip
-        return request
+        return {
+            'type': 'http',
+            'path': path,
+            'method': method,
+            'headers': [],
+            'client': (client_ip, 12345),
+        }
 
     return _factory
 
 
+@pytest.fixture
+def rate_limit_send():
+    """ASGI send that collects the response messages."""
+
+    messages = []
+
+    async def _send(message):
+        messages.append(message)
+
+    _send.messages = messages
+    return _send
+
+
 # --- redis cache management ---
 
 
@@ -403,6 +415,16 @@ def mock_download_use_case_get_stream(mocker):
     )
 
 
+@pytest.fixture
+def mock_download_use_case_get_metadata_many(mocker):
+    """Mock for DownloadFileUseCase.get_metadata_many."""
+    return mocker.patch(
+        'src.application.use_cases.file_download.'
+        'DownloadFileUseCase.get_metadata_many',
+        new_callable=AsyncMock,
+    )
+
+
 @pytest.fixture
 def mock_pneumatic_token_data(mocker):
     """Mock for PneumaticToken.data."""
@@ -420,6 +442,23 @@ def mock_http_client_check_permission(mocker):
     )
 
 
+@pytest.fixture
+def mock_http_client_check_permissions(mocker):
+    """Mock for HttpClient.check_file_permissions."""
+    return mocker.patch(
+        'src.infra.http_client.HttpClient.check_file_permissions',
+        new_callable=AsyncMock,
+    )
+
+
+@pytest.fixture
+def mock_access_cache_redis_client(mocker):
+    """Mock for get_redis_client in access_cache module."""
+    return mocker.patch(
+        'src.infra.access_cache.get_redis_client',
+    )
+
+
 @pytest.fixture
 def mock_aioboto3_session(mocker):
     """Mock for aioboto3.Session."""
@@ -0,0 +1,284 @@
+"""Tests for file access cache and access check use case."""
+
+from datetime import UTC, datetime
+from unittest.mock import ANY, AsyncMock
+
+import pytest
+
+from src.application.use_cases.file_access import CheckFileAccessUseCase
+from src.domain.entities.file_record import FileRecord
+from src.infra.access_cache import FileAccessCache
+from src.shared_kernel.auth.user_types import UserType
+from src.shared_kernel.exceptions import RedisConnectionError
+from src.shared_kernel.middleware.auth_middleware import AuthUser
+
+
+def _make_file_record(file_id: str, user_id: int | None = 999) -> FileRecord:
+    return FileRecord(
+        file_id=file_id,
+        filename='test_file.txt',
+        content_type='text/plain',
+        size=12,
+        user_id=user_id,
+        account_id=1,
+        created_at=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+
+
+def _make_user(user_id: int | None = 1, key: str = 'valid') -> AuthUser:
+    return AuthUser(
+        auth_type=(
+            UserType.AUTHENTICATED
+            if user_id is not None
+            else UserType.PUBLIC_TOKEN
+        ),
+        user_id=user_id,
+        account_id=1,
+        token=key,
+    )
+
+
+# --- FileAccessCache ---
+
+
+def test_file_record__cached__return_record():
+    # arrange
+    cache = FileAccessCache(record_ttl=60, decision_ttl=60, maxsize=10)
+    file_record = _make_file_record('file-1')
+
+    # act
+    cache.set_file_record(file_record)
+
+    # assert
+    assert cache.get_file_record('file-1') is file_record
+    assert cache.get_file_record('file-2') is None
+
+
+def test_file_record__maxsize_exceeded__evict_least_recent():
+    # arrange
+    cache = FileAccessCache(record_ttl=60, decision_ttl=60, maxsize=2)
+    cache.set_file_record(_make_file_record('file-1'))
+    cache.set_file_record(_make_file_record('file-2'))
+    cache.get_file_record('file-1')
+
+    # act
+    cache.set_file_record(_make_file_record('file-3'))
+
+    # assert
+    assert cache.get_file_record('file-1') is not None
+    assert cache.get_file_record('file-2') is None
+    assert cache.get_file_record('file-3') is not None
+
+
+def test_file_record__zero_ttl__not_cached():
+    # arrange
+    cache = FileAccessCache(record_ttl=0, decision_ttl=0, maxsize=10)
+
+    # act
+    cache.set_file_record(_make_file_record('file-1'))
+
+    # assert
+    assert cache.get_file_record('file-1') is None
+
+
+def test_decision__version_changed__not_used():
+    # arrange
+    cache = FileAccessCache(record_ttl=60, decision_ttl=60, maxsize=10)
+    user = _make_user()
+    cache.set_decision(user, 'file-1', 3, allowed=True)
+
+    # act
+    same_version = cache.get_decision(user, 'file-1', 3)
+    new_version = cache.get_decision(user, 'file-1', 4)
+
+    # assert
+    assert same_version is True
+    assert new_version is None
+
+
+def test_decision__other_token__not_used():
+    # arrange
+    cache = FileAccessCache(record_ttl=60, decision_ttl=60, maxsize=10)
+    cache.set_decision(
+        _make_user(user_id=None, key='a'),
+        'file-1',
+        1,
+        allowed=True,
+    )
+
+    # act
+    result = cache.get_decision(
+        _make_user(user_id=None, key='b'),
+        'file-1',
+        1,
+    )
+
+    # assert
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_get_acl_version__redis_error__return_none(
+    mock_access_cache_redis_client,
+):
+    # arrange
+    cache = FileAccessCache(record_ttl=60, decision_ttl=60, maxsize=10)
+    redis_client = AsyncMock()
+    redis_client.get_version.side_effect = RedisConnectionError(
+        'Connection refused',
+    )
+    mock_access_cache_redis_client.return_value = redis_client
+
+    # act
+    result = await cache.get_acl_version(1)
+
+    # assert
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_get_acl_version__ok__return_version(
+    mock_access_cache_redis_client,
+):
+    # arrange
+    cache = FileAccessCache(record_ttl=60, decision_ttl=60, maxsize=10)
+    redis_client = AsyncMock()
+    redis_client.get_version.return_value = 5
+    mock_access_cache_redis_client.return_value = redis_client
+
+    # act
+    result = await cache.get_acl_version(1)
+
+    # assert
+    assert result == 5
+    redis_client.get_version.assert_called_once_with(
+        'attachment_acl_version:1',
+    )
+
+
+# --- CheckFileAccessUseCase ---
+
+
+@pytest.mark.asyncio
+async def test_execute__owner__backend_not_called(mock_http_client):
+    # arrange
+    cache = FileAccessCache(record_ttl=60, decision_ttl=60, maxsize=10)
+    use_case = CheckFileAccessUseCase(
+        http_client=mock_http_client,
+        access_cache=cache,
+    )
+
+    # act
+    result = await use_case.execute(
+        user=_make_user(),
+        file_records=[_make_file_record('file-1', user_id=1)],
+    )
+
+    # assert
+    assert result == {'file-1'}
+    mock_http_client.check_file_permission.assert_not_called()
+    mock_http_client.check_file_permissions.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute__cached_decision__backend_called_once(
+    mock_http_client,
+    mock_access_cache_redis_client,
+):
+    # arrange
+    cache = FileAccessCache(record_ttl=60, decision_ttl=60, maxsize=10)
+    redis_client = AsyncMock()
+    redis_client.get_version.return_value = 1
+    mock_access_cache_redis_client.return_value = redis_client
+    use_case = CheckFileAccessUseCase(
+        http_client=mock_http_client,
+        access_cache=cache,
+    )
+    file_records = [_make_file_record('file-1')]
+
+    # act
+    first = await use_case.execute(
+        user=_make_user(), file_records=file_records
+    )
+    second = await use_case.execute(
+        user=_make_user(),
+        file_records=file_records,
+    )
+
+    # assert
+    assert first == {'file-1'}
+    assert second == {'file-1'}
+    mock_http_client.check_file_permission.assert_called_once_with(
+        user=ANY,
+        file_id='file-1',
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute__acl_version_bumped__ask_backend_again(
+    mock_http_client,
+    mock_access_cache_redis_client,
+):
+    # arrange
+    cache = FileAccessCache(record_ttl=60, decision_ttl=60, maxsize=10)
+    redis_client = AsyncMock()
+    redis_client.get_version.side_effect = [1, 2]
+    mock_access_cache_redis_client.return_value = redis_client
+    mock_http_client.check_file_permission.side_effect = [True, False]
+    use_case = CheckFileAccessUseCase(
+        http_client=mock_http_client,
+        access_cache=cache,
+    )
+    file_records = [_make_file_record('file-1')]
+
+    # act
+    first = await use_case.execute(
+        user=_make_user(), file_records=file_records
+    )
+    second = await use_case.execute(
+        user=_make_user(),
+        file_records=file_records,
+    )
+
+    # assert
+    assert first == {'file-1'}
+    assert second == set()
+    assert mock_http_client.check_file_permission.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_execute__many_files__one_batch_request(
+    mock_http_client,
+    mock_access_cache_redis_client,
+):
+    # arrange
+    cache = FileAccessCache(record_ttl=60, decision_ttl=60, maxsize=10)
+    redis_client = AsyncMock()
+    redis_client.get_version.return_value = 1
+    mock_access_cache_redis_client.return_value = redis_client
+    mock_http_client.check_file_permissions.return_value = {'file-2'}
+    use_case = CheckFileAccessUseCase(
+        http_client=mock_http_client,
+        access_cache=cache,
+    )
+    file_records = [
+        _make_file_record('file-1', user_id=1),
+        _make_file_record('file-2'),
+        _make_file_record('file-3'),
+    ]
+
+    # act
+    result = await use_case.execute(
+        user=_make_user(),
+        file_records=file_records,
+    )
+
+    # assert
+    assert result == {'file-1', 'file-2'}
+    mock_http_client.check_file_permissions.assert_called_once_with(
+        user=ANY,
+        file_ids=['file-2', 'file-3'],
+    )
+    mock_http_client.check_file_permission.assert_not_called()
+    redis_client.get_version.assert_called_once()
+    assert cache.get_decision(_make_user(), 'file-3', 1) is False
@@ -1,11 +1,11 @@
 """Tests for HttpClient and SharedClientHolder."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
 
-from src.infra.http_client import SharedClientHolder
+from src.infra.http_client import HttpClient, SharedClientHolder
 from src.shared_kernel.auth.user_types import UserType
 from src.shared_kernel.exceptions import (
     HttpClientError,
@@ -234,6 +234,77 @@ async def test_check_permission__server_error__false(
     )
 
 
+# --- HttpClient.check_file_permissions ---
+
+
+@pytest.mark.asyncio
+async def test_check_permissions__ok__return_allowed_ids(mock_httpx_post):
+    # arrange
+    http_client = HttpClient(
+        base_url='http://test.example.com',
+        batch_url='http://test.example.com/batch',
+    )
+    user = AuthUser(
+        auth_type=UserType.AUTHENTICATED,
+        user_id=1,
+        account_id=1,
+        token='valid-token',
+    )
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {'file_ids': ['file-1']}
+    mock_httpx_post.return_value = mock_response
+
+    # act
+    result = await http_client.check_file_permissions(
+        user=user,
+        file_ids=['file-1', 'file-2'],
+    )
+
+    # assert
+    assert result == {'file-1'}
+    mock_httpx_post.assert_called_once_with(
+        url='http://test.example.com/batch',
+        json={'file_ids': ['file-1', 'file-2']},
+        headers={
+            'Authorization': 'Bearer valid-token',
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_check_permissions__denied__return_empty(
+    http_client,
+    mock_httpx_post,
+):
+    # arrange
+    user = AuthUser(
+        auth_type=UserType.GUEST_TOKEN,
+        user_id=1,
+        account_id=1,
+        token='guest-token',
+    )
+    mock_response = MagicMock()
+    mock_response.status_code = 403
+    mock_httpx_post.return_value = mock_response
+
+    # act
+    result = await http_client.check_file_permissions(
+        user=user,
+        file_ids=['file-1'],
+    )
+
+    # assert
+    assert result == set()
+    mock_httpx_post.assert_called_once_with(
+        url='http://test.example.com',
+        json={'file_ids': ['file-1']},
+        headers={
+            'X-Guest-Authorization': 'guest-token',
+        },
+    )
+
+
 # --- SharedClientHolder ---
 
 
@@ -5,15 +5,15 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from starlette.requests import Request
-from starlette.responses import Response
 
+from src.shared_kernel.exceptions import RedisConnectionError
 from src.shared_kernel.middleware.rate_limit import (
     _CLEANUP_INTERVAL_SECONDS,
     RateLimitMiddleware,
     _classify_route,
     _get_client_ip,
     _RateLimit,
-    _SlidingWindow,
+    _TokenBucket,
 )
 
 
@@ -136,223 +136,303 @@ def test_get_client_ip__no_client__fallback():
     assert result == '0.0.0.0'
 
 
-def test_sliding_window__empty__zero_count():
+def test_token_bucket__empty__allowed():
     # arrange
-    window = _SlidingWindow()
+    bucket = _TokenBucket()
+    limit = _RateLimit(max_requests=2, window_seconds=60)
 
     # act
-    count = window.count_in_window(time.monotonic(), 60)
+    retry_after = bucket.acquire(time.monotonic(), limit)
 
     # assert
-    assert count == 0
+    assert retry_after == 0
 
 
-def test_sliding_window__one_request__count_one():
+def test_token_bucket__burst_exhausted__retry_after_interval():
     # arrange
-    window = _SlidingWindow()
+    bucket = _TokenBucket()
+    limit = _RateLimit(max_requests=2, window_seconds=60)
     now = time.monotonic()
-    window.record(now)
+    bucket.acquire(now, limit)
+    bucket.acquire(now, limit)
 
     # act
-    count = window.count_in_window(now, 60)
+    retry_after = bucket.acquire(now, limit)
 
     # assert
-    assert count == 1
+    assert retry_after == 30
 
 
-def test_sliding_window__expired__count_zero():
+def test_token_bucket__denied__state_unchanged():
     # arrange
-    window = _SlidingWindow()
-    old = time.monotonic() - 120
-    window.record(old)
+    bucket = _TokenBucket()
+    limit = _RateLimit(max_requests=1, window_seconds=60)
+    now = time.monotonic()
+    bucket.acquire(now, limit)
+    tat = bucket.tat
 
     # act
-    now = time.monotonic()
-    count = window.count_in_window(now, 60)
+    bucket.acquire(now, limit)
 
     # assert
-    assert count == 0
+    assert bucket.tat == tat
 
 
-def test_sliding_window__mixed__count_recent_only():
+def test_token_bucket__after_interval__allowed_again():
     # arrange
-    window = _SlidingWindow()
+    bucket = _TokenBucket()
+    limit = _RateLimit(max_requests=2, window_seconds=60)
     now = time.monotonic()
-    window.record(now - 120)
-    window.record(now - 30)
-    window.record(now - 5)
+    bucket.acquire(now, limit)
+    bucket.acquire(now, limit)
 
     # act
-    count = window.count_in_window(now, 60)
+    retry_after = bucket.acquire(now + 30, limit)
 
     # assert
-    assert count == 2
+    assert retry_after == 0
 
 
 @pytest.mark.asyncio
-async def test_dispatch__under_limit__pass(
+async def test_call__under_limit__pass(
     fast_rate_limits,
-    make_rate_request,
+    make_rate_scope,
+    rate_limit_send,
 ):
     # arrange
+    app_mock = AsyncMock()
     mw = RateLimitMiddleware(
-        app=AsyncMock(),
+        app=app_mock,
         rate_limits=fast_rate_limits,
+        use_redis=False,
     )
-    request = make_rate_request()
-    expected = Response(status_code=200)
-    call_next_mock = AsyncMock(return_value=expected)
+    scope = make_rate_scope()
+    receive = AsyncMock()
 
     # act
-    response = await mw.dispatch(request, call_next_mock)
+    await mw(scope, receive, rate_limit_send)
 
     # assert
-    assert response.status_code == 200
-    call_next_mock.assert_called_once_with(request)
+    app_mock.assert_called_once_with(scope, receive, rate_limit_send)
+    assert rate_limit_send.messages == []
 
 
 @pytest.mark.asyncio
-async def test_dispatch__over_limit__return_429(
+async def test_call__over_limit__return_429(
     fast_rate_limits,
-    make_rate_request,
+    make_rate_scope,
+    rate_limit_send,
 ):
     # arrange
+    app_mock = AsyncMock()
     mw = RateLimitMiddleware(
-        app=AsyncMock(),
+        app=app_mock,
         rate_limits=fast_rate_limits,
-    )
-    call_next_mock = AsyncMock(
-        return_value=Response(status_code=200),
+        use_redis=False,
     )
 
     # act
-    for _ in range(2):
-        req = make_rate_request()
-        await mw.dispatch(req, call_next_mock)
-
-    req = make_rate_request()
-    response = await mw.dispatch(req, call_next_mock)
+    for _ in range(3):
+        await mw(make_rate_scope(), AsyncMock(), rate_limit_send)
 
     # assert
-    assert response.status_code == 429
-    assert call_next_mock.call_count == 2
+    assert app_mock.call_count == 2
+    assert rate_limit_send.messages[0]['status'] == 429
 
 
 @pytest.mark.asyncio
-async def test_dispatch__different_ips__independent(
+async def test_call__different_ips__independent(
     fast_rate_limits,
-    make_rate_request,
+    make_rate_scope,
+    rate_limit_send,
 ):
     # arrange
+    app_mock = AsyncMock()
     mw = RateLimitMiddleware(
-        app=AsyncMock(),
+        app=app_mock,
         rate_limits=fast_rate_limits,
+        use_redis=False,
     )
-    call_next_mock = AsyncMock(
-        return_value=Response(status_code=200),
-    )
-    responses = []
 
     # act
     for ip in ('10.0.0.1', '10.0.0.2'):
         for _ in range(2):
-            req = make_rate_request(client_ip=ip)
-            resp = await mw.dispatch(req, call_next_mock)
-            responses.append(resp)
+            scope = make_rate_scope(client_ip=ip)
+            await mw(scope, AsyncMock(), rate_limit_send)
 
     # assert
-    assert all(r.status_code == 200 for r in responses)
-    assert call_next_mock.call_count == 4
+    assert rate_limit_send.messages == []
+    assert app_mock.call_count == 4
 
 
 @pytest.mark.asyncio
-async def test_dispatch__non_limited_route__pass(
+async def test_call__non_limited_route__pass(
     fast_rate_limits,
-    make_rate_request,
+    make_rate_scope,
+    rate_limit_send,
 ):
     # arrange
+    app_mock = AsyncMock()
     mw = RateLimitMiddleware(
-        app=AsyncMock(),
+        app=app_mock,
         rate_limits=fast_rate_limits,
+        use_redis=False,
     )
-    call_next_mock = AsyncMock(
-        return_value=Response(status_code=200),
-    )
-    responses = []
 
     # act
     for _ in range(10):
-        req = make_rate_request(path='/', method='GET')
-        resp = await mw.dispatch(req, call_next_mock)
-        responses.append(resp)
+        scope = make_rate_scope(path='/', method='GET')
+        await mw(scope, AsyncMock(), rate_limit_send)
 
     # assert
-    assert all(r.status_code == 200 for r in responses)
+    assert rate_limit_send.messages == []
+    assert app_mock.call_count == 10
 
 
 @pytest.mark.asyncio
-async def test_dispatch__429_has_retry_after(
+async def test_call__not_http__pass(fast_rate_limits):
+    # arrange
+    app_mock = AsyncMock()
+    mw = RateLimitMiddleware(
+        app=app_mock,
+        rate_limits=fast_rate_limits,
+        use_redis=False,
+    )
+    scope = {'type': 'lifespan'}
+
+    # act
+    await mw(scope, AsyncMock(), AsyncMock())
+
+    # assert
+    app_mock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_call__429_has_retry_after(
     fast_rate_limits,
-    make_rate_request,
+    make_rate_scope,
+    rate_limit_send,
 ):
     # arrange
     mw = RateLimitMiddleware(
         app=AsyncMock(),
         rate_limits=fast_rate_limits,
-    )
-    call_next_mock = AsyncMock(
-        return_value=Response(status_code=200),
+        use_redis=False,
     )
     for _ in range(2):
-        req = make_rate_request()
-        await mw.dispatch(req, call_next_mock)
+        await mw(make_rate_scope(), AsyncMock(), rate_limit_send)
 
     # act
-    req = make_rate_request()
-    response = await mw.dispatch(req, call_next_mock)
+    await mw(make_rate_scope(), AsyncMock(), rate_limit_send)
 
     # assert
-    assert response.status_code == 429
-    assert response.headers.get('retry-after') == '60'
+    start = rate_limit_send.messages[0]
+    assert start['status'] == 429
+    # GCRA: one request is refilled every window / max_requests
+    assert (b'retry-after', b'30') in start['headers']
 
 
 @pytest.mark.asyncio
-async def test_dispatch__download_higher_limit(
+async def test_call__download_higher_limit(
     fast_rate_limits,
-    make_rate_request,
+    make_rate_scope,
+    rate_limit_send,
 ):
     # arrange
+    app_mock = AsyncMock()
     mw = RateLimitMiddleware(
-        app=AsyncMock(),
+        app=app_mock,
         rate_limits=fast_rate_limits,
+        use_redis=False,
     )
-    call_next_mock = AsyncMock(
-        return_value=Response(status_code=200),
-    )
-    responses = []
 
     # act — 3 downloads OK, 4th blocked
-    for _ in range(3):
-        req = make_rate_request(
-            path='/some-file-id',
-            method='GET',
-        )
-        resp = await mw.dispatch(req, call_next_mock)
-        responses.append(resp)
-
-    req = make_rate_request(
-        path='/some-file-id',
-        method='GET',
+    for _ in range(4):
+        scope = make_rate_scope(path='/some-file-id', method='GET')
+        await mw(scope, AsyncMock(), rate_limit_send)
+
+    # assert
+    assert app_mock.call_count == 3
+    assert rate_limit_send.messages[0]['status'] == 429
+
+
+@pytest.mark.asyncio
+async def test_call__redis__shared_limit_used(
+    mocker,
+    fast_rate_limits,
+    make_rate_scope,
+    rate_limit_send,
+):
+    # arrange
+    redis_client = MagicMock()
+    redis_client.acquire_rate_limit = AsyncMock(return_value=12.2)
+    mocker.patch(
+        'src.shared_kernel.middleware.rate_limit.get_redis_client',
+        return_value=redis_client,
+    )
+    app_mock = AsyncMock()
+    mw = RateLimitMiddleware(
+        app=app_mock,
+        rate_limits=fast_rate_limits,
+        use_redis=True,
+    )
+
+    # act
+    await mw(
+        make_rate_scope(client_ip='10.0.0.1'),
+        AsyncMock(),
+        rate_limit_send,
     )
-    response = await mw.dispatch(req, call_next_mock)
 
     # assert
-    assert all(r.status_code == 200 for r in responses)
-    assert response.status_code == 429
+    redis_client.acquire_rate_limit.assert_called_once_with(
+        key='upload:10.0.0.1',
+        max_requests=2,
+        window_seconds=60,
+    )
+    app_mock.assert_not_called()
+    start = rate_limit_send.messages[0]
+    assert start['status'] == 429
+    assert (b'retry-after', b'13') in start['headers']
+    assert mw._buckets == {}
+
+
+@pytest.mark.asyncio
+async def test_call__redis_unavailable__fallback_to_memory(
+    mocker,
+    fast_rate_limits,
+    make_rate_scope,
+    rate_limit_send,
+):
+    # arrange
+    redis_client = MagicMock()
+    redis_client.acquire_rate_limit = AsyncMock(
+        side_effect=RedisConnectionError(details='Connection refused'),
+    )
+    mocker.patch(
+        'src.shared_kernel.middleware.rate_limit.get_redis_client',
+        return_value=redis_client,
+    )
+    app_mock = AsyncMock()
+    mw = RateLimitMiddleware(
+        app=app_mock,
+        rate_limits=fast_rate_limits,
+        use_redis=True,
+    )
+
+    # act
+    for _ in range(3):
+        await mw(make_rate_scope(), AsyncMock(), rate_limit_send)
+
+    # assert — Redis is not retried until the retry interval passes
+    redis_client.acquire_rate_limit.assert_called_once()
+    assert app_mock.call_count == 2
+    assert rate_limit_send.messages[0]['status'] == 429
 
 
-def test_evict_stale__removes_expired_windows():
-    """Stale windows are removed after cleanup interval."""
+def test_evict_stale__removes_full_buckets():
+    """Buckets back to the full capacity are removed
+    after cleanup interval."""
     # arrange
 
     mw = RateLimitMiddleware(
@@ -360,27 +440,25 @@ def test_evict_stale__removes_expired_windows():
         rate_limits={
             'upload': _RateLimit(max_requests=10, window_seconds=60),
         },
+        use_redis=False,
     )
     now = time.monotonic()
     # Simulate old entries
     for i in range(100):
-        key = f'upload:10.0.0.{i}'
-        win = _SlidingWindow()
-        win.record(now - 200)  # 200s ago, well past 60s window
-        mw._windows[key] = win
+        mw._buckets[f'upload:10.0.0.{i}'] = _TokenBucket(tat=now - 200)
 
-    assert len(mw._windows) == 100
+    assert len(mw._buckets) == 100
 
     # act — force cleanup by advancing past interval
     mw._last_cleanup = now - _CLEANUP_INTERVAL_SECONDS - 1
     mw._maybe_evict_stale(now)
 
     # assert
-    assert len(mw._windows) == 0
+    assert len(mw._buckets) == 0
 
 
-def test_evict_stale__keeps_recent_windows():
-    """Recent windows survive eviction."""
+def test_evict_stale__keeps_recent_buckets():
+    """Buckets still refilling survive eviction."""
     # arrange
 
     mw = RateLimitMiddleware(
@@ -388,21 +466,16 @@ def test_evict_stale__keeps_recent_windows():
         rate_limits={
             'upload': _RateLimit(max_requests=10, window_seconds=60),
         },
+        use_redis=False,
     )
     now = time.monotonic()
-    # Old entry
-    old_win = _SlidingWindow()
-    old_win.record(now - 200)
-    mw._windows['upload:10.0.0.1'] = old_win
-    # Recent entry
-    new_win = _SlidingWindow()
-    new_win.record(now - 5)
-    mw._windows['upload:10.0.0.2'] = new_win
+    mw._buckets['upload:10.0.0.1'] = _TokenBucket(tat=now - 200)
+    mw._buckets['upload:10.0.0.2'] = _TokenBucket(tat=now + 5)
 
     # act
     mw._last_cleanup = now - _CLEANUP_INTERVAL_SECONDS - 1
     mw._maybe_evict_stale(now)
 
     # assert
-    assert 'upload:10.0.0.1' not in mw._windows
-    assert 'upload:10.0.0.2' in mw._windows
+    assert 'upload:10.0.0.1' not in mw._buckets
+    assert 'upload:10.0.0.2' in mw._buckets
@@ -3,7 +3,7 @@
 import os
 import pickle
 import subprocess
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 import redis.asyncio as redis
@@ -515,3 +515,89 @@ async def test_close_redis__clears_cache(
 
     # assert
     assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_acquire_rate_limit__allowed__return_zero(
+    redis_auth_client,
+    unit_mock_redis_client,
+):
+    # arrange
+    script_mock = AsyncMock(return_value=b'0')
+    unit_mock_redis_client.register_script = Mock(return_value=script_mock)
+
+    # act
+    result = await redis_auth_client.acquire_rate_limit(
+        key='upload:10.0.0.1',
+        max_requests=10,
+        window_seconds=60,
+    )
+
+    # assert
+    assert result == 0
+    script_mock.assert_called_once_with(
+        keys=['rate_limit:upload:10.0.0.1'],
+        args=[6.0, 60],
+    )
+
+
+@pytest.mark.asyncio
+async def test_acquire_rate_limit__limited__return_retry_after(
+    redis_auth_client,
+    unit_mock_redis_client,
+):
+    # arrange
+    script_mock = AsyncMock(return_value=b'5.5')
+    unit_mock_redis_client.register_script = Mock(return_value=script_mock)
+
+    # act
+    result = await redis_auth_client.acquire_rate_limit(
+        key='upload:10.0.0.1',
+        max_requests=10,
+        window_seconds=60,
+    )
+
+    # assert
+    assert result == 5.5
+
+
+@pytest.mark.asyncio
+async def test_acquire_rate_limit__script_registered_once(
+    redis_auth_client,
+    unit_mock_redis_client,
+):
+    # arrange
+    script_mock = AsyncMock(return_value=b'0')
+    unit_mock_redis_client.register_script = Mock(return_value=script_mock)
+
+    # act
+    for _ in range(3):
+        await redis_auth_client.acquire_rate_limit(
+            key='upload:10.0.0.1',
+            max_requests=10,
+            window_seconds=60,
+        )
+
+    # assert
+    unit_mock_redis_client.register_script.assert_called_once()
+    assert script_mock.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_acquire_rate_limit__conn_error__raise_conn_error(
+    redis_auth_client,
+    unit_mock_redis_client,
+):
+    # arrange
+    script_mock = AsyncMock(
+        side_effect=redis.ConnectionError('Connection failed'),
+    )
+    unit_mock_redis_client.register_script = Mock(return_value=script_mock)
+
+    # act
+    with pytest.raises(RedisConnectionError):
+        await redis_auth_client.acquire_rate_limit(
+            key='upload:10.0.0.1',
+            max_requests=10,
+            window_seconds=60,
+        )